@@ -1,23 +1,996 @@
+import functools
+import math
+import time
+import tracemalloc
+from urllib.parse import urlsplit
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import LabelEncoder
+
+from snbp.batch import UNKNOWN_LABEL, predict_table, read_table
+from snbp.config import (
+    CACHE_DIR, EXPORT_HOST, EXPORT_PORT, EXPORT_URL, GEO_BUNDLE, HISTORY_DIR, METRICS_PORT, MODEL_DIR, REGISTRY_DIR,
+    SHEET_TTL, SPREADSHEET_URL,
+)
+from snbp.cube import DIMENSIONS, AggregateCube
+from snbp.download import ExportSource, export_stream, export_url, row_count, serve as serve_export
+from snbp.figures import FIGURES
+from snbp.geo import LEVELS, GeoBundle
+from snbp.history import HistoryStore
+from snbp.index import CascadeIndex
+from snbp.ingest import read_dataset
+from snbp.loader import SheetLoader
+from snbp.metrics import METRICS, serve
+from snbp.model import FEATURES, ModelStore, feature_options, training_key
+from snbp.neighbors import DEFAULT_K, NeighborIndex
+from snbp.registry import ModelRegistry
+from snbp.report import JALUR_OPTIONS, jalur_report, province_report, rasio_report
+from snbp.scenario import Adjustment, Scenario, ScenarioEngine
+from snbp.search import SearchIndex
+from snbp.shared import SharedDataset
+from snbp.table import PAGE_SIZE, paginate
+
+# plotly.express baru dieksekusi saat diagram pertama dibuat (lihat snbp.figures), sehingga judul dan
+# Statistik Umum sudah terkirim ke browser lebih dulu. scikit-learn hanya dimuat ketika prediksi dipakai.
+
+# Dataset dibagi semua sesi sebagai array read-only di atas memory map (lihat snbp.shared).
+# Dengan copy-on-write, potongan dan kolom turunan per sesi adalah view yang baru disalin saat diubah.
+pd.set_option("mode.copy_on_write", True)
+
+# --- Instrumentasi: waktu, alokasi, dan cache hit/miss per bagian (lihat snbp.metrics) ---
+# Panel debug tampil di sidebar bila URL memuat ?debug=1. Angka kumulatif proses bisa diambil
+# oleh scraper Prometheus lokal di http://127.0.0.1:SNBP_METRICS_PORT/metrics (dan /metrics.json).
+METRICS.begin_run()
+
+
+@st.cache_resource
+def start_metrics_server():
+    return serve(METRICS, METRICS_PORT)
+
+
+if METRICS_PORT:
+    start_metrics_server()
+
 
 # --- Ambil data dari Google Spreadsheet dalam format CSV ---
-spreadsheet_url = "https://docs.google.com/spreadsheets/d/1f6m1Bjj3IxCMCbPEcgWt6bsZ7uEz1pK1baiK34XqzlM/export?format=csv"
-df = pd.read_csv(spreadsheet_url)
+# Loader dibagi semua sesi: unduh sekali per TTL, refresh di latar belakang, snapshot disimpan di disk
+@st.cache_resource
+def get_loader():
+    return SheetLoader(SPREADSHEET_URL, CACHE_DIR / "sheet", ttl=SHEET_TTL).start()
 
-df['PEMINAT 2024'] = df.apply(
-    lambda row: row['DAYA TAMPUNG 2025'] if row['PEMINAT 2024'] == 0 else row['PEMINAT 2024'], axis=1
-)
 
 # --- Preprocessing ---
-df.columns = df.columns.str.strip()
-df['NAMA'] = df['NAMA'].astype(str)
-df['ASAL UNIV'] = df['ASAL UNIV'].astype(str)
-df['DAYA TAMPUNG 2025'] = pd.to_numeric(df['DAYA TAMPUNG 2025'], errors='coerce')
-df['PEMINAT 2024'] = pd.to_numeric(df['PEMINAT 2024'], errors='coerce')
+# Parsing dan konversi tipe (lihat snbp.ingest.SCHEMA) hanya dijalankan sekali per versi data,
+# hasilnya ditulis sebagai snapshot Arrow yang di-memory-map dan dibagi semua sesi dan proses server
+@st.cache_resource
+def get_shared_dataset():
+    return SharedDataset(CACHE_DIR / "dataset")
+
+
+@METRICS.cached("load_dataset", st.cache_resource(show_spinner=False))
+def load_dataset(version, _data):
+    return get_shared_dataset().get(version, lambda: read_dataset(_data))
+
+
+# --- Kubus agregat: semua groupby/top-N dibangun sekali per versi data dan dibagi antar sesi ---
+@METRICS.cached("get_cube", st.cache_resource(show_spinner=False))
+def get_cube(version, _df):
+    return AggregateCube(_df)
+
+
+# --- Indeks filter bertingkat: jalur kunci -> posisi baris dan pilihan tingkat berikutnya ---
+# Dibangun sekali per versi data; setiap langkah cascade cukup satu lookup dict, tanpa memindai df.
+LEVEL_WILAYAH = ('PROVINSI', 'ASAL UNIV', 'KATEGORI JURUSAN')
+LEVEL_JALUR = ('JALUR', 'KATEGORI JURUSAN')
+
+
+@METRICS.cached("get_index", st.cache_resource(show_spinner=False))
+def get_index(version, levels, _df):
+    return CascadeIndex(_df, levels)
+
+
+# --- Indeks pencarian fuzzy NAMA / ASAL UNIV / PROSPEK KERJA (lihat snbp.search) ---
+# Selectbox hanya mengirim hasil pencarian (paling banyak DEFAULT_LIMIT pilihan), bukan seluruh katalog.
+@METRICS.cached("get_search_index", st.cache_resource(show_spinner=False))
+def get_search_index(version, _df):
+    return SearchIndex(_df)
+
+
+# --- Indeks tetangga terdekat untuk "jurusan serupa yang lebih sepi" (lihat snbp.neighbors) ---
+@METRICS.cached("get_neighbor_index", st.cache_resource(show_spinner=False))
+def get_neighbor_index(version, _df):
+    return NeighborIndex(_df)
+
+
+def pilihan_cari(indeks_cari, kolom, kueri):
+    """Nilai ``kolom`` yang cocok dengan ``kueri``; yang paling sering muncul bila kueri kosong atau tidak cocok."""
+    if kueri:
+        hasil = indeks_cari.values_for(kueri, kolom)
+        if hasil:
+            return hasil
+        st.caption(f"Tidak ada {kolom} yang cocok dengan \"{kueri}\"; menampilkan yang paling sering muncul.")
+    return indeks_cari.popular(kolom)
+
+
+with METRICS.section("muat_data"):
+    snapshot = get_loader().get()
+    df = load_dataset(snapshot.version, snapshot.data)
+    cube = get_cube(snapshot.version, df)
+    indeks_wilayah = get_index(snapshot.version, LEVEL_WILAYAH, df)
+    indeks_jalur = get_index(snapshot.version, LEVEL_JALUR, df)
+
+
+# --- Bagian dashboard yang dijalankan ulang sendiri-sendiri ---
+# Setiap bagian adalah fragment Streamlit: perubahan widget di dalamnya hanya menjalankan ulang
+# fungsi bagian tersebut, bukan seluruh halaman. Data yang dibutuhkan dikirim lewat argumen,
+# widget yang memengaruhinya didefinisikan di dalam fungsi. Durasi eksekusi terakhir tiap bagian
+# dicatat di st.session_state[DURASI_BAGIAN] (dipakai bench/rerun_latency.py), metrik rerun
+# terakhir sesi ini di st.session_state[METRIK_RERUN].
+DURASI_BAGIAN = "_durasi_bagian"
+METRIK_RERUN = "_metrik_rerun"
+
+
+def bagian(func):
+    @functools.wraps(func)
+    def dengan_waktu(*args, **kwargs):
+        # Rerun fragment saja tidak melewati awal script, jadi dicatat sebagai rerun tersendiri
+        fragment_saja = METRICS.current_run() is None
+        if fragment_saja:
+            METRICS.begin_run()
+        mulai = time.perf_counter()
+        selesai = False
+        try:
+            with METRICS.section(func.__name__):
+                hasil = func(*args, **kwargs)
+            selesai = True
+            return hasil
+        finally:
+            st.session_state.setdefault(DURASI_BAGIAN, {})[func.__name__] = time.perf_counter() - mulai
+            # st.rerun() (mis. klik peta) atau error menghentikan script sebelum end_run di akhir app.py;
+            # rerun ditutup di sini agar rerun fragment berikutnya di thread yang sama tidak ikut tercatat
+            if fragment_saja or not selesai:
+                run = METRICS.end_run()
+                if run is not None:
+                    st.session_state[METRIK_RERUN] = run.as_dict()
+
+    return st.experimental_fragment(dengan_waktu)
+
+
+# --- Bagian berat baru dihitung setelah dibuka ---
+# Render pertama hanya memuat Statistik Umum, Top 10 rasio, peminat per provinsi, dan ringkasan jalur.
+# Bagian lain menampilkan judul + placeholder, dan isinya baru dihitung setelah toggle "Tampilkan"
+# dinyalakan. Toggle berada di dalam fragment bagian itu sendiri, jadi membukanya hanya menjalankan
+# fragment tersebut; status buka tersimpan per sesi. URL dengan ?buka=semua membuka semuanya sejak awal
+# (dipakai benchmark untuk mengukur halaman penuh).
+def dibuka(judul, kunci, keterangan):
+    """Judul bagian + toggle "Tampilkan" (key ``kunci``); ``True`` bila isinya perlu dihitung sekarang."""
+    if kunci not in st.session_state:
+        st.session_state[kunci] = st.query_params.get("buka") == "semua"
+    col_judul, col_buka = st.columns([5, 1])
+    col_judul.header(judul)
+    if col_buka.toggle("Tampilkan", key=kunci):
+        return True
+    st.info(f"{keterangan} Nyalakan **Tampilkan** untuk memuat bagian ini.", icon="⏸️")
+    return False
+
+
+def bagian_tunda(judul, keterangan):
+    """Seperti ``bagian``, tetapi fungsi baru dijalankan setelah dibuka (toggle ``buka_<nama fungsi>``)."""
+    def dekorator(func):
+        @functools.wraps(func)
+        def tertunda(*args, **kwargs):
+            if dibuka(judul, f"buka_{func.__name__}", keterangan):
+                with st.spinner(f"Memuat {judul}..."):
+                    return func(*args, **kwargs)
+
+        return bagian(tertunda)
+
+    return dekorator
+
+
+# --- Panel debug performa (opt-in lewat ?debug=1) ---
+LACAK_ALOKASI = "_lacak_alokasi"
+
+
+def atur_tracemalloc():
+    if st.session_state[LACAK_ALOKASI]:
+        tracemalloc.start()
+    else:
+        tracemalloc.stop()
+
+
+def panel_debug(rerun):
+    with st.sidebar:
+        st.header("🛠️ Debug Performa")
+        st.caption("Rerun terakhir sesi ini")
+        st.dataframe(pd.DataFrame(
+            [
+                {
+                    'Bagian': nama,
+                    'Waktu (ms)': round(hasil['seconds'] * 1000, 1),
+                    'Alokasi puncak (KB)': None if hasil['alloc_bytes'] is None else round(hasil['alloc_bytes'] / 1024),
+                }
+                for nama, hasil in rerun['sections'].items()
+            ],
+            columns=['Bagian', 'Waktu (ms)', 'Alokasi puncak (KB)'],
+        ), hide_index=True, use_container_width=True)
+        st.dataframe(pd.DataFrame(
+            [{'Cache': nama, 'Hit': hasil['hits'], 'Miss': hasil['misses']} for nama, hasil in rerun['caches'].items()],
+            columns=['Cache', 'Hit', 'Miss'],
+        ), hide_index=True, use_container_width=True)
+
+        st.toggle(
+            "Lacak alokasi memori (tracemalloc)", value=tracemalloc.is_tracing(), key=LACAK_ALOKASI,
+            on_change=atur_tracemalloc, help="Berlaku untuk seluruh proses dan memperlambat semua sesi.",
+        )
+        st.caption(f"Kumulatif proses: {METRICS.reruns} rerun")
+        st.download_button("⬇️ Metrik (JSON)", METRICS.to_json(), file_name="metrik_snbp.json", mime="application/json")
+        st.download_button("⬇️ Metrik (Prometheus)", METRICS.to_prometheus(), file_name="metrik_snbp.prom", mime="text/plain")
+        if METRICS_PORT:
+            st.caption(f"Endpoint scraper: http://127.0.0.1:{METRICS_PORT}/metrics")
+
+
+# --- Layout 2 kolom visualisasi ---
+def dua_kolom_chart(title1, chart1, insight1, title2, chart2, insight2):
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader(title1)
+        st.plotly_chart(chart1, use_container_width=True)
+        st.markdown(insight1)
+    with col2:
+        st.subheader(title2)
+        st.plotly_chart(chart2, use_container_width=True)
+        st.markdown(insight2)
+
+
+# --- Tabel dengan paging, pengurutan, dan pilihan kolom di sisi server ---
+# Browser hanya menerima satu halaman. Filter dikirim sebagai posisi baris (rows) agar dataset
+# tidak disalin; widget tabel memakai key berawalan `key` sehingga beberapa tabel bisa berdampingan.
+KOLOM_DETAIL = [
+    'NAMA', 'ASAL UNIV', 'JENJANG', 'JALUR', 'DAYA TAMPUNG 2025',
+    'PEMINAT 2024', 'RASIO_LABEL', 'KATEGORI JURUSAN', 'PROSPEK KERJA'
+]
+TANPA_URUTAN = "(urutan data)"
+
+
+def tabel_halaman(frame, key, rows=None, columns=None, page_size=PAGE_SIZE):
+    semua_kolom = list(frame.columns)
+    col_kolom, col_urut, col_arah = st.columns([3, 2, 1])
+    kolom = col_kolom.multiselect(
+        "Kolom", semua_kolom,
+        default=[c for c in (columns or semua_kolom) if c in semua_kolom], key=f"{key}_kolom"
+    )
+    urut = col_urut.selectbox("Urutkan berdasarkan", [TANPA_URUTAN] + semua_kolom, key=f"{key}_urut")
+    menurun = col_arah.toggle("Menurun", key=f"{key}_menurun")
+
+    total = len(frame) if rows is None else len(rows)
+    jumlah_halaman = max(1, math.ceil(total / page_size))
+    # Filter baru bisa membuat nomor halaman lama di luar jangkauan
+    if st.session_state.get(f"{key}_halaman", 1) > jumlah_halaman:
+        st.session_state[f"{key}_halaman"] = 1
+    halaman = st.number_input(
+        f"Halaman (dari {jumlah_halaman})", min_value=1, max_value=jumlah_halaman, step=1, key=f"{key}_halaman"
+    )
+
+    hasil = paginate(
+        frame, halaman, page_size,
+        sort_by=None if urut == TANPA_URUTAN else urut, ascending=not menurun,
+        columns=kolom or semua_kolom, rows=rows,
+    )
+    st.dataframe(hasil.rows, use_container_width=True, hide_index=True)
+    if hasil.total:
+        st.caption(f"Menampilkan baris {hasil.start + 1}–{hasil.start + len(hasil.rows)} dari {hasil.total:,}")
+    else:
+        st.caption("Tidak ada baris untuk pilihan ini.")
+
+
+@bagian
+def bagian_rasio(indeks_jalur, cube, version):
+    """Top 10 rasio keketatan. Widget: jalur_rasio, kategori_rasio."""
+    st.header("📊 Top 10 Jurusan dengan Rasio Keketatan Tertinggi")
+
+    # --- Filter berdasarkan jalur & kategori jurusan ---
+    col_jalur, col_kategori = st.columns(2)
+    jalur_filter = col_jalur.selectbox("Pilih Jalur:", indeks_jalur.options(), key="jalur_rasio")
+    kategori_filter = col_kategori.selectbox("Pilih Kategori Jurusan:", indeks_jalur.options(jalur_filter), key="kategori_rasio")
+
+    # --- Diagram dan tabel Top 10 (lihat snbp.report.rasio_report) ---
+    laporan = rasio_report(cube, jalur_filter, kategori_filter, version)
+    st.plotly_chart(laporan.charts['top10'], use_container_width=True)
+
+    # --- Tabel detail ---
+    st.subheader("📋 Detail Top 10 Jurusan Berdasarkan Rasio Keketatan")
+    st.dataframe(laporan.tables['top10'])
+
+
+# --- Peta choropleth provinsi dari bundel geometri lokal (lihat snbp.geo); None bila file bundel tidak ada ---
+@st.cache_resource(show_spinner=False)
+def get_geo_bundle():
+    return GeoBundle.load(GEO_BUNDLE)
+
+
+UKURAN_PETA = {
+    'Peminat 2024': 'PEMINAT 2024',
+    'Daya Tampung 2025': 'DAYA TAMPUNG 2025',
+    'Rata-rata Rasio Keketatan (%)': 'RASIO RATA-RATA',
+}
+
+# Klik provinsi di peta langsung memilih drill-down (event seleksi plotly, key KLIK_PETA)
+KLIK_PETA = "peta_provinsi"
+KUNCI_PROVINSI = "provinsi_terpilih"
+# Toggle "Tampilkan" drill-down provinsi (bagian_tunda: buka_<nama fungsi>); klik peta ikut membukanya
+BUKA_PROVINSI = "buka_bagian_provinsi_terpilih"
+PETA_TERAKHIR = "_peta_provinsi_terakhir"
+
+
+@METRICS.cached("get_data_peta", st.cache_resource(show_spinner=False))
+def get_data_peta(version, _cube, _geo):
+    data = _cube.profile('PROVINSI')[['PROVINSI', 'PEMINAT 2024', 'DAYA TAMPUNG 2025', 'JUMLAH', 'JUMLAH PTN']]
+    # Rata-rata tanpa rasio inf (program tanpa peminat) agar skala warna tetap bermakna
+    rasio = _cube.rows['RASIO KEKETATAN']
+    rata_rata = rasio.mask(rasio.abs() == math.inf).groupby(_cube.rows['PROVINSI'], observed=True).mean()
+    return data.assign(**{
+        'RASIO RATA-RATA': rata_rata.reindex(data['PROVINSI']).to_numpy(),
+        'ID PETA': _geo.keys(data['PROVINSI'].astype(str)),
+    })
+
+
+@bagian
+def bagian_peta_provinsi(cube, version, geo):
+    """Choropleth provinsi; klik provinsi = Pilih Provinsi. Widget: ukuran_peta, detail_peta, peta_provinsi."""
+    col_ukuran, col_detail = st.columns([2, 1])
+    label = col_ukuran.radio("Warnai menurut", list(UKURAN_PETA), horizontal=True, key="ukuran_peta")
+    level = col_detail.radio("Detail peta", list(LEVELS), horizontal=True, key="detail_peta")
+    ukuran = UKURAN_PETA[label]
+
+    data = get_data_peta(version, cube, geo)
+    di_peta = data['ID PETA'].notna()
+    fig = FIGURES.choropleth(
+        "provinsi.peta", data[di_peta], state=(ukuran, level), version=version,
+        geojson=geo.geojson(level), locations='ID PETA', featureidkey='id', color=ukuran,
+        color_continuous_scale='Blues', hover_name='PROVINSI',
+        hover_data={'ID PETA': False, 'JUMLAH PTN': True, 'JUMLAH': True},
+        labels={ukuran: label, 'JUMLAH PTN': 'Jumlah Universitas', 'JUMLAH': 'Jumlah Program Studi'},
+        title=f"{label} per Provinsi",
+        layout=dict(geo=dict(fitbounds='locations', visible=False), margin=dict(l=0, r=0, t=40, b=0)),
+    )
+
+    event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", selection_mode="points", key=KLIK_PETA)
+    # point_index = urutan baris frame peta (baris yang ada di geometri)
+    klik = [data.loc[di_peta, 'PROVINSI'].iloc[titik['point_index']] for titik in event.selection.points]
+    # Hanya klik baru yang mengubah pilihan; seleksi lama tetap ada setelah Pilih Provinsi diganti manual
+    if klik and klik[0] != st.session_state.get(PETA_TERAKHIR):
+        st.session_state[PETA_TERAKHIR] = klik[0]
+        st.session_state[KUNCI_PROVINSI] = klik[0]
+        st.session_state[BUKA_PROVINSI] = True
+        st.rerun()
+    st.caption("Klik provinsi pada peta (atau pilih di daftar **Pilih Provinsi** di bawah) untuk melihat detailnya.")
+
+    if not di_peta.all():
+        st.caption(f"Tidak ditemukan di geometri peta: {', '.join(data.loc[~di_peta, 'PROVINSI'].astype(str))}.")
+    if geo.attribution:
+        st.caption(geo.attribution)
+
+
+@bagian_tunda("📍 Drill-down Provinsi", "Jurusan dengan peminat terbanyak/tersedikit dan daftar universitas di satu provinsi.")
+def bagian_provinsi_terpilih(df, cube, indeks_wilayah, df_provinsi, version):
+    """Drill-down satu provinsi. Widget: Pilih Provinsi (key provinsi_terpilih, juga diisi klik peta)."""
+    # --- Fitur Pilih Provinsi ---
+    provinsi_terpilih = st.selectbox("Pilih Provinsi", df_provinsi['PROVINSI'].unique(), key=KUNCI_PROVINSI)
+
+    # --- Posisi baris Provinsi Terpilih dari indeks (tabel detail di-page, data tidak disalin) ---
+    baris_provinsi_terpilih = indeks_wilayah.rows(provinsi_terpilih)
+
+    # --- Diagram peminat terbanyak/tersedikit dan insight (lihat snbp.report.province_report) ---
+    laporan = province_report(cube, provinsi_terpilih, version)
+
+    # Menampilkan kedua diagram batang di Streamlit
+    st.subheader(f"📊 Jurusan dengan Peminat Terbanyak di {provinsi_terpilih}")
+    st.plotly_chart(laporan.charts['terbanyak'], use_container_width=True)
+
+    st.subheader(f"📊 Jurusan dengan Peminat Paling Sedikit di {provinsi_terpilih}")
+    st.plotly_chart(laporan.charts['tersedikit'], use_container_width=True)
+
+    # --- Insight Otomatis ---
+    st.subheader("📊 Insight Otomatis")
+    for teks in laporan.insights['insight']:
+        st.write(teks)
+
+    # --- Tabel Detail ---
+    st.subheader(f"📋 Detail Universitas per Provinsi {provinsi_terpilih}")
+    tabel_halaman(df, "tabel_provinsi_terpilih", rows=baris_provinsi_terpilih, columns=KOLOM_DETAIL)
+
+
+@bagian_tunda("🎯 Eksplorasi Jurusan Berdasarkan Provinsi, Universitas, dan Kategori",
+              "Telusuri program studi per provinsi, universitas, dan kategori jurusan.")
+def bagian_eksplorasi(df, cube, indeks_wilayah, version):
+    """Cascade Provinsi -> Universitas -> Kategori. Widget: cari_univ_eksplorasi, tiga selectbox cascade."""
+
+    # --- Pencarian universitas: hasil yang dipilih langsung mengisi Provinsi dan Universitas ---
+    opsi_provinsi = indeks_wilayah.options()
+    indeks_provinsi, univ_dicari = 0, None
+    kueri_univ = st.text_input("🔎 Cari Universitas", key="cari_univ_eksplorasi")
+    if kueri_univ:
+        hasil_cari = get_search_index(version, df).values_for(kueri_univ, 'ASAL UNIV')
+        if hasil_cari:
+            univ_dicari = st.selectbox("Hasil pencarian", hasil_cari, key="hasil_cari_univ")
+            indeks_provinsi = next(
+                i for i, provinsi in enumerate(opsi_provinsi) if univ_dicari in indeks_wilayah.options(provinsi)
+            )
+        else:
+            st.caption(f"Tidak ada universitas yang cocok dengan \"{kueri_univ}\".")
+
+    # --- Dropdown untuk memilih Provinsi ---
+    # Pilihan tiap tingkat diambil dari indeks (lookup konstan, tanpa filter df)
+    provinsi_terpilih = st.selectbox("📍 Pilih Provinsi", options=opsi_provinsi, index=indeks_provinsi)
+
+    # --- Dropdown untuk memilih Universitas dari provinsi yang dipilih ---
+    opsi_univ = indeks_wilayah.options(provinsi_terpilih)
+    indeks_univ = opsi_univ.index(univ_dicari) if univ_dicari in opsi_univ else 0
+    univ_terpilih = st.selectbox("🏫 Pilih Universitas", options=opsi_univ, index=indeks_univ)
+
+    # --- Dropdown untuk memilih Kategori Jurusan ---
+    kategori_terpilih = st.selectbox("📊 Pilih Kategori Jurusan", options=indeks_wilayah.options(provinsi_terpilih, univ_terpilih))
+
+    # --- Total peminat, daya tampung, rata-rata rasio per jurusan (jika ada duplikat nama) ---
+    # Urut dari jumlah peminat tertinggi
+    df_jurusan = cube.ranking('NAMA', 'PEMINAT 2024', where={
+        'PROVINSI': provinsi_terpilih,
+        'ASAL UNIV': univ_terpilih,
+        'KATEGORI JURUSAN': kategori_terpilih,
+    })
+
+    # --- Visualisasi diagram batang ---
+    fig = FIGURES.bar(
+        "eksplorasi.jurusan", df_jurusan,
+        state=(provinsi_terpilih, univ_terpilih, kategori_terpilih), version=version,
+        x='NAMA',
+        y='PEMINAT 2024',
+        title=f"Jumlah Peminat Jurusan di {univ_terpilih} ({kategori_terpilih})",
+        labels={'NAMA': 'Nama Jurusan', 'PEMINAT 2024': 'Jumlah Peminat'},
+        hover_data={
+            'DAYA TAMPUNG 2025': True,
+            'RASIO KEKETATAN': True,
+            'PROSPEK KERJA': True,
+        },
+        layout=dict(xaxis_tickangle=-45),
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # --- Insight Otomatis ---
+    st.subheader("📌 Insight Otomatis")
+
+    if not df_jurusan.empty:
+        tertinggi = df_jurusan.iloc[0]
+        terendah = df_jurusan.iloc[-1]
+
+        st.markdown(f"✅ **Jurusan dengan peminat terbanyak** adalah **{tertinggi['NAMA']}** dengan **{tertinggi['PEMINAT 2024']} peminat**.")
+        st.markdown(f"⚠️ **Jurusan dengan peminat paling sedikit** adalah **{terendah['NAMA']}** dengan **{terendah['PEMINAT 2024']} peminat**.")
+
+        st.markdown("📢 **Rekomendasi:**")
+        if kategori_terpilih == 'SEPI PEMINAT':
+            st.write(f"- Jurusan-jurusan ini memiliki peminat rendah. Rekomendasi untuk universitas: perkuat promosi dan kolaborasi dengan industri terkait seperti bidang **{terendah['PROSPEK KERJA']}**.")
+        else:
+            st.write(f"- Jurusan dengan peminat tinggi seperti **{tertinggi['NAMA']}** mungkin perlu penambahan **daya tampung** untuk mengakomodasi permintaan yang tinggi.")
+    else:
+        st.warning("Data tidak tersedia untuk pilihan ini.")
+
+    # --- Tabel Detail Pilihan ---
+    st.subheader(f"📋 Detail Program Studi {univ_terpilih} ({kategori_terpilih})")
+    baris_terpilih = indeks_wilayah.rows(provinsi_terpilih, univ_terpilih, kategori_terpilih)
+    tabel_halaman(df, "tabel_eksplorasi", rows=baris_terpilih, columns=KOLOM_DETAIL)
+
+
+KOLOM_ALTERNATIF = [
+    'NAMA', 'ASAL UNIV', 'PROVINSI', 'JENJANG', 'PROSPEK KERJA',
+    'DAYA TAMPUNG 2025', 'PEMINAT 2024', 'RASIO_LABEL', 'KATEGORI JURUSAN', 'JARAK'
+]
+
+
+@bagian_tunda("🔁 Jurusan Serupa yang Lebih Sepi Peminat", "Cari program serupa dengan persaingan yang lebih longgar.")
+def bagian_alternatif(df, version):
+    """Program serupa dengan persaingan lebih longgar. Widget: cari_alternatif, nama_alternatif, program_alternatif, jumlah_alternatif."""
+    st.caption(
+        "Program dengan prospek kerja, jenjang, provinsi, daya tampung, dan jumlah peminat yang mirip, "
+        "tetapi rasio keketatannya lebih tinggi (lebih banyak kursi per peminat) pada jalur yang sama."
+    )
+    indeks_tetangga = get_neighbor_index(version, df)
+
+    # --- Program acuan: cari nama jurusan, lalu pilih universitas dan jalurnya ---
+    col_nama, col_program = st.columns(2)
+    kueri = col_nama.text_input("🔎 Cari jurusan acuan", key="cari_alternatif")
+    nama = col_nama.selectbox(
+        "Jurusan acuan", pilihan_cari(get_search_index(version, df), 'NAMA', kueri), key="nama_alternatif"
+    )
+    posisi = indeks_tetangga.programs(nama)
+    label_program = (df['ASAL UNIV'].iloc[posisi].astype(str) + " — " + df['JALUR'].iloc[posisi].astype(str)).tolist()
+    pilihan = col_program.selectbox(
+        "Universitas — Jalur", range(len(posisi)), format_func=label_program.__getitem__, key="program_alternatif"
+    )
+    jumlah = col_program.slider("Jumlah alternatif", 5, 30, DEFAULT_K, key="jumlah_alternatif")
+    if pilihan is None:
+        st.warning("Data tidak tersedia untuk pilihan ini.")
+        return
+
+    acuan = df.iloc[posisi[pilihan]]
+    st.markdown(
+        f"Acuan: **{acuan['NAMA']}** di **{acuan['ASAL UNIV']}** ({acuan['JALUR']}, {acuan['PROVINSI']}) — "
+        f"{acuan['PEMINAT 2024']} peminat, daya tampung {acuan['DAYA TAMPUNG 2025']}, rasio keketatan **{acuan['RASIO_LABEL']}**."
+    )
+    alternatif = indeks_tetangga.alternatives(posisi[pilihan], jumlah)
+    if alternatif.empty:
+        st.info("Tidak ada program serupa dengan rasio keketatan yang lebih longgar.")
+    else:
+        st.dataframe(alternatif[KOLOM_ALTERNATIF], hide_index=True, use_container_width=True)
+
+
+@bagian
+def bagian_jalur(cube, version):
+    """Semua diagram dan insight yang bergantung pada pilihan jalur.
+
+    Widget: Pilih Jalur, buka_jalur_keseluruhan, buka_jalur_distribusi.
+    """
+    # --- Filter Jalur ---
+    st.header("🎛️ Filter Jalur Masuk")
+    pilihan_jalur = st.radio("Pilih Jalur:", JALUR_OPTIONS)
+
+    # --- Diagram, tabel, dan insight jalur terpilih (lihat snbp.report.jalur_report) ---
+    # Kelompok "keseluruhan" dan "distribusi" baru dibangun setelah panelnya dibuka
+    laporan = jalur_report(cube, pilihan_jalur, version, groups=["ringkas"])
+    chart, insight = laporan.charts, laporan.insights
+
+    # --- Tampilkan Diagram Peminat 0 - 50 ---
+    st.subheader("📊 Diagram Jurusan IPS dengan Jumlah Peminat antara 0 dan 50")
+    st.plotly_chart(chart['sepi_top10'], use_container_width=True)
+
+    # --- Tabel Insight untuk Peminat 0 - 50 ---
+    st.write("Pemetaan Jurusan dengan Peminat Rendah (0 - 50):")
+    st.write(laporan.tables['sepi_top10'])
+
+    # --- Tampilkan Diagram Peminat lebih dari 50 ---
+    st.subheader("📊 Diagram Jurusan IPS dengan Jumlah Peminat lebih dari 50")
+    st.plotly_chart(chart['ramai_top10'], use_container_width=True)
+
+    # --- Tabel Insight untuk Peminat lebih dari 50 ---
+    st.write("Pemetaan Jurusan dengan Peminat Tinggi (> 50):")
+    st.write(laporan.tables['ramai_top10'])
+
+    # --- Diagram Peminat (Top 20 & Bottom 20) ---
+    dua_kolom_chart("🔝 Top 20 Peminat", chart['top_peminat'], insight['top_peminat'],
+                    "🔻 Bottom 20 Peminat", chart['bottom_peminat'], insight['bottom_peminat'])
+
+    # --- Diagram Daya Tampung (Top 20 & Bottom 20) ---
+    dua_kolom_chart("🔝 Top 20 Daya Tampung", chart['top_dt'], insight['top_dt'],
+                    "🔻 Bottom 20 Daya Tampung", chart['bottom_dt'], insight['bottom_dt'])
+
+    # --- Diagram Keseluruhan per Jurusan (semua NAMA, dibangun saat dibuka) ---
+    if dibuka("📈 Visualisasi Keseluruhan per Jurusan", "buka_jalur_keseluruhan",
+              f"Jumlah peminat dan daya tampung semua jurusan pada jalur {pilihan_jalur}."):
+        with st.spinner("Memuat diagram keseluruhan..."):
+            laporan = jalur_report(cube, pilihan_jalur, version, groups=["keseluruhan"])
+            chart, insight = laporan.charts, laporan.insights
+
+            # --- Diagram Peminat Keseluruhan (Terurut) ---
+            st.subheader("📈 Visualisasi Keseluruhan Jumlah Peminat per Jurusan")
+            st.plotly_chart(chart['all_peminat'], use_container_width=True)
+            st.markdown(insight['all_peminat'])
+
+            # --- Diagram Daya Tampung Keseluruhan (Terurut) ---
+            st.subheader("📥 Visualisasi Keseluruhan Daya Tampung per Jurusan")
+            st.plotly_chart(chart['all_daya'], use_container_width=True)
+            st.markdown(insight['all_daya'])
+
+    # --- Distribusi jenjang, perbandingan, prospek kerja, universitas (dibangun saat dibuka) ---
+    if dibuka("🎓 Distribusi Jenjang, Prospek Kerja, dan Universitas", "buka_jalur_distribusi",
+              "Distribusi jenjang, perbandingan peminat vs daya tampung, prospek kerja, dan jumlah jurusan per universitas."):
+        with st.spinner("Memuat diagram distribusi..."):
+            laporan = jalur_report(cube, pilihan_jalur, version, groups=["distribusi"])
+            chart, insight = laporan.charts, laporan.insights
+
+            # --- Pie Chart Jenjang ---
+            st.subheader("🎓 Distribusi Jenjang Pendidikan")
+            st.plotly_chart(chart['jenjang'], use_container_width=True)
+            st.markdown(insight['jenjang'])
+
+            # --- Perbandingan Peminat vs Daya Tampung (Top & Bottom 10) ---
+            st.subheader("📊 Perbandingan Peminat vs Daya Tampung")
+            dua_kolom_chart("Top 10 Peminat vs Daya Tampung", chart['top10_compare'], insight['top10_compare'],
+                            "Bottom 10 Peminat vs Daya Tampung", chart['bottom10_compare'], insight['bottom10_compare'])
+
+            # --- Diagram Prospek Kerja ---
+            st.subheader("💼 Persebaran Prospek Kerja")
+            st.plotly_chart(chart['prospek'], use_container_width=True)
+            st.markdown(insight['prospek'])
+
+            # --- Diagram Jumlah Jurusan per Universitas (Top 20 & Bottom 20) ---
+            st.subheader("🏫 Jumlah Jurusan per Universitas")
+            dua_kolom_chart("🏆 Top 20 Universitas", chart['top_univ'], insight['top_univ'],
+                            "📉 Bottom 20 Universitas", chart['bottom_univ'], insight['bottom_univ'])
+
+
+# --- Riwayat multi-tahun: snapshot sheet ditambahkan sekali per versi data ---
+# Hanya partisi TAHUN/JALUR yang berubah yang ditulis ulang; tren dibaca dari agregat per partisi.
+@st.cache_resource
+def get_history():
+    return HistoryStore(HISTORY_DIR)
+
+
+@METRICS.cached("sync_history", st.cache_resource(show_spinner=False))
+def sync_history(version, _df):
+    return get_history().append(_df)
+
+
+@bagian_tunda("📈 Tren Antar Tahun", "Perubahan peminat, daya tampung, dan rasio keketatan dari riwayat multi-tahun.")
+def bagian_tren(history):
+    """Tren antar tahun dari agregat riwayat. Widget: provinsi_tren, ukuran_tren."""
+    tahun = history.years()
+
+    col_provinsi, col_ukuran = st.columns(2)
+    daftar_provinsi = sorted(history.aggregates()['PROVINSI'].unique())
+    provinsi = col_provinsi.selectbox("Provinsi", ["Semua Provinsi"] + daftar_provinsi, key="provinsi_tren")
+    ukuran = col_ukuran.radio("Ukuran", ["PEMINAT", "DAYA TAMPUNG", "RASIO KEKETATAN"], horizontal=True, key="ukuran_tren")
+
+    where = None if provinsi == "Semua Provinsi" else {'PROVINSI': provinsi}
+    tren_jalur = history.trends(by=['JALUR'], where=where)
+    # Riwayat bisa berubah tanpa versi dataset baru (python -m snbp.history), jadi hanya memakai template
+    fig_tren = FIGURES.line(
+        "tren.jalur", tren_jalur, x='TAHUN', y=ukuran, color='JALUR', markers=True,
+        title=f"Tren {ukuran.title()} per Jalur ({provinsi})",
+        labels={'TAHUN': 'Tahun Penerimaan', 'RASIO KEKETATAN': 'Rasio Keketatan (%)'},
+        layout=dict(xaxis_dtick=1),
+    )
+    st.plotly_chart(fig_tren, use_container_width=True)
+
+    if len(tahun) < 2:
+        st.info("Riwayat baru memuat satu tahun. Tambahkan sheet tahun sebelumnya dengan "
+                f"`python -m snbp.history {HISTORY_DIR} sheet_tahun_lalu.csv`.")
+        return
+
+    # Insight perubahan dari tahun pertama ke tahun terakhir (semua jalur)
+    tren = history.trends(where=where).set_index('TAHUN')
+    awal, akhir = tren.iloc[0], tren.iloc[-1]
+    perubahan = (akhir['PEMINAT'] - awal['PEMINAT']) / awal['PEMINAT'] * 100 if awal['PEMINAT'] else float("nan")
+    st.markdown(
+        f"📌 Dari **{tahun[0]}** ke **{tahun[-1]}**, jumlah peminat di **{provinsi}** berubah **{perubahan:+.1f}%** "
+        f"({int(awal['PEMINAT']):,} → {int(akhir['PEMINAT']):,}), sedangkan daya tampung "
+        f"{int(awal['DAYA TAMPUNG']):,} → {int(akhir['DAYA TAMPUNG']):,} kursi."
+    )
+
+
+# --- Model yang dipakai: yang dipromosikan di registry (python -m snbp.evaluate --promote) ---
+# Model yang dipromosikan hanya dipakai bila dilatih dengan data saat ini (data_key == training_key).
+# Selain itu RandomForest diambil dari cache (memori/disk) dan dilatih ulang hanya jika data berubah;
+# model ini baru dipanggil saat pengguna menekan "Prediksi Kategori" atau mengunggah file.
+@st.cache_resource
+def get_registry():
+    return ModelRegistry(REGISTRY_DIR)
+
+
+@st.cache_resource
+def get_model_store():
+    store = ModelStore(MODEL_DIR)
+    store.warm()
+    return store
+
+
+@METRICS.cached("get_training_key", st.cache_resource(show_spinner=False))
+def get_training_key(version, _df):
+    return training_key(_df, FEATURES)
+
+
+@METRICS.cached("get_model", st.cache_resource(show_spinner="Menyiapkan model..."))
+def get_model(version, promoted_id, _df):
+    if promoted_id is not None:
+        return get_registry().load(promoted_id)
+    return get_model_store().get(_df, FEATURES)
+
+
+def promosi_aktif(version, df):
+    """Entri registry yang dipromosikan bila dilatih dengan data versi ini, selain itu ``None``."""
+    promoted = get_registry().promoted()
+    if promoted is not None and promoted['data_key'] == get_training_key(version, df):
+        return promoted
+    return None
+
+
+def model_aktif(version, df):
+    promoted = promosi_aktif(version, df)
+    return get_model(version, promoted['id'] if promoted else None, df)
+
+
+# --- Pilihan form = classes_ LabelEncoder, diambil dari dataset tanpa memuat model ---
+@st.cache_resource(show_spinner=False)
+def get_feature_options(version, _df):
+    return feature_options(_df)
+
+
+@bagian_tunda("🔮 Prediksi Kategori Jurusan IPS (Ramai atau Sepi Peminat)",
+              "Prediksi kategori dengan model RandomForest (model dimuat atau dilatih saat bagian ini dibuka).")
+def bagian_prediksi(df, version):
+    """Form prediksi satuan dan prediksi massal. Widget: cari_nama/cari_univ/cari_prospek, form_prediksi, file_prediksi_massal."""
+    promoted = promosi_aktif(version, df)
+    if promoted:
+        # Pilihan form mengikuti encoder model yang benar-benar melayani prediksi
+        opsi = get_model(version, promoted['id'], df).options()
+        st.caption(
+            f"Model aktif: **{promoted['name']}** — akurasi {promoted['accuracy']:.3f}, "
+            f"F1 macro {promoted['f1_macro']:.3f} ({promoted['folds']}-fold CV, {promoted['rows']:,} baris)."
+        )
+    else:
+        opsi = get_feature_options(version, df)
+        usang = get_registry().promoted()
+        if usang:
+            st.caption(
+                f"Model aktif: Random Forest. Model **{usang['name']}** di registry dilatih dengan data lain "
+                f"(jalankan ulang `python -m snbp.evaluate --promote` untuk data saat ini)."
+            )
+        else:
+            st.caption("Model aktif: Random Forest (belum ada model yang dipromosikan di registry).")
+
+    entri_registry = get_registry().entries()
+    if entri_registry:
+        with st.expander("📋 Registry Model (hasil cross-validation)"):
+            st.dataframe(pd.DataFrame(entri_registry)[[
+                'id', 'accuracy', 'f1_macro', 'fit_seconds', 'predict_us_per_row', 'predict_single_ms', 'rows'
+            ]], hide_index=True, use_container_width=True)
+
+    # --- Form input pengguna ---
+    st.subheader("📝 Masukkan Data Jurusan")
+
+    # Pencarian di luar form agar pilihan langsung diperbarui saat mengetik (hanya fragment ini yang rerun)
+    indeks_cari = get_search_index(version, df)
+    col_cari_nama, col_cari_univ, col_cari_prospek = st.columns(3)
+    kueri_nama = col_cari_nama.text_input("🔎 Cari Nama Jurusan", key="cari_nama")
+    kueri_univ = col_cari_univ.text_input("🔎 Cari Asal Universitas", key="cari_univ")
+    kueri_prospek = col_cari_prospek.text_input("🔎 Cari Prospek Kerja", key="cari_prospek")
+
+    with st.form("form_prediksi"):
+        peminat = st.number_input("Peminat 2024", min_value=0)
+        daya_tampung = st.number_input("Daya Tampung 2025", min_value=0)
+
+        asal_univ = st.selectbox("Asal Universitas", pilihan_cari(indeks_cari, 'ASAL UNIV', kueri_univ))
+        provinsi = st.selectbox("Provinsi", opsi['PROVINSI'])
+        prospek = st.selectbox("Prospek Kerja", pilihan_cari(indeks_cari, 'PROSPEK KERJA', kueri_prospek))
+        jalur = st.selectbox("Jalur", opsi['JALUR'])
+        nama = st.selectbox("Nama Jurusan", pilihan_cari(indeks_cari, 'NAMA', kueri_nama))
+        jenjang = st.selectbox("Jenjang", opsi['JENJANG'])
+
+        pred_button = st.form_submit_button("Prediksi Kategori")
+
+    # --- Prediksi ---
+    if pred_button:
+        input_df = pd.DataFrame([{
+            'PEMINAT 2024': peminat,
+            'ASAL UNIV': asal_univ,
+            'PROVINSI': provinsi,
+            'DAYA TAMPUNG 2025': daya_tampung,
+            'PROSPEK KERJA': prospek,
+            'JALUR': jalur,
+            'NAMA': nama,
+            'JENJANG': jenjang,
+        }])
+        hasil = predict_table(model_aktif(version, df), input_df)
+        kategori = hasil['KATEGORI PREDIKSI'].iloc[0]
+        if kategori == UNKNOWN_LABEL:
+            st.warning(f"⚠️ Tidak dapat diprediksi: nilai {hasil['KOLOM TIDAK DIKENAL'].iloc[0]} tidak dikenal model.")
+        else:
+            st.success(f"✅ Prediksi: Jurusan ini termasuk **{kategori}**.")
+
+    # --- Prediksi Massal dari File ---
+    st.subheader("📂 Prediksi Massal dari File CSV/Parquet")
+    st.caption(f"File harus memuat kolom: {', '.join(FEATURES)}. Kategori yang tidak dikenal model ditandai dan tidak diprediksi.")
+
+    file_batch = st.file_uploader("Upload file program studi", type=["csv", "parquet"], key="file_prediksi_massal")
+    if file_batch is not None:
+        try:
+            df_batch = read_table(file_batch.getvalue(), file_batch.name)
+            hasil_batch = predict_table(model_aktif(version, df), df_batch)
+        except ValueError as exc:
+            st.error(f"❌ {exc}")
+        else:
+            jumlah_tidak_dikenal = int((hasil_batch['KATEGORI PREDIKSI'] == UNKNOWN_LABEL).sum())
+            st.write(f"Berhasil memprediksi **{len(hasil_batch) - jumlah_tidak_dikenal}** dari **{len(hasil_batch)}** baris.")
+            if jumlah_tidak_dikenal:
+                st.warning(f"⚠️ {jumlah_tidak_dikenal} baris memuat kategori/angka yang tidak dikenal model (lihat kolom KOLOM TIDAK DIKENAL).")
+            tabel_halaman(hasil_batch, "tabel_prediksi_massal")
+            st.download_button(
+                "⬇️ Unduh Hasil Prediksi (CSV)",
+                data=hasil_batch.to_csv(index=False).encode("utf-8"),
+                file_name="hasil_prediksi.csv",
+                mime="text/csv",
+            )
+
+
+# --- Simulasi skenario: array dasar per versi dataset, skenario dievaluasi sekaligus (lihat snbp.scenario) ---
+@METRICS.cached("get_scenario_engine", st.cache_resource(show_spinner=False))
+def get_scenario_engine(version, _df):
+    return ScenarioEngine(_df)
+
+
+# Rentang perubahan daya tampung (%) yang disapu bersama skenario pilihan untuk grafik sensitivitas
+SAPUAN_KAPASITAS = range(-50, 101, 10)
+
+KOLOM_SIMULASI = [
+    'NAMA', 'ASAL UNIV', 'JALUR', 'PROVINSI', 'DAYA TAMPUNG 2025', 'DAYA TAMPUNG SIMULASI',
+    'PEMINAT SIMULASI', 'RASIO_LABEL', 'RASIO_LABEL SIMULASI', 'KATEGORI JURUSAN', 'KATEGORI SIMULASI'
+]
+
+
+@bagian_tunda("🧪 Simulasi Skenario Daya Tampung dan Peminat",
+              "Hitung ulang rasio keketatan dan kategori untuk perubahan daya tampung/peminat.")
+def bagian_simulasi(df, version):
+    """Simulasi "bagaimana jika" daya tampung/peminat. Widget: kolom_simulasi, form_simulasi."""
+    st.caption(
+        "Ubah daya tampung dan/atau peminat untuk sebagian program, lalu lihat rasio keketatan, "
+        "Top 10 rasio, dan kategori hasil model yang baru. Semua skenario sapuan dihitung dalam satu batch."
+    )
+    opsi = get_feature_options(version, df)
+
+    # Di luar form agar pilihan nilai langsung mengikuti kolom yang dipilih
+    kolom = st.selectbox("Terapkan pada", ['PROVINSI', 'JALUR', 'ASAL UNIV', 'NAMA'], key="kolom_simulasi")
+    with st.form("form_simulasi"):
+        nilai = st.multiselect(f"{kolom.title()} (kosongkan untuk semua program)", opsi[kolom], key=f"nilai_simulasi_{kolom}")
+        kategori = st.multiselect(
+            "Kategori jurusan", ['SEPI PEMINAT', 'RAMAI PEMINAT'], default=['SEPI PEMINAT', 'RAMAI PEMINAT'], key="kategori_simulasi"
+        )
+        col_kapasitas, col_peminat = st.columns(2)
+        kapasitas = col_kapasitas.slider("Perubahan daya tampung (%)", -50, 100, 10, step=5, key="kapasitas_simulasi")
+        permintaan = col_peminat.slider("Perubahan peminat (%)", -50, 100, 0, step=5, key="peminat_simulasi")
+        jalur_top = st.selectbox("Top 10 rasio untuk jalur", ["Semua Jalur"] + list(opsi['JALUR']), key="jalur_simulasi")
+        jalankan = st.form_submit_button("Jalankan Simulasi")
+
+    if not jalankan:
+        return
+
+    where = {'KATEGORI JURUSAN': kategori}
+    if nilai:
+        where[kolom] = nilai
+    # Skenario 0 = data asli, 1 = pilihan pengguna, sisanya sapuan daya tampung dengan perubahan peminat yang sama
+    skenario = [Scenario("Data asli"), Scenario("Skenario pilihan", (Adjustment(where, 1 + kapasitas / 100, 1 + permintaan / 100),))]
+    skenario += [
+        Scenario(f"{persen:+d}%", (Adjustment(where, 1 + persen / 100, 1 + permintaan / 100),))
+        for persen in SAPUAN_KAPASITAS
+    ]
+    engine = get_scenario_engine(version, df)
+    hasil = engine.evaluate(skenario)
+    hasil.classify(model_aktif(version, df))
+    ringkasan = hasil.summary()
+
+    dasar, pilihan = ringkasan.iloc[0], ringkasan.iloc[1]
+    if not pilihan['PROGRAM BERUBAH']:
+        st.info("Tidak ada program yang berubah dengan filter dan persentase ini.")
+        return
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Program berubah", int(pilihan['PROGRAM BERUBAH']))
+    col2.metric("Total daya tampung", f"{pilihan['DAYA TAMPUNG SIMULASI']:,}",
+                f"{pilihan['DAYA TAMPUNG SIMULASI'] - dasar['DAYA TAMPUNG SIMULASI']:+,}")
+    col3.metric("Program SEPI PEMINAT", int(pilihan['SEPI PEMINAT']), int(pilihan['SEPI PEMINAT'] - dasar['SEPI PEMINAT']))
+    col4.metric("Pindah kategori", int(pilihan['PINDAH KATEGORI']))
+
+    # --- Sensitivitas: jumlah SEPI/RAMAI PEMINAT menurut perubahan daya tampung ---
+    sapuan = ringkasan.iloc[2:].assign(**{'PERUBAHAN DAYA TAMPUNG (%)': list(SAPUAN_KAPASITAS)}).melt(
+        id_vars='PERUBAHAN DAYA TAMPUNG (%)', value_vars=['SEPI PEMINAT', 'RAMAI PEMINAT'],
+        var_name='KATEGORI', value_name='JUMLAH PROGRAM',
+    )
+    fig_sapuan = FIGURES.line(
+        "simulasi.sapuan", sapuan, x='PERUBAHAN DAYA TAMPUNG (%)', y='JUMLAH PROGRAM', color='KATEGORI', markers=True,
+        title=f"Kategori Hasil Model menurut Perubahan Daya Tampung (peminat {permintaan:+d}%)",
+    )
+    st.plotly_chart(fig_sapuan, use_container_width=True)
+
+    # --- Top 10 rasio setelah simulasi ---
+    mask = None if jalur_top == "Semua Jalur" else (df['JALUR'].astype(str) == jalur_top).to_numpy()
+    st.subheader(f"📋 Top 10 Rasio Keketatan Setelah Simulasi ({jalur_top})")
+    st.dataframe(hasil.top_frame(1, 10, mask)[KOLOM_SIMULASI], hide_index=True, use_container_width=True)
+
+
+# --- Unduh data hasil filter sebagai CSV/Parquet (lihat snbp.download) ---
+# st.download_button butuh seluruh file di memori sesi; dengan SNBP_EXPORT_PORT tombol hanya membuka
+# URL endpoint /export yang membaca, memfilter, dan mengirim data per potongan. Endpoint melayani data
+# versi terbaru yang diterbitkan setiap rerun (hanya referensi ke dataset, kubus, dan riwayat bersama).
+# Tanpa port, file disusun di memori sesi saat diminta lalu dikirim lewat st.download_button.
+SUMBER_UNDUH = {'Baris program studi': 'baris', 'Agregat': 'agregat', 'Riwayat multi-tahun': 'riwayat'}
+
+
+@st.cache_resource
+def get_export_source():
+    source = ExportSource()
+    if EXPORT_PORT:
+        serve_export(source, EXPORT_PORT, EXPORT_HOST)
+    return source
+
+
+def header_permintaan():
+    """Header HTTP koneksi browser sesi ini (kosong di AppTest)."""
+    if hasattr(st, "context"):  # Streamlit >= 1.37
+        return st.context.headers
+    from streamlit.web.server.websocket_headers import _get_websocket_headers
+
+    try:
+        return _get_websocket_headers() or {}
+    except RuntimeError:  # bukan koneksi browser (AppTest)
+        return {}
+
+
+def alamat_unduh():
+    """Alamat dasar endpoint unduhan: ``SNBP_EXPORT_URL`` bila diisi, selain itu host yang dipakai
+    browser untuk membuka dashboard ini (dari header Origin/Host) dengan port ``SNBP_EXPORT_PORT``."""
+    if EXPORT_URL:
+        return EXPORT_URL
+    header = header_permintaan()
+    asal = urlsplit(header.get("Origin") or f"http://{header.get('Host') or '127.0.0.1'}")
+    host = asal.hostname or '127.0.0.1'
+    if ':' in host:  # IPv6
+        host = f"[{host}]"
+    return f"{asal.scheme}://{host}:{EXPORT_PORT}"
+
+
+def bawaan_unduh(kunci, pilihan):
+    """Pilihan filter lain di halaman (bila ada dan valid) sebagai nilai awal filter unduhan."""
+    nilai = st.session_state.get(kunci)
+    return [nilai] if nilai in pilihan else []
+
+
+@bagian
+def bagian_unduh(cube, history, versi):
+    """Unduhan hasil filter (streaming bila SNBP_EXPORT_PORT diisi). Widget: jalur_unduh, provinsi_unduh, univ_unduh,
+    kategori_unduh, sumber_unduh, format_unduh, per_unduh, tahun_unduh, siapkan_unduh, tombol_unduh."""
+    st.header("⬇️ Unduh Data")
+    opsi = {kolom: sorted(cube.base[kolom].astype(str).unique()) for kolom in ['JALUR', 'PROVINSI', 'ASAL UNIV', 'KATEGORI JURUSAN']}
+    col_jalur, col_provinsi = st.columns(2)
+    jalur = col_jalur.multiselect("Jalur", opsi['JALUR'], default=bawaan_unduh("jalur_rasio", opsi['JALUR']), key="jalur_unduh")
+    provinsi = col_provinsi.multiselect(
+        "Provinsi", opsi['PROVINSI'], default=bawaan_unduh(KUNCI_PROVINSI, opsi['PROVINSI']), key="provinsi_unduh"
+    )
+    col_univ, col_kategori = st.columns(2)
+    univ = col_univ.multiselect("Universitas", opsi['ASAL UNIV'], key="univ_unduh")
+    kategori = col_kategori.multiselect(
+        "Kategori jurusan", opsi['KATEGORI JURUSAN'], default=bawaan_unduh("kategori_rasio", opsi['KATEGORI JURUSAN']),
+        key="kategori_unduh",
+    )
+    where = {kolom: nilai for kolom, nilai in
+             zip(['JALUR', 'PROVINSI', 'ASAL UNIV', 'KATEGORI JURUSAN'], [jalur, provinsi, univ, kategori]) if nilai}
+
+    col_sumber, col_format = st.columns(2)
+    sumber = SUMBER_UNDUH[col_sumber.radio("Isi file", list(SUMBER_UNDUH), horizontal=True, key="sumber_unduh")]
+    format_file = col_format.radio("Format", ['csv', 'parquet'], format_func=str.upper, horizontal=True, key="format_unduh")
+
+    per, tahun = [], []
+    if sumber == 'agregat':
+        per = st.multiselect("Agregat per", DIMENSIONS, default=['PROVINSI'], key="per_unduh")
+        if not per:
+            st.warning("Pilih minimal satu kolom agregat.")
+            return
+        st.caption(f"{len(cube.rollup(per, where, remember=False)):,} baris agregat.")
+    elif sumber == 'riwayat':
+        tahun = st.multiselect("Tahun (kosong = semua)", history.years(), key="tahun_unduh")
+        st.caption("Baris riwayat dibaca per batch dari partisi TAHUN/JALUR yang dipilih saja.")
+    else:
+        st.caption(f"{row_count(cube, where):,} baris program studi cocok dengan filter.")
+
+    if EXPORT_PORT:
+        st.link_button(
+            f"⬇️ Unduh {format_file.upper()}", export_url(alamat_unduh(), sumber, format_file, where, per, tahun),
+            use_container_width=True,
+        )
+        return
+
+    # Tanpa endpoint streaming: susun file di memori sesi hanya saat diminta, dan hanya untuk filter saat ini
+    permintaan = (sumber, format_file, repr(sorted(where.items())), tuple(per), tuple(tahun), versi)
+    if st.button("Siapkan file", key="siapkan_unduh", use_container_width=True):
+        nama_file, mime, body = export_stream(sumber, format_file, where, per, tahun, cube.rows, cube, history)
+        st.session_state["file_unduh"] = (permintaan, nama_file, mime, b"".join(body))
+    siap = st.session_state.get("file_unduh")
+    if siap is not None and siap[0] == permintaan:
+        _, nama_file, mime, data = siap
+        st.download_button(
+            f"⬇️ Unduh {format_file.upper()} ({len(data) / 1024:,.0f} KB)", data, file_name=nama_file, mime=mime,
+            key="tombol_unduh", use_container_width=True,
+        )
+    else:
+        st.caption("Untuk file besar, jalankan dashboard dengan `SNBP_EXPORT_PORT=8502` agar data dikirim "
+                   "per potongan tanpa disusun di memori sesi.")
 
 
 # --- Title ---
@@ -39,639 +1012,105 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- Statistik Umum ---
-st.header("📌 Statistik Umum")
-col1, col2, col3, col4 = st.columns(4)
-col1.metric("Jumlah Program Studi", df['NAMA'].nunique())
-col2.metric("Jumlah PTN", df['ASAL UNIV'].nunique())
-col3.metric("Total Daya Tampung 2025", int(df['DAYA TAMPUNG 2025'].sum()))
-col4.metric("Jumlah Peminat 2024", int(df['PEMINAT 2024'].sum()))
-
-
-# --- Filter Jalur ---
-st.header("🎛️ Filter Jalur Masuk")
-jalur_opsi = ["SNBP", "SNBT", "SNBP dan SNBT"]
-pilihan_jalur = st.radio("Pilih Jalur:", jalur_opsi)
-
-if pilihan_jalur == "SNBP dan SNBT":
-    filtered_df = df[df["JALUR"].isin(["SNBP", "SNBT"])]
-else:
-    filtered_df = df[df["JALUR"] == pilihan_jalur]
-
-# --- Layout 2 kolom visualisasi ---
-def dua_kolom_chart(title1, chart1, insight1, title2, chart2, insight2):
-    col1, col2 = st.columns(2)
-    with col1:
-        st.subheader(title1)
-        st.plotly_chart(chart1, use_container_width=True)
-        st.markdown(insight1)
-    with col2:
-        st.subheader(title2)
-        st.plotly_chart(chart2, use_container_width=True)
-        st.markdown(insight2)
-
-# --- Filter Jurusan dengan Peminat antara 0 - 50 ---
-filtered_df_sepi_peminat = filtered_df[(filtered_df['PEMINAT 2024'] >= 0) & (filtered_df['PEMINAT 2024'] <= 50)]
-
-# Ambil 10 jurusan teratas berdasarkan jumlah peminat (0 - 50)
-filtered_df_sepi_peminat_top10 = filtered_df_sepi_peminat.nlargest(10, 'PEMINAT 2024')
-
-# --- Filter Jurusan dengan Peminat lebih dari 50 ---
-filtered_df_banyak_peminat = filtered_df[filtered_df['PEMINAT 2024'] > 50]
-
-# Ambil 10 jurusan teratas berdasarkan jumlah peminat (> 50)
-filtered_df_banyak_peminat_top10 = filtered_df_banyak_peminat.nlargest(10, 'PEMINAT 2024')
-
-# --- Visualisasi Diagram Batang untuk Peminat 0 - 50 ---
-fig1 = px.bar(
-    filtered_df_sepi_peminat_top10,
-    x='PEMINAT 2024',
-    y='NAMA',
-    orientation='h',
-    title="10 Jurusan dengan Peminat 2024 antara 0 dan 50",
-    labels={'PEMINAT 2024': 'Jumlah Peminat', 'NAMA': 'Nama Jurusan'},
-    color='PEMINAT 2024',
-    color_continuous_scale='Viridis'
-)
+with METRICS.section("statistik_umum"):
+    st.header("📌 Statistik Umum")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Jumlah Program Studi", cube.totals['JUMLAH PROGRAM STUDI'])
+    col2.metric("Jumlah PTN", cube.totals['JUMLAH PTN'])
+    col3.metric("Total Daya Tampung 2025", cube.totals['DAYA TAMPUNG 2025'])
+    col4.metric("Jumlah Peminat 2024", cube.totals['PEMINAT 2024'])
 
-# --- Visualisasi Diagram Batang untuk Peminat lebih dari 50 ---
-fig2 = px.bar(
-    filtered_df_banyak_peminat_top10,
-    x='PEMINAT 2024',
-    y='NAMA',
-    orientation='h',
-    title="10 Jurusan dengan Peminat 2024 lebih dari 50",
-    labels={'PEMINAT 2024': 'Jumlah Peminat', 'NAMA': 'Nama Jurusan'},
-    color='PEMINAT 2024',
-    color_continuous_scale='Viridis'
-)
-
-st.header("📊 Top 10 Jurusan dengan Rasio Keketatan Tertinggi")
-
-# --- Filter berdasarkan jalur & kategori jurusan ---
-col_jalur, col_kategori = st.columns(2)
-jalur_filter = col_jalur.selectbox("Pilih Jalur:", df['JALUR'].unique(), key="jalur_rasio")
-kategori_filter = col_kategori.selectbox("Pilih Kategori Jurusan:", df['KATEGORI JURUSAN'].unique(), key="kategori_rasio")
-
-# --- Filter dataframe sesuai pilihan ---
-filtered_rasio = df[
-    (df['JALUR'] == jalur_filter) &
-    (df['KATEGORI JURUSAN'] == kategori_filter)
-].copy()
-
-# --- Tangani nilai RASIO KEKETATAN ---
-import numpy as np
-
-filtered_rasio['RASIO_ANGKA'] = filtered_rasio['RASIO KEKETATAN'].astype(str).str.replace(',', '.')
-filtered_rasio['RASIO_ANGKA'] = filtered_rasio['RASIO_ANGKA'].replace('inf', np.inf)
-filtered_rasio['RASIO_ANGKA'] = pd.to_numeric(filtered_rasio['RASIO_ANGKA'], errors='coerce')
-
-# --- Ambil Top 10 ---
-top10_rasio = filtered_rasio.sort_values(by='RASIO_ANGKA', ascending=False).head(10)
-
-# --- Format tampilan rasio ---
-def format_rasio(x):
-    if np.isinf(x):
-        return "∞"
-    elif pd.isnull(x):
-        return "-"
-    else:
-        return f"{x:.2f}%"
-
-# --- Visualisasi ---
-import plotly.express as px
-fig_top10 = px.bar(
-    top10_rasio,
-    x='NAMA',
-    y='RASIO_ANGKA',
-    text=top10_rasio['RASIO_ANGKA'].apply(format_rasio),
-    labels={'RASIO_ANGKA': 'Rasio Keketatan (%)'},
-    title=f"Top 10 Jurusan {kategori_filter} - Jalur {jalur_filter} berdasarkan Rasio Keketatan"
-)
-fig_top10.update_traces(marker_color='darkblue', textposition='outside')
-fig_top10.update_layout(xaxis_tickangle=-45, yaxis_title="Rasio Keketatan (%)")
-st.plotly_chart(fig_top10, use_container_width=True)
-
-# --- Tabel detail ---
-st.subheader("📋 Detail Top 10 Jurusan Berdasarkan Rasio Keketatan")
-top10_rasio_formatted = top10_rasio.copy()
-top10_rasio_formatted['PEMINAT 2024'] = top10_rasio_formatted['PEMINAT 2024'].apply(lambda x: f"{x:,}")
-top10_rasio_formatted['RASIO KEKETATAN'] = top10_rasio_formatted['RASIO KEKETATAN'].astype(str)
-
-st.dataframe(top10_rasio_formatted[[
-    'NAMA', 'ASAL UNIV', 'JENJANG', 'DAYA TAMPUNG 2025',
-    'PEMINAT 2024', 'RASIO KEKETATAN', 'PROSPEK KERJA'
-]])
 
+bagian_rasio(indeks_jalur, cube, snapshot.version)
 
 # --- Total peminat per provinsi ---
-df_provinsi = df.groupby('PROVINSI')['PEMINAT 2024'].sum().reset_index()
-df_provinsi.columns = ['provinsi', 'total_peminat']
-
-# Pastikan nama kolom sesuai format
-# df['PROVINSI'] = df['PROVINSI'].str.upper().str.strip()
-
-# # Group berdasarkan provinsi dan jumlahkan peminat
-# df_provinsi = df.groupby('PROVINSI')['PEMINAT 2024'].sum().reset_index()
-
-# df['PROVINSI'] = df['PROVINSI'].str.title().str.strip()
-
-# df_provinsi = df.groupby('PROVINSI')['PEMINAT 2024'].sum().reset_index()
-
-# --- Menghitung Jumlah Peminat per Provinsi ---
-df_provinsi = df.groupby('PROVINSI').agg({'PEMINAT 2024': 'sum'}).reset_index()
-
-# --- Mengurutkan data berdasarkan jumlah peminat dari tertinggi ke terendah ---
-df_provinsi = df_provinsi.sort_values(by='PEMINAT 2024', ascending=False)
-
-# --- Membuat Diagram Batang berdasarkan Provinsi dan Jumlah Peminat ---
-fig = px.bar(
-    df_provinsi,
-    x='PROVINSI', 
-    y='PEMINAT 2024', 
-    title="Jumlah Peminat Berdasarkan Provinsi",
-    labels={'PEMINAT 2024': 'Jumlah Peminat', 'PROVINSI': 'Provinsi'},
-    hover_data={
-        'PEMINAT 2024': False,  # Jangan tampilkan jumlah peminat di hover
-        'PROVINSI': False,  # Jangan tampilkan provinsi di hover
-    }
-)
-
-# --- Menambahkan data hover untuk universitas, daya tampung, rasio keketatan, kategori jurusan
-fig.update_traces(
-    hovertemplate='<b>%{x}</b><br>' +
-                  'Nama Universitas: %{customdata[0]}<br>' +
-                  'Daya Tampung 2025: %{customdata[1]}<br>' +
-                  'Kategori Jurusan: %{customdata[3]}<br>',  # Hapus %{customdata[2]} untuk Rasio Keketatan
-    customdata=df[['NAMA', 'DAYA TAMPUNG 2025', 'RASIO KEKETATAN', 'KATEGORI JURUSAN']].values
-)
-
-# --- Tampilkan Diagram Batang di Streamlit ---
-st.subheader("📊 Diagram Batang Jumlah Peminat Berdasarkan Provinsi")
-st.plotly_chart(fig, use_container_width=True)
-
-# --- Insight Otomatis Berdasarkan Provinsi ---
-# Jurusan dengan peminat terbanyak dan tersedikit per provinsi
-jurusan_terbanyak = df_provinsi.loc[df_provinsi['PEMINAT 2024'].idxmax()]
-jurusan_terendah = df_provinsi.loc[df_provinsi['PEMINAT 2024'].idxmin()]
-
-# Menampilkan insight
-st.subheader("📊 Insight Otomatis")
-st.write(f"🎯 Provinsi dengan jumlah peminat tertinggi adalah **{jurusan_terbanyak['PROVINSI']}** dengan **{jurusan_terbanyak['PEMINAT 2024']} peminat**.")
-st.write(f"🎯 Provinsi dengan jumlah peminat paling sedikit adalah **{jurusan_terendah['PROVINSI']}** dengan **{jurusan_terendah['PEMINAT 2024']} peminat**.")
-
-# Rekomendasi
-if jurusan_terbanyak['PEMINAT 2024'] > jurusan_terendah['PEMINAT 2024']:
-    st.write(f"📌 **Rekomendasi:** Provinsi dengan peminat tertinggi, **{jurusan_terbanyak['PROVINSI']}**, dapat mempertimbangkan **peningkatan kapasitas daya tampung** untuk menampung lebih banyak peminat. Sementara itu, provinsi dengan peminat paling sedikit, **{jurusan_terendah['PROVINSI']}**, perlu melihat strategi **peningkatan daya tarik** untuk jurusan-jurusan tersebut.")
-else:
-    st.write(f"📌 **Rekomendasi:** Provinsi dengan peminat sedikit mungkin perlu **meningkatkan promosi** atau memperbaiki kualitas pendidikan di wilayah tersebut.")
-
-# --- Tabel Detail ---
-st.subheader("📋 Tabel Detail Jumlah Peminat Berdasarkan Provinsi")
-st.dataframe(df_provinsi, use_container_width=True)
-
-
-
-# --- Fitur Pilih Provinsi ---
-provinsi_terpilih = st.selectbox("Pilih Provinsi", df_provinsi['PROVINSI'].unique())
-
-# --- Menampilkan Data untuk Provinsi Terpilih ---
-df_provinsi_terpilih = df[df['PROVINSI'] == provinsi_terpilih]
-
-# --- Menghitung Jumlah Peminat per Jurusan di Provinsi Terpilih ---
-df_terpilih_jurusan = df_provinsi_terpilih.groupby('NAMA').agg({'PEMINAT 2024': 'sum'}).reset_index()
-
-# --- Mengurutkan data untuk jurusan dengan peminat terbanyak dan tersedikit ---
-df_terpilih_jurusan_terbanyak = df_terpilih_jurusan.sort_values(by='PEMINAT 2024', ascending=False)
-df_terpilih_jurusan_tersedikit = df_terpilih_jurusan.sort_values(by='PEMINAT 2024', ascending=True)
-
-# --- Menampilkan Diagram Batang Jurusan dengan Peminat Terbanyak ---
-fig_terbanyak = px.bar(
-    df_terpilih_jurusan_terbanyak,
-    x='NAMA', 
-    y='PEMINAT 2024', 
-    title=f"Jurusan dengan Peminat Terbanyak di {provinsi_terpilih}",
-    labels={'PEMINAT 2024': 'Jumlah Peminat', 'NAMA': 'Nama Jurusan'},
-    hover_data={
-        'PEMINAT 2024': True,
-        'NAMA': False
-    }
-)
-
-# --- Menampilkan Diagram Batang Jurusan dengan Peminat Tersedikit ---
-fig_tersedikit = px.bar(
-    df_terpilih_jurusan_tersedikit,
-    x='NAMA', 
-    y='PEMINAT 2024', 
-    title=f"Jurusan dengan Peminat Paling Sedikit di {provinsi_terpilih}",
-    labels={'PEMINAT 2024': 'Jumlah Peminat', 'NAMA': 'Nama Jurusan'},
-    hover_data={
-        'PEMINAT 2024': True,
-        'NAMA': False
-    }
-)
-
-# Menampilkan kedua diagram batang di Streamlit
-st.subheader(f"📊 Jurusan dengan Peminat Terbanyak di {provinsi_terpilih}")
-st.plotly_chart(fig_terbanyak, use_container_width=True)
-
-st.subheader(f"📊 Jurusan dengan Peminat Paling Sedikit di {provinsi_terpilih}")
-st.plotly_chart(fig_tersedikit, use_container_width=True)
-
-# --- Insight Otomatis ---
-# Jurusan dengan Peminat Terbanyak
-jurusan_terbanyak = df_terpilih_jurusan_terbanyak.iloc[0]
-jurusan_terendah = df_terpilih_jurusan_tersedikit.iloc[0]
-
-# Menampilkan insight
-st.subheader("📊 Insight Otomatis")
-st.write(f"🎯 Di provinsi {provinsi_terpilih}, jurusan dengan peminat terbanyak adalah **{jurusan_terbanyak['NAMA']}** dengan **{jurusan_terbanyak['PEMINAT 2024']} peminat**.")
-st.write(f"🎯 Sedangkan jurusan dengan peminat paling sedikit adalah **{jurusan_terendah['NAMA']}** dengan **{jurusan_terendah['PEMINAT 2024']} peminat**.")
-
-# Rekomendasi
-if jurusan_terbanyak['PEMINAT 2024'] > jurusan_terendah['PEMINAT 2024']:
-    st.write(f"📌 **Rekomendasi:** Berdasarkan data, jurusan **{jurusan_terbanyak['NAMA']}** memiliki peminat terbanyak, yang menunjukkan bahwa jurusan ini lebih diminati. **Pihak universitas perlu mempertimbangkan peningkatan kapasitas daya tampung dan rasio keketatan** untuk jurusan ini.")
-else:
-    st.write(f"📌 **Rekomendasi:** Jurusan dengan peminat paling sedikit perlu mendapat perhatian khusus. Mungkin perlu adanya **upaya untuk meningkatkan daya tarik jurusan tersebut**, seperti penambahan program studi baru atau perbaikan promosi jurusan.")
-
-# --- Tabel Detail ---
-st.subheader(f"📋 Detail Universitas per Provinsi {provinsi_terpilih}")
-st.dataframe(df_provinsi_terpilih, use_container_width=True)
-
-
-st.title("🎯 Eksplorasi Jurusan Berdasarkan Provinsi, Universitas, dan Kategori")
-
-# --- Dropdown untuk memilih Provinsi ---
-provinsi_terpilih = st.selectbox("📍 Pilih Provinsi", options=df['PROVINSI'].dropna().unique())
-
-# Filter berdasarkan provinsi
-df_filtered_prov = df[df['PROVINSI'] == provinsi_terpilih]
-
-# --- Dropdown untuk memilih Universitas dari provinsi yang dipilih ---
-univ_terpilih = st.selectbox("🏫 Pilih Universitas", options=df_filtered_prov['ASAL UNIV'].dropna().unique())
-
-# Filter berdasarkan universitas
-df_filtered_univ = df_filtered_prov[df_filtered_prov['ASAL UNIV'] == univ_terpilih]
-
-# --- Dropdown untuk memilih Kategori Jurusan ---
-kategori_terpilih = st.selectbox("📊 Pilih Kategori Jurusan", options=df_filtered_univ['KATEGORI JURUSAN'].dropna().unique())
-
-# Filter final berdasarkan kategori jurusan
-df_final = df_filtered_univ[df_filtered_univ['KATEGORI JURUSAN'] == kategori_terpilih]
-
-# Membersihkan kolom 'RASIO KEKETATAN' dan mengonversinya ke tipe numerik
-df_final['RASIO KEKETATAN'] = df_final['RASIO KEKETATAN'].replace({',': ''}, regex=True)  # Menghapus koma sebagai pemisah ribuan
-df_final['RASIO KEKETATAN'] = pd.to_numeric(df_final['RASIO KEKETATAN'], errors='coerce')  # Mengonversi ke numerik
-
-# Menggunakan metode groupby dan agregasi
-df_jurusan = df_final.groupby('NAMA').agg({
-    'RASIO KEKETATAN': 'mean',  # Mengambil nilai rata-rata dari Rasio Keketatan
-    # kolom lain yang perlu dihitung agregatnya
-})
-
-# --- Pastikan kolom RASIO KEKETATAN bertipe float ---
-df['RASIO KEKETATAN'] = (
-    df['RASIO KEKETATAN']
-    .astype(str)                     # ubah ke string
-    .str.replace(',', '.', regex=False)  # ganti koma dengan titik
-    .astype(float)                  # konversi ke float
-)
-
-
-# --- Hitung total peminat per jurusan (jika ada duplikat nama) ---
-df_jurusan = df_final.groupby('NAMA').agg({
-    'PEMINAT 2024': 'sum',
-    'DAYA TAMPUNG 2025': 'sum',
-    'RASIO KEKETATAN': 'mean',
-    'PROSPEK KERJA': 'first'
-}).reset_index()
-
-# Urutkan dari jumlah peminat tertinggi
-df_jurusan = df_jurusan.sort_values(by='PEMINAT 2024', ascending=False)
-
-# --- Visualisasi diagram batang ---
-fig = px.bar(
-    df_jurusan,
-    x='NAMA',
-    y='PEMINAT 2024',
-    title=f"Jumlah Peminat Jurusan di {univ_terpilih} ({kategori_terpilih})",
-    labels={'NAMA': 'Nama Jurusan', 'PEMINAT 2024': 'Jumlah Peminat'},
-    hover_data={
-        'DAYA TAMPUNG 2025': True,
-        'RASIO KEKETATAN': True,
-        'PROSPEK KERJA': True,
-    }
-)
-fig.update_layout(xaxis_tickangle=-45)
-
-st.plotly_chart(fig, use_container_width=True)
-
-# --- Insight Otomatis ---
-st.subheader("📌 Insight Otomatis")
-
-if not df_jurusan.empty:
-    tertinggi = df_jurusan.iloc[0]
-    terendah = df_jurusan.iloc[-1]
-
-    st.markdown(f"✅ **Jurusan dengan peminat terbanyak** adalah **{tertinggi['NAMA']}** dengan **{tertinggi['PEMINAT 2024']} peminat**.")
-    st.markdown(f"⚠️ **Jurusan dengan peminat paling sedikit** adalah **{terendah['NAMA']}** dengan **{terendah['PEMINAT 2024']} peminat**.")
-
-    st.markdown("📢 **Rekomendasi:**")
-    if kategori_terpilih == 'SEPI PEMINAT':
-        st.write(f"- Jurusan-jurusan ini memiliki peminat rendah. Rekomendasi untuk universitas: perkuat promosi dan kolaborasi dengan industri terkait seperti bidang **{terendah['PROSPEK KERJA']}**.")
+with METRICS.section("peminat_per_provinsi"):
+    # --- Menghitung Jumlah Peminat per Provinsi, terurut dari tertinggi ke terendah ---
+    df_provinsi = cube.ranking('PROVINSI', 'PEMINAT 2024')[['PROVINSI', 'PEMINAT 2024']]
+
+    # --- Menambahkan data hover untuk universitas, daya tampung, kategori jurusan ---
+    # Satu baris ringkasan per batang provinsi (bukan semua baris data), urutannya sama dengan df_provinsi
+    kolom_hover = ['JUMLAH PTN', 'JUMLAH', 'DAYA TAMPUNG 2025', 'RAMAI PEMINAT', 'SEPI PEMINAT']
+    hover_provinsi = cube.profile('PROVINSI').set_index('PROVINSI').loc[df_provinsi['PROVINSI'], kolom_hover]
+
+    # --- Membuat Diagram Batang berdasarkan Provinsi dan Jumlah Peminat ---
+    fig = FIGURES.bar(
+        "provinsi.peminat", df_provinsi.join(hover_provinsi.reset_index(drop=True)), version=snapshot.version,
+        x='PROVINSI',
+        y='PEMINAT 2024',
+        title="Jumlah Peminat Berdasarkan Provinsi",
+        labels={'PEMINAT 2024': 'Jumlah Peminat', 'PROVINSI': 'Provinsi'},
+        hover_data={
+            'PEMINAT 2024': False,  # Jangan tampilkan jumlah peminat di hover
+            'PROVINSI': False,  # Jangan tampilkan provinsi di hover
+        },
+        custom_data=kolom_hover,
+        traces=dict(hovertemplate='<b>%{x}</b><br>' +
+                                  'Jumlah Universitas: %{customdata[0]}<br>' +
+                                  'Jumlah Program Studi: %{customdata[1]}<br>' +
+                                  'Daya Tampung 2025: %{customdata[2]}<br>' +
+                                  'Kategori Jurusan: %{customdata[3]} ramai / %{customdata[4]} sepi<extra></extra>'),
+    )
+
+    # --- Peta (bila bundel geometri tersedia) dan Diagram Batang ---
+    # Tab peta baru diisi setelah section ini ditutup (bagian tidak boleh bersarang, lihat snbp.metrics)
+    geo = get_geo_bundle()
+    if geo is not None:
+        tab_peta, tab_batang = st.tabs(["🗺️ Peta Provinsi", "📊 Diagram Batang"])
     else:
-        st.write(f"- Jurusan dengan peminat tinggi seperti **{tertinggi['NAMA']}** mungkin perlu penambahan **daya tampung** untuk mengakomodasi permintaan yang tinggi.")
-else:
-    st.warning("Data tidak tersedia untuk pilihan ini.")
-
-
-
-# --- Tampilkan Diagram Peminat 0 - 50 ---
-st.subheader("📊 Diagram Jurusan IPS dengan Jumlah Peminat antara 0 dan 50")
-st.plotly_chart(fig1, use_container_width=True)
-
-# --- Tabel Insight untuk Peminat 0 - 50 ---
-insight_table_1 = filtered_df_sepi_peminat_top10[['ASAL UNIV', 'NAMA', 'JENJANG', 'PEMINAT 2024', 'DAYA TAMPUNG 2025', 'PROSPEK KERJA']]
-st.write("Pemetaan Jurusan dengan Peminat Rendah (0 - 50):")
-st.write(insight_table_1)
-
-# --- Tampilkan Diagram Peminat lebih dari 50 ---
-st.subheader("📊 Diagram Jurusan IPS dengan Jumlah Peminat lebih dari 50")
-st.plotly_chart(fig2, use_container_width=True)
-
-# --- Tabel Insight untuk Peminat lebih dari 50 ---
-insight_table_2 = filtered_df_banyak_peminat_top10[['ASAL UNIV', 'NAMA', 'JENJANG', 'PEMINAT 2024', 'DAYA TAMPUNG 2025', 'PROSPEK KERJA']]
-st.write("Pemetaan Jurusan dengan Peminat Tinggi (> 50):")
-st.write(insight_table_2)
-
-# --- Diagram Peminat (Top 20 & Bottom 20) ---
-peminat_df = filtered_df.groupby("NAMA")["PEMINAT 2024"].sum().reset_index().sort_values("PEMINAT 2024", ascending=False)
-
-top20_peminat = peminat_df.head(20)
-bottom20_peminat = peminat_df[peminat_df["PEMINAT 2024"] > 0].tail(20)
-
-# Insight otomatis Peminat
-top_peminat = top20_peminat.sort_values("PEMINAT 2024", ascending=False).iloc[0]
-bottom_peminat = bottom20_peminat.sort_values("PEMINAT 2024").iloc[0]
-insight_top_peminat = f"""
-📌 Berdasarkan diagram di atas, Pada jalur **{pilihan_jalur}**, jurusan **{top_peminat['NAMA']}** memiliki jumlah peminat tertinggi sebanyak **{top_peminat['PEMINAT 2024']}** orang. Hal ini mengindikasikan bahwa jurusan ini memiliki daya tarik tinggi, baik dari segi prospek kerja maupun popularitas kampus. Rekomendasinya adalah memperluas kapasitas daya tampung atau membuka kelas tambahan jika memungkinkan.
-"""
-insight_bottom_peminat = f"""
-📌 Berdasarkan diagram di atas, Pada jalur **{pilihan_jalur}**, jurusan **{bottom_peminat['NAMA']}** memiliki jumlah peminat terendah dari 20 terbawah sebanyak **{bottom_peminat['PEMINAT 2024']}** orang. Hal ini bisa jadi karena kurangnya informasi publik, prospek kerja yang belum populer, atau lokasi kampus yang kurang strategis. Rekomendasinya adalah melakukan promosi dan kolaborasi industri untuk menarik minat calon mahasiswa.
-"""
-
-fig_top_peminat = px.bar(top20_peminat, x="NAMA", y="PEMINAT 2024", title="Top 20 Jurusan dengan Peminat Terbanyak", labels={"NAMA": "Jurusan"})
-fig_bottom_peminat = px.bar(bottom20_peminat, x="NAMA", y="PEMINAT 2024", title="Bottom 20 Jurusan dengan Peminat Terendah", labels={"NAMA": "Jurusan"})
-
-dua_kolom_chart("🔝 Top 20 Peminat", fig_top_peminat, insight_top_peminat,
-                "🔻 Bottom 20 Peminat", fig_bottom_peminat, insight_bottom_peminat)
-
-# --- Diagram Daya Tampung (Top 20 & Bottom 20) ---
-dt_df = filtered_df.groupby("NAMA")["DAYA TAMPUNG 2025"].sum().reset_index().sort_values("DAYA TAMPUNG 2025", ascending=False)
-top20_dt = dt_df.head(20)
-bottom20_dt = dt_df[dt_df["DAYA TAMPUNG 2025"] > 0].tail(20)
+        tab_peta, tab_batang = None, st.container()
+        st.caption(f"Peta provinsi tidak tersedia: bundel geometri `{GEO_BUNDLE}` tidak ditemukan "
+                   "(bangun dengan `python -m snbp.geo provinsi.geojson`).")
+
+    # --- Tampilkan Diagram Batang di Streamlit ---
+    with tab_batang:
+        st.subheader("📊 Diagram Batang Jumlah Peminat Berdasarkan Provinsi")
+        st.plotly_chart(fig, use_container_width=True)
+
+    # --- Insight Otomatis Berdasarkan Provinsi ---
+    # Jurusan dengan peminat terbanyak dan tersedikit per provinsi
+    jurusan_terbanyak = df_provinsi.iloc[0]
+    jurusan_terendah = df_provinsi.iloc[-1]
+
+    # Menampilkan insight
+    st.subheader("📊 Insight Otomatis")
+    st.write(f"🎯 Provinsi dengan jumlah peminat tertinggi adalah **{jurusan_terbanyak['PROVINSI']}** dengan **{jurusan_terbanyak['PEMINAT 2024']} peminat**.")
+    st.write(f"🎯 Provinsi dengan jumlah peminat paling sedikit adalah **{jurusan_terendah['PROVINSI']}** dengan **{jurusan_terendah['PEMINAT 2024']} peminat**.")
+
+    # Rekomendasi
+    if jurusan_terbanyak['PEMINAT 2024'] > jurusan_terendah['PEMINAT 2024']:
+        st.write(f"📌 **Rekomendasi:** Provinsi dengan peminat tertinggi, **{jurusan_terbanyak['PROVINSI']}**, dapat mempertimbangkan **peningkatan kapasitas daya tampung** untuk menampung lebih banyak peminat. Sementara itu, provinsi dengan peminat paling sedikit, **{jurusan_terendah['PROVINSI']}**, perlu melihat strategi **peningkatan daya tarik** untuk jurusan-jurusan tersebut.")
+    else:
+        st.write(f"📌 **Rekomendasi:** Provinsi dengan peminat sedikit mungkin perlu **meningkatkan promosi** atau memperbaiki kualitas pendidikan di wilayah tersebut.")
 
-top_dt = top20_dt.iloc[0]
-bottom_dt = bottom20_dt.iloc[0]
-insight_top_dt = f"""
-📌 Berdasarkan diagram di atas, Pada jalur **{pilihan_jalur}**, jurusan **{top_dt['NAMA']}** memiliki daya tampung tertinggi sebanyak **{top_dt['DAYA TAMPUNG 2025']}** kursi. Ini menunjukkan kesiapan fasilitas dan kemungkinan kebutuhan tinggi akan lulusan bidang tersebut. Rekomendasinya adalah mempertahankan kualitas pengajaran meski dengan jumlah mahasiswa besar.
-"""
-insight_bottom_dt = f"""
-📌 Berdasarkan diagram di atas, Pada jalur **{pilihan_jalur}**, jurusan **{bottom_dt['NAMA']}** memiliki daya tampung terendah dari 20 terbawah sebanyak **{bottom_dt['DAYA TAMPUNG 2025']}** kursi. Jurusan ini mungkin bersifat spesialis atau baru dibuka. Rekomendasi: evaluasi keterisian daya tampung dan dorong kerja sama dengan industri untuk meningkatkan daya tarik.
-"""
+    # --- Tabel Detail ---
+    st.subheader("📋 Tabel Detail Jumlah Peminat Berdasarkan Provinsi")
+    st.dataframe(df_provinsi, use_container_width=True)
 
-fig_top_dt = px.bar(top20_dt, x="NAMA", y="DAYA TAMPUNG 2025", title="Top 20 Jurusan dengan Daya Tampung Terbanyak")
-fig_bottom_dt = px.bar(bottom20_dt, x="NAMA", y="DAYA TAMPUNG 2025", title="Bottom 20 Jurusan dengan Daya Tampung Terendah")
+if tab_peta is not None:
+    with tab_peta:
+        st.subheader("🗺️ Peta Jumlah Peminat Berdasarkan Provinsi")
+        bagian_peta_provinsi(cube, snapshot.version, geo)
 
-dua_kolom_chart("🔝 Top 20 Daya Tampung", fig_top_dt, insight_top_dt,
-                "🔻 Bottom 20 Daya Tampung", fig_bottom_dt, insight_bottom_dt)
+bagian_provinsi_terpilih(df, cube, indeks_wilayah, df_provinsi, snapshot.version)
 
+bagian_eksplorasi(df, cube, indeks_wilayah, snapshot.version)
 
-# --- Diagram Peminat Keseluruhan (Terurut) ---
-st.header("📈 Visualisasi Keseluruhan Jumlah Peminat per Jurusan")
+bagian_jalur(cube, snapshot.version)
 
-# Mengelompokkan dan menjumlahkan data peminat
-total_peminat_df = filtered_df.groupby("NAMA")["PEMINAT 2024"].sum().reset_index()
+bagian_alternatif(df, snapshot.version)
 
-# Mengurutkan data berdasarkan peminat 2024 dari yang terbesar ke yang terkecil
-total_peminat_df = total_peminat_df.sort_values(by="PEMINAT 2024", ascending=False)
+with METRICS.section("sinkron_riwayat"):
+    sync_history(snapshot.version, df)
+bagian_tren(get_history())
 
-# Membuat diagram batang untuk peminat
-fig_all_peminat = px.bar(
-    total_peminat_df,
-    x="NAMA",
-    y="PEMINAT 2024",
-    labels={"NAMA": "Jurusan", "PEMINAT 2024": "Jumlah Peminat"},
-    title=f"Jumlah Peminat Keseluruhan per Jurusan ({pilihan_jalur})"
-)
+bagian_prediksi(df, snapshot.version)
 
-fig_all_peminat.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig_all_peminat, use_container_width=True)
-
-# Insight otomatis peminat keseluruhan
-total_jurusan = total_peminat_df['NAMA'].nunique()
-avg_peminat = int(total_peminat_df["PEMINAT 2024"].mean())
-insight_all_peminat = f"""
-📌 Pada jalur **{pilihan_jalur}**, terdapat total **{total_jurusan}** jurusan IPS yang tersedia.  
-🔢 Rata-rata jumlah peminat per jurusan adalah sekitar **{avg_peminat}** orang.  
-📈 Grafik di atas menunjukkan distribusi jumlah peminat yang bervariasi, dengan beberapa jurusan jauh lebih populer dari yang lain.  
-🔍 Rekomendasi: jurusan dengan peminat tinggi bisa menyesuaikan kapasitas, sementara jurusan dengan peminat rendah perlu meningkatkan promosi dan kerja sama eksternal.
-"""
-st.markdown(insight_all_peminat)
-
-
-# --- Diagram Daya Tampung Keseluruhan (Terurut) ---
-st.header("📥 Visualisasi Keseluruhan Daya Tampung per Jurusan")
-
-# Mengelompokkan dan menjumlahkan data daya tampung
-total_daya_df = filtered_df.groupby("NAMA")["DAYA TAMPUNG 2025"].sum().reset_index()
-
-# Mengurutkan data berdasarkan daya tampung 2025 dari yang terbesar ke yang terkecil
-total_daya_df = total_daya_df.sort_values(by="DAYA TAMPUNG 2025", ascending=False)
-
-# Membuat diagram batang untuk daya tampung
-fig_all_daya = px.bar(
-    total_daya_df,
-    x="NAMA",
-    y="DAYA TAMPUNG 2025",
-    labels={"NAMA": "Jurusan", "DAYA TAMPUNG 2025": "Daya Tampung"},
-    title=f"Daya Tampung Keseluruhan per Jurusan ({pilihan_jalur})"
-)
+bagian_simulasi(df, snapshot.version)
 
-fig_all_daya.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig_all_daya, use_container_width=True)
-
-# Insight otomatis daya tampung keseluruhan
-avg_daya = int(total_daya_df["DAYA TAMPUNG 2025"].mean())
-insight_all_daya = f"""
-📌 Pada jalur **{pilihan_jalur}**, total daya tampung dari semua jurusan adalah **{int(total_daya_df['DAYA TAMPUNG 2025'].sum())}** kursi.  
-🔢 Rata-rata daya tampung per jurusan adalah sekitar **{avg_daya}** kursi.  
-📥 Grafik memperlihatkan variasi besar dalam daya tampung antar jurusan, yang dapat dipengaruhi oleh kapasitas fakultas, kebijakan kampus, dan kebutuhan industri.  
-🔍 Rekomendasi: evaluasi kembali alokasi daya tampung agar lebih proporsional terhadap peminat dan kebutuhan pasar kerja.
-"""
-st.markdown(insight_all_daya)
-
-
-
-
-# --- Pie Chart Jenjang ---
-st.header("🎓 Distribusi Jenjang Pendidikan")
-jenjang_df = df['JENJANG'].value_counts().reset_index()
-jenjang_df.columns = ['Jenjang', 'Jumlah']
-fig_jenjang = px.pie(jenjang_df, names='Jenjang', values='Jumlah', title="Distribusi Jenjang", hover_data=['Jumlah'], labels={'Jumlah': 'Jumlah'})
-fig_jenjang.update_traces(textinfo='percent+label')
-st.plotly_chart(fig_jenjang, use_container_width=True)
-
-# Insight jenjang
-insight_jenjang = f"""
-📌 Pada jalur **{pilihan_jalur}**, Sebagian besar program studi berada pada jenjang **{jenjang_df.iloc[0]['Jenjang']}** dengan jumlah **{jenjang_df.iloc[0]['Jumlah']}** program studi. Ini menandakan dominasi program sarjana dalam ranah IPS di PTN Indonesia. Rekomendasi: dorong peningkatan jenjang pendidikan lanjutan untuk memperluas akses ke pendidikan pascasarjana.
-"""
-st.markdown(insight_jenjang)
-
-# --- Perbandingan Peminat vs Daya Tampung (Top & Bottom 10) ---
-st.header("📊 Perbandingan Peminat vs Daya Tampung")
-
-compare_df = filtered_df.groupby("NAMA")[["PEMINAT 2024", "DAYA TAMPUNG 2025"]].sum().reset_index()
-top10_compare = compare_df.sort_values("PEMINAT 2024", ascending=False).head(10)
-bottom10_compare = compare_df.sort_values("PEMINAT 2024", ascending=True).head(10)
-
-fig_top10_compare = px.bar(top10_compare.melt(id_vars="NAMA"), x="NAMA", y="value", color="variable",
-                           barmode="group", title="Top 10 Peminat vs Daya Tampung")
-fig_bottom10_compare = px.bar(bottom10_compare.melt(id_vars="NAMA"), x="NAMA", y="value", color="variable",
-                              barmode="group", title="Bottom 10 Peminat vs Daya Tampung")
-
-insight_top10_compare = f"""
-📌 Pada jalur **{pilihan_jalur}**, 10 jurusan teratas memiliki jumlah peminat yang jauh melampaui daya tampung. Hal ini menunjukkan persaingan yang sangat ketat dan popularitas tinggi jurusan tersebut.  
-🔍 Rekomendasi: pertimbangkan peningkatan daya tampung atau pembukaan kelas paralel, serta lakukan seleksi masuk yang lebih kompetitif.
-"""
-
-insight_bottom10_compare = f"""
-📌 Pada jalur **{pilihan_jalur}**, 10 jurusan terbawah memiliki jumlah peminat yang relatif rendah dibandingkan daya tampung yang tersedia.  
-🔍 Rekomendasi: lakukan promosi jurusan melalui media digital dan kolaborasi industri agar lebih dikenal, serta evaluasi kurikulum agar sesuai dengan kebutuhan pasar kerja.
-"""
-
-dua_kolom_chart("Top 10 Peminat vs Daya Tampung", fig_top10_compare, insight_top10_compare,
-                "Bottom 10 Peminat vs Daya Tampung", fig_bottom10_compare, insight_bottom10_compare)
-
-# --- Diagram Prospek Kerja ---
-st.header("💼 Persebaran Prospek Kerja")
-prospek_df = df['PROSPEK KERJA'].value_counts().reset_index()
-prospek_df.columns = ['Prospek Kerja', 'Jumlah']
-fig_prospek = px.bar(prospek_df, x='Prospek Kerja', y='Jumlah', title="Distribusi Prospek Kerja", labels={"Jumlah": "Jumlah Lulusan"})
-st.plotly_chart(fig_prospek, use_container_width=True)
-
-# Insight prospek kerja
-top_prospek = prospek_df.iloc[0]
-insight_prospek = f"""
-📌 Berdasarkan diagram di atas, prospek kerja sebagai **{top_prospek['Prospek Kerja']}** mendominasi dengan **{top_prospek['Jumlah']}** jurusan yang mengarah ke bidang ini. Ini menunjukkan permintaan tinggi dan kesesuaian kurikulum pendidikan dengan kebutuhan industri. Rekomendasi: dorong kolaborasi lebih lanjut antara kampus dan sektor industri ini.
-"""
-
-st.markdown(insight_prospek)
-
-# --- Diagram Jumlah Jurusan per Universitas (Top 20 & Bottom 20) ---
-st.header("🏫 Jumlah Jurusan per Universitas")
-
-# Hitung jumlah jurusan unik per universitas
-jurusan_per_univ = df.groupby("ASAL UNIV")["NAMA"].nunique().reset_index()
-jurusan_per_univ.columns = ["Universitas", "Jumlah Jurusan"]
-jurusan_per_univ = jurusan_per_univ.sort_values("Jumlah Jurusan", ascending=False)
-
-# Ambil Top 20 dan Bottom 20
-top20_univ = jurusan_per_univ.head(20)
-bottom20_univ = jurusan_per_univ.tail(20)
-
-# Insight otomatis
-top_univ = top20_univ.iloc[0]
-bottom_univ = bottom20_univ.iloc[-1]
-insight_top_univ = f"""
-📌 Pada jalur **{pilihan_jalur}**, universitas **{top_univ['Universitas']}** memiliki jumlah jurusan terbanyak yaitu **{top_univ['Jumlah Jurusan']}**. Ini mencerminkan kapasitas akademik yang luas dan ragam pilihan bagi calon mahasiswa di jalur tersebut.  
-🔍 Rekomendasi: pastikan kualitas tiap jurusan tetap terjaga melalui evaluasi berkala dan penguatan kolaborasi akademik.
-"""
-
-insight_bottom_univ = f"""
-📌 Pada jalur **{pilihan_jalur}**, universitas **{bottom_univ['Universitas']}** hanya memiliki **{bottom_univ['Jumlah Jurusan']}** jurusan. Hal ini bisa menunjukkan fokus pada bidang tertentu atau kapasitas institusi yang terbatas.  
-🔍 Rekomendasi: evaluasi potensi pengembangan jurusan baru untuk memperluas akses pendidikan di jalur {pilihan_jalur.lower()}.
-"""
-
-
-# Visualisasi dengan Plotly
-fig_top20_univ = px.bar(
-    top20_univ,
-    x="Universitas",
-    y="Jumlah Jurusan",
-    title="Top 20 Universitas dengan Jumlah Jurusan Terbanyak",
-    labels={"Universitas": "Universitas", "Jumlah Jurusan": "Jumlah Jurusan"},
-    hover_data=["Universitas"]
-)
-fig_bottom20_univ = px.bar(
-    bottom20_univ,
-    x="Universitas",
-    y="Jumlah Jurusan",
-    title="Bottom 20 Universitas dengan Jumlah Jurusan Tersedikit",
-    labels={"Universitas": "Universitas", "Jumlah Jurusan": "Jumlah Jurusan"},
-    hover_data=["Universitas"]
-)
+get_export_source().publish(snapshot.version, df, cube, get_history())
+bagian_unduh(cube, get_history(), snapshot.version)
 
-# Tampilkan visual dan insight secara berdampingan
-dua_kolom_chart("🏆 Top 20 Universitas", fig_top20_univ, insight_top_univ,
-                "📉 Bottom 20 Universitas", fig_bottom20_univ, insight_bottom_univ)
-
-
-st.header("🔮 Prediksi Kategori Jurusan IPS (Ramai atau Sepi Peminat)")
-
-# --- Preprocessing untuk model ---
-df_model = df.copy()
-
-# Encode target
-df_model['KATEGORI JURUSAN'] = df_model['KATEGORI JURUSAN'].map({'SEPI PEMINAT': 0, 'RAMAI PEMINAT': 1})
-
-# Encode label kategori
-label_cols = ['ASAL UNIV', 'PROVINSI', 'PROSPEK KERJA', 'JALUR', 'NAMA', 'JENJANG']
-label_encoders = {}
-for col in label_cols:
-    le = LabelEncoder()
-    df_model[col] = le.fit_transform(df_model[col].astype(str))
-    label_encoders[col] = le
-
-# Fitur yang digunakan (tanpa RASIO KEKETATAN)
-fitur = ['PEMINAT 2024', 'ASAL UNIV', 'PROVINSI',
-         'DAYA TAMPUNG 2025', 'PROSPEK KERJA', 'JALUR', 'NAMA', 'JENJANG']
-
-# Data training
-X = df_model[fitur]
-y = df_model['KATEGORI JURUSAN']
-
-# Latih model
-model = RandomForestClassifier(random_state=42)
-model.fit(X, y)
-
-# --- Form input pengguna ---
-st.subheader("📝 Masukkan Data Jurusan")
-
-with st.form("form_prediksi"):
-    peminat = st.number_input("Peminat 2024", min_value=0)
-    daya_tampung = st.number_input("Daya Tampung 2025", min_value=0)
-
-    asal_univ = st.selectbox("Asal Universitas", label_encoders['ASAL UNIV'].classes_)
-    provinsi = st.selectbox("Provinsi", label_encoders['PROVINSI'].classes_)
-    prospek = st.selectbox("Prospek Kerja", label_encoders['PROSPEK KERJA'].classes_)
-    jalur = st.selectbox("Jalur", label_encoders['JALUR'].classes_)
-    nama = st.selectbox("Nama Jurusan", label_encoders['NAMA'].classes_)
-    jenjang = st.selectbox("Jenjang", label_encoders['JENJANG'].classes_)
-
-    pred_button = st.form_submit_button("Prediksi Kategori")
-
-# --- Prediksi ---
-if pred_button:
-    input_data = [[
-        peminat,
-        label_encoders['ASAL UNIV'].transform([asal_univ])[0],
-        label_encoders['PROVINSI'].transform([provinsi])[0],
-        daya_tampung,
-        label_encoders['PROSPEK KERJA'].transform([prospek])[0],
-        label_encoders['JALUR'].transform([jalur])[0],
-        label_encoders['NAMA'].transform([nama])[0],
-        label_encoders['JENJANG'].transform([jenjang])[0],
-    ]]
-    hasil = model.predict(input_data)[0]
-    kategori = "RAMAI PEMINAT" if hasil == 1 else "SEPI PEMINAT"
-    st.success(f"✅ Prediksi: Jurusan ini termasuk **{kategori}**.")
+st.session_state[METRIK_RERUN] = METRICS.end_run().as_dict()
+if st.query_params.get("debug") == "1":
+    panel_debug(st.session_state[METRIK_RERUN])
@@ -0,0 +1,100 @@
+"""Ukur ukuran JSON setiap diagram yang dikirim ke browser dan cek terhadap anggarannya.
+
+Dataset dari ``--csv`` diperbesar ``--skala`` kali (NAMA dan ASAL UNIV diberi
+akhiran per salinan sehingga kardinalitasnya ikut naik), lalu app dijalankan
+lewat ``AppTest``. Ukuran diagram seharusnya tidak ikut membesar.
+
+Contoh:
+    python bench/chart_payload.py --csv data.csv --skala 1 10
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from snbp.payload import FIGURE_BUDGET_BYTES  # noqa: E402
+
+
+def perbesar(df, skala):
+    salinan = []
+    for i in range(skala):
+        bagian = df.copy()
+        if i:
+            bagian["NAMA"] = bagian["NAMA"].astype(str) + f" {i}"
+            bagian["ASAL UNIV"] = bagian["ASAL UNIV"].astype(str) + f" {i}"
+        salinan.append(bagian)
+    return pd.concat(salinan, ignore_index=True)
+
+
+def ukur_diagram(csv_path, timeout):
+    """Jalankan app di proses terpisah (konfigurasi snbp dibaca saat import) dan kembalikan ukuran diagram."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, SNBP_SHEET_URL=Path(csv_path).resolve().as_uri(), SNBP_CACHE_DIR=cache_dir)
+        proses = subprocess.run(
+            [sys.executable, __file__, "--ukur-sekali", "--timeout", str(timeout)],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        return json.loads(proses.stdout.strip().splitlines()[-1])
+
+
+def ukur_sekali(timeout):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout).run()
+    if at.exception:
+        raise SystemExit(f"App gagal dijalankan: {at.exception[0].value}")
+    hasil = {}
+    for chart in at.get("plotly_chart"):
+        spec = chart.proto.figure.spec
+        judul = json.loads(spec)["layout"].get("title", {}).get("text", "(tanpa judul)")
+        hasil[judul] = len(spec.encode("utf-8"))
+    print(json.dumps(hasil))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", help="CSV dataset SNBP")
+    parser.add_argument("--skala", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--ukur-sekali", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.ukur_sekali:
+        return ukur_sekali(args.timeout)
+    if not args.csv:
+        parser.error("--csv wajib diisi")
+
+    df = pd.read_csv(args.csv)
+    per_skala = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for skala in args.skala:
+            path = Path(tmp) / f"sheet_x{skala}.csv"
+            perbesar(df, skala).to_csv(path, index=False)
+            per_skala[skala] = ukur_diagram(path, args.timeout)
+
+    judul_semua = list(dict.fromkeys(j for hasil in per_skala.values() for j in hasil))
+    kepala = "".join(f"{f'x{s} ({len(df) * s} baris)':>22}" for s in args.skala)
+    print(f"{'Diagram':<60}{kepala}")
+    melebihi = 0
+    for judul in judul_semua:
+        kolom = ""
+        for skala in args.skala:
+            ukuran = per_skala[skala].get(judul)
+            tanda = "!" if ukuran and ukuran > FIGURE_BUDGET_BYTES else " "
+            melebihi += tanda == "!"
+            kolom += f"{'-' if ukuran is None else f'{ukuran / 1024:.1f} KB':>21}{tanda}"
+        print(f"{judul[:58]:<60}{kolom}")
+    print(f"\nAnggaran per diagram: {FIGURE_BUDGET_BYTES / 1024:.0f} KB; melebihi anggaran: {melebihi}")
+    return 1 if melebihi else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Ukur unduhan hasil filter: file yang disusun utuh di memori vs streaming per potongan (``snbp.download``).
+
+Data sintetis (``snbp.synthetic``) ``--baris`` baris, ditambah riwayat
+``--tahun`` tahun (satu snapshot sintetis per tahun) di folder sementara.
+Filter yang diekspor: JALUR SNBP (sekitar separuh baris).
+
+- ``utuh``: cara ``st.download_button``: ``df[mask].to_csv()`` /
+  ``to_parquet(BytesIO)``, riwayat lewat ``HistoryStore.read`` lalu difilter;
+- ``stream``: ``snbp.download.export_stream``, bytes dibuang per potongan
+  (seperti dikirim ke socket).
+
+Setiap kasus dijalankan di proses Python baru. Setelah dataset, kubus, dan
+riwayat dimuat, puncak RSS (VmHWM) di-reset lewat ``/proc/self/clear_refs``;
+yang dilaporkan adalah tambahan RSS puncak selama ekspor (hanya Linux), waktu,
+dan ukuran file.
+
+Contoh:
+    python bench/export_stream.py --baris 20000 200000 --tahun 5
+"""
+
+import argparse
+import gc
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+SUMBER = ["baris", "riwayat", "agregat"]
+FORMAT = ["csv", "parquet"]
+MODE = ["utuh", "stream"]
+FILTER = {'JALUR': ['SNBP']}
+PER = ['ASAL UNIV', 'NAMA']
+
+
+def rss_mb(kunci):
+    with open("/proc/self/status") as f:
+        for baris in f:
+            if baris.startswith(kunci + ":"):
+                return int(baris.split()[1]) / 1024
+    return float("nan")
+
+
+def siapkan(folder, baris, tahun, seed):
+    from snbp.history import HistoryStore, prepare_snapshot
+    from snbp.synthetic import generate
+
+    store = HistoryStore(folder / "riwayat")
+    for i in range(tahun):
+        sheet = generate(baris, seed=seed + i)
+        if i == tahun - 1:
+            sheet.to_csv(folder / "sheet.csv", index=False)
+        store.append(prepare_snapshot(sheet)[1], year=2025 - tahun + 1 + i)
+
+
+def utuh(sumber, format_file, df, cube, history):
+    if sumber == "baris":
+        frame = df[df['JALUR'].astype(str).isin(FILTER['JALUR']).to_numpy()]
+    elif sumber == "riwayat":
+        frame = history.read(jalur=FILTER['JALUR'])
+    else:
+        from snbp.download import aggregate_table
+
+        frame = aggregate_table(cube, PER, FILTER)
+    if format_file == "csv":
+        return len(frame.to_csv(index=False).encode("utf-8"))
+    from snbp.download import _plain
+
+    buffer = io.BytesIO()
+    _plain(frame).to_parquet(buffer, index=False)
+    return len(buffer.getvalue())
+
+
+def stream(sumber, format_file, df, cube, history):
+    from snbp.download import export_stream
+
+    _, _, body = export_stream(sumber, format_file, FILTER, PER, [], df, cube, history)
+    return sum(len(data) for data in body)
+
+
+def anak(folder, mode, sumber, format_file):
+    """Dijalankan di proses anak: satu kasus, cetak JSON hasil."""
+    from snbp.cube import AggregateCube
+    from snbp.history import HistoryStore
+    from snbp.ingest import read_dataset
+
+    df = read_dataset((folder / "sheet.csv").read_bytes())
+    cube = AggregateCube(df)
+    history = HistoryStore(folder / "riwayat")
+    gc.collect()
+    Path("/proc/self/clear_refs").write_text("5")
+    awal = rss_mb("VmRSS")
+
+    mulai = time.perf_counter()
+    ukuran = (utuh if mode == "utuh" else stream)(sumber, format_file, df, cube, history)
+    waktu = time.perf_counter() - mulai
+    print(json.dumps({
+        "mode": mode, "sumber": sumber, "format": format_file,
+        "detik": waktu, "ukuran_mb": ukuran / 2**20, "puncak_mb": rss_mb("VmHWM") - awal,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baris", type=int, nargs="+", default=[20000, 200000])
+    parser.add_argument("--tahun", type=int, default=5, help="jumlah tahun riwayat sintetis")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    parser.add_argument("--anak", nargs=4, metavar=("FOLDER", "MODE", "SUMBER", "FORMAT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.anak:
+        anak(Path(args.anak[0]), *args.anak[1:])
+        return
+
+    hasil = []
+    for baris in args.baris:
+        with tempfile.TemporaryDirectory() as tmp:
+            siapkan(Path(tmp), baris, args.tahun, args.seed)
+            for sumber in SUMBER:
+                for format_file in FORMAT:
+                    for mode in MODE:
+                        keluaran = subprocess.run(
+                            [sys.executable, __file__, "--anak", tmp, mode, sumber, format_file],
+                            check=True, capture_output=True, text=True,
+                        ).stdout
+                        hasil.append({"baris": baris, **json.loads(keluaran.strip().splitlines()[-1])})
+
+    print(f"{'baris':>8}  {'sumber':<9}{'format':<9}{'mode':<8}{'file (MB)':>10}{'waktu (s)':>11}{'RSS puncak (MB)':>17}")
+    for h in hasil:
+        print(f"{h['baris']:>8}  {h['sumber']:<9}{h['format']:<9}{h['mode']:<8}{h['ukuran_mb']:>10.1f}"
+              f"{h['detik']:>11.2f}{h['puncak_mb']:>17.1f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Ukur waktu membangun figure per tampilan: plotly.express vs template vs cache figure.
+
+Semua kombinasi yang diekspor ``snbp.export`` (tiga pilihan jalur, setiap
+provinsi, setiap JALUR x KATEGORI JURUSAN) dibangun dengan ``snbp.report`` dari
+dataset sintetis (``snbp.synthetic``) dalam tiga mode:
+
+- ``px``: setiap figure dibangun ``plotly.express`` (perilaku sebelum ``snbp.figures``);
+- ``template``: template sudah hangat, figure diisi ulang untuk setiap filter
+  (tanpa versi data, jadi tidak ada cache figure);
+- ``cache``: figure diambil dari cache ``(id diagram, filter, versi)``.
+
+Kubus agregat dihangatkan lebih dulu, jadi yang terukur hanya pembangunan
+figure (dan sedikit pemotongan DataFrame yang sama di semua mode).
+
+Contoh:
+    python bench/figure_build.py --baris 20000 --ulang 3
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import snbp.report as report  # noqa: E402
+from snbp.cube import AggregateCube  # noqa: E402
+from snbp.export import BUILDERS, combinations  # noqa: E402
+from snbp.figures import FigureFactory, px  # noqa: E402
+from snbp.ingest import read_dataset  # noqa: E402
+
+MODE = ["px", "template", "cache"]
+VERSI = "bench"
+
+
+class HanyaPx(FigureFactory):
+    """Selalu ``plotly.express``, tanpa template dan tanpa cache."""
+
+    def build(self, kind, chart_id, frame, state=(), version=None, title=None, traces=None, layout=None, **px_kwargs):
+        fig = getattr(px, kind)(frame, title=title, **px_kwargs)
+        if traces:
+            fig.update_traces(**traces)
+        if layout:
+            fig.update_layout(**layout)
+        return fig
+
+
+def bangun_semua(cube, combos, version):
+    waktu, jumlah = {view: [] for view in BUILDERS}, 0
+    for view, args in combos:
+        mulai = time.perf_counter()
+        laporan = BUILDERS[view](cube, *args, version=version)
+        waktu[view].append(time.perf_counter() - mulai)
+        jumlah += len(laporan.charts)
+    return waktu, jumlah
+
+
+def ukur(mode, cube, combos, ulang):
+    if mode == "px":
+        report.FIGURES = HanyaPx()
+    else:
+        report.FIGURES = FigureFactory()
+    version = VERSI if mode == "cache" else None
+    # Putaran pemanasan: kubus, template (mode template), atau cache figure (mode cache)
+    bangun_semua(cube, combos, version)
+
+    per_view = {view: [] for view in BUILDERS}
+    for _ in range(ulang):
+        waktu, jumlah = bangun_semua(cube, combos, version)
+        for view, detik in waktu.items():
+            per_view[view].extend(detik)
+    return {
+        "mode": mode,
+        "figure_per_putaran": jumlah,
+        "ms_per_tampilan": {view: statistics.fmean(detik) * 1000 for view, detik in per_view.items()},
+        "ms_per_figure": sum(sum(detik) for detik in per_view.values()) / (ulang * jumlah) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baris", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ulang", type=int, default=3, help="putaran terukur per mode")
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    args = parser.parse_args()
+
+    from snbp.synthetic import generate
+
+    df = read_dataset(generate(args.baris, seed=args.seed).to_csv(index=False).encode("utf-8"))
+    cube = AggregateCube(df)
+    combos = combinations(df, cube)
+    hasil = [ukur(mode, cube, combos, args.ulang) for mode in MODE]
+
+    print(f"{args.baris} baris, {len(combos)} tampilan, {hasil[0]['figure_per_putaran']} figure per putaran\n")
+    print(f"{'mode':<10}" + "".join(f"{view + ' (ms)':>16}" for view in BUILDERS) + f"{'ms/figure':>12}{'percepatan':>12}")
+    for h in hasil:
+        print(
+            f"{h['mode']:<10}" + "".join(f"{h['ms_per_tampilan'][view]:>16.1f}" for view in BUILDERS)
+            + f"{h['ms_per_figure']:>12.2f}{hasil[0]['ms_per_figure'] / h['ms_per_figure']:>11.1f}x"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2))
+
+
+if __name__ == "__main__":
+    main()
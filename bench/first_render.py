@@ -0,0 +1,97 @@
+"""Ukur waktu sampai render pertama (Statistik Umum) pada cold start, dibanding halaman penuh.
+
+Setiap pengukuran berjalan di proses Python baru agar biaya import (streamlit,
+pandas, plotly, scikit-learn) ikut terukur. Streamlit mengirim elemen ke browser
+sambil script berjalan, jadi "render pertama" adalah saat bagian
+``statistik_umum`` selesai dan "render bermakna" saat filter dan ringkasan jalur
+(``bagian_jalur``) selesai (dibaca dari metrik rerun di
+``st.session_state["_metrik_rerun"]``), sedangkan "halaman penuh" adalah
+selesainya seluruh script. Dicatat juga modul berat yang sudah terimport.
+
+Halaman diukur dua kali: bawaan (bagian berat tertutup, lihat ``bagian_tunda``
+di app.py) dan dengan ``?buka=semua`` (semua bagian dihitung, seperti sebelum
+ada render bertahap).
+
+Contoh:
+    SNBP_SHEET_URL=file:///path/ke/sheet.csv python bench/first_render.py --ulang 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+METRIK_RERUN = "_metrik_rerun"
+MODUL_BERAT = ["plotly.express", "sklearn", "joblib"]
+
+
+def ukur_sekali(timeout, buka_semua):
+    mulai = time.time()
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout)
+    if buka_semua:
+        at.query_params["buka"] = "semua"
+    at.run()
+    selesai = time.time()
+    if at.exception:
+        raise SystemExit(f"App gagal dijalankan: {at.exception[0].value}")
+    bagian = at.session_state[METRIK_RERUN]["sections"]
+    print(json.dumps({
+        "render_pertama_s": bagian["statistik_umum"]["finished_at"] - mulai,
+        "render_bermakna_s": bagian["bagian_jalur"]["finished_at"] - mulai,
+        "halaman_penuh_s": selesai - mulai,
+        "modul": [nama for nama in MODUL_BERAT if nama in sys.modules],
+    }))
+
+
+def ukur(ulang, timeout, buka_semua=False):
+    hasil = []
+    for _ in range(ulang):
+        # Cache disk (snapshot sheet, model) dibiarkan hangat agar yang terukur adalah biaya start proses
+        proses = subprocess.run(
+            [sys.executable, __file__, "--ukur-sekali", "--timeout", str(timeout)] + (["--buka-semua"] if buka_semua else []),
+            env=dict(os.environ, PYTHONPATH=str(ROOT)), capture_output=True, text=True, check=True,
+        )
+        hasil.append(json.loads(proses.stdout.strip().splitlines()[-1]))
+    return hasil
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ulang", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    parser.add_argument("--ukur-sekali", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--buka-semua", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.ukur_sekali:
+        return ukur_sekali(args.timeout, args.buka_semua)
+
+    if "SNBP_CACHE_DIR" not in os.environ:
+        os.environ["SNBP_CACHE_DIR"] = tempfile.mkdtemp(prefix="snbp-first-render-")
+    # Run pemanasan: isi snapshot sheet dan model di disk agar unduhan/pelatihan tidak ikut terukur
+    ukur(1, args.timeout, buka_semua=True)
+    hasil = {"bawaan": ukur(args.ulang, args.timeout), "buka_semua": ukur(args.ulang, args.timeout, buka_semua=True)}
+
+    print(f"Median {args.ulang} proses per mode (detik sejak proses mulai)\n")
+    print(f"{'mode':<12}{'render pertama':>16}{'render bermakna':>17}{'halaman penuh':>15}  modul berat terimport")
+    for mode, ukuran in hasil.items():
+        median = {kunci: statistics.median(h[kunci] for h in ukuran)
+                  for kunci in ("render_pertama_s", "render_bermakna_s", "halaman_penuh_s")}
+        print(f"{mode:<12}{median['render_pertama_s']:>16.3f}{median['render_bermakna_s']:>17.3f}"
+              f"{median['halaman_penuh_s']:>15.3f}  {', '.join(ukuran[-1]['modul']) or '-'}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Ukur bundel geometri ``snbp.geo``: ukuran payload per tingkat zoom, waktu bangun, dan celah antar provinsi.
+
+Tanpa ``--sumber``, geometri dibuat sintetis: grid ``--provinsi`` sel di
+kotak koordinat Indonesia, setiap batas antar sel adalah jalan acak bergerigi
+(``--titik`` titik per sisi) yang dipakai persis sama oleh kedua sel, plus
+beberapa pulau kecil per provinsi. Dengan ``--sumber`` dipakai FeatureCollection
+asli (misalnya batas provinsi BPS/GADM).
+
+Celah dihitung dari ruas batas: setelah penyederhanaan, setiap ruas di dalam
+daratan harus dipakai tepat dua provinsi. Ruas yang dipakai satu provinsi saja
+tetapi tidak terletak di tepi luar grid adalah celah/tumpang tindih. Sebagai
+pembanding, setiap ring juga disederhanakan sendiri-sendiri (Douglas-Peucker
+per polygon, tanpa arc bersama). Celah hanya dihitung untuk geometri sintetis.
+
+Contoh:
+    python bench/geo_payload.py --provinsi 38 --titik 400
+    python bench/geo_payload.py --sumber provinsi.geojson
+"""
+
+import argparse
+import json
+import math
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from snbp.geo import LEVELS, QUANTIZE, build_bundle, douglas_peucker  # noqa: E402
+
+# Kotak koordinat kira-kira wilayah Indonesia (bujur, lintang)
+KOTAK = (95.0, -11.0, 141.0, 6.0)
+
+
+def peta_sintetis(jumlah, titik, rng):
+    kolom = math.ceil(math.sqrt(jumlah * 2.5))
+    baris = math.ceil(jumlah / kolom)
+    xs = np.linspace(KOTAK[0], KOTAK[2], kolom + 1)
+    ys = np.linspace(KOTAK[1], KOTAK[3], baris + 1)
+    lebar = min(xs[1] - xs[0], ys[1] - ys[0])
+    sisi = {}
+
+    def jalan(a, b, luar):
+        """Titik dari ``a`` ke ``b``; lurus di tepi luar grid, bergerigi di dalam (sama untuk kedua sel)."""
+        kunci = (a, b) if a <= b else (b, a)
+        if kunci not in sisi:
+            t = np.linspace(0, 1, titik)[:, None]
+            p, q = np.array(kunci[0]), np.array(kunci[1])
+            garis = p + t * (q - p)
+            if not luar:
+                normal = np.array([-(q - p)[1], (q - p)[0]]) / np.hypot(*(q - p))
+                geser = np.cumsum(rng.normal(0, lebar * 0.01, titik))
+                geser -= np.linspace(geser[0], geser[-1], titik)  # ujung tetap di titik sudut
+                garis = garis + geser[:, None] * normal
+            sisi[kunci] = garis.round(6).tolist()
+        return sisi[kunci] if (a, b) == kunci else sisi[kunci][::-1]
+
+    fitur, tepi = [], []
+    for i in range(jumlah):
+        c, r = i % kolom, i // kolom
+        sudut = [(xs[c], ys[r]), (xs[c + 1], ys[r]), (xs[c + 1], ys[r + 1]), (xs[c], ys[r + 1])]
+        ring = []
+        for j in range(4):
+            a, b = sudut[j], sudut[(j + 1) % 4]
+            luar = (j == 0 and r == 0) or (j == 1 and c == kolom - 1) or (j == 2 and r == baris - 1) \
+                or (j == 3 and c == 0) or (j == 2 and i + kolom >= jumlah) or (j == 1 and i + 1 >= jumlah)
+            ring.extend(jalan(a, b, luar)[:-1])
+            if luar:
+                tepi.append((a, b))
+        ring.append(ring[0])
+        polygon = [[ring]]
+        # Pulau kecil (dibuang di tingkat kasar): segi-12 beberapa ratus meter di dalam sel
+        for _ in range(3):
+            pusat = (rng.uniform(xs[c] + lebar * 0.2, xs[c + 1] - lebar * 0.2), rng.uniform(ys[r] + lebar * 0.2, ys[r + 1] - lebar * 0.2))
+            sudut_pulau = np.linspace(0, 2 * np.pi, 13)
+            pulau = np.c_[pusat[0] + 0.004 * np.cos(sudut_pulau), pusat[1] + 0.004 * np.sin(sudut_pulau)]
+            polygon.append([pulau.round(6).tolist()])
+        fitur.append({"type": "Feature", "properties": {"PROVINSI": f"Provinsi {i}"},
+                      "geometry": {"type": "MultiPolygon", "coordinates": polygon}})
+    return {"type": "FeatureCollection", "features": fitur}, tepi
+
+
+def ring_daratan(collection):
+    for feature in collection["features"]:
+        geometry = feature["geometry"]
+        polygons = [geometry["coordinates"]] if geometry["type"] == "Polygon" else geometry["coordinates"]
+        yield max((polygon[0] for polygon in polygons), key=len)
+
+
+def celah(rings, tepi):
+    """Ruas yang hanya dipakai satu ring dan tidak terletak di tepi luar grid (``tepi``: sisi lurus terluar)."""
+    hitung = Counter()
+    for ring in rings:
+        titik = [tuple(np.rint(np.asarray(p) * QUANTIZE).astype(int)) for p in ring]
+        for a, b in zip(titik[:-1], titik[1:]):
+            if a != b:
+                hitung[(a, b) if a <= b else (b, a)] += 1
+    garis = [(np.rint(np.asarray(a) * QUANTIZE), np.rint(np.asarray(b) * QUANTIZE)) for a, b in tepi]
+
+    def di_garis(titik, p, q):
+        # Segaris (toleransi satu sel grid karena pembulatan) dan di dalam rentang sisi
+        d = q - p
+        silang = abs(d[0] * (titik[1] - p[1]) - d[1] * (titik[0] - p[0])) / np.hypot(*d)
+        return silang <= 1 and (np.minimum(p, q) - 1 <= titik).all() and (titik <= np.maximum(p, q) + 1).all()
+
+    def di_tepi(a, b):
+        return any(di_garis(np.array(a), p, q) and di_garis(np.array(b), p, q) for p, q in garis)
+
+    return sum(1 for (a, b), n in hitung.items() if n == 1 and not di_tepi(a, b))
+
+
+def per_ring(collection, toleransi):
+    """Pembanding: setiap ring daratan disederhanakan sendiri tanpa arc bersama."""
+    hasil = []
+    for ring in ring_daratan(collection):
+        titik = np.rint(np.asarray(ring) * QUANTIZE)
+        hasil.append((titik[douglas_peucker(titik, toleransi * QUANTIZE)] / QUANTIZE).tolist())
+    return hasil
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sumber", help="FeatureCollection provinsi asli (default: geometri sintetis)")
+    parser.add_argument("--provinsi", type=int, default=38)
+    parser.add_argument("--titik", type=int, default=400, help="titik per sisi batas sintetis")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sumber = Path(args.sumber) if args.sumber else Path(tmp) / "sintetis.geojson"
+        if not args.sumber:
+            peta, tepi = peta_sintetis(args.provinsi, args.titik, np.random.default_rng(args.seed))
+            sumber.write_text(json.dumps(peta))
+        asli = json.loads(sumber.read_text())
+        mulai = time.perf_counter()
+        bundel = build_bundle(sumber, Path(tmp) / "bundel.json")
+        bangun = time.perf_counter() - mulai
+        ukuran_bundel = (Path(tmp) / "bundel.json").stat().st_size
+
+    hasil = {
+        "sumber_kb": len(json.dumps(asli, separators=(",", ":"))) / 1e3,
+        "titik_sumber": sum(len(ring) for ring in ring_daratan(asli)),
+        "bangun_detik": bangun,
+        "bundel_kb": ukuran_bundel / 1e3,
+        "tingkat": {},
+    }
+    for level, collection in bundel["levels"].items():
+        rings = list(ring_daratan(collection))
+        hasil["tingkat"][level] = {
+            "payload_kb": len(json.dumps(collection, separators=(",", ":"))) / 1e3,
+            "provinsi": len(collection["features"]),
+            "titik_daratan": sum(len(ring) for ring in rings),
+            "celah": None if args.sumber else celah(rings, tepi),
+            "celah_per_ring": None if args.sumber else celah(per_ring(asli, LEVELS[level]), tepi),
+        }
+
+    print(f"sumber {hasil['sumber_kb']:.0f} kB ({hasil['titik_sumber']} titik daratan), "
+          f"bangun {hasil['bangun_detik']:.2f} s, bundel {hasil['bundel_kb']:.0f} kB\n")
+    print(f"{'tingkat':<10}{'payload (kB)':>14}{'provinsi':>10}{'titik':>8}{'celah':>8}{'celah per ring':>16}")
+    for level, t in hasil["tingkat"].items():
+        print(f"{level:<10}{t['payload_kb']:>14.1f}{t['provinsi']:>10}{t['titik_daratan']:>8}"
+              f"{t['celah'] if t['celah'] is not None else '-':>8}{t['celah_per_ring'] if t['celah_per_ring'] is not None else '-':>16}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2))
+
+
+if __name__ == "__main__":
+    main()
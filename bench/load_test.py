@@ -0,0 +1,321 @@
+"""Uji beban: banyak sesi browser simulasi terhadap ``streamlit run app.py`` lewat websocket.
+
+Server Streamlit dijalankan lokal di proses terpisah. Setiap sesi simulasi
+berbicara dengan protokol yang sama seperti browser (protobuf ``BackMsg`` /
+``ForwardMsg`` di ``/_stcore/stream``): membuka halaman, lalu menjalankan skrip
+interaksi berulang kali dengan jeda berpikir acak:
+
+1. ganti "Pilih Jalur:" (radio di fragment jalur);
+2. ganti "Pilih Provinsi" (drill-down provinsi);
+3. telusuri kaskade eksplorasi: provinsi -> universitas -> kategori jurusan;
+4. isi "Peminat 2024" dan kirim form "Prediksi Kategori".
+
+Latensi satu interaksi dihitung dari ``BackMsg`` rerun dikirim sampai
+``script_finished`` diterima (rerun penuh atau fragment). Untuk setiap tingkat
+konkurensi (``--sesi``) dilaporkan persentil latensi, waktu muat halaman
+pertama, serta CPU dan RSS proses server (disampel dari ``/proc``, hanya Linux).
+
+Data: CSV sintetis ``--baris`` baris (``snbp.synthetic``), atau bila tidak
+diberikan, ``SNBP_SHEET_URL``/``SNBP_CACHE_DIR`` dari environment.
+
+Contoh:
+    python bench/load_test.py --baris 20000 --sesi 1 5 10 20 --putaran 3 --jeda-ms 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+WIDGET = ("selectbox", "radio", "number_input", "button")
+TICK = os.sysconf("SC_CLK_TCK")
+
+
+def port_bebas():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def jalankan_server(port, env, log):
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", str(ROOT / "app.py"),
+            "--server.headless=true", "--server.address=127.0.0.1", f"--server.port={port}",
+            "--server.fileWatcherType=none", "--browser.gatherUsageStats=false",
+        ],
+        cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+
+
+def tunggu_siap(port, proses, timeout):
+    batas = time.monotonic() + timeout
+    while time.monotonic() < batas:
+        if proses.poll() is not None:
+            raise SystemExit("Server Streamlit berhenti sebelum siap (lihat log)")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as resp:
+                if resp.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit(f"Server tidak siap dalam {timeout} s")
+
+
+def baca_proc(pid):
+    """``(detik CPU kumulatif, RSS dalam MB)`` proses ``pid``."""
+    with open(f"/proc/{pid}/stat") as f:
+        # Nama proses bisa memuat spasi; field sesudah ")" dimulai dari field ke-3
+        field = f.read().rsplit(")", 1)[1].split()
+    with open(f"/proc/{pid}/statm") as f:
+        rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    return (int(field[11]) + int(field[12])) / TICK, rss
+
+
+async def sampel_server(pid, interval, hasil, berhenti):
+    cpu_lalu, _ = baca_proc(pid)
+    waktu_lalu = time.perf_counter()
+    while not berhenti.is_set():
+        try:
+            await asyncio.wait_for(berhenti.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+        cpu, rss = baca_proc(pid)
+        sekarang = time.perf_counter()
+        hasil.append((100 * (cpu - cpu_lalu) / (sekarang - waktu_lalu), rss))
+        cpu_lalu, waktu_lalu = cpu, sekarang
+
+
+class Sesi:
+    """Satu tab browser: koneksi websocket, nilai widget, dan widget yang sedang tampil."""
+
+    def __init__(self, port, timeout):
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.timeout = timeout
+        self.ws = None
+        self.widget = {}   # label -> (jenis, proto, fragment_id) dari delta terakhir
+        self.nilai = {}    # id widget -> WidgetState yang sudah diubah pengguna
+        self.cache = {}    # hash -> ForwardMsg, untuk pesan ``ref_hash`` (seperti cache browser)
+        self.galat = []
+
+    async def buka(self):
+        from tornado.websocket import websocket_connect
+
+        self.ws = await websocket_connect(self.url, subprotocols=["streamlit"], max_message_size=2**30)
+        return await self.rerun()
+
+    def tutup(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    async def rerun(self, fragment_id="", pemicu=None):
+        """Kirim rerun dengan semua nilai widget (+ tombol ``pemicu``); kembalikan latensinya."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        msg = BackMsg()
+        client = msg.rerun_script
+        client.query_string = "buka=semua"  # semua bagian tertunda dibuka (widget interaksi harus ada)
+        client.page_script_hash = ""
+        client.fragment_id = fragment_id
+        client.widget_states.widgets.extend(self.nilai.values())
+        if pemicu is not None:
+            client.widget_states.widgets.append(WidgetState(id=pemicu, trigger_value=True))
+
+        mulai = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        while True:
+            data = await asyncio.wait_for(self.ws.read_message(), self.timeout)
+            if data is None:
+                raise ConnectionError("Websocket ditutup server")
+            pesan = ForwardMsg()
+            pesan.ParseFromString(data)
+            self._terima(pesan)
+            if pesan.WhichOneof("type") == "script_finished":
+                if pesan.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                return time.perf_counter() - mulai
+
+    def _terima(self, pesan):
+        if pesan.WhichOneof("type") == "ref_hash":
+            pesan = self.cache.get(pesan.ref_hash, pesan)
+        elif pesan.metadata.cacheable:
+            self.cache[pesan.hash] = pesan
+        if pesan.WhichOneof("type") != "delta" or pesan.delta.WhichOneof("type") != "new_element":
+            return
+        elemen = pesan.delta.new_element
+        jenis = elemen.WhichOneof("type")
+        if jenis in WIDGET:
+            proto = getattr(elemen, jenis)
+            self.widget[proto.label] = (jenis, proto, pesan.delta.fragment_id)
+        elif jenis == "exception":
+            self.galat.append(elemen.exception.message)
+
+    def _cari(self, label):
+        try:
+            return self.widget[label]
+        except KeyError:
+            raise LookupError(f"Widget '{label}' tidak ditemukan") from None
+
+    async def pilih(self, label, rng):
+        """Pilih opsi lain secara acak pada selectbox/radio ``label``."""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        _, proto, fragment_id = self._cari(label)
+        sekarang = self.nilai[proto.id].int_value if proto.id in self.nilai else proto.default
+        pilihan = [i for i in range(len(proto.options)) if i != sekarang] or [sekarang]
+        self.nilai[proto.id] = WidgetState(id=proto.id, int_value=rng.choice(pilihan))
+        return await self.rerun(fragment_id)
+
+    async def isi_angka(self, label, nilai):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        _, proto, _ = self._cari(label)
+        # Nilai widget di dalam form baru dikirim saat form di-submit
+        self.nilai[proto.id] = WidgetState(id=proto.id, int_value=nilai)
+
+    async def klik(self, label):
+        _, proto, fragment_id = self._cari(label)
+        return await self.rerun(fragment_id, pemicu=proto.id)
+
+
+async def skrip(sesi, rng):
+    """Satu putaran interaksi; ``[(nama, detik)]``."""
+    hasil = [("Pilih Jalur", await sesi.pilih("Pilih Jalur:", rng))]
+    hasil.append(("Pilih Provinsi", await sesi.pilih("Pilih Provinsi", rng)))
+    hasil.append(("Eksplorasi: provinsi", await sesi.pilih("📍 Pilih Provinsi", rng)))
+    hasil.append(("Eksplorasi: universitas", await sesi.pilih("🏫 Pilih Universitas", rng)))
+    hasil.append(("Eksplorasi: kategori", await sesi.pilih("📊 Pilih Kategori Jurusan", rng)))
+    await sesi.isi_angka("Peminat 2024", rng.randint(0, 500))
+    hasil.append(("Prediksi (submit form)", await sesi.klik("Prediksi Kategori")))
+    return hasil
+
+
+async def pengguna(port, putaran, jeda, seed, timeout, catatan):
+    rng = random.Random(seed)
+    sesi = Sesi(port, timeout)
+    try:
+        catatan["muat"].append(await sesi.buka())
+        for _ in range(putaran):
+            for nama, detik in await skrip(sesi, rng):
+                catatan["interaksi"].setdefault(nama, []).append(detik)
+                # Jeda berpikir di antara interaksi, acak di sekitar --jeda-ms
+                await asyncio.sleep(jeda * rng.uniform(0.5, 1.5))
+    except (LookupError, ConnectionError, OSError, asyncio.TimeoutError) as exc:
+        catatan["gagal"].append(f"{type(exc).__name__}: {exc}")
+    finally:
+        catatan["galat_app"].extend(sesi.galat)
+        sesi.tutup()
+
+
+def persentil(nilai, q):
+    return float(np.percentile(np.array(nilai) * 1000, q)) if nilai else float("nan")
+
+
+async def ukur(port, pid, jumlah_sesi, putaran, jeda, timeout, seed):
+    catatan = {"muat": [], "interaksi": {}, "gagal": [], "galat_app": []}
+    sampel, berhenti = [], asyncio.Event()
+    sampler = asyncio.create_task(sampel_server(pid, 0.25, sampel, berhenti))
+    mulai = time.perf_counter()
+    await asyncio.gather(*(
+        pengguna(port, putaran, jeda, seed * 1000 + i, timeout, catatan) for i in range(jumlah_sesi)
+    ))
+    durasi = time.perf_counter() - mulai
+    berhenti.set()
+    await sampler
+
+    semua = [detik for daftar in catatan["interaksi"].values() for detik in daftar]
+    cpu = [c for c, _ in sampel] or [float("nan")]
+    return {
+        "sesi": jumlah_sesi,
+        "interaksi": len(semua),
+        "durasi_s": durasi,
+        "rerun_per_s": len(semua) / durasi,
+        "p50_ms": persentil(semua, 50),
+        "p95_ms": persentil(semua, 95),
+        "p99_ms": persentil(semua, 99),
+        "muat_p50_ms": persentil(catatan["muat"], 50),
+        "muat_p95_ms": persentil(catatan["muat"], 95),
+        "per_interaksi_p95_ms": {nama: persentil(daftar, 95) for nama, daftar in catatan["interaksi"].items()},
+        "cpu_rata2_persen": statistics.fmean(cpu),
+        "cpu_maks_persen": max(cpu),
+        "rss_maks_mb": max((r for _, r in sampel), default=baca_proc(pid)[1]),
+        "gagal": catatan["gagal"],
+        "galat_app": sorted(set(catatan["galat_app"])),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sesi", type=int, nargs="+", default=[1, 5, 10, 20], help="tingkat konkurensi")
+    parser.add_argument("--putaran", type=int, default=3, help="putaran skrip interaksi per sesi")
+    parser.add_argument("--jeda-ms", type=float, default=500.0, help="rata-rata jeda berpikir antar interaksi")
+    parser.add_argument("--baris", type=int, help="pakai CSV sintetis sebanyak ini (default: data dari environment)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=300.0, help="batas tunggu satu rerun / server siap")
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, PYTHONPATH=str(ROOT))
+        if args.baris:
+            from snbp.synthetic import generate
+
+            csv = Path(tmp) / "sheet.csv"
+            generate(args.baris, seed=args.seed).to_csv(csv, index=False)
+            env.update(SNBP_SHEET_URL=csv.as_uri(), SNBP_CACHE_DIR=str(Path(tmp) / "cache"))
+
+        port = port_bebas()
+        log_path = Path(tmp) / "server.log"
+        with open(log_path, "w") as log:
+            server = jalankan_server(port, env, log)
+            try:
+                tunggu_siap(port, server, args.timeout)
+                # Pemanasan: satu sesi mengisi cache data, kubus, model, dan figure
+                pemanasan = asyncio.run(ukur(port, server.pid, 1, 1, 0.0, args.timeout, args.seed))
+                if pemanasan["gagal"]:
+                    raise SystemExit(f"Pemanasan gagal: {pemanasan['gagal'][0]}\n{log_path.read_text()[-2000:]}")
+                hasil = [
+                    asyncio.run(ukur(port, server.pid, n, args.putaran, args.jeda_ms / 1000, args.timeout, args.seed + 1))
+                    for n in args.sesi
+                ]
+            finally:
+                server.terminate()
+                server.wait(30)
+
+    print(f"{args.putaran} putaran x 6 interaksi per sesi, jeda ~{args.jeda_ms:.0f} ms\n")
+    print(
+        f"{'sesi':>5}{'rerun/s':>9}{'p50 (ms)':>10}{'p95 (ms)':>10}{'p99 (ms)':>10}"
+        f"{'muat p50 (ms)':>15}{'CPU rata2 %':>13}{'CPU maks %':>12}{'RSS maks (MB)':>15}{'gagal':>7}"
+    )
+    for h in hasil:
+        print(
+            f"{h['sesi']:>5}{h['rerun_per_s']:>9.1f}{h['p50_ms']:>10.0f}{h['p95_ms']:>10.0f}{h['p99_ms']:>10.0f}"
+            f"{h['muat_p50_ms']:>15.0f}{h['cpu_rata2_persen']:>13.0f}{h['cpu_maks_persen']:>12.0f}"
+            f"{h['rss_maks_mb']:>15.0f}{len(h['gagal']):>7}"
+        )
+    for h in hasil:
+        for pesan in h["galat_app"]:
+            print(f"Galat app ({h['sesi']} sesi): {pesan}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Ukur waktu bangun dan latensi kueri ``snbp.neighbors.NeighborIndex`` pada dataset sintetis.
+
+Untuk setiap ukuran (``snbp.synthetic``, dipadatkan seperti snapshot
+``snbp.shared``), ``--kueri`` program acak dicari alternatifnya (``k`` terdekat
+dengan rasio keketatan lebih longgar, satu jalur). Dilaporkan juga rata-rata
+jumlah hasil dan berapa persen hasil yang berbagi PROSPEK KERJA dengan program
+acuan.
+
+Contoh:
+    python bench/neighbors_latency.py --baris 2000 20000 200000 --kueri 500
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from snbp.neighbors import DEFAULT_K, NeighborIndex  # noqa: E402
+
+
+def ukur(baris, jumlah_kueri, k, seed):
+    from snbp.ingest import read_dataset
+    from snbp.shared import compact
+    from snbp.synthetic import generate
+
+    df = compact(read_dataset(generate(baris, seed=seed).to_csv(index=False).encode("utf-8")))
+    mulai = time.perf_counter()
+    indeks = NeighborIndex(df)
+    bangun = time.perf_counter() - mulai
+
+    prospek = df['PROSPEK KERJA'].to_numpy()
+    latensi, jumlah, sama = [], [], []
+    for posisi in np.random.default_rng(seed).integers(0, len(df), jumlah_kueri):
+        mulai = time.perf_counter()
+        hasil = indeks.alternatives(posisi, k)
+        latensi.append(time.perf_counter() - mulai)
+        jumlah.append(len(hasil))
+        if len(hasil):
+            sama.append((hasil['PROSPEK KERJA'].to_numpy() == prospek[posisi]).mean())
+
+    latensi = np.array(latensi) * 1000
+    return {
+        "baris": baris,
+        "bangun_ms": bangun * 1000,
+        "p50_ms": float(np.percentile(latensi, 50)),
+        "p99_ms": float(np.percentile(latensi, 99)),
+        "hasil_rata2": float(np.mean(jumlah)),
+        "prospek_sama_persen": 100 * float(np.mean(sama)) if sama else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baris", type=int, nargs="+", default=[2000, 20000, 200000])
+    parser.add_argument("--kueri", type=int, default=500)
+    parser.add_argument("-k", type=int, default=DEFAULT_K)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    args = parser.parse_args()
+
+    hasil = [ukur(baris, args.kueri, args.k, args.seed) for baris in args.baris]
+
+    print(f"{'baris':>9}{'bangun (ms)':>13}{'p50 (ms)':>10}{'p99 (ms)':>10}{'hasil':>7}{'prospek sama %':>16}")
+    for h in hasil:
+        print(
+            f"{h['baris']:>9}{h['bangun_ms']:>13.0f}{h['p50_ms']:>10.2f}{h['p99_ms']:>10.2f}"
+            f"{h['hasil_rata2']:>7.1f}{h['prospek_sama_persen']:>16.1f}"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2))
+
+
+if __name__ == "__main__":
+    main()
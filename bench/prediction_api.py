@@ -0,0 +1,156 @@
+"""Uji beban layanan prediksi ``snbp.api`` di localhost, dengan dan tanpa micro-batching.
+
+Untuk setiap nilai ``--max-batch`` layanan dijalankan sebagai proses terpisah,
+lalu ``--klien`` thread mengirim request satu baris (diambil acak dari dataset)
+berturut-turut selama ``--durasi`` detik lewat koneksi keep-alive. Yang
+dilaporkan: latensi p50/p99 dan throughput di sisi klien, serta rata-rata
+ukuran batch dan latensi yang dicatat layanan (``GET /stats``).
+
+Contoh:
+    SNBP_SHEET_URL=file:///path/ke/sheet.csv python bench/prediction_api.py --max-batch 1 64 --klien 32
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def port_bebas():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def contoh_baris(jumlah, seed=0):
+    from snbp.config import CACHE_DIR, SHEET_TTL, SPREADSHEET_URL
+    from snbp.ingest import read_dataset
+    from snbp.loader import SheetLoader
+    from snbp.model import FEATURES
+
+    df = read_dataset(SheetLoader(SPREADSHEET_URL, CACHE_DIR / "sheet", ttl=SHEET_TTL).get().data)
+    sampel = df[FEATURES].sample(jumlah, replace=True, random_state=seed)
+    return json.loads(sampel.to_json(orient="records"))
+
+
+def tunggu_siap(port, timeout):
+    batas = time.monotonic() + timeout
+    while time.monotonic() < batas:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"layanan di port {port} tidak siap dalam {timeout} s")
+
+
+def klien(port, baris, berhenti, hasil):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    latensi, i = [], 0
+    while not berhenti.is_set():
+        body = json.dumps({"rows": [baris[i % len(baris)]]})
+        mulai = time.perf_counter()
+        conn.request("POST", "/predict", body, {"Content-Type": "application/json"})
+        respons = conn.getresponse()
+        respons.read()
+        if respons.status != 200:
+            raise RuntimeError(f"status {respons.status}")
+        latensi.append(time.perf_counter() - mulai)
+        i += 1
+    conn.close()
+    hasil.extend(latensi)
+
+
+def ukur(max_batch, max_wait_ms, jumlah_klien, durasi, baris, timeout):
+    port = port_bebas()
+    proses = subprocess.Popen(
+        [sys.executable, "-m", "snbp.api", "--port", str(port),
+         "--max-batch", str(max_batch), "--max-wait-ms", str(max_wait_ms)],
+        cwd=ROOT, env={**os.environ, "PYTHONPATH": str(ROOT)},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        tunggu_siap(port, timeout)
+        # Pemanasan singkat agar import dan cache model tidak ikut terukur
+        selesai_pemanasan = threading.Event()
+        threading.Timer(1.0, selesai_pemanasan.set).start()
+        klien(port, baris, selesai_pemanasan, [])
+
+        berhenti, latensi = threading.Event(), []
+        threads = [threading.Thread(target=klien, args=(port, baris, berhenti, latensi)) for _ in range(jumlah_klien)]
+        mulai = time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(durasi)
+        berhenti.set()
+        for t in threads:
+            t.join()
+        lama = time.perf_counter() - mulai
+
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        conn.request("GET", "/stats")
+        server = json.loads(conn.getresponse().read())
+    finally:
+        proses.terminate()
+        proses.wait()
+
+    ms = np.array(latensi) * 1000
+    return {
+        "max_batch": max_batch,
+        "klien": jumlah_klien,
+        "request": len(latensi),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "throughput_rps": len(latensi) / lama,
+        "server_p50_ms": server["p50_ms"],
+        "server_p99_ms": server["p99_ms"],
+        "rata_batch": server["mean_batch_rows"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-batch", type=int, nargs="+", default=[1, 64], help="ukuran batch yang dibandingkan")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--klien", type=int, default=32, help="jumlah klien bersamaan")
+    parser.add_argument("--durasi", type=float, default=10.0, help="detik per konfigurasi")
+    parser.add_argument("--timeout", type=float, default=300.0, help="batas waktu layanan siap")
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    args = parser.parse_args()
+
+    baris = contoh_baris(1000)
+    hasil = [ukur(b, args.max_wait_ms, args.klien, args.durasi, baris, args.timeout) for b in args.max_batch]
+
+    print(f"{args.klien} klien, {args.durasi:.0f} s per konfigurasi, 1 baris per request\n")
+    print(f"{'max batch':>10}{'request':>9}{'p50 (ms)':>10}{'p99 (ms)':>10}{'req/s':>9}{'server p50/p99 (ms)':>22}{'rata batch':>12}")
+    for h in hasil:
+        server = f"{h['server_p50_ms']:.1f} / {h['server_p99_ms']:.1f}"
+        print(
+            f"{h['max_batch']:>10}{h['request']:>9}{h['p50_ms']:>10.1f}{h['p99_ms']:>10.1f}"
+            f"{h['throughput_rps']:>9.0f}{server:>22}{h['rata_batch']:>12.1f}"
+        )
+    if len(hasil) > 1:
+        dasar = hasil[0]["throughput_rps"]
+        print("\nthroughput relatif: " + ", ".join(
+            f"max batch {h['max_batch']} {h['throughput_rps'] / dasar:.1f}x" for h in hasil
+        ))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2))
+
+
+if __name__ == "__main__":
+    main()
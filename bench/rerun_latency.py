@@ -0,0 +1,62 @@
+"""Bandingkan latensi rerun per interaksi: seluruh halaman vs hanya bagian (fragment) terkait.
+
+Setiap interaksi dijalankan lewat ``AppTest`` (rerun penuh = perilaku sebelum ada
+fragment). Durasi bagian yang memuat widget tersebut dibaca dari
+``st.session_state["_durasi_bagian"]``; itulah kode yang dijalankan ulang oleh
+Streamlit ketika fragment saja yang rerun.
+
+Contoh:
+    SNBP_SHEET_URL=file:///path/ke/sheet.csv python bench/rerun_latency.py --ulang 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from skenario import DURASI_BAGIAN, INTERAKSI  # noqa: E402
+
+
+def ukur(ulang, timeout):
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout)
+    # Semua bagian tertunda dibuka agar widget interaksinya ada
+    at.query_params["buka"] = "semua"
+    mulai = time.perf_counter()
+    at.run()
+    print(f"Run pertama (cold): {time.perf_counter() - mulai:.3f} s")
+    if at.exception:
+        raise SystemExit(f"App gagal dijalankan: {at.exception[0].value}")
+
+    hasil = []
+    for nama, bagian, aksi in INTERAKSI:
+        penuh, fragmen = [], []
+        for i in range(ulang):
+            aksi(at, i)
+            mulai = time.perf_counter()
+            at.run()
+            penuh.append(time.perf_counter() - mulai)
+            fragmen.append(at.session_state[DURASI_BAGIAN][bagian])
+        hasil.append((nama, statistics.median(penuh), statistics.median(fragmen)))
+    return hasil
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ulang", type=int, default=5, help="jumlah pengulangan per interaksi")
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    hasil = ukur(args.ulang, args.timeout)
+    print(f"\n{'Interaksi':<26}{'Rerun penuh (ms)':>18}{'Fragment (ms)':>16}{'Lebih cepat':>13}")
+    for nama, penuh, fragmen in hasil:
+        print(f"{nama:<26}{penuh * 1000:>18.1f}{fragmen * 1000:>16.1f}{penuh / fragmen:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Jalankan app headless pada dataset sintetis berbagai ukuran dan laporkan waktu serta memori puncak.
+
+Untuk setiap ukuran, ``snbp.synthetic.generate`` membuat CSV dengan skema 13 kolom
+yang sama seperti spreadsheet. App lalu dijalankan lewat ``AppTest`` di proses
+terpisah (konfigurasi snbp dibaca saat import, dan memori puncak diukur per
+proses) dengan skenario interaksi dari ``bench/skenario.py``.
+
+Yang dilaporkan per ukuran: waktu run pertama (cold), median waktu rerun per
+interaksi, dan RSS puncak proses setelah run pertama serta setelah semua interaksi.
+
+Contoh:
+    python bench/scaling.py --baris 2000 20000 200000 1000000 --json hasil_scaling.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from skenario import INTERAKSI  # noqa: E402
+
+
+def rss_puncak_mb():
+    """RSS puncak proses ini (ru_maxrss dalam KB di Linux, byte di macOS)."""
+    puncak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return puncak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def ukur_sekali(ulang, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    hasil = {"rss_awal_mb": rss_puncak_mb()}
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout)
+    mulai = time.perf_counter()
+    at.run()
+    hasil["cold_s"] = time.perf_counter() - mulai
+    if at.exception:
+        raise SystemExit(f"App gagal dijalankan: {at.exception[0].value}")
+    hasil["rss_cold_mb"] = rss_puncak_mb()
+
+    hasil["interaksi"] = {}
+    for nama, _, aksi in INTERAKSI:
+        durasi = []
+        for i in range(ulang):
+            aksi(at, i)
+            mulai = time.perf_counter()
+            at.run()
+            durasi.append(time.perf_counter() - mulai)
+            if at.exception:
+                raise SystemExit(f"Interaksi '{nama}' gagal: {at.exception[0].value}")
+        hasil["interaksi"][nama] = statistics.median(durasi)
+    hasil["rss_puncak_mb"] = rss_puncak_mb()
+    print(json.dumps(hasil))
+
+
+def ukur_ukuran(baris, seed, ulang, timeout):
+    from snbp.synthetic import generate
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / f"sheet_{baris}.csv"
+        mulai = time.perf_counter()
+        generate(baris, seed=seed).to_csv(csv_path, index=False)
+        waktu_buat = time.perf_counter() - mulai
+        ukuran_csv = csv_path.stat().st_size / 2**20
+
+        env = dict(os.environ, SNBP_SHEET_URL=csv_path.as_uri(), SNBP_CACHE_DIR=str(Path(tmp) / "cache"))
+        proses = subprocess.run(
+            [sys.executable, __file__, "--ukur-sekali", "--ulang", str(ulang), "--timeout", str(timeout)],
+            env=env, capture_output=True, text=True,
+        )
+        if proses.returncode:
+            return {"baris": baris, "gagal": proses.stderr.strip().splitlines()[-1:] or ["(tanpa pesan)"]}
+        hasil = json.loads(proses.stdout.strip().splitlines()[-1])
+    hasil.update(baris=baris, ukuran_csv_mb=ukuran_csv, buat_dataset_s=waktu_buat)
+    return hasil
+
+
+def cetak_laporan(laporan):
+    berhasil = [h for h in laporan if "gagal" not in h]
+    kepala = "".join(f"{h['baris']:>14,}" for h in berhasil)
+    print(f"\n{'Baris':<32}{kepala}")
+    print(f"{'Run pertama (s)':<32}" + "".join(f"{h['cold_s']:>14.2f}" for h in berhasil))
+    for nama, _, _ in INTERAKSI:
+        print(f"{nama[:30]:<32}" + "".join(f"{h['interaksi'][nama] * 1000:>11.0f} ms" for h in berhasil))
+    print(f"{'RSS setelah run pertama (MB)':<32}" + "".join(f"{h['rss_cold_mb']:>14.0f}" for h in berhasil))
+    print(f"{'RSS puncak (MB)':<32}" + "".join(f"{h['rss_puncak_mb']:>14.0f}" for h in berhasil))
+    for h in laporan:
+        if "gagal" in h:
+            print(f"\n{h['baris']:,} baris gagal: {h['gagal'][0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baris", type=int, nargs="+", default=[2_000, 20_000, 200_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ulang", type=int, default=3, help="jumlah pengulangan per interaksi")
+    parser.add_argument("--timeout", type=float, default=900)
+    parser.add_argument("--json", help="simpan laporan lengkap ke file JSON ini")
+    parser.add_argument("--ukur-sekali", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.ukur_sekali:
+        return ukur_sekali(args.ulang, args.timeout)
+
+    laporan = []
+    for baris in args.baris:
+        print(f"Mengukur {baris:,} baris...", flush=True)
+        laporan.append(ukur_ukuran(baris, args.seed, args.ulang, args.timeout))
+    cetak_laporan(laporan)
+    if args.json:
+        Path(args.json).write_text(json.dumps(laporan, indent=2))
+    return 1 if any("gagal" in h for h in laporan) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Bandingkan simulasi skenario batch (``snbp.scenario``) dengan perhitungan ulang per skenario memakai pandas.
+
+Skenario dibuat acak dari dataset sintetis (``snbp.synthetic``): setiap
+skenario memuat satu sampai tiga penyesuaian daya tampung/peminat
+(-30%..+50%) untuk satu PROVINSI, JALUR, ASAL UNIV, atau NAMA, opsional
+dibatasi satu KATEGORI JURUSAN. Untuk setiap skenario dihitung rasio baru,
+top 10 rasio per JALUR, dan kategori hasil model RandomForest.
+
+- ``pandas``: salin DataFrame per skenario, mask ``isin``, hitung rasio,
+  ``sort_values`` per jalur, lalu ``predict_table`` atas semua baris;
+- ``batch``: ``ScenarioEngine.evaluate`` + ``top`` + ``classify`` untuk semua
+  skenario sekaligus.
+
+Hasil kedua mode dicocokkan (rasio, top 10, kategori) sebelum waktunya dilaporkan.
+
+Contoh:
+    python bench/scenario_batch.py --baris 2000 20000 --skenario 100 500
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from snbp.batch import predict_table  # noqa: E402
+from snbp.scenario import Adjustment, Scenario, ScenarioEngine  # noqa: E402
+
+KOLOM_FILTER = ['PROVINSI', 'JALUR', 'ASAL UNIV', 'NAMA']
+
+
+def buat_skenario(df, jumlah, rng):
+    nilai = {kolom: sorted(df[kolom].astype(str).unique()) for kolom in KOLOM_FILTER}
+    kategori = sorted(df['KATEGORI JURUSAN'].astype(str).unique())
+    skenario = []
+    for i in range(jumlah):
+        penyesuaian = []
+        for _ in range(rng.randint(1, 3)):
+            kolom = rng.choice(KOLOM_FILTER)
+            where = {kolom: rng.choice(nilai[kolom])}
+            if rng.random() < 0.5:
+                where['KATEGORI JURUSAN'] = rng.choice(kategori)
+            penyesuaian.append(Adjustment(
+                where,
+                capacity=1 + rng.choice([-30, -10, 10, 25, 50]) / 100,
+                demand=1 + rng.choice([0, 0, -20, 20]) / 100,
+            ))
+        skenario.append(Scenario(f"skenario {i}", tuple(penyesuaian)))
+    return skenario
+
+
+def per_skenario_pandas(df, skenario, model):
+    """Perhitungan ulang biasa: satu salinan DataFrame per skenario."""
+    rasio, top, kategori = [], [], []
+    tanpa_peminat = np.isinf(df['RASIO KEKETATAN'].to_numpy())
+    for s in skenario:
+        frame = df.copy()
+        frame['PEMINAT 2024'] = frame['PEMINAT 2024'].where(~tanpa_peminat, 0).astype(float)
+        frame['DAYA TAMPUNG 2025'] = frame['DAYA TAMPUNG 2025'].astype(float)
+        asli = frame[['DAYA TAMPUNG 2025', 'PEMINAT 2024']].copy()
+        # Pengali dikumpulkan dulu lalu dikalikan sekali (pembulatan sama dengan mode batch)
+        faktor = pd.DataFrame(1.0, index=frame.index, columns=['DAYA TAMPUNG 2025', 'PEMINAT 2024'])
+        for p in s.adjustments:
+            mask = np.ones(len(frame), dtype=bool)
+            for kolom, nilai in p.where.items():
+                mask &= frame[kolom].astype(str).isin([nilai]).to_numpy()
+            faktor.loc[mask, 'DAYA TAMPUNG 2025'] *= p.capacity
+            faktor.loc[mask, 'PEMINAT 2024'] *= p.demand
+        frame[faktor.columns] = (frame[faktor.columns] * faktor).round()
+        berubah = (frame[['DAYA TAMPUNG 2025', 'PEMINAT 2024']] != asli).any(axis=1)
+        baru = (frame['DAYA TAMPUNG 2025'] / frame['PEMINAT 2024'] * 100).where(frame['PEMINAT 2024'] > 0, np.inf)
+        frame['RASIO KEKETATAN'] = baru.where(berubah, frame['RASIO KEKETATAN'])
+        rasio.append(frame['RASIO KEKETATAN'].to_numpy())
+        top.append({
+            jalur: bagian.sort_values('RASIO KEKETATAN', ascending=False, kind='stable').index[:10].tolist()
+            for jalur, bagian in frame.groupby('JALUR', observed=True)
+        })
+        frame['PEMINAT 2024'] = frame['PEMINAT 2024'].where(frame['PEMINAT 2024'] != 0, frame['DAYA TAMPUNG 2025'])
+        kategori.append(predict_table(model, frame)['KATEGORI PREDIKSI'].to_numpy())
+    return rasio, top, kategori
+
+
+def batch(engine, skenario, model):
+    hasil = engine.evaluate(skenario)
+    jalur = engine.df['JALUR'].astype(str).to_numpy()
+    top = {j: hasil.top(10, jalur == j) for j in np.unique(jalur)}
+    hasil.classify(model)
+    return hasil, top
+
+
+def ukur(baris, jumlah, seed):
+    from snbp.ingest import read_dataset
+    from snbp.model import train_model
+    from snbp.synthetic import generate
+
+    df = read_dataset(generate(baris, seed=seed).to_csv(index=False).encode("utf-8"))
+    model = train_model(df)
+    skenario = buat_skenario(df, jumlah, random.Random(seed))
+
+    mulai = time.perf_counter()
+    engine = ScenarioEngine(df)
+    bangun = time.perf_counter() - mulai
+    mulai = time.perf_counter()
+    hasil, top = batch(engine, skenario, model)
+    waktu_batch = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    rasio, top_pandas, kategori = per_skenario_pandas(df, skenario, model)
+    waktu_pandas = time.perf_counter() - mulai
+
+    for i in range(len(skenario)):
+        assert np.allclose(rasio[i], hasil.rasio[i], equal_nan=True), f"rasio skenario {i} berbeda"
+        assert (kategori[i] == hasil.labels(i)).all(), f"kategori skenario {i} berbeda"
+        for j, indeks in top_pandas[i].items():
+            baris_top = top[j][i]
+            assert df.index[baris_top[baris_top >= 0]].tolist() == indeks, f"top 10 skenario {i} jalur {j} berbeda"
+
+    return {
+        "baris": baris,
+        "skenario": jumlah,
+        "sel_berubah": int(hasil.changed.sum()),
+        "bangun_ms": bangun * 1000,
+        "batch_ms": waktu_batch * 1000,
+        "pandas_ms": waktu_pandas * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baris", type=int, nargs="+", default=[2000, 20000])
+    parser.add_argument("--skenario", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    args = parser.parse_args()
+
+    hasil = [ukur(baris, jumlah, args.seed) for baris in args.baris for jumlah in args.skenario]
+
+    print(f"{'baris':>9}{'skenario':>10}{'sel berubah':>13}{'bangun (ms)':>13}{'batch (ms)':>12}{'pandas (ms)':>13}{'percepatan':>12}")
+    for h in hasil:
+        print(
+            f"{h['baris']:>9}{h['skenario']:>10}{h['sel_berubah']:>13}{h['bangun_ms']:>13.1f}"
+            f"{h['batch_ms']:>12.1f}{h['pandas_ms']:>13.0f}{h['pandas_ms'] / h['batch_ms']:>11.1f}x"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2))
+
+
+if __name__ == "__main__":
+    main()
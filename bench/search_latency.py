@@ -0,0 +1,97 @@
+"""Ukur waktu bangun dan latensi pencarian ``snbp.search.SearchIndex``, serta ketepatannya.
+
+Untuk setiap ukuran dataset sintetis (``snbp.synthetic``), kueri dibuat dari
+nilai acak NAMA, ASAL UNIV, dan PROSPEK KERJA dalam tiga bentuk: utuh, salah
+ketik (satu huruf dihapus/diganti/ditukar), dan awalan 4 huruf. Yang
+dilaporkan: jumlah dokumen indeks, waktu bangun, latensi p50/p99 per
+pencarian, dan persentase kueri salah ketik yang nilai aslinya muncul di 5
+hasil teratas.
+
+Contoh:
+    python bench/search_latency.py --baris 2000 20000 200000 --kueri 2000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from snbp.search import SEARCH_FIELDS, SearchIndex  # noqa: E402
+
+
+def salah_ketik(teks, rng):
+    if len(teks) < 4:
+        return teks
+    i = rng.randrange(1, len(teks) - 1)
+    jenis = rng.choice(["hapus", "ganti", "tukar"])
+    if jenis == "hapus":
+        return teks[:i] + teks[i + 1:]
+    if jenis == "ganti":
+        return teks[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + teks[i + 1:]
+    return teks[:i - 1] + teks[i] + teks[i - 1] + teks[i + 1:]
+
+
+def ukur(baris, jumlah_kueri, seed):
+    from snbp.ingest import read_dataset
+    from snbp.synthetic import generate
+
+    df = read_dataset(generate(baris, seed=seed).to_csv(index=False).encode("utf-8"))
+    mulai = time.perf_counter()
+    indeks = SearchIndex(df)
+    bangun = time.perf_counter() - mulai
+
+    rng = random.Random(seed)
+    asli = [(rng.choice(list(df[kolom].dropna().astype(str).unique())), kolom)
+            for kolom in (rng.choice(SEARCH_FIELDS) for _ in range(jumlah_kueri))]
+    kueri = {
+        "utuh": [(nilai, nilai, kolom) for nilai, kolom in asli],
+        "salah ketik": [(salah_ketik(nilai, rng), nilai, kolom) for nilai, kolom in asli],
+        "awalan": [(nilai[:4], nilai, kolom) for nilai, kolom in asli],
+    }
+
+    hasil = {"baris": baris, "dokumen": len(indeks), "bangun_ms": bangun * 1000, "kueri": {}}
+    for bentuk, daftar in kueri.items():
+        latensi, ketemu = [], 0
+        for teks, nilai, kolom in daftar:
+            mulai = time.perf_counter()
+            cocok = indeks.search(teks, field=kolom, limit=5)
+            latensi.append(time.perf_counter() - mulai)
+            ketemu += any(m.value == nilai for m in cocok)
+        latensi = np.array(latensi) * 1000
+        hasil["kueri"][bentuk] = {
+            "p50_ms": float(np.percentile(latensi, 50)),
+            "p99_ms": float(np.percentile(latensi, 99)),
+            "top5_persen": 100 * ketemu / len(daftar),
+        }
+    return hasil
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baris", type=int, nargs="+", default=[2000, 20000, 200000])
+    parser.add_argument("--kueri", type=int, default=2000, help="jumlah nilai acak per ukuran")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    args = parser.parse_args()
+
+    hasil = [ukur(baris, args.kueri, args.seed) for baris in args.baris]
+
+    print(f"{'baris':>9}{'dokumen':>9}{'bangun (ms)':>13}  {'kueri':<13}{'p50 (ms)':>10}{'p99 (ms)':>10}{'top-5 %':>9}")
+    for h in hasil:
+        for i, (bentuk, k) in enumerate(h["kueri"].items()):
+            kepala = f"{h['baris']:>9}{h['dokumen']:>9}{h['bangun_ms']:>13.0f}" if i == 0 else " " * 31
+            print(f"{kepala}  {bentuk:<13}{k['p50_ms']:>10.3f}{k['p99_ms']:>10.3f}{k['top5_persen']:>9.1f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Ukur memori per sesi dan per proses: dataset lewat ``st.cache_data`` vs snapshot Arrow yang di-memory-map.
+
+``st.cache_data`` mengembalikan salinan hasil (di-unpickle) ke setiap pemanggil,
+jadi setiap sesi yang sedang rerun memegang DataFrame sendiri. Dengan
+``snbp.shared.SharedDataset`` + ``st.cache_resource`` semua sesi memegang objek
+yang sama, dan halaman datanya dibagi antar proses lewat page cache.
+
+Untuk setiap mode, ``--proses`` proses Python dijalankan bersamaan pada CSV
+sintetis (``snbp.synthetic``). Setiap proses memuat dataset sekali, lalu
+``--sesi`` kali lagi sambil menahan hasilnya (mensimulasikan sesi yang rerun
+bersamaan). Yang dilaporkan: tambahan RSS per sesi, serta PSS (memori yang
+dibagi dihitung proporsional) dan memori privat tiap proses saat semua proses
+hidup (dari ``/proc/<pid>/smaps_rollup``, hanya Linux).
+
+Contoh:
+    python bench/shared_memory.py --baris 200000 --sesi 8 --proses 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+MODE = ["cache_data", "mmap"]
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def smaps_mb(pid):
+    """``{"Pss", "Private", "Shared"}`` dalam MB dari ``/proc/<pid>/smaps_rollup``."""
+    nilai = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for baris in f:
+            bagian = baris.split()
+            if len(bagian) == 3 and bagian[2] == "kB":
+                nilai[bagian[0].rstrip(":")] = int(bagian[1]) / 1024
+    return {
+        "Pss": nilai["Pss"],
+        "Private": nilai["Private_Clean"] + nilai["Private_Dirty"],
+        "Shared": nilai["Shared_Clean"] + nilai["Shared_Dirty"],
+    }
+
+
+def ukur_sekali(mode, csv, folder, sesi):
+    """Dijalankan di proses anak: cetak JSON hasil, lalu tunggu stdin ditutup."""
+    import streamlit as st
+
+    from snbp.ingest import read_dataset
+    from snbp.shared import SharedDataset
+
+    data = Path(csv).read_bytes()
+    version = hashlib.sha1(data).hexdigest()[:16]
+    if mode == "cache_data":
+        @st.cache_data(show_spinner=False)
+        def load_dataset(version, _data):
+            return read_dataset(_data)
+    else:
+        shared = SharedDataset(folder)
+
+        @st.cache_resource(show_spinner=False)
+        def load_dataset(version, _data):
+            return shared.get(version, lambda: read_dataset(_data))
+
+    awal = rss_mb()
+    dipegang = [load_dataset(version, data)]
+    satu = rss_mb()
+    dipegang += [load_dataset(version, data) for _ in range(sesi - 1)]
+    semua = rss_mb()
+
+    print(json.dumps({
+        "dataset_mb": satu - awal,
+        "per_sesi_mb": (semua - satu) / max(sesi - 1, 1),
+        "objek_berbeda": len({id(df) for df in dipegang}),
+    }), flush=True)
+    sys.stdin.read()
+
+
+def ukur(mode, csv, folder, sesi, jumlah_proses, timeout):
+    proses, hasil = [], []
+    try:
+        # Berurutan: proses pertama membuat snapshot, proses berikutnya hanya membukanya
+        for _ in range(jumlah_proses):
+            p = subprocess.Popen(
+                [sys.executable, __file__, "--ukur-sekali", mode, csv, folder, str(sesi)],
+                cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+            )
+            proses.append(p)
+            hasil.append(json.loads(p.stdout.readline()))
+        memori = [smaps_mb(p.pid) for p in proses]
+    finally:
+        for p in proses:
+            p.stdin.close()
+            p.wait(timeout)
+    return {
+        "mode": mode,
+        # Proses terakhir: snapshot sudah ada, jadi hanya biaya membuka (untuk mmap)
+        "dataset_mb": hasil[-1]["dataset_mb"],
+        "per_sesi_mb": statistics.fmean(h["per_sesi_mb"] for h in hasil),
+        "objek_berbeda": hasil[0]["objek_berbeda"],
+        "pss_total_mb": sum(m["Pss"] for m in memori),
+        "privat_per_proses_mb": statistics.fmean(m["Private"] for m in memori),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baris", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sesi", type=int, default=8, help="sesi bersamaan per proses")
+    parser.add_argument("--proses", type=int, default=4, help="proses server bersamaan")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    parser.add_argument("--ukur-sekali", nargs=4, metavar=("MODE", "CSV", "FOLDER", "SESI"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.ukur_sekali:
+        mode, csv, folder, sesi = args.ukur_sekali
+        ukur_sekali(mode, csv, folder, int(sesi))
+        return
+
+    from snbp.synthetic import generate
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = str(Path(tmp) / "sheet.csv")
+        generate(args.baris, seed=args.seed).to_csv(csv, index=False)
+        hasil = [ukur(mode, csv, str(Path(tmp) / "dataset"), args.sesi, args.proses, args.timeout) for mode in MODE]
+
+    print(f"{args.baris} baris, {args.sesi} sesi x {args.proses} proses\n")
+    print(f"{'mode':<12}{'dataset (MB)':>14}{'per sesi (MB)':>15}{'objek df':>10}{'PSS total (MB)':>16}{'privat/proses (MB)':>20}")
+    for h in hasil:
+        print(
+            f"{h['mode']:<12}{h['dataset_mb']:>14.1f}{h['per_sesi_mb']:>15.2f}{h['objek_berbeda']:>10}"
+            f"{h['pss_total_mb']:>16.0f}{h['privat_per_proses_mb']:>20.0f}"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(hasil, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Skenario interaksi ``AppTest`` yang dipakai bersama oleh skrip benchmark.
+
+Setiap interaksi adalah ``(nama, bagian yang memuat widget, aksi)``; ``aksi(at, i)``
+mengubah widget untuk pengulangan ke-``i`` tanpa menjalankan ``at.run()``.
+"""
+
+DURASI_BAGIAN = "_durasi_bagian"
+
+
+def _widget(elements, label):
+    for element in elements:
+        if element.label == label:
+            return element
+    raise LookupError(f"Widget '{label}' tidak ditemukan")
+
+
+def _pilih_berikutnya(selectbox, i):
+    return selectbox.set_value(selectbox.options[(i + 1) % len(selectbox.options)])
+
+
+def _halaman_berikutnya(number_input, i):
+    return number_input.set_value(1 + (i + 1) % int(number_input.max))
+
+
+INTERAKSI = [
+    ("Pilih Jalur (radio)", "bagian_jalur",
+     lambda at, i: _widget(at.radio, "Pilih Jalur:").set_value(["SNBT", "SNBP dan SNBT", "SNBP"][i % 3])),
+    ("Rasio: jalur_rasio", "bagian_rasio",
+     lambda at, i: _pilih_berikutnya(at.selectbox(key="jalur_rasio"), i)),
+    ("Rasio: kategori_rasio", "bagian_rasio",
+     lambda at, i: _pilih_berikutnya(at.selectbox(key="kategori_rasio"), i)),
+    ("Pilih Provinsi", "bagian_provinsi_terpilih",
+     lambda at, i: _pilih_berikutnya(_widget(at.selectbox, "Pilih Provinsi"), i)),
+    ("Tabel provinsi: halaman", "bagian_provinsi_terpilih",
+     lambda at, i: _halaman_berikutnya(at.number_input(key="tabel_provinsi_terpilih_halaman"), i)),
+    ("Eksplorasi: provinsi", "bagian_eksplorasi",
+     lambda at, i: _pilih_berikutnya(_widget(at.selectbox, "📍 Pilih Provinsi"), i)),
+    ("Prediksi (submit form)", "bagian_prediksi",
+     lambda at, i: _widget(at.button, "Prediksi Kategori").click()),
+]
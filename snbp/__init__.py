@@ -0,0 +1 @@
+"""Inti analitik Dashboard Analisis Jurusan IPS (tanpa ketergantungan Streamlit)."""
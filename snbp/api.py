@@ -0,0 +1,334 @@
+"""Layanan prediksi HTTP/JSON lokal dengan micro-batching.
+
+Memakai fitur dan LabelEncoder yang sama dengan form prediksi dashboard: model
+yang dipromosikan di ``snbp.registry`` bila ada, selain itu model RandomForest
+dari ``ModelStore`` untuk dataset saat ini. Request yang datang bersamaan
+dikumpulkan oleh ``MicroBatcher`` (sampai ``max_batch`` baris atau ``max_wait``
+detik) lalu diprediksi dengan satu panggilan ``predict_table``/``predict_proba``.
+``ModelSource`` memeriksa ulang versi sheet dan promosi registry paling sering
+sekali per ``--reload-seconds`` dan memasang model baru tanpa restart.
+
+Endpoint (default http://127.0.0.1:8600):
+
+    POST /predict   {"rows": [{"PEMINAT 2024": 120, "ASAL UNIV": ..., ...}]}
+                    atau satu objek baris; hasil {"model", "predictions": [...]}
+    GET  /stats     jumlah request, latensi p50/p99, throughput, ukuran batch
+    GET  /health    model yang dipakai
+
+Contoh:
+    python -m snbp.api --port 8600 --max-batch 64 --max-wait-ms 2
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from snbp.batch import predict_table
+from snbp.model import CLASS_NAMES
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH = 64
+MAX_WAIT_MS = 2.0
+# Latensi yang disimpan untuk persentil, dan jendela (detik) untuk throughput
+LATENCY_WINDOW = 10000
+THROUGHPUT_WINDOW = 10.0
+# Jarak minimum (detik) antar pemeriksaan model baru
+RELOAD_SECONDS = 30.0
+
+OUTPUT_COLUMNS = [f"PROBA {name}" for name in CLASS_NAMES.values()] + ["KATEGORI PREDIKSI", "KOLOM TIDAK DIKENAL"]
+
+
+class LatencyStats:
+    """Latensi per request (dari diterima sampai hasil siap) dan ukuran batch."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self._finished = deque(maxlen=window)
+        self.requests = 0
+        self.batches = 0
+        self.batch_rows = 0
+        self.max_batch_rows = 0
+        self.started = time.time()
+
+    def record_batch(self, rows, latencies):
+        now = time.time()
+        with self._lock:
+            self.batches += 1
+            self.batch_rows += rows
+            self.max_batch_rows = max(self.max_batch_rows, rows)
+            self.requests += len(latencies)
+            self._latencies.extend(latencies)
+            self._finished.extend([now] * len(latencies))
+
+    def summary(self):
+        now = time.time()
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            finished = np.array(self._finished)
+            requests, batches, batch_rows = self.requests, self.batches, self.batch_rows
+            max_batch_rows = self.max_batch_rows
+        # Throughput dari request yang selesai di jendela terakhir (atau sejak start bila lebih singkat)
+        window = min(THROUGHPUT_WINDOW, now - self.started) or 1.0
+        recent = int((finished >= now - window).sum()) if len(finished) else 0
+        return {
+            "requests": requests,
+            "batches": batches,
+            "mean_batch_rows": batch_rows / batches if batches else 0.0,
+            "max_batch_rows": max_batch_rows,
+            "p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else None,
+            "p99_ms": float(np.percentile(latencies, 99)) if len(latencies) else None,
+            "throughput_rps": recent / window,
+        }
+
+
+class MicroBatcher:
+    """Gabungkan request yang datang bersamaan menjadi satu panggilan ``predict``.
+
+    ``predict`` menerima satu DataFrame gabungan dan mengembalikan DataFrame hasil
+    dengan jumlah baris yang sama. Satu thread pekerja mengambil request pertama,
+    menunggu paling lama ``max_wait`` detik untuk request berikutnya selama total
+    baris belum mencapai ``max_batch``, lalu membagi hasilnya kembali per request.
+    """
+
+    def __init__(self, predict, max_batch=MAX_BATCH, max_wait=MAX_WAIT_MS / 1000, stats=None):
+        self._predict = predict
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.stats = stats or LatencyStats()
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="snbp-microbatch", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame):
+        """Antrekan ``frame``; ``Future`` berisi DataFrame hasil untuk baris-baris itu saja."""
+        future = Future()
+        self._queue.put((frame, future, time.perf_counter()))
+        return future
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        rows = len(batch[0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch, rows
+
+    def _run(self):
+        while True:
+            batch, rows = self._collect()
+            try:
+                result = self._predict(pd.concat([frame for frame, _, _ in batch], ignore_index=True))
+            except Exception as exc:
+                for _, future, _ in batch:
+                    future.set_exception(exc)
+                continue
+
+            latencies, offset = [], 0
+            for frame, future, queued_at in batch:
+                future.set_result(result.iloc[offset:offset + len(frame)])
+                latencies.append(time.perf_counter() - queued_at)
+                offset += len(frame)
+            self.stats.record_batch(rows, latencies)
+
+
+class ModelSource:
+    """Model aktif ``(id, TrainedModel)`` yang diperbarui di latar belakang.
+
+    ``load`` memuat model aktif; ``version`` mengembalikan kunci murah (versi sheet dan
+    id promosi) yang menentukan apakah ``load`` perlu dipanggil lagi. Pemeriksaan
+    dipicu ``get`` paling sering sekali per ``interval`` detik di thread terpisah, dan
+    model baru dipasang dengan satu assignment: batch yang sedang berjalan tetap
+    memakai model yang diambilnya di awal batch.
+    """
+
+    def __init__(self, load, version, interval=RELOAD_SECONDS):
+        self._load = load
+        self._version = version
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._key = version()
+        self._current = load()
+        self._checked = time.monotonic()
+
+    def get(self):
+        if time.monotonic() - self._checked >= self.interval and not self._lock.locked():
+            threading.Thread(target=self.reload, name="snbp-model-reload", daemon=True).start()
+        return self._current
+
+    def reload(self):
+        """Muat ulang model bila ``version`` berubah; pemanggil bersamaan dilewati."""
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._checked = time.monotonic()
+            key = self._version()
+            if key == self._key:
+                return False
+            current = self._load()
+            if current[0] != self._current[0]:
+                logger.info("Model diganti: %s -> %s", self._current[0], current[0])
+            self._current, self._key = current, key
+            return True
+        except Exception:  # model lama tetap dipakai; dicoba lagi pada pemeriksaan berikutnya
+            logger.exception("Gagal memuat ulang model")
+            return False
+        finally:
+            self._lock.release()
+
+
+def predict_batch(source, frame):
+    """``predict_table`` dengan model aktif ``source``; id model dicatat di ``attrs["model"]``."""
+    model_id, trained = source.get()
+    result = predict_table(trained, frame)
+    result.attrs["model"] = model_id
+    return result
+
+
+def _records(result):
+    # NaN (baris yang tidak bisa diprediksi) menjadi null di JSON
+    out = result[OUTPUT_COLUMNS].astype(object)
+    return out.where(out.notna(), None).to_dict(orient="records")
+
+
+def make_server(source, batcher, port, host="127.0.0.1"):
+    """Server HTTP untuk ``batcher``; model aktif ``source`` dipakai untuk memvalidasi kolom fitur."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, payload):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/stats":
+                self._reply(200, batcher.stats.summary())
+            elif self.path == "/health":
+                model_id, model = source.get()
+                self._reply(200, {"model": model_id, "features": model.features})
+            else:
+                self._reply(404, {"error": "tidak ditemukan"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                self._reply(404, {"error": "tidak ditemukan"})
+                return
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+                rows = body.get("rows", [body]) if isinstance(body, dict) else body
+                frame = pd.DataFrame.from_records(rows)
+            except (ValueError, TypeError, AttributeError) as exc:
+                self._reply(400, {"error": f"Body JSON tidak valid: {exc}"})
+                return
+            # Validasi di sini agar satu request yang salah tidak menggagalkan seluruh batch
+            _, model = source.get()
+            missing = [col for col in model.features if col not in frame.columns]
+            if frame.empty or missing:
+                self._reply(400, {"error": f"Kolom fitur tidak ditemukan: {', '.join(missing or model.features)}"})
+                return
+            try:
+                result = batcher.submit(frame[model.features]).result()
+            except Exception as exc:
+                logger.exception("Prediksi gagal")
+                self._reply(500, {"error": str(exc)})
+                return
+            self._reply(200, {"model": result.attrs.get("model"), "predictions": _records(result)})
+
+        def log_message(self, format, *args):
+            logger.debug(format, *args)
+
+    class Server(ThreadingHTTPServer):
+        # Antrean listen default (5) terlalu kecil untuk banyak klien yang terhubung bersamaan
+        request_queue_size = 128
+
+    return Server((host, port), Handler)
+
+
+def active_model(loader, registry, store):
+    """``(id, TrainedModel)``: model yang dipromosikan bila dilatih dengan dataset saat ini,
+    selain itu RandomForest untuk dataset saat ini."""
+    from snbp.ingest import read_dataset
+    from snbp.model import training_key
+
+    df = read_dataset(loader.get().data)
+    promoted = registry.promoted()
+    if promoted is not None:
+        if promoted["data_key"] == training_key(df):
+            return promoted["id"], registry.load(promoted["id"])
+        logger.warning("Model %s dilatih dengan data lain; memakai RandomForest untuk data saat ini", promoted["id"])
+
+    trained = store.get(df)
+    return f"rf-{trained.key}", trained
+
+
+def model_source(interval=RELOAD_SECONDS):
+    """``ModelSource`` untuk sheet, registry, dan ``ModelStore`` dari ``snbp.config``."""
+    from snbp.config import CACHE_DIR, MODEL_DIR, REGISTRY_DIR, SHEET_TTL, SPREADSHEET_URL
+    from snbp.loader import SheetLoader
+    from snbp.model import ModelStore
+    from snbp.registry import ModelRegistry
+
+    loader = SheetLoader(SPREADSHEET_URL, CACHE_DIR / "sheet", ttl=SHEET_TTL)
+    registry = ModelRegistry(REGISTRY_DIR)
+    store = ModelStore(MODEL_DIR)
+
+    def version():
+        # loader.get memicu unduhan ulang di latar bila TTL sheet habis
+        promoted = registry.promoted()
+        return loader.get().version, promoted and promoted["id"]
+
+    return ModelSource(lambda: active_model(loader, registry, store), version, interval)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Layanan prediksi RAMAI/SEPI PEMINAT lewat HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH, help="baris maksimum per batch (1 = tanpa batching)")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS, help="waktu tunggu maksimum untuk mengisi batch")
+    parser.add_argument("--reload-seconds", type=float, default=RELOAD_SECONDS,
+                        help="jarak minimum antar pemeriksaan sheet/registry untuk model baru")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    source = model_source(args.reload_seconds)
+    batcher = MicroBatcher(
+        lambda frame: predict_batch(source, frame),
+        max_batch=args.max_batch,
+        max_wait=args.max_wait_ms / 1000,
+    )
+    server = make_server(source, batcher, args.port, args.host)
+    logger.info("Model %s, layanan prediksi di http://%s:%d/predict", source.get()[0], args.host, server.server_address[1])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Prediksi massal: klasifikasikan banyak program studi sekaligus dari file CSV/Parquet."""
+
+import io
+
+import numpy as np
+import pandas as pd
+
+from snbp.model import CLASS_NAMES
+
+# Label untuk baris yang tidak bisa diprediksi karena ada nilai yang tidak dikenal
+UNKNOWN_LABEL = "TIDAK DAPAT DIPREDIKSI"
+
+# Opsi penanganan kategori yang tidak pernah muncul saat pelatihan
+UNKNOWN_POLICIES = ("tandai", "error")
+
+
+def read_table(data, filename):
+    """Baca upload CSV atau Parquet menjadi DataFrame dengan nama kolom yang dirapikan."""
+    name = filename.lower()
+    if name.endswith(".parquet") or name.endswith(".pq"):
+        frame = pd.read_parquet(io.BytesIO(data))
+    elif name.endswith(".csv"):
+        frame = pd.read_csv(io.BytesIO(data))
+    else:
+        raise ValueError("Format file tidak didukung, gunakan .csv atau .parquet")
+    frame.columns = frame.columns.astype(str).str.strip()
+    return frame
+
+
+def predict_table(trained, frame, unknown="tandai"):
+    """Prediksi kategori untuk setiap baris ``frame`` dalam satu panggilan ``predict_proba``.
+
+    Baris yang memuat kategori tidak dikenal (atau angka kosong) tidak ikut
+    diprediksi: probabilitasnya NaN, kategorinya ``UNKNOWN_LABEL``, dan kolom
+    ``KOLOM TIDAK DIKENAL`` menyebutkan kolom penyebabnya. Dengan
+    ``unknown="error"`` baris seperti itu langsung menghasilkan ``ValueError``.
+    """
+    if unknown not in UNKNOWN_POLICIES:
+        raise ValueError(f"unknown harus salah satu dari {UNKNOWN_POLICIES}")
+    missing = [col for col in trained.features if col not in frame.columns]
+    if missing:
+        raise ValueError(f"Kolom fitur tidak ditemukan: {', '.join(missing)}")
+
+    X, unknown_cells = trained.encode(frame)
+    invalid = unknown_cells.to_numpy().any(axis=1)
+    if unknown == "error" and invalid.any():
+        raise ValueError(f"{int(invalid.sum())} baris memuat nilai yang tidak dikenal model")
+
+    classes = list(trained.model.classes_)
+    proba = np.full((len(frame), len(classes)), np.nan)
+    if (~invalid).any():
+        proba[~invalid] = trained.model.predict_proba(X[~invalid])
+
+    result = frame.copy()
+    for i, cls in enumerate(classes):
+        result[f"PROBA {CLASS_NAMES[cls]}"] = proba[:, i]
+    labels = np.array([CLASS_NAMES[cls] for cls in classes], dtype=object)
+    predicted = np.full(len(frame), UNKNOWN_LABEL, dtype=object)
+    predicted[~invalid] = labels[proba[~invalid].argmax(axis=1)]
+    result["KATEGORI PREDIKSI"] = predicted
+
+    # Nama kolom penyebab, disusun per kolom (bukan per baris)
+    reasons = pd.Series("", index=frame.index, dtype=object)
+    for col in trained.features:
+        mask = unknown_cells[col].to_numpy()
+        reasons[mask] = reasons[mask] + col + ", "
+    result["KOLOM TIDAK DIKENAL"] = reasons.str.rstrip(", ")
+    return result
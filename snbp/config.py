@@ -0,0 +1,41 @@
+"""Konfigurasi bersama: sumber data dan lokasi cache di disk."""
+
+import os
+from pathlib import Path
+
+# --- Sumber data: ekspor CSV Google Spreadsheet ---
+SPREADSHEET_URL = os.environ.get(
+    "SNBP_SHEET_URL",
+    "https://docs.google.com/spreadsheets/d/1f6m1Bjj3IxCMCbPEcgWt6bsZ7uEz1pK1baiK34XqzlM/export?format=csv",
+)
+
+# --- Berapa detik data dianggap masih segar sebelum dicek ulang ke spreadsheet ---
+SHEET_TTL = float(os.environ.get("SNBP_SHEET_TTL", "600"))
+
+# --- Folder untuk snapshot data, model, dan artefak lain ---
+CACHE_DIR = Path(os.environ.get("SNBP_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache"))
+
+# --- Port endpoint metrik Prometheus/JSON (127.0.0.1); 0 = tidak dijalankan ---
+METRICS_PORT = int(os.environ.get("SNBP_METRICS_PORT", "0"))
+
+# --- Folder riwayat multi-tahun (Parquet per TAHUN/JALUR, lihat snbp.history) ---
+HISTORY_DIR = Path(os.environ.get("SNBP_HISTORY_DIR", CACHE_DIR / "history"))
+
+# --- Cache model RandomForest per data latih (lihat snbp.model.ModelStore), dipakai dashboard dan API ---
+MODEL_DIR = Path(os.environ.get("SNBP_MODEL_DIR", CACHE_DIR / "models"))
+
+# --- Registry model hasil evaluasi (lihat snbp.evaluate / snbp.registry) ---
+REGISTRY_DIR = Path(os.environ.get("SNBP_REGISTRY_DIR", CACHE_DIR / "registry"))
+
+# --- Bundel geometri provinsi untuk peta (dibangun dengan python -m snbp.geo, lihat snbp.geo) ---
+GEO_BUNDLE = Path(os.environ.get("SNBP_GEO_BUNDLE", Path(__file__).resolve().parent / "data" / "provinsi.json"))
+
+# --- Port endpoint unduhan streaming CSV/Parquet (lihat snbp.download); 0 = tidak dijalankan ---
+EXPORT_PORT = int(os.environ.get("SNBP_EXPORT_PORT", "0"))
+
+# --- Antarmuka tempat endpoint unduhan mendengarkan; default semua, seperti server Streamlit ---
+EXPORT_HOST = os.environ.get("SNBP_EXPORT_HOST", "0.0.0.0")
+
+# --- Alamat endpoint unduhan yang dibuka browser. Kosong = host yang dipakai browser untuk membuka
+# dashboard dengan port SNBP_EXPORT_PORT; isi bila di belakang reverse proxy (misalnya https://host/unduh) ---
+EXPORT_URL = os.environ.get("SNBP_EXPORT_URL", "")
@@ -0,0 +1,156 @@
+"""Kubus agregat bersama untuk semua diagram dan "Insight Otomatis".
+
+Kubus dibangun sekali per versi dataset pada tingkat paling rinci
+(JALUR x PROVINSI x ASAL UNIV x KATEGORI JURUSAN x NAMA). Semua rollup,
+peringkat top/bottom-k, dan hitungan diturunkan dari tabel dasar itu lalu
+disimpan (memo), sehingga perubahan filter cukup mengambil potongan yang
+sudah ada, bukan menghitung ulang ``groupby`` atas seluruh data.
+"""
+
+import threading
+
+import numpy as np
+
+from snbp.metrics import METRICS
+
+DIMENSIONS = ['JALUR', 'PROVINSI', 'ASAL UNIV', 'KATEGORI JURUSAN', 'NAMA']
+
+# Kolom yang dihitung frekuensinya per baris (pie jenjang, distribusi prospek kerja)
+COUNT_COLUMNS = ['JENJANG', 'PROSPEK KERJA']
+
+# Agregasi tabel dasar; rasio disimpan sebagai jumlah + cacah agar rata-ratanya bisa di-rollup
+_BASE_AGG = {
+    'PEMINAT 2024': ('PEMINAT 2024', 'sum'),
+    'DAYA TAMPUNG 2025': ('DAYA TAMPUNG 2025', 'sum'),
+    'JUMLAH': ('PEMINAT 2024', 'size'),
+    '_RASIO_SUM': ('RASIO KEKETATAN', 'sum'),
+    '_RASIO_N': ('RASIO KEKETATAN', 'count'),
+    'PROSPEK KERJA': ('PROSPEK KERJA', 'first'),
+}
+
+_ROLLUP_AGG = {
+    'PEMINAT 2024': 'sum',
+    'DAYA TAMPUNG 2025': 'sum',
+    'JUMLAH': 'sum',
+    '_RASIO_SUM': 'sum',
+    '_RASIO_N': 'sum',
+    'PROSPEK KERJA': 'first',
+}
+
+
+def _freeze(where):
+    if not where:
+        return ()
+    return tuple(sorted(
+        (col, tuple(value) if isinstance(value, (list, tuple, set)) else (value,))
+        for col, value in where.items()
+    ))
+
+
+class AggregateCube:
+    """Tabel agregat dasar + memo rollup/peringkat untuk satu versi dataset."""
+
+    def __init__(self, df):
+        self.rows = df
+        base = df.groupby(DIMENSIONS, observed=True, sort=False).agg(**_BASE_AGG).reset_index()
+        self.base = base
+        self.totals = {
+            'JUMLAH PROGRAM STUDI': int(df['NAMA'].nunique()),
+            'JUMLAH PTN': int(df['ASAL UNIV'].nunique()),
+            'DAYA TAMPUNG 2025': int(base['DAYA TAMPUNG 2025'].sum()),
+            'PEMINAT 2024': int(base['PEMINAT 2024'].sum()),
+        }
+        self._memo = {('counts', col): df[col].value_counts() for col in COUNT_COLUMNS}
+        self._lock = threading.Lock()
+
+    def _remember(self, key, build):
+        result = self._memo.get(key)
+        METRICS.cache("cube", hit=result is not None)
+        if result is None:
+            result = build()
+            with self._lock:
+                self._memo[key] = result
+        return result
+
+    @staticmethod
+    def _mask(frame, where):
+        mask = np.ones(len(frame), dtype=bool)
+        for col, values in where:
+            mask &= frame[col].isin(values).to_numpy()
+        return mask
+
+    # --- Rollup ---
+    def rollup(self, by, where=None, remember=True):
+        """Jumlah peminat/daya tampung, cacah baris, rata-rata rasio, dan prospek pertama per ``by``.
+
+        ``where`` adalah dict kolom -> nilai (atau daftar nilai) untuk memfilter dimensi.
+        Hasil dibagi antar pemanggil; jangan diubah di tempat. ``remember=False`` untuk
+        kombinasi sekali pakai (misalnya unduhan): hasil dihitung tanpa disimpan di memo.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        frozen = _freeze(where)
+
+        def build():
+            base = self.base[self._mask(self.base, frozen)] if frozen else self.base
+            table = base.groupby(by, observed=True).agg(_ROLLUP_AGG).reset_index()
+            with np.errstate(invalid='ignore'):
+                table['RASIO KEKETATAN'] = table['_RASIO_SUM'] / table['_RASIO_N'].where(table['_RASIO_N'] > 0)
+            return table.drop(columns=['_RASIO_SUM', '_RASIO_N'])
+
+        if not remember:
+            result = self._memo.get(('rollup', tuple(by), frozen))
+            return build() if result is None else result
+        return self._remember(('rollup', tuple(by), frozen), build)
+
+    def ranking(self, by, measure, where=None, ascending=False):
+        """Rollup yang sudah diurutkan menurut ``measure`` (untuk top/bottom-k)."""
+        by = [by] if isinstance(by, str) else list(by)
+        key = ('ranking', tuple(by), measure, _freeze(where), ascending)
+        return self._remember(key, lambda: self.rollup(by, where).sort_values(
+            measure, ascending=ascending, kind='stable', ignore_index=True))
+
+    def top(self, by, measure, k, where=None):
+        return self.ranking(by, measure, where).head(k)
+
+    def bottom(self, by, measure, k, where=None):
+        return self.ranking(by, measure, where, ascending=True).head(k)
+
+    def distinct(self, by, of, where=None):
+        """Jumlah nilai unik ``of`` per ``by``, diurutkan dari yang terbanyak."""
+        frozen = _freeze(where)
+
+        def build():
+            base = self.base[self._mask(self.base, frozen)] if frozen else self.base
+            table = base.groupby(by, observed=True)[of].nunique().reset_index()
+            return table.sort_values(of, ascending=False, kind='stable', ignore_index=True)
+
+        return self._remember(('distinct', by, of, frozen), build)
+
+    def profile(self, by):
+        """Ringkasan per nilai ``by`` untuk hover: prodi, PTN, daya tampung, rasio, cacah RAMAI/SEPI."""
+
+        def build():
+            table = self.rollup(by).set_index(by)
+            table['JUMLAH PTN'] = self.base.groupby(by, observed=True)['ASAL UNIV'].nunique()
+            kategori = self.rollup([by, 'KATEGORI JURUSAN']).pivot_table(
+                index=by, columns='KATEGORI JURUSAN', values='JUMLAH', aggfunc='sum', observed=True)
+            kategori = kategori.reindex(index=table.index, columns=['RAMAI PEMINAT', 'SEPI PEMINAT'])
+            table[kategori.columns] = kategori.fillna(0).astype(int).to_numpy()
+            return table.reset_index()
+
+        return self._remember(('profile', by), build)
+
+    def counts(self, column):
+        """Frekuensi nilai ``column`` per baris data (seperti ``value_counts``)."""
+        return self._remember(('counts', column), lambda: self.rows[column].value_counts())
+
+    # --- Peringkat tingkat baris (tabel detail butuh kolom asli seperti JENJANG) ---
+    def rows_ranked(self, measure, where=None, ascending=False):
+        """Baris data asli yang lolos filter, diurutkan menurut ``measure``."""
+        frozen = _freeze(where)
+
+        def build():
+            rows = self.rows[self._mask(self.rows, frozen)] if frozen else self.rows
+            return rows.sort_values(measure, ascending=ascending, kind='stable')
+
+        return self._remember(('rows', measure, frozen, ascending), build)
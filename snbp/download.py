@@ -0,0 +1,300 @@
+"""Unduhan streaming: baris atau agregat hasil filter sebagai CSV/Parquet yang dikirim per potongan.
+
+``st.download_button`` butuh seluruh isi file sebagai bytes di memori sesi.
+Di sini hasil filter tidak pernah disusun utuh: sumber data dibaca per
+``CHUNK_ROWS`` baris, setiap potongan difilter lalu langsung dienkode dan
+dikirim dengan ``Transfer-Encoding: chunked`` oleh server HTTP kecil di proses
+dashboard. Memori per unduhan konstan (satu potongan + buffer satu row group
+Parquet), berapa pun ukuran hasilnya.
+
+Sumber:
+
+- ``baris``: baris dataset saat ini (snapshot yang di-memory-map, ``snbp.shared``);
+- ``agregat``: rollup kubus (``AggregateCube.rollup``) per kolom ``per``;
+- ``riwayat``: baris riwayat multi-tahun (``snbp.history``), dibaca per batch
+  Parquet dan hanya dari partisi TAHUN/JALUR yang cocok.
+
+Endpoint (lihat ``serve``)::
+
+    GET /export?sumber=baris&format=csv&jalur=SNBP&provinsi=Bali&provinsi=...
+    GET /export?sumber=agregat&format=parquet&per=PROVINSI&per=KATEGORI%20JURUSAN
+    GET /export?sumber=riwayat&format=csv&tahun=2024&tahun=2025&kategori=SEPI%20PEMINAT
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from snbp.cube import DIMENSIONS
+from snbp.history import COLUMNS, PARTITION_KEYS
+
+logger = logging.getLogger(__name__)
+
+# Baris per potongan yang difilter dan dienkode sekaligus (juga ukuran row group Parquet)
+CHUNK_ROWS = 20_000
+
+# Parameter URL -> kolom filter
+FILTERS = {'jalur': 'JALUR', 'provinsi': 'PROVINSI', 'univ': 'ASAL UNIV', 'kategori': 'KATEGORI JURUSAN'}
+
+SOURCES = ('baris', 'agregat', 'riwayat')
+FORMATS = {'csv': 'text/csv; charset=utf-8', 'parquet': 'application/vnd.apache.parquet'}
+
+
+def export_url(base, source, fmt, where=None, by=None, years=None):
+    """URL ``/export`` untuk filter ``where`` (kolom -> daftar nilai) di server ``base``."""
+    columns = {col: key for key, col in FILTERS.items()}
+    params = [('sumber', source), ('format', fmt)]
+    params += [(columns[col], value) for col, values in (where or {}).items() for value in values]
+    params += [('per', col) for col in by or ()]
+    params += [('tahun', year) for year in years or ()]
+    return f"{base.rstrip('/')}/export?{urlencode(params)}"
+
+
+def parse_query(query):
+    """``(sumber, format, where, per, tahun)`` dari query string; ``ValueError`` bila tidak valid."""
+    params = parse_qs(query, keep_blank_values=False)
+    source = params.get('sumber', ['baris'])[0]
+    fmt = params.get('format', ['csv'])[0]
+    if source not in SOURCES:
+        raise ValueError(f"sumber harus salah satu dari {', '.join(SOURCES)}")
+    if fmt not in FORMATS:
+        raise ValueError(f"format harus salah satu dari {', '.join(FORMATS)}")
+    where = {col: params[key] for key, col in FILTERS.items() if key in params}
+    by = params.get('per', [])
+    if source == 'agregat':
+        if not by:
+            raise ValueError("sumber=agregat butuh minimal satu parameter per")
+        unknown = [col for col in by if col not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Kolom per tidak dikenal: {', '.join(unknown)} (pilihan: {', '.join(DIMENSIONS)})")
+    try:
+        years = [int(year) for year in params.get('tahun', [])]
+    except ValueError:
+        raise ValueError("tahun harus berupa angka") from None
+    return source, fmt, where, by, years
+
+
+def _matches(frame, where):
+    mask = np.ones(len(frame), dtype=bool)
+    for col, values in where.items():
+        mask &= frame[col].astype(str).isin(values).to_numpy()
+    return mask
+
+
+def row_count(cube, where=None):
+    """Jumlah baris dataset yang cocok dengan ``where``, dihitung dari tabel dasar kubus (tanpa memindai baris)."""
+    base = cube.base
+    return int(base['JUMLAH'][_matches(base, where)].sum()) if where else int(base['JUMLAH'].sum())
+
+
+def row_chunks(df, where=None, chunk_rows=CHUNK_ROWS):
+    """Potongan baris ``df`` yang cocok dengan ``where``; ``df`` dibaca per ``chunk_rows`` baris.
+
+    Bila tidak ada yang cocok, satu potongan kosong tetap dikirim agar file berisi header/skema.
+    """
+    found = False
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        if where:
+            chunk = chunk[_matches(chunk, where)]
+        if len(chunk):
+            found = True
+            yield chunk
+    if not found:
+        yield df.iloc[:0]
+
+
+def aggregate_table(cube, by, where=None):
+    """Rollup kubus per ``by`` untuk diekspor (tidak disimpan di memo kubus).
+
+    RASIO KEKETATAN dihitung dari total kelompok (DAYA TAMPUNG / PEMINAT * 100, PEMINAT 0
+    menjadi NaN seperti ``HistoryStore.trends``), bukan rata-rata rasio per baris yang bisa inf.
+    """
+    by = list(by)
+    table = cube.rollup(by, where, remember=False)[by + ['PEMINAT 2024', 'DAYA TAMPUNG 2025', 'JUMLAH']]
+    peminat = table['PEMINAT 2024'].where(table['PEMINAT 2024'] != 0)
+    return table.assign(**{'RASIO KEKETATAN': table['DAYA TAMPUNG 2025'] / peminat * 100})
+
+
+def aggregate_chunks(cube, by, where=None, chunk_rows=CHUNK_ROWS):
+    """``aggregate_table`` (tabel agregat kecil) dipotong per ``chunk_rows``."""
+    table = aggregate_table(cube, by, where)
+    for start in range(0, max(len(table), 1), chunk_rows):
+        yield table.iloc[start:start + chunk_rows]
+
+
+def history_chunks(store, where=None, years=None, chunk_rows=CHUNK_ROWS):
+    """Baris riwayat per batch Parquet; partisi TAHUN/JALUR yang tidak cocok tidak dibuka."""
+    import pyarrow.parquet as pq
+
+    where = dict(where or {})
+    jalur = where.pop('JALUR', None)
+    found = False
+    for key in sorted(store.partitions):
+        year, part_jalur = key.split('/')
+        if (years and int(year) not in years) or (jalur and part_jalur not in jalur):
+            continue
+        parquet = pq.ParquetFile(store.partition_path(year, part_jalur))
+        for batch in parquet.iter_batches(batch_size=chunk_rows):
+            chunk = batch.to_pandas()
+            if where:
+                chunk = chunk[_matches(chunk, where)]
+            if len(chunk):
+                found = True
+                yield chunk.assign(TAHUN=int(year), JALUR=part_jalur)
+    if not found:
+        yield pd.DataFrame(columns=COLUMNS + PARTITION_KEYS)
+
+
+def _plain(chunk):
+    # Kategori -> teks biasa agar skema Parquet sama di semua potongan
+    categorical = [col for col in chunk.columns if isinstance(chunk[col].dtype, pd.CategoricalDtype)]
+    return chunk.astype({col: str for col in categorical}) if categorical else chunk
+
+
+def csv_stream(chunks):
+    """Bytes CSV per potongan: header sekali, lalu baris setiap potongan."""
+    header = True
+    for chunk in chunks:
+        yield chunk.to_csv(index=False, header=header).encode('utf-8')
+        header = False
+
+
+class _Sink:
+    """File tujuan ``ParquetWriter`` yang isinya diambil (dan dikosongkan) setelah setiap row group."""
+
+    def __init__(self):
+        self._parts = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def parquet_stream(chunks):
+    """Bytes Parquet: satu row group per potongan, dikirim begitu row group selesai ditulis."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink, writer = _Sink(), None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(_plain(chunk), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(sink, table.schema)
+            writer.write_table(table.cast(writer.schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        if writer is not None:
+            writer.close()
+    yield sink.drain()
+
+
+def export_stream(source, fmt, where, by, years, df=None, cube=None, history=None):
+    """``(nama file, content type, iterator bytes)`` untuk satu permintaan ``/export``."""
+    if source == 'baris':
+        chunks = row_chunks(df, where)
+    elif source == 'agregat':
+        chunks = aggregate_chunks(cube, by, where)
+    else:
+        if history is None:
+            raise ValueError("Riwayat multi-tahun tidak tersedia")
+        chunks = history_chunks(history, where, years)
+    encode = csv_stream if fmt == 'csv' else parquet_stream
+    return f"snbp-{source}.{fmt}", FORMATS[fmt], encode(chunks)
+
+
+class ExportSource:
+    """Data terbaru yang dilayani ``/export``; diperbarui dashboard setiap rerun (hanya referensi)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current = (None, None, None, None)
+
+    def publish(self, version, df, cube, history=None):
+        with self._lock:
+            self._current = (version, df, cube, history)
+
+    def current(self):
+        with self._lock:
+            return self._current
+
+
+def serve(source, port, host="127.0.0.1"):
+    """Jalankan endpoint ``/export`` untuk ``source`` (``ExportSource``) di thread daemon.
+
+    Mengembalikan ``None`` (dengan peringatan di log) bila port sudah dipakai.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path != "/export":
+                self.send_error(404)
+                return
+            version, df, cube, history = source.current()
+            try:
+                if df is None:
+                    raise ValueError("Dataset belum dimuat")
+                filename, content_type, body = export_stream(*parse_query(url.query), df, cube, history)
+            except ValueError as exc:
+                self.send_error(400, str(exc))
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+            self.send_header("X-SNBP-Version", str(version))
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                for data in body:
+                    if data:
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                logger.debug("Unduhan dibatalkan klien: %s", self.path)
+                self.close_connection = True
+            except Exception:
+                # Status 200 sudah terkirim: koneksi ditutup tanpa potongan penutup (0\r\n\r\n)
+                # agar klien melihat unduhan terputus, bukan file yang tampak lengkap
+                logger.exception("Unduhan gagal di tengah jalan: %s", self.path)
+                self.close_connection = True
+
+        def log_message(self, format, *args):
+            logger.debug(format, *args)
+
+    try:
+        server = ThreadingHTTPServer((host, port), Handler)
+    except OSError as exc:
+        logger.warning("Endpoint unduhan tidak bisa dijalankan di %s:%d: %s", host, port, exc)
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="snbp-export", daemon=True).start()
+    logger.info("Endpoint unduhan berjalan di http://%s:%d/export", host, server.server_address[1])
+    return server
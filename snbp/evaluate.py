@@ -0,0 +1,187 @@
+"""Evaluasi paralel kandidat model "Prediksi Kategori Jurusan" dengan stratified cross-validation.
+
+Kandidat: RandomForest (model dashboard saat ini), Gaussian Naive Bayes, dan
+opsional GaussianNB + SMOTE (butuh paket ``imbalanced-learn``; oversampling
+hanya pada fold latih) serta HistGradientBoosting. Setiap pasangan
+(kandidat, fold) dijalankan sebagai tugas terpisah di semua core lewat
+``joblib.Parallel``. Hasilnya (akurasi, F1 macro, waktu latih, latensi
+inferensi) dicatat di ``snbp.registry.ModelRegistry`` bersama model yang
+dilatih pada seluruh data, lalu kandidat terbaik bisa dipromosikan.
+Encoding kategori di-fit di dalam tiap fold latih saja; kategori yang hanya
+muncul di fold uji di-encode sebagai -1, seperti data baru di produksi.
+
+Contoh:
+    python -m snbp.evaluate --smote --hist-gb --promote
+"""
+
+import statistics
+import time
+
+import numpy as np
+
+from snbp.model import FEATURES, LABEL_COLS, MODEL_PARAMS, TARGET, TARGET_MAP, train_model, training_key
+
+CV_FOLDS = 5
+
+
+def candidates(smote=False, hist_gradient_boosting=False):
+    """Estimator kandidat (belum dilatih) per nama."""
+    from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+    from sklearn.naive_bayes import GaussianNB
+
+    models = {
+        "random_forest": RandomForestClassifier(**MODEL_PARAMS),
+        "gaussian_nb": GaussianNB(),
+    }
+    if smote:
+        try:
+            from imblearn.over_sampling import SMOTE
+            from imblearn.pipeline import make_pipeline
+        except ImportError as exc:
+            raise ImportError("Kandidat GaussianNB + SMOTE membutuhkan paket imbalanced-learn") from exc
+        models["gaussian_nb_smote"] = make_pipeline(SMOTE(**MODEL_PARAMS), GaussianNB())
+    if hist_gradient_boosting:
+        models["hist_gradient_boosting"] = HistGradientBoostingClassifier(**MODEL_PARAMS)
+    return models
+
+
+def with_encoder(estimator, features=FEATURES):
+    """``estimator`` didahului OrdinalEncoder untuk ``LABEL_COLS``, dengan urutan kolom ``features``.
+
+    Kode kategori sama dengan LabelEncoder di ``snbp.model.training_data`` untuk nilai yang
+    dikenal; nilai yang tidak ada saat fit menjadi -1.
+    """
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OrdinalEncoder
+
+    columns = [
+        (col, OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1) if col in LABEL_COLS
+         else "passthrough", [col])
+        for col in features
+    ]
+    return Pipeline([("encode", ColumnTransformer(columns)), ("model", estimator)])
+
+
+def _run_fold(name, estimator, X, y, train, test):
+    from sklearn.base import clone
+    from sklearn.metrics import accuracy_score, f1_score
+
+    model = clone(estimator)
+    start = time.perf_counter()
+    model.fit(X.iloc[train], y.iloc[train])
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predicted = model.predict(X.iloc[test])
+    predict_seconds = time.perf_counter() - start
+    return name, {
+        "accuracy": accuracy_score(y.iloc[test], predicted),
+        "f1_macro": f1_score(y.iloc[test], predicted, average="macro"),
+        "fit_seconds": fit_seconds,
+        "predict_us_per_row": predict_seconds / len(test) * 1e6,
+    }
+
+
+def cross_validate(df, models, folds=CV_FOLDS, n_jobs=-1, features=FEATURES):
+    """Stratified k-fold untuk semua ``models`` sekaligus; kembalikan ringkasan metrik per nama."""
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import StratifiedKFold
+
+    X = df[list(features)].astype({col: str for col in LABEL_COLS if col in features})
+    y = df[TARGET].astype(str).map(TARGET_MAP)
+    splits = list(StratifiedKFold(folds, shuffle=True, **MODEL_PARAMS).split(X, y))
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_run_fold)(name, with_encoder(estimator, features), X, y, train, test)
+        for name, estimator in models.items()
+        for train, test in splits
+    )
+
+    summary = {}
+    for name in models:
+        per_fold = [metrics for result_name, metrics in results if result_name == name]
+        summary[name] = {"folds": folds}
+        for metric in ("accuracy", "f1_macro"):
+            values = [m[metric] for m in per_fold]
+            summary[name][metric] = statistics.fmean(values)
+            summary[name][f"{metric}_std"] = statistics.pstdev(values)
+        summary[name]["fit_seconds"] = statistics.fmean(m["fit_seconds"] for m in per_fold)
+        summary[name]["predict_us_per_row"] = statistics.fmean(m["predict_us_per_row"] for m in per_fold)
+    return summary
+
+
+def _fit_full(name, estimator, df, features, key):
+    from sklearn.base import clone
+
+    trained = train_model(df, features, key, clone(estimator))
+    X, _ = trained.encode(df.head(1))
+    latencies = []
+    for _ in range(50):
+        start = time.perf_counter()
+        trained.model.predict_proba(X)
+        latencies.append(time.perf_counter() - start)
+    return name, trained, float(np.median(latencies)) * 1000
+
+
+def evaluate(df, registry, models, folds=CV_FOLDS, n_jobs=-1, features=FEATURES, promote=False):
+    """Cross-validate ``models``, latih ulang pada seluruh data, dan catat semuanya di ``registry``.
+
+    Bila ``promote``, kandidat dengan F1 macro tertinggi (lalu akurasi) dipromosikan.
+    Mengembalikan daftar entri registry, terbaik lebih dulu.
+    """
+    from joblib import Parallel, delayed
+
+    summary = cross_validate(df, models, folds, n_jobs, features)
+    key = training_key(df, features)
+    fitted = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_full)(name, estimator, df, features, key) for name, estimator in models.items()
+    )
+    entries = [
+        registry.register(name, trained, {**summary[name], "predict_single_ms": single_ms, "rows": len(df)})
+        for name, trained, single_ms in fitted
+    ]
+    entries.sort(key=lambda e: (e["f1_macro"], e["accuracy"]), reverse=True)
+    if promote:
+        registry.promote(entries[0]["id"])
+    return entries
+
+
+def main(argv=None):
+    import argparse
+
+    from snbp.config import CACHE_DIR, REGISTRY_DIR, SHEET_TTL, SPREADSHEET_URL
+    from snbp.ingest import read_dataset
+    from snbp.loader import SheetLoader
+    from snbp.registry import ModelRegistry
+
+    parser = argparse.ArgumentParser(description="Evaluasi kandidat model dengan stratified cross-validation.")
+    parser.add_argument("--folds", type=int, default=CV_FOLDS)
+    parser.add_argument("--jobs", type=int, default=-1, help="jumlah proses paralel (-1 = semua core)")
+    parser.add_argument("--smote", action="store_true", help="tambahkan GaussianNB + SMOTE (imbalanced-learn)")
+    parser.add_argument("--hist-gb", action="store_true", help="tambahkan HistGradientBoosting")
+    parser.add_argument("--promote", action="store_true", help="promosikan kandidat terbaik untuk dashboard")
+    args = parser.parse_args(argv)
+
+    try:
+        models = candidates(args.smote, args.hist_gb)
+    except ImportError as exc:
+        parser.error(str(exc))
+
+    snapshot = SheetLoader(SPREADSHEET_URL, CACHE_DIR / "sheet", ttl=SHEET_TTL).get()
+    df = read_dataset(snapshot.data)
+    registry = ModelRegistry(REGISTRY_DIR)
+    start = time.perf_counter()
+    entries = evaluate(df, registry, models, folds=args.folds, n_jobs=args.jobs, promote=args.promote)
+    print(f"{len(df)} baris, {args.folds}-fold CV, selesai dalam {time.perf_counter() - start:.1f} s\n")
+    print(f"{'Model':<24}{'Akurasi':>16}{'F1 macro':>16}{'Latih (s)':>11}{'Inferensi/baris':>17}{'1 baris':>10}")
+    for e in entries:
+        print(
+            f"{e['name']:<24}{e['accuracy']:>9.4f} ±{e['accuracy_std']:.3f}{e['f1_macro']:>9.4f} ±{e['f1_macro_std']:.3f}"
+            f"{e['fit_seconds']:>11.2f}{e['predict_us_per_row']:>14.1f} µs{e['predict_single_ms']:>7.2f} ms"
+        )
+    if args.promote:
+        print(f"\nDipromosikan: {entries[0]['id']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Ekspor statis tampilan yang paling sering dibuka, untuk semua kombinasi filter.
+
+Tampilan yang diekspor (isi dari ``snbp.report``):
+
+- ``jalur``: tiga pilihan "Pilih Jalur:" (SNBP, SNBT, SNBP dan SNBT);
+- ``provinsi``: drill-down setiap provinsi;
+- ``rasio``: Top 10 rasio keketatan untuk setiap pasangan JALUR x KATEGORI JURUSAN.
+
+Setiap kombinasi ditulis sebagai ``<view>/<slug>.html`` (diagram Plotly, insight,
+dan tabel) dan ``<view>/<slug>.json`` (figure JSON, teks markdown, baris tabel),
+ditambah ``index.html``, ``manifest.json``, dan ``plotly.min.js`` sehingga folder
+hasilnya bisa dilayani server statis apa pun tanpa akses internet. Kombinasi
+dibangun paralel di process pool; setiap proses membuka snapshot dataset yang
+di-memory-map (``snbp.shared``) dan membangun kubus agregatnya sekali.
+
+Contoh:
+    python -m snbp.export laporan --jobs 4
+    python -m http.server --directory laporan 8080
+"""
+
+import html
+import json
+import os
+import re
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from snbp.cube import AggregateCube
+from snbp.index import CascadeIndex
+from snbp.report import JALUR_OPTIONS, jalur_report, province_report, rasio_report
+from snbp.shared import open_snapshot
+
+BUILDERS = {"jalur": jalur_report, "provinsi": province_report, "rasio": rasio_report}
+
+_PAGE = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{root}plotly.min.js"></script>
+<style>
+body {{ font-family: sans-serif; max-width: 1100px; margin: 0 auto; padding: 1rem; }}
+table {{ border-collapse: collapse; font-size: 0.9rem; }}
+td, th {{ border: 1px solid #ddd; padding: 0.25rem 0.5rem; }}
+</style>
+</head>
+<body>
+<p><a href="{root}index.html">Semua laporan</a> · data versi {version}</p>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+
+def combinations(df, cube):
+    """Semua ``(view, args)`` yang diekspor, dalam urutan pilihan di dashboard."""
+    combos = [("jalur", (jalur,)) for jalur in JALUR_OPTIONS]
+    combos += [("provinsi", (provinsi,)) for provinsi in cube.ranking('PROVINSI', 'PEMINAT 2024')['PROVINSI']]
+    index = CascadeIndex(df, ('JALUR', 'KATEGORI JURUSAN'))
+    combos += [("rasio", (jalur, kategori)) for jalur in index.options() for kategori in index.options(jalur)]
+    return combos
+
+
+def slug(args):
+    return "-".join(re.sub(r"[^0-9A-Za-z]+", "-", str(arg)).strip("-") for arg in args)
+
+
+def _markdown(text):
+    """Markdown insight (tebal dan baris baru saja) menjadi HTML."""
+    escaped = html.escape(textwrap.dedent(text).strip())
+    escaped = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", escaped)
+    return "<p>" + "<br>\n".join(line.strip() for line in escaped.splitlines()) + "</p>"
+
+
+def _write(path, text):
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def render(report, version, root="../"):
+    """``(html, payload)`` satu laporan; figure diserialisasi sekali untuk keduanya."""
+    charts = {chart_id: fig.to_json() for chart_id, fig in report.charts.items()}
+    insights = {
+        insight_id: text if isinstance(text, list) else [text]
+        for insight_id, text in report.insights.items()
+    }
+
+    # Insight dan tabel diletakkan setelah diagram dengan id yang sama, sisanya di akhir
+    body = []
+    order = list(charts) + [i for i in {**insights, **report.tables} if i not in charts]
+    for item_id in order:
+        if item_id in charts:
+            body.append(
+                f'<div id="chart-{item_id}"></div>\n<script>(function () {{ var fig = {charts[item_id]};'
+                f' Plotly.newPlot("chart-{item_id}", fig.data, fig.layout, {{responsive: true}}); }})();</script>'
+            )
+        body.extend(_markdown(text) for text in insights.get(item_id, []))
+        if item_id in report.tables:
+            body.append(report.tables[item_id].to_html(index=False, border=0))
+
+    page = _PAGE.format(title=html.escape(report.title), root=root, version=version, body="\n".join(body))
+    payload = json.dumps({
+        "title": report.title,
+        "version": version,
+        "charts": {chart_id: json.loads(fig) for chart_id, fig in charts.items()},
+        "insights": insights,
+        "tables": {
+            table_id: json.loads(table.to_json(orient="records", force_ascii=False))
+            for table_id, table in report.tables.items()
+        },
+    }, ensure_ascii=False)
+    return page, payload
+
+
+# --- Proses pekerja: kubus dibangun sekali per proses dari snapshot yang di-memory-map ---
+_cube = None
+
+
+def _init_worker(snapshot_path):
+    global _cube
+    _cube = AggregateCube(open_snapshot(snapshot_path))
+
+
+def _export_one(view, args, out_dir, version):
+    start = time.perf_counter()
+    report = BUILDERS[view](_cube, *args)
+    page, payload = render(report, version)
+    directory = Path(out_dir) / view
+    directory.mkdir(parents=True, exist_ok=True)
+    name = slug(args)
+    _write(directory / f"{name}.html", page)
+    _write(directory / f"{name}.json", payload)
+    return {
+        "view": view, "args": list(args), "title": report.title,
+        "html": f"{view}/{name}.html", "json": f"{view}/{name}.json",
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def export(snapshot_path, out_dir, version, jobs=None):
+    """Ekspor semua kombinasi ke ``out_dir``; kembalikan isi manifest."""
+    import plotly.offline
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+
+    df = open_snapshot(snapshot_path)
+    combos = combinations(df, AggregateCube(df))
+    with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(str(snapshot_path),)) as pool:
+        futures = [pool.submit(_export_one, view, args, str(out_dir), version) for view, args in combos]
+        pages = [future.result() for future in futures]
+
+    _write(out_dir / "plotly.min.js", plotly.offline.get_plotlyjs())
+    links = []
+    for view in BUILDERS:
+        items = "\n".join(
+            f'<li><a href="{page["html"]}">{html.escape(page["title"])}</a> (<a href="{page["json"]}">json</a>)</li>'
+            for page in pages if page["view"] == view
+        )
+        links.append(f"<h2>{view}</h2>\n<ul>\n{items}\n</ul>")
+    _write(out_dir / "index.html", _PAGE.format(
+        title="Laporan SNBP/SNBT IPS", root="", version=version, body="\n".join(links)
+    ))
+
+    manifest = {
+        "version": version,
+        "generated_at": time.time(),
+        "seconds": time.perf_counter() - start,
+        "pages": pages,
+    }
+    _write(out_dir / "manifest.json", json.dumps(manifest, indent=2, ensure_ascii=False))
+    return manifest
+
+
+def main(argv=None):
+    import argparse
+
+    from snbp.config import CACHE_DIR, SHEET_TTL, SPREADSHEET_URL
+    from snbp.ingest import read_dataset
+    from snbp.loader import SheetLoader
+    from snbp.shared import SharedDataset
+
+    parser = argparse.ArgumentParser(description="Ekspor HTML/JSON statis untuk semua kombinasi jalur, provinsi, dan rasio.")
+    parser.add_argument("directory", help="folder hasil")
+    parser.add_argument("--jobs", type=int, help="jumlah proses (default: semua core)")
+    args = parser.parse_args(argv)
+
+    snapshot = SheetLoader(SPREADSHEET_URL, CACHE_DIR / "sheet", ttl=SHEET_TTL).get()
+    shared = SharedDataset(CACHE_DIR / "dataset")
+    shared.get(snapshot.version, lambda: read_dataset(snapshot.data))
+    manifest = export(shared.path(snapshot.version), args.directory, snapshot.version, args.jobs)
+
+    for view in BUILDERS:
+        pages = [page for page in manifest["pages"] if page["view"] == view]
+        print(f"{view:<10}{len(pages):>4} halaman  {sum(page['seconds'] for page in pages):>7.2f} s kerja")
+    print(f"Selesai dalam {manifest['seconds']:.1f} s: {args.directory}/index.html")
+
+
+if __name__ == "__main__":
+    main()
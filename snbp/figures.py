@@ -0,0 +1,222 @@
+"""Pembangunan figure Plotly yang cepat: template per bentuk diagram + cache per versi data.
+
+``plotly.express`` memproses DataFrame, memvalidasi setiap properti, dan
+menyusun layout dari nol pada setiap panggilan (puluhan milidetik per
+diagram, belasan diagram per rerun). Padahal bentuk diagram dashboard tidak
+pernah berubah antar rerun, hanya datanya. ``FigureFactory`` karena itu:
+
+1. Membangun diagram dengan px **sekali** per template (jenis diagram +
+   argumen px selain judul + grup warna), lalu mencatat kolom DataFrame asal
+   setiap array trace (``x``, ``y``, ``text``, ``customdata``, ``marker.color``,
+   ``labels``, ``values``, ``locations``, ``z``). Template divalidasi: mengisinya kembali dengan data
+   yang sama harus menghasilkan JSON yang identik dengan px. Bila tidak cocok,
+   diagram dengan argumen itu selalu dibangun lewat px.
+2. Untuk data berikutnya, spesifikasi template disalin dangkal, array-nya
+   diganti kolom data baru, dan hasilnya dibungkus ``go.Figure`` tanpa
+   validasi ulang.
+3. Figure yang sudah jadi disimpan (LRU) dengan kunci ``(id diagram, filter,
+   versi data)`` dan dibagi semua sesi. Figure ini tidak boleh diubah setelah
+   dibuat: pengaturan trace/layout diberikan lewat argumen ``traces``/``layout``
+   sehingga ikut masuk ke template.
+
+Contoh::
+
+    fig = FIGURES.bar("rasio.top10", frame, state=(jalur, kategori), version=versi,
+                      x='NAMA', y='RASIO KEKETATAN', title=judul,
+                      traces={'marker_color': 'darkblue'})
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from snbp.lazy import lazy_import
+from snbp.metrics import METRICS
+
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
+# Jumlah figure jadi yang disimpan per proses (semua diagram x filter x versi)
+FIGURE_CACHE_SIZE = 512
+
+# Atribut trace yang berisi data per baris dan boleh diganti tanpa membangun ulang
+ARRAY_PATHS = (
+    ("x",), ("y",), ("text",), ("customdata",), ("labels",), ("values",), ("hovertext",), ("marker", "color"),
+    ("locations",), ("z",),
+)
+
+
+def _get(trace, path):
+    for part in path:
+        if not isinstance(trace, dict):
+            return None
+        trace = trace.get(part)
+    return trace
+
+
+def _same(a, b):
+    if len(a) != len(b):
+        return False
+    try:
+        return np.array_equal(a, b, equal_nan=True)
+    except TypeError:
+        return np.array_equal(a, b)
+
+
+def _source(values, rows):
+    """Kolom ``rows`` asal array ``values`` (tuple kolom untuk array 2D), atau ``None``.
+
+    ``ValueError`` bila lebih dari satu kolom berisi nilai yang sama (mis. TOTAL
+    dan MIN saat setiap kelompok peringkat berisi satu jurusan): kolom asalnya
+    tidak bisa dipastikan dari data ini.
+    """
+    values = np.asarray(values)
+    if values.ndim == 2:
+        columns = tuple(_source(values[:, i], rows) for i in range(values.shape[1]))
+        return None if None in columns else columns
+    matches = [col for col in rows.columns if _same(values, rows[col].to_numpy())]
+    if len(matches) > 1:
+        raise ValueError(f"Array trace cocok dengan beberapa kolom: {matches}")
+    return matches[0] if matches else None
+
+
+class FigureTemplate:
+    """Spesifikasi figure hasil px ditambah kolom asal setiap array trace."""
+
+    def __init__(self, spec, color, sources):
+        self.traces = spec["data"]
+        self.layout = spec["layout"]
+        self.color = color
+        self.sources = sources
+
+    @classmethod
+    def from_figure(cls, fig, frame, color=None):
+        """Template dari ``fig`` yang dibangun px atas ``frame``, atau ``None`` bila array tak terpetakan.
+
+        ``ValueError`` bila kolom asal suatu array ambigu untuk ``frame`` ini.
+        """
+        spec = fig.to_dict()
+        sources = []
+        for trace in spec["data"]:
+            rows = cls._rows(frame, color, trace)
+            mapping = {}
+            for path in ARRAY_PATHS:
+                values = _get(trace, path)
+                # Nilai tunggal (mis. marker.color='darkblue') adalah bagian dari template
+                if values is None or isinstance(values, str) or np.ndim(values) == 0:
+                    continue
+                mapping[path] = _source(values, rows)
+                if mapping[path] is None:
+                    return None
+            sources.append(mapping)
+        return cls(spec, color, sources)
+
+    @staticmethod
+    def _rows(frame, color, trace):
+        return frame if color is None else frame[frame[color].astype(str) == trace["name"]]
+
+    def fill(self, frame, title=None):
+        data = []
+        for trace, mapping in zip(self.traces, self.sources):
+            rows = self._rows(frame, self.color, trace)
+            trace = dict(trace)
+            for path, source in mapping.items():
+                values = rows[list(source)].to_numpy() if isinstance(source, tuple) else rows[source].to_numpy()
+                if len(path) == 1:
+                    trace[path[0]] = values
+                else:
+                    trace[path[0]] = {**trace[path[0]], path[1]: values}
+            data.append(trace)
+        layout = self.layout
+        if title is not None:
+            layout = {**layout, "title": {**layout.get("title", {}), "text": title}}
+        # Spesifikasi sudah divalidasi px saat template dibuat; hanya array yang diganti
+        return go.Figure({"data": data, "layout": layout}, _validate=False)
+
+
+class FigureFactory:
+    """Figure per ``(id diagram, filter, versi)`` yang dibangun dari template tervalidasi."""
+
+    def __init__(self, maxsize=FIGURE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._figures = OrderedDict()
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def bar(self, chart_id, frame, **kwargs):
+        return self.build("bar", chart_id, frame, **kwargs)
+
+    def line(self, chart_id, frame, **kwargs):
+        return self.build("line", chart_id, frame, **kwargs)
+
+    def pie(self, chart_id, frame, **kwargs):
+        return self.build("pie", chart_id, frame, **kwargs)
+
+    def choropleth(self, chart_id, frame, **kwargs):
+        return self.build("choropleth", chart_id, frame, **kwargs)
+
+    def build(self, kind, chart_id, frame, state=(), version=None, title=None, traces=None, layout=None, **px_kwargs):
+        """Figure ``px.<kind>(frame, title=title, **px_kwargs)`` + ``traces``/``layout``.
+
+        Hanya di-cache bila ``version`` diberikan; ``state`` berisi nilai filter
+        yang menentukan ``frame`` dan ``title``.
+        """
+        key = (chart_id, state, version) if version is not None else None
+        if key is not None:
+            with self._lock:
+                fig = self._figures.get(key)
+                if fig is not None:
+                    self._figures.move_to_end(key)
+            METRICS.cache("figure", hit=fig is not None)
+            if fig is not None:
+                return fig
+
+        fig = self._from_template(kind, frame, title, traces or {}, layout or {}, px_kwargs)
+
+        if key is not None:
+            with self._lock:
+                self._figures[key] = fig
+                while len(self._figures) > self.maxsize:
+                    self._figures.popitem(last=False)
+        return fig
+
+    def _from_template(self, kind, frame, title, traces, layout, px_kwargs):
+        color = px_kwargs.get("color")
+        if color is not None and pd.api.types.is_numeric_dtype(frame[color]):
+            color = None  # skala warna kontinu: tetap satu trace
+        # Grup warna ikut menentukan jumlah dan urutan trace
+        groups = tuple(pd.unique(frame[color].astype(str))) if color is not None else ()
+        template_key = (kind, repr(sorted(px_kwargs.items())), repr(sorted(traces.items())), repr(sorted(layout.items())), groups)
+
+        template = self._templates.get(template_key) if len(frame) else None
+        METRICS.cache("figure_template", hit=template is not None)
+        if template is not None:
+            return template.fill(frame, title)
+
+        fig = getattr(px, kind)(frame, title=title, **px_kwargs)
+        if traces:
+            fig.update_traces(**traces)
+        if layout:
+            fig.update_layout(**layout)
+        if len(frame) and template_key not in self._templates:
+            try:
+                template = FigureTemplate.from_figure(fig, frame, color)
+            except ValueError:
+                return fig  # coba lagi dengan data berikutnya
+            # Template yang tidak menghasilkan figure identik tidak pernah dipakai
+            if template is not None and json.loads(template.fill(frame, title).to_json()) != json.loads(fig.to_json()):
+                template = None
+            with self._lock:
+                self._templates[template_key] = template
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self._templates.clear()
+
+
+FIGURES = FigureFactory()
@@ -0,0 +1,379 @@
+"""Geometri provinsi untuk peta choropleth: disederhanakan sekali, dibaca dari bundel lokal.
+
+Batas provinsi mentah (GeoJSON BPS/GADM/OSM) berukuran puluhan megabyte,
+terlalu besar untuk dikirim ke browser setiap rerun. ``build_bundle``
+menyederhanakannya **sekali** (``python -m snbp.geo provinsi.geojson``) ke
+beberapa tingkat zoom, lalu menyimpannya sebagai satu file JSON ringkas
+(``GEO_BUNDLE``) yang dibaca dashboard tanpa akses jaringan.
+
+Penyederhanaan menjaga topologi seperti TopoJSON: koordinat dikuantisasi ke
+grid ``QUANTIZE``, setiap ring dipecah menjadi *arc* di titik pertemuan
+(junction, titik yang tetangganya berbeda di ring lain), dan setiap arc unik
+disederhanakan dengan Douglas-Peucker satu kali. Batas yang dipakai dua
+provinsi berasal dari arc yang sama, sehingga tidak ada celah atau tumpang
+tindih di antara provinsi setelah disederhanakan. Ring yang menyusut menjadi
+kurang dari tiga titik (pulau kecil di tingkat nasional) dibuang, kecuali bila
+itu membuat satu provinsi hilang sama sekali.
+
+Isi bundel::
+
+    {"source": "<sha1 sumber>", "attribution": "<asal dan lisensi geometri>",
+     "tolerances": {"nasional": 0.05, ...}, "levels": {"nasional": FeatureCollection, ...}}
+
+Setiap feature memakai ``id`` = ``province_key(nama)``, sehingga nama provinsi
+di spreadsheet dan di sumber geometri boleh berbeda penulisan ("DKI Jakarta"
+/ "Daerah Khusus Ibukota Jakarta" / "Jakarta Special Capital Region").
+
+Bundel bawaan ``snbp/data/provinsi.json`` dibangun dari peta Indonesia
+echarts-countries-js (paket ``echarts-countries-pypkg`` 0.1.6, lisensi MIT;
+lihat ``snbp/data/SUMBER.md``): 34 provinsi sebelum pemekaran Papua 2022,
+sehingga Papua Barat Daya, Papua Tengah, Papua Pegunungan, dan Papua Selatan
+tampil sebagai keterangan di bawah peta. Untuk menggantinya dengan batas lain:
+
+1. siapkan batas provinsi Indonesia sebagai GeoJSON FeatureCollection WGS84
+   (misalnya GADM tingkat 1, nama di ``NAME_1``) atau file peta ECharts
+   (``echarts.registerMap``, geometri terkompresi didekode ``read_source``);
+2. ``python -m snbp.geo provinsi.geojson --atribusi "..."`` (menulis
+   ``snbp/data/provinsi.json``, atau ``--keluar``/``SNBP_GEO_BUNDLE``), cukup
+   sekali per sumber;
+3. periksa keluarannya: jumlah provinsi per tingkat harus sama dengan sumber, dan
+   nama yang tidak cocok dengan spreadsheet tampil sebagai keterangan di bawah peta
+   (tambahkan penulisannya ke ``ALIASES``).
+"""
+
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+from snbp.search import normalize
+
+# Toleransi Douglas-Peucker per tingkat zoom, dalam derajat (0.01 derajat ~ 1,1 km)
+LEVELS = {'nasional': 0.05, 'pulau': 0.01, 'detail': 0.002}
+
+# Resolusi grid kuantisasi: titik per derajat
+QUANTIZE = 10_000
+
+# Properti feature yang dicoba (berurutan) sebagai nama provinsi
+NAME_PROPERTIES = ('PROVINSI', 'Propinsi', 'provinsi', 'NAME_1', 'name', 'NAME', 'state')
+
+# Penulisan lain nama provinsi -> kunci baku (setelah ``normalize`` dan tanpa awalan "provinsi")
+ALIASES = {
+    'daerah khusus ibukota jakarta': 'dki jakarta',
+    'jakarta raya': 'dki jakarta',
+    'jakarta': 'dki jakarta',
+    'daerah istimewa yogyakarta': 'di yogyakarta',
+    'yogyakarta': 'di yogyakarta',
+    'nanggroe aceh darussalam': 'aceh',
+    'bangka belitung': 'kepulauan bangka belitung',
+    'kep bangka belitung': 'kepulauan bangka belitung',
+    'kep riau': 'kepulauan riau',
+    'ntb': 'nusa tenggara barat',
+    'ntt': 'nusa tenggara timur',
+    # Nama bahasa Inggris (echarts-countries-js, OSM/Natural Earth)
+    'jakarta special capital region': 'dki jakarta',
+    'special region of yogyakarta': 'di yogyakarta',
+    'bangka belitung islands': 'kepulauan bangka belitung',
+    'riau islands': 'kepulauan riau',
+    'north sumatra': 'sumatera utara',
+    'west sumatra': 'sumatera barat',
+    'south sumatra': 'sumatera selatan',
+    'west java': 'jawa barat',
+    'central java': 'jawa tengah',
+    'east java': 'jawa timur',
+    'west nusa tenggara': 'nusa tenggara barat',
+    'east nusa tenggara': 'nusa tenggara timur',
+    'west kalimantan': 'kalimantan barat',
+    'central kalimantan': 'kalimantan tengah',
+    'south kalimantan': 'kalimantan selatan',
+    'east kalimantan': 'kalimantan timur',
+    'north kalimantan': 'kalimantan utara',
+    'north sulawesi': 'sulawesi utara',
+    'central sulawesi': 'sulawesi tengah',
+    'west sulawesi': 'sulawesi barat',
+    'south sulawesi': 'sulawesi selatan',
+    'southeast sulawesi': 'sulawesi tenggara',
+    'north maluku': 'maluku utara',
+    'west papua': 'papua barat',
+}
+
+# Skala kuantisasi default geometri terkompresi ECharts (``UTF8Scale``)
+ECHARTS_SCALE = 1024
+
+
+def province_key(name):
+    """Kunci pencocokan nama provinsi antara spreadsheet dan geometri."""
+    key = normalize(name)
+    if key.startswith('provinsi '):
+        key = key[len('provinsi '):]
+    return ALIASES.get(key, key)
+
+
+def _name(properties):
+    for prop in NAME_PROPERTIES:
+        if properties.get(prop):
+            return str(properties[prop])
+    raise ValueError(f"Feature tanpa nama provinsi (properti yang dicari: {', '.join(NAME_PROPERTIES)})")
+
+
+def _polygons(geometry):
+    if geometry['type'] == 'Polygon':
+        return [geometry['coordinates']]
+    if geometry['type'] == 'MultiPolygon':
+        return geometry['coordinates']
+    raise ValueError(f"Jenis geometri tidak didukung: {geometry['type']}")
+
+
+def _quantize(ring):
+    points = np.rint(np.asarray(ring, dtype=float)[:, :2] * QUANTIZE).astype(np.int64)
+    # Buang titik berurutan yang sama dan titik penutup ring
+    keep = np.r_[True, (points[1:] != points[:-1]).any(axis=1)]
+    points = points[keep]
+    if len(points) > 1 and (points[0] == points[-1]).all():
+        points = points[:-1]
+    return [tuple(p) for p in points.tolist()]
+
+
+def douglas_peucker(points, tolerance):
+    """Indeks titik ``points`` (array N x 2) yang dipertahankan; titik pertama dan terakhir selalu."""
+    n = len(points)
+    if n < 3:
+        return np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, n - 1]] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        segment = points[end] - points[start]
+        inner = points[start + 1:end] - points[start]
+        length = math.hypot(*segment)
+        if length == 0:
+            distance = np.hypot(inner[:, 0], inner[:, 1])
+        else:
+            distance = np.abs(segment[0] * inner[:, 1] - segment[1] * inner[:, 0]) / length
+        i = int(distance.argmax())
+        if distance[i] > tolerance:
+            keep[start + 1 + i] = True
+            stack += [(start, start + 1 + i), (start + 1 + i, end)]
+    return np.flatnonzero(keep)
+
+
+class _Topology:
+    """Ring terkuantisasi semua feature, dipecah menjadi arc bersama di titik junction."""
+
+    def __init__(self, features):
+        self.rings = []  # (indeks feature, indeks polygon, indeks ring, titik)
+        for f, feature in enumerate(features):
+            for p, polygon in enumerate(_polygons(feature['geometry'])):
+                for r, ring in enumerate(polygon):
+                    points = _quantize(ring)
+                    if len(points) >= 3:
+                        self.rings.append((f, p, r, points))
+
+        # Junction: titik yang muncul di lebih dari satu tempat dengan pasangan tetangga berbeda
+        neighbours = {}
+        for *_, points in self.rings:
+            n = len(points)
+            for i, point in enumerate(points):
+                pair = frozenset((points[i - 1], points[(i + 1) % n]))
+                neighbours.setdefault(point, set()).add(pair)
+        self.junctions = {point for point, pairs in neighbours.items() if len(pairs) > 1}
+
+    def arcs(self, points):
+        """Pecah satu ring menjadi arc (titik awal dan akhir ikut); ring tanpa junction = satu arc tertutup."""
+        cut = [i for i, point in enumerate(points) if point in self.junctions]
+        if not cut:
+            # Mulai dari titik terkecil agar ring yang sama di feature lain dipecah identik
+            start = min(range(len(points)), key=points.__getitem__)
+            return [points[start:] + points[:start] + [points[start]]]
+        rotated = points[cut[0]:] + points[:cut[0]]
+        cut = [i - cut[0] for i in cut] + [len(points)]
+        rotated.append(rotated[0])
+        return [rotated[a:b + 1] for a, b in zip(cut[:-1], cut[1:])]
+
+
+def _simplify_arc(arc, tolerance, memo):
+    # Arc yang sama (searah atau terbalik) disederhanakan sekali dengan arah baku
+    forward = tuple(arc)
+    backward = forward[::-1]
+    canonical = min(forward, backward)
+    simplified = memo.get(canonical)
+    if simplified is None:
+        points = np.array(canonical, dtype=float)
+        if canonical[0] == canonical[-1]:
+            # Arc tertutup: belah di titik terjauh dari titik awal agar Douglas-Peucker punya ruas
+            far = int(np.hypot(*(points - points[0]).T).argmax())
+            keep = np.r_[douglas_peucker(points[:far + 1], tolerance),
+                         far + douglas_peucker(points[far:], tolerance)[1:]]
+        else:
+            keep = douglas_peucker(points, tolerance)
+        simplified = [canonical[i] for i in keep]
+        memo[canonical] = simplified
+    return simplified if canonical == forward else simplified[::-1]
+
+
+def _decimals(tolerance):
+    # Presisi koordinat keluaran: satu digit di bawah toleransi, tidak lebih halus dari grid
+    return min(int(math.ceil(-math.log10(tolerance))) + 1, int(math.log10(QUANTIZE)))
+
+
+def simplify(geojson, levels=LEVELS):
+    """FeatureCollection per tingkat zoom, dari FeatureCollection sumber (lihat docstring modul)."""
+    features = geojson['features']
+    names = [_name(feature.get('properties') or {}) for feature in features]
+    topology = _Topology(features)
+    ring_arcs = [(f, p, r, topology.arcs(points)) for f, p, r, points in topology.rings]
+
+    result = {}
+    for level, tolerance in levels.items():
+        memo = {}
+        digits = _decimals(tolerance)
+        polygons = [{} for _ in features]
+        for f, p, r, arcs in ring_arcs:
+            ring = []
+            for arc in arcs:
+                ring.extend(_simplify_arc(arc, tolerance * QUANTIZE, memo)[:-1])
+            if len(ring) < 3:
+                continue
+            ring.append(ring[0])
+            coords = [[round(x / QUANTIZE, digits), round(y / QUANTIZE, digits)] for x, y in ring]
+            if r == 0:
+                polygons[f][p] = [coords]
+            elif p in polygons[f]:
+                polygons[f][p].append(coords)
+
+        collection = []
+        for f, (name, feature_polygons) in enumerate(zip(names, polygons)):
+            if not feature_polygons:
+                # Provinsi tidak boleh hilang dari peta: pakai ring luar terbesarnya tanpa penyederhanaan
+                outer = [points for g, _, r, points in topology.rings if g == f and r == 0]
+                if not outer:
+                    continue
+                ring = max(outer, key=len)
+                feature_polygons = {0: [[[round(x / QUANTIZE, digits), round(y / QUANTIZE, digits)]
+                                         for x, y in ring + ring[:1]]]}
+            shapes = list(feature_polygons.values())
+            geometry = ({'type': 'Polygon', 'coordinates': shapes[0]} if len(shapes) == 1
+                        else {'type': 'MultiPolygon', 'coordinates': shapes})
+            collection.append({'type': 'Feature', 'id': province_key(name), 'properties': {'name': name},
+                               'geometry': geometry})
+        result[level] = {'type': 'FeatureCollection', 'features': collection}
+    return result
+
+
+def _decode_ring(encoded, offset, scale):
+    # Kebalikan encoder ECharts: per titik dua karakter, delta zigzag terhadap titik sebelumnya
+    codes = np.frombuffer(encoded.encode('utf-32-le'), dtype=np.uint32).astype(np.int64) - 64
+    deltas = ((codes >> 1) ^ -(codes & 1)).reshape(-1, 2)
+    deltas[0] += offset
+    return (np.cumsum(deltas, axis=0) / scale).tolist()
+
+
+def _decode_echarts(collection):
+    """FeatureCollection ECharts (``UTF8Encoding``) menjadi GeoJSON biasa."""
+    scale = collection.get('UTF8Scale', ECHARTS_SCALE)
+    features = []
+    for feature in collection['features']:
+        geometry = feature['geometry']
+        polygons, offsets = geometry['coordinates'], geometry['encodeOffsets']
+        if geometry['type'] == 'Polygon':
+            polygons, offsets = [polygons], [offsets]
+        coordinates = [
+            [_decode_ring(ring, offset, scale) for ring, offset in zip(polygon, polygon_offsets)]
+            for polygon, polygon_offsets in zip(polygons, offsets)
+        ]
+        if geometry['type'] == 'Polygon':
+            geometry = {'type': 'Polygon', 'coordinates': coordinates[0]}
+        else:
+            geometry = {'type': 'MultiPolygon', 'coordinates': coordinates}
+        features.append({**feature, 'geometry': geometry})
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def read_source(data):
+    """FeatureCollection dari isi file sumber: GeoJSON, atau skrip peta ECharts (``echarts.registerMap``)."""
+    text = data.decode('utf-8')
+    start = text.find('registerMap(')
+    if start < 0:
+        collection = json.loads(text)
+    else:
+        collection, _ = json.JSONDecoder().raw_decode(text, text.index('{', start))
+    if collection.get('UTF8Encoding'):
+        collection = _decode_echarts(collection)
+    return collection
+
+
+def build_bundle(source, target, levels=LEVELS, attribution=None):
+    """Sederhanakan ``source`` (lihat ``read_source``) dan tulis bundel ke ``target`` (atomik).
+
+    ``attribution`` (asal dan lisensi geometri) ikut disimpan dan ditampilkan di bawah peta.
+    Mengembalikan bundel.
+    """
+    data = Path(source).read_bytes()
+    bundle = {
+        'source': hashlib.sha1(data).hexdigest()[:16],
+        'attribution': attribution,
+        'tolerances': dict(levels),
+        'levels': simplify(read_source(data), levels),
+    }
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix('.tmp')
+    tmp.write_text(json.dumps(bundle, separators=(',', ':'), ensure_ascii=False), encoding='utf-8')
+    os.replace(tmp, target)
+    return bundle
+
+
+class GeoBundle:
+    """Bundel hasil ``build_bundle`` yang sudah dimuat: geometri per tingkat dan pencocokan nama."""
+
+    def __init__(self, bundle):
+        self.source = bundle['source']
+        self.attribution = bundle.get('attribution')
+        self.levels = bundle['levels']
+
+    @classmethod
+    def load(cls, path):
+        """Muat bundel dari disk; ``None`` bila file belum ada."""
+        try:
+            return cls(json.loads(Path(path).read_text(encoding='utf-8')))
+        except FileNotFoundError:
+            return None
+
+    def geojson(self, level):
+        return self.levels[level]
+
+    def keys(self, names, level=None):
+        """``province_key`` untuk setiap nama; ``None`` bila provinsi itu tidak ada di geometri."""
+        features = self.levels[level or next(iter(self.levels))]['features']
+        known = {feature['id'] for feature in features}
+        return [key if key in known else None for key in map(province_key, names)]
+
+
+def main(argv=None):
+    """``python -m snbp.geo <provinsi.geojson>``: bangun bundel geometri untuk peta provinsi."""
+    import argparse
+
+    from snbp.config import GEO_BUNDLE
+
+    parser = argparse.ArgumentParser(description="Sederhanakan batas provinsi (GeoJSON) menjadi bundel peta dashboard.")
+    parser.add_argument("source", help="FeatureCollection provinsi (Polygon/MultiPolygon, WGS84) atau peta ECharts (.js)")
+    parser.add_argument("--keluar", default=str(GEO_BUNDLE), help=f"file bundel (default {GEO_BUNDLE})")
+    parser.add_argument("--atribusi", help="asal dan lisensi geometri, ditampilkan di bawah peta")
+    args = parser.parse_args(argv)
+
+    bundle = build_bundle(args.source, args.keluar, attribution=args.atribusi)
+    size = os.path.getsize(args.source)
+    print(f"{args.source}: {size / 1e6:.1f} MB -> {args.keluar}")
+    for level, collection in bundle['levels'].items():
+        payload = len(json.dumps(collection, separators=(',', ':')).encode('utf-8'))
+        print(f"  {level:<9} toleransi {bundle['tolerances'][level]:<6} {len(collection['features'])} provinsi, {payload / 1e3:.0f} kB")
+
+
+if __name__ == "__main__":
+    main()
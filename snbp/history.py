@@ -0,0 +1,259 @@
+"""Riwayat multi-tahun dalam Parquet, dipartisi per TAHUN dan JALUR.
+
+Setiap snapshot sheet (tahunan atau di tengah musim pendaftaran) ditambahkan
+dengan ``HistoryStore.append``. Hanya partisi yang isinya berubah yang ditulis
+ulang, dan bersamaan dengan itu agregat kecil partisi tersebut (per PROVINSI x
+KATEGORI JURUSAN) ikut diperbarui. Tampilan tren cukup membaca agregat-agregat
+itu, bukan seluruh baris riwayat.
+
+Tata letak di disk::
+
+    <directory>/TAHUN=2025/JALUR=SNBP/data.parquet   baris program studi
+    <directory>/TAHUN=2025/JALUR=SNBP/agg.parquet    agregat partisi
+    <directory>/manifest.json                        hash + jumlah baris per partisi
+
+TAHUN adalah tahun daya tampung (siklus penerimaan); PEMINAT pada siklus itu
+adalah jumlah peminat tahun sebelumnya, sama seperti kolom sheet aslinya.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from snbp.ingest import prepare
+
+# Nama kolom bertahun di sheet dan nama generiknya di riwayat
+YEAR_COLUMNS = {"PEMINAT": "PEMINAT 2024", "DAYA TAMPUNG": "DAYA TAMPUNG 2025"}
+_YEAR_COLUMN = re.compile(r"^(PEMINAT|DAYA TAMPUNG) (\d{4})$")
+
+PARTITION_KEYS = ["TAHUN", "JALUR"]
+COLUMNS = [
+    "KODE", "NAMA", "JENJANG", "JENIS PORTOFOLIO", "ASAL UNIV", "PROSPEK KERJA",
+    "PROVINSI", "KATEGORI JURUSAN", "PEMINAT", "DAYA TAMPUNG", "RASIO KEKETATAN",
+]
+AGG_DIMENSIONS = ["PROVINSI", "KATEGORI JURUSAN"]
+MEASURES = ["PEMINAT", "DAYA TAMPUNG", "JUMLAH"]
+
+
+def snapshot_year(columns):
+    """Tahun siklus sebuah snapshot, dari nama kolom ``DAYA TAMPUNG <tahun>``."""
+    for col in columns:
+        match = _YEAR_COLUMN.match(str(col).strip())
+        if match and match.group(1) == "DAYA TAMPUNG":
+            return int(match.group(2))
+    raise ValueError("Kolom 'DAYA TAMPUNG <tahun>' tidak ditemukan")
+
+
+def prepare_snapshot(raw):
+    """Siapkan sheet mentah tahun berapa pun: ``(tahun, DataFrame hasil snbp.ingest.prepare)``.
+
+    Kolom ``PEMINAT <tahun>`` / ``DAYA TAMPUNG <tahun>`` diganti ke nama di
+    ``snbp.ingest.SCHEMA`` agar jalur parsing yang sama bisa dipakai.
+    """
+    year = snapshot_year(raw.columns)
+    renamed = {}
+    for col in raw.columns:
+        match = _YEAR_COLUMN.match(str(col).strip())
+        if match:
+            renamed[col] = YEAR_COLUMNS[match.group(1)]
+    return year, prepare(raw.rename(columns=renamed))
+
+
+def _partition_hash(frame):
+    digest = hashlib.sha1()
+    digest.update(json.dumps(list(frame.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(frame.astype(str), index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _aggregate(frame):
+    return (
+        frame.groupby(AGG_DIMENSIONS, observed=True, sort=True)
+        .agg(**{
+            "PEMINAT": ("PEMINAT", "sum"),
+            "DAYA TAMPUNG": ("DAYA TAMPUNG", "sum"),
+            "JUMLAH": ("PEMINAT", "size"),
+        })
+        .reset_index()
+    )
+
+
+def _write_parquet(frame, path):
+    # Tulis ke file sementara lalu rename agar pembaca tidak melihat file setengah jadi
+    tmp = path.with_suffix(".tmp")
+    frame.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+class HistoryStore:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._manifest_mtime = None
+        self._manifest = self._read_manifest()
+        self._aggregates = None
+
+    # --- Manifest ---
+    @property
+    def _manifest_path(self):
+        return self.directory / "manifest.json"
+
+    def _stat_manifest(self):
+        try:
+            return self._manifest_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_manifest(self):
+        # mtime dicatat sebelum dibaca: penulisan di antaranya terdeteksi pada pemeriksaan berikutnya
+        self._manifest_mtime = self._stat_manifest()
+        try:
+            return json.loads(self._manifest_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _refresh(self):
+        """Baca ulang manifest bila berubah di disk (mis. ``python -m snbp.history`` dari proses lain)."""
+        with self._lock:
+            if self._stat_manifest() != self._manifest_mtime:
+                self._manifest = self._read_manifest()
+                self._aggregates = None
+            return self._manifest
+
+    def _write_manifest(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._manifest, indent=2, sort_keys=True))
+        os.replace(tmp, self._manifest_path)
+        self._manifest_mtime = self._stat_manifest()
+
+    def _partition_dir(self, year, jalur):
+        return self.directory / f"TAHUN={year}" / f"JALUR={jalur}"
+
+    def partition_path(self, year, jalur):
+        """File baris (``data.parquet``) satu partisi."""
+        return self._partition_dir(year, jalur) / "data.parquet"
+
+    @property
+    def partitions(self):
+        """``{"2025/SNBP": {"hash", "rows", "updated_at"}, ...}``"""
+        return dict(self._refresh())
+
+    def years(self):
+        return sorted({int(key.split("/")[0]) for key in self._refresh()})
+
+    # --- Penambahan snapshot ---
+    def append(self, df, year=None):
+        """Tambahkan snapshot hasil ``snbp.ingest.prepare`` sebagai tahun ``year``.
+
+        ``year`` default diambil dari nama kolom DAYA TAMPUNG. Partisi (TAHUN, JALUR)
+        yang isinya sama dengan yang tersimpan dilewati; snapshot baru untuk tahun
+        yang sama menggantikan partisi lamanya, dan partisi tahun itu yang JALUR-nya
+        tidak ada lagi di snapshot dihapus. Mengembalikan daftar partisi yang ditulis
+        atau dihapus.
+        """
+        year = snapshot_year(df.columns) if year is None else int(year)
+        frame = df.rename(columns={v: k for k, v in YEAR_COLUMNS.items()})[COLUMNS + ["JALUR"]]
+
+        changed = []
+        with self._lock:
+            if self._stat_manifest() != self._manifest_mtime:
+                self._aggregates = None
+            self._manifest = self._read_manifest()
+            for jalur, part in frame.groupby("JALUR", observed=True, sort=True):
+                part = part[COLUMNS].reset_index(drop=True)
+                key = f"{year}/{jalur}"
+                digest = _partition_hash(part)
+                if self._manifest.get(key, {}).get("hash") == digest:
+                    continue
+                directory = self._partition_dir(year, jalur)
+                directory.mkdir(parents=True, exist_ok=True)
+                _write_parquet(part, directory / "data.parquet")
+                _write_parquet(_aggregate(part), directory / "agg.parquet")
+                self._manifest[key] = {"hash": digest, "rows": len(part), "updated_at": time.time()}
+                changed.append(key)
+            # Partisi tahun ini yang tidak ada lagi di snapshot: keluarkan dari manifest dulu,
+            # baru hapus filenya, agar pembaca di proses lain tidak membuka partisi yang hilang
+            present = {f"{year}/{jalur}" for jalur in frame["JALUR"].dropna().unique()}
+            stale = [key for key in sorted(self._manifest) if key.split("/")[0] == str(year) and key not in present]
+            for key in stale:
+                del self._manifest[key]
+            changed.extend(stale)
+            if changed:
+                self._write_manifest()
+                self._aggregates = None
+            for key in stale:
+                shutil.rmtree(self._partition_dir(*key.split("/")), ignore_errors=True)
+        return changed
+
+    # --- Pembacaan ---
+    def read(self, years=None, jalur=None, columns=None):
+        """Baris riwayat untuk ``years``/``jalur`` (None = semua); hanya partisi itu yang dibaca."""
+        frames = []
+        for key in sorted(self._refresh()):
+            year, part_jalur = key.split("/")
+            if (years is None or int(year) in years) and (jalur is None or part_jalur in jalur):
+                frame = pd.read_parquet(self.partition_path(year, part_jalur), columns=columns)
+                frames.append(frame.assign(TAHUN=int(year), JALUR=part_jalur))
+        if not frames:
+            return pd.DataFrame(columns=PARTITION_KEYS + (columns or COLUMNS))
+        return pd.concat(frames, ignore_index=True)
+
+    def aggregates(self):
+        """Gabungan agregat semua partisi; dibaca ulang hanya setelah ada partisi yang berubah."""
+        self._refresh()
+        with self._lock:
+            if self._aggregates is None:
+                frames = []
+                for key in sorted(self._manifest):
+                    year, jalur = key.split("/")
+                    frame = pd.read_parquet(self._partition_dir(year, jalur) / "agg.parquet")
+                    frames.append(frame.assign(TAHUN=int(year), JALUR=jalur))
+                columns = PARTITION_KEYS + AGG_DIMENSIONS + MEASURES
+                self._aggregates = pd.concat(frames, ignore_index=True)[columns] if frames else pd.DataFrame(columns=columns)
+            return self._aggregates
+
+    def trends(self, by=(), where=None):
+        """Total PEMINAT, DAYA TAMPUNG, JUMLAH, dan rasio keketatan per TAHUN (dan ``by``).
+
+        ``where`` berbentuk ``{kolom: nilai atau daftar nilai}`` atas kolom partisi
+        atau dimensi agregat.
+        """
+        frame = self.aggregates()
+        for col, values in (where or {}).items():
+            values = values if isinstance(values, (list, tuple, set)) else [values]
+            frame = frame[frame[col].isin(values)]
+        keys = ["TAHUN"] + list(by)
+        result = frame.groupby(keys, sort=True)[MEASURES].sum().reset_index()
+        peminat = result["PEMINAT"].where(result["PEMINAT"] != 0)
+        result["RASIO KEKETATAN"] = result["DAYA TAMPUNG"] / peminat * 100
+        return result
+
+
+def main(argv=None):
+    """``python -m snbp.history <direktori> <sheet.csv> [...]``: tambahkan sheet ke riwayat."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tambahkan snapshot sheet SNBP (CSV/Parquet) ke riwayat Parquet.")
+    parser.add_argument("directory", help="folder riwayat")
+    parser.add_argument("files", nargs="+", help="file sheet; tahun diambil dari kolom DAYA TAMPUNG <tahun>")
+    parser.add_argument("--tahun", type=int, help="paksa tahun siklus (hanya untuk satu file)")
+    args = parser.parse_args(argv)
+
+    store = HistoryStore(args.directory)
+    for path in args.files:
+        raw = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+        year, df = prepare_snapshot(raw)
+        changed = store.append(df, year=args.tahun or year)
+        print(f"{path}: tahun {args.tahun or year}, partisi berubah: {', '.join(changed) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Indeks hierarkis untuk filter bertingkat (Provinsi -> Universitas -> Kategori, Jalur -> Kategori).
+
+Baris diurutkan sekali sehingga setiap jalur kunci (mis. provinsi, atau provinsi
++ universitas) menempati potongan bersebelahan dari satu array permutasi.
+``rows`` mengembalikan potongan itu (view NumPy, bukan salinan) dan ``options``
+daftar pilihan tingkat berikutnya, keduanya lewat satu lookup dict.
+
+Urutan pilihan sama dengan ``Series.unique()`` pada subset induknya (urutan
+kemunculan pertama), jadi selectbox yang memakai indeks menampilkan urutan yang
+sama seperti sebelumnya.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class CascadeIndex:
+    def __init__(self, df, levels):
+        self.levels = list(levels)
+        n = len(df)
+        position = np.arange(n)
+
+        # Posisi kemunculan pertama tiap grup prefix, untuk setiap tingkat
+        codes = [pd.factorize(df[col], use_na_sentinel=False)[0] for col in self.levels]
+        first = []
+        for depth in range(1, len(self.levels) + 1):
+            group = pd.Series(position).groupby(codes[:depth], sort=False)
+            first.append(group.transform("min").to_numpy())
+
+        order = np.lexsort([position] + first[::-1])
+        self._positions = order.astype(np.intp)
+        self._positions.flags.writeable = False
+
+        values = [df[col].astype(object).to_numpy()[order] for col in self.levels]
+        self._rows = {(): (0, n)}
+        self._options = {}
+        for depth, starts_at in enumerate(first):
+            # Batas grup: setiap kali posisi kemunculan pertama pada tingkat ini berganti
+            sorted_first = starts_at[order]
+            starts = np.flatnonzero(np.r_[True, sorted_first[1:] != sorted_first[:-1]])
+            ends = np.r_[starts[1:], n]
+            for start, end in zip(starts, ends):
+                path = tuple(level[start] for level in values[:depth + 1])
+                self._rows[path] = (start, end)
+                # Seperti ``.dropna().unique()``: nilai kosong tidak menjadi pilihan
+                if not pd.isna(path[-1]):
+                    self._options.setdefault(path[:-1], []).append(path[-1])
+
+    def options(self, *path):
+        """Pilihan tingkat berikutnya di bawah ``path`` (kosong untuk tingkat teratas)."""
+        return self._options.get(tuple(path), [])
+
+    def rows(self, *path):
+        """Posisi baris (view read-only) untuk ``path``; array kosong bila tidak ada."""
+        start, end = self._rows.get(tuple(path), (0, 0))
+        return self._positions[start:end]
@@ -0,0 +1,101 @@
+"""Tahap ingest tunggal: CSV mentah -> DataFrame bertipe sesuai skema.
+
+Semua konversi dilakukan sekali per versi dataset secara vektorisasi, sehingga
+bagian lain dashboard tinggal memakai kolom numerik/kategorikal yang sudah
+siap tanpa parsing string ulang di setiap rerun.
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+
+# --- Skema dataset SNBP (13 kolom) ---
+# "int"      : angka bulat, nilai tidak valid menjadi NaN
+# "rasio"    : angka desimal berkoma ("75,0") dengan "inf" untuk peminat 0
+# "category" : teks berulang dengan sedikit nilai unik
+# "str"      : teks bebas
+SCHEMA = {
+    "NO": "int",
+    "KODE": "str",
+    "NAMA": "str",
+    "JENJANG": "category",
+    "DAYA TAMPUNG 2025": "int",
+    "PEMINAT 2024": "int",
+    "JENIS PORTOFOLIO": "category",
+    "JALUR": "category",
+    "ASAL UNIV": "str",
+    "PROSPEK KERJA": "category",
+    "PROVINSI": "category",
+    "RASIO KEKETATAN": "rasio",
+    "KATEGORI JURUSAN": "category",
+}
+
+# Kolom yang wajib ada agar dashboard bisa berjalan
+REQUIRED_COLUMNS = [
+    "NAMA", "JENJANG", "DAYA TAMPUNG 2025", "PEMINAT 2024", "JALUR",
+    "ASAL UNIV", "PROSPEK KERJA", "PROVINSI", "RASIO KEKETATAN", "KATEGORI JURUSAN",
+]
+
+
+def parse_int(values):
+    numbers = pd.to_numeric(values, errors="coerce")
+    if numbers.isna().any():
+        return numbers.astype("float64")
+    return numbers.astype("int64")
+
+
+def parse_rasio(values):
+    """Ubah teks rasio ("75,0", "inf") menjadi float dengan ``np.inf``."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype("float64")
+    text = values.astype(str).str.strip().str.replace(",", ".", regex=False)
+    # to_numeric sudah mengenali "inf"; nilai lain yang tidak valid menjadi NaN
+    return pd.to_numeric(text, errors="coerce").astype("float64")
+
+
+def format_rasio_series(values):
+    """Versi vektorisasi ``format_rasio``: "∞" untuk inf, "-" untuk NaN, selain itu "x.xx%"."""
+    labels = values.map("{:.2f}%".format, na_action="ignore").astype(object)
+    labels[np.isinf(values.to_numpy())] = "∞"
+    return labels.fillna("-")
+
+
+def parse_text(values):
+    """Teks tanpa spasi di tepi; sel kosong tetap NaN (``astype(str)`` akan mengubahnya menjadi "nan")."""
+    return values.where(values.isna(), values.astype(str).str.strip())
+
+
+PARSERS = {
+    "int": parse_int,
+    "rasio": parse_rasio,
+    "category": lambda values: parse_text(values).astype("category"),
+    "str": parse_text,
+}
+
+
+def prepare(raw):
+    """Bersihkan DataFrame mentah sesuai ``SCHEMA`` dan tambahkan kolom turunan."""
+    df = raw.copy()
+    df.columns = df.columns.str.strip()
+
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom wajib tidak ditemukan di spreadsheet: {', '.join(missing)}")
+
+    # Buang kolom tambahan yang tidak ada di skema (misal "Unnamed: 13")
+    df = df[[col for col in SCHEMA if col in df.columns]]
+    df = pd.DataFrame({col: PARSERS[SCHEMA[col]](df[col]) for col in df.columns})
+
+    # Peminat 0 diisi dengan daya tampung (sebelumnya df.apply per baris)
+    peminat = df["PEMINAT 2024"]
+    df["PEMINAT 2024"] = peminat.where(peminat != 0, df["DAYA TAMPUNG 2025"])
+
+    # Label rasio untuk tampilan, dihitung sekali
+    df["RASIO_LABEL"] = format_rasio_series(df["RASIO KEKETATAN"])
+    return df
+
+
+def read_dataset(data):
+    """Parsing isi CSV (bytes) lalu jalankan ``prepare``."""
+    return prepare(pd.read_csv(io.BytesIO(data)))
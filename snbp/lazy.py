@@ -0,0 +1,22 @@
+"""Import modul berat (plotly.express, scikit-learn) baru saat pertama dipakai."""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """Kembalikan modul ``name`` yang baru dieksekusi ketika atributnya pertama diakses.
+
+    Resep ``importlib.util.LazyLoader`` dari dokumentasi Python: biaya import
+    dipindah dari cold start ke pemakaian pertama. Bila modul sudah pernah
+    diimport, modul yang ada langsung dikembalikan.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,202 @@
+"""Pemuat spreadsheet bersama dengan refresh di latar belakang.
+
+Satu ``SheetLoader`` dipakai oleh semua sesi. Data diunduh paling banyak
+sekali per TTL (single-flight), dicek ulang memakai permintaan kondisional
+(ETag/Last-Modified), dan snapshot terakhir yang valid disimpan di disk
+sehingga cold start maupun gangguan di sisi spreadsheet tetap dilayani
+dari disk.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from snbp.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Isi CSV mentah beserta metadata versinya."""
+
+    data: bytes
+    version: str
+    fetched_at: float
+    etag: str = None
+    last_modified: str = None
+
+
+class SheetLoader:
+    """Mengambil CSV spreadsheet sekali per TTL dan menyimpannya di disk."""
+
+    def __init__(self, url, snapshot_dir, ttl=600.0, timeout=30.0):
+        self.url = url
+        self.ttl = ttl
+        self.timeout = timeout
+        self.snapshot_dir = Path(snapshot_dir)
+        self.last_error = None
+        self._snapshot = None
+        self._fetch_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # --- Lokasi file snapshot di disk ---
+    @property
+    def _data_path(self):
+        return self.snapshot_dir / "sheet.csv"
+
+    @property
+    def _meta_path(self):
+        return self.snapshot_dir / "sheet.json"
+
+    def _is_fresh(self, snapshot):
+        return snapshot is not None and time.time() - snapshot.fetched_at < self.ttl
+
+    # --- API publik ---
+    def get(self):
+        """Kembalikan snapshot terbaru; unduh hanya bila belum ada sama sekali."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._load_from_disk()
+        METRICS.cache("sheet", hit=snapshot is not None)
+        if snapshot is None:
+            # Cold start tanpa snapshot di disk: semua pemanggil menunggu satu unduhan yang sama
+            return self.refresh()
+        if not self._is_fresh(snapshot):
+            self.refresh_async()
+        return snapshot
+
+    @property
+    def version(self):
+        return self.get().version
+
+    def refresh(self, force=False):
+        """Cek ulang spreadsheet; pemanggil bersamaan berbagi satu unduhan."""
+        with self._fetch_lock:
+            snapshot = self._snapshot or self._load_from_disk()
+            # Pemanggil lain mungkin sudah selesai mengunduh selama kita menunggu lock
+            if not force and self._is_fresh(snapshot):
+                return snapshot
+            try:
+                snapshot = self._fetch(snapshot)
+                self.last_error = None
+            except (urllib.error.URLError, OSError, ValueError) as exc:
+                self.last_error = exc
+                if snapshot is None:
+                    raise
+                logger.warning("Gagal memperbarui spreadsheet, memakai snapshot lama: %s", exc)
+            return snapshot
+
+    def refresh_async(self):
+        """Picu refresh di thread terpisah bila belum ada yang berjalan."""
+        if self._fetch_lock.locked():
+            return
+        threading.Thread(target=self._refresh_quietly, name="sheet-refresh", daemon=True).start()
+
+    def start(self):
+        """Jalankan thread latar yang memperbarui data setiap TTL."""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sheet-loader", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout)
+
+    # --- Internal ---
+    def _run(self):
+        while not self._stop.is_set():
+            self._refresh_quietly()
+            snapshot = self._snapshot
+            wait = self.ttl if snapshot is None else max(self.ttl - (time.time() - snapshot.fetched_at), 1.0)
+            self._stop.wait(wait)
+
+    def _refresh_quietly(self):
+        try:
+            self.refresh()
+        except Exception as exc:  # thread latar tidak boleh mati karena error jaringan
+            logger.warning("Refresh spreadsheet gagal: %s", exc)
+
+    def _fetch(self, current):
+        request = urllib.request.Request(self.url)
+        if current is not None:
+            if current.etag:
+                request.add_header("If-None-Match", current.etag)
+            if current.last_modified:
+                request.add_header("If-Modified-Since", current.last_modified)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as exc:
+            if exc.code == 304 and current is not None:
+                # Tidak berubah: cukup perpanjang umur snapshot; CSV di disk tidak ditulis ulang
+                snapshot = replace(current, fetched_at=time.time())
+                self._write_meta(snapshot)
+                self._snapshot = snapshot
+                return snapshot
+            raise
+        if not data.strip():
+            raise ValueError("Spreadsheet mengembalikan respons kosong")
+        return self._store(data, etag, last_modified)
+
+    def _store(self, data, etag, last_modified):
+        snapshot = Snapshot(
+            data=data,
+            version=hashlib.sha1(data).hexdigest()[:16],
+            fetched_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._write_to_disk(snapshot)
+        self._snapshot = snapshot
+        return snapshot
+
+    def _write_to_disk(self, snapshot):
+        self._write_file(self._data_path, snapshot.data)
+        self._write_meta(snapshot)
+
+    def _write_meta(self, snapshot):
+        meta = {
+            "version": snapshot.version,
+            "fetched_at": snapshot.fetched_at,
+            "etag": snapshot.etag,
+            "last_modified": snapshot.last_modified,
+        }
+        self._write_file(self._meta_path, json.dumps(meta).encode())
+
+    def _write_file(self, path, payload):
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        # Tulis ke file sementara lalu rename agar pembaca tidak melihat file setengah jadi
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+
+    def _load_from_disk(self):
+        try:
+            data = self._data_path.read_bytes()
+            meta = json.loads(self._meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        snapshot = Snapshot(
+            data=data,
+            version=hashlib.sha1(data).hexdigest()[:16],
+            fetched_at=float(meta.get("fetched_at", 0.0)),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+        self._snapshot = snapshot
+        return snapshot
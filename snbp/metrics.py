@@ -0,0 +1,217 @@
+"""Instrumentasi ringan per bagian dashboard: waktu, alokasi memori, dan cache hit/miss.
+
+``METRICS`` adalah registry tunggal per proses. Angka kumulatif (untuk ekspor
+JSON/Prometheus) dibagi semua sesi, sedangkan ``RunRecord`` mencatat satu
+rerun saja: setiap rerun Streamlit berjalan di thread-nya sendiri, jadi rerun
+yang sedang aktif disimpan di thread-local.
+
+Alokasi memori hanya diukur ketika ``tracemalloc`` sedang aktif (mis. dinyalakan
+dari panel debug atau lewat ``PYTHONTRACEMALLOC``). Nilainya adalah puncak
+alokasi selama bagian berjalan, sehingga bagian tidak boleh bersarang dan
+angkanya ikut tercampur bila beberapa sesi berjalan bersamaan.
+"""
+
+import functools
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SectionStats:
+    runs: int = 0
+    total_seconds: float = 0.0
+    last_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_alloc_bytes: int = None
+
+
+@dataclass
+class RunRecord:
+    started: float = field(default_factory=time.time)
+    sections: dict = field(default_factory=dict)
+    caches: dict = field(default_factory=dict)
+
+    def as_dict(self):
+        return asdict(self)
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.sections = {}
+        self.caches = {}
+        self.reruns = 0
+
+    # --- Satu rerun ---
+    def begin_run(self):
+        run = RunRecord()
+        self._local.run = run
+        with self._lock:
+            self.reruns += 1
+        return run
+
+    def end_run(self):
+        run, self._local.run = self.current_run(), None
+        return run
+
+    def current_run(self):
+        return getattr(self._local, "run", None)
+
+    # --- Pencatatan ---
+    @contextmanager
+    def section(self, name):
+        """Ukur blok kode sebagai bagian ``name``."""
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            alloc = max(0, tracemalloc.get_traced_memory()[1] - start_bytes) if tracing else None
+            self.record(name, seconds, alloc)
+
+    def record(self, name, seconds, alloc_bytes=None):
+        with self._lock:
+            stats = self.sections.setdefault(name, SectionStats())
+            stats.runs += 1
+            stats.total_seconds += seconds
+            stats.last_seconds = seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.last_alloc_bytes = alloc_bytes
+        run = self.current_run()
+        if run is not None:
+            run.sections[name] = {"seconds": seconds, "alloc_bytes": alloc_bytes, "finished_at": time.time()}
+
+    def cache(self, name, hit):
+        """Catat satu akses cache ``name``."""
+        outcome = "hits" if hit else "misses"
+        with self._lock:
+            counts = self.caches.setdefault(name, {"hits": 0, "misses": 0})
+            counts[outcome] += 1
+        run = self.current_run()
+        if run is not None:
+            run.caches.setdefault(name, {"hits": 0, "misses": 0})[outcome] += 1
+
+    def cached(self, name, decorator):
+        """Seperti ``decorator`` (mis. ``st.cache_data``), tetapi setiap panggilan dicatat hit/miss.
+
+        Badan fungsi hanya dijalankan ketika cache miss, jadi penanda yang
+        dipasang di dalamnya menunjukkan apakah panggilan terakhir miss.
+        """
+        def decorate(func):
+            @functools.wraps(func)
+            def body(*args, **kwargs):
+                self._local.cache_stack[-1] = True
+                return func(*args, **kwargs)
+
+            cached_body = decorator(body)
+
+            @functools.wraps(func)
+            def call(*args, **kwargs):
+                stack = self._local.__dict__.setdefault("cache_stack", [])
+                stack.append(False)
+                try:
+                    return cached_body(*args, **kwargs)
+                finally:
+                    self.cache(name, hit=not stack.pop())
+
+            call.clear = cached_body.clear
+            return call
+
+        return decorate
+
+    # --- Ekspor ---
+    def snapshot(self):
+        with self._lock:
+            return {
+                "reruns": self.reruns,
+                "sections": {name: asdict(stats) for name, stats in self.sections.items()},
+                "caches": {name: dict(counts) for name, counts in self.caches.items()},
+            }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """Format teks eksposisi Prometheus (versi 0.0.4)."""
+        snap = self.snapshot()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        sections = snap["sections"].items()
+        caches = snap["caches"].items()
+        metric("snbp_reruns_total", "counter", "Jumlah rerun script dashboard.", [({}, snap["reruns"])])
+        metric("snbp_section_runs_total", "counter", "Jumlah eksekusi per bagian.",
+               [({"section": name}, s["runs"]) for name, s in sections])
+        metric("snbp_section_seconds_total", "counter", "Total waktu eksekusi per bagian (detik).",
+               [({"section": name}, s["total_seconds"]) for name, s in sections])
+        metric("snbp_section_last_seconds", "gauge", "Waktu eksekusi terakhir per bagian (detik).",
+               [({"section": name}, s["last_seconds"]) for name, s in sections])
+        metric("snbp_section_max_seconds", "gauge", "Waktu eksekusi terlama per bagian (detik).",
+               [({"section": name}, s["max_seconds"]) for name, s in sections])
+        metric("snbp_section_last_alloc_bytes", "gauge", "Puncak alokasi eksekusi terakhir per bagian (byte, tracemalloc).",
+               [({"section": name}, s["last_alloc_bytes"]) for name, s in sections if s["last_alloc_bytes"] is not None])
+        metric("snbp_cache_hits_total", "counter", "Jumlah cache hit.",
+               [({"cache": name}, c["hits"]) for name, c in caches])
+        metric("snbp_cache_misses_total", "counter", "Jumlah cache miss.",
+               [({"cache": name}, c["misses"]) for name, c in caches])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def serve(metrics, port, host="127.0.0.1"):
+    """Jalankan endpoint ``/metrics`` (Prometheus) dan ``/metrics.json`` di thread daemon.
+
+    Mengembalikan ``None`` (dengan peringatan di log) bila port sudah dipakai.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = metrics.to_prometheus(), "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path == "/metrics.json":
+                body, content_type = metrics.to_json(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            logger.debug(format, *args)
+
+    try:
+        server = ThreadingHTTPServer((host, port), Handler)
+    except OSError as exc:
+        logger.warning("Endpoint metrik tidak bisa dijalankan di %s:%d: %s", host, port, exc)
+        return None
+    threading.Thread(target=server.serve_forever, name="snbp-metrics", daemon=True).start()
+    logger.info("Endpoint metrik berjalan di http://%s:%d/metrics", host, server.server_address[1])
+    return server
+
+
+METRICS = Metrics()
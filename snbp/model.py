@@ -0,0 +1,191 @@
+"""Model RandomForest "Prediksi Kategori Jurusan" beserta penyimpanannya di disk.
+
+Model dan LabelEncoder disimpan dengan kunci hash isi data latih dan daftar
+fitur, sehingga pelatihan ulang hanya terjadi ketika dataset benar-benar
+berubah. scikit-learn dan joblib baru diimport saat model dilatih atau dimuat,
+jadi modul ini ringan untuk diimport di jalur cold start.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from snbp.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# --- Kolom kategorikal yang di-encode dengan LabelEncoder ---
+LABEL_COLS = ['ASAL UNIV', 'PROVINSI', 'PROSPEK KERJA', 'JALUR', 'NAMA', 'JENJANG']
+
+# --- Fitur yang digunakan (tanpa RASIO KEKETATAN) ---
+FEATURES = ['PEMINAT 2024', 'ASAL UNIV', 'PROVINSI',
+            'DAYA TAMPUNG 2025', 'PROSPEK KERJA', 'JALUR', 'NAMA', 'JENJANG']
+
+TARGET = 'KATEGORI JURUSAN'
+TARGET_MAP = {'SEPI PEMINAT': 0, 'RAMAI PEMINAT': 1}
+CLASS_NAMES = {value: key for key, value in TARGET_MAP.items()}
+
+MODEL_PARAMS = {'random_state': 42}
+
+# Jumlah file model terbaru yang disimpan di disk (termasuk model aktif)
+KEEP_MODELS = 3
+
+
+@dataclass
+class TrainedModel:
+    model: object
+    encoders: dict
+    features: list
+    key: str
+
+    def encode(self, frame):
+        """Encode semua kolom fitur sekaligus (vektorisasi, tanpa ``transform`` per nilai).
+
+        Mengembalikan ``(X, unknown)``: ``X`` matriks fitur dan ``unknown`` DataFrame
+        boolean yang menandai sel berisi kategori yang tidak dikenal saat pelatihan
+        atau angka yang kosong/tidak valid.
+        """
+        columns, unknown = {}, {}
+        for col in self.features:
+            if col in self.encoders:
+                classes = self.encoders[col].classes_
+                codes = pd.Categorical(frame[col].astype(str).str.strip(), categories=classes).codes
+                columns[col] = codes
+                unknown[col] = codes < 0
+            else:
+                values = pd.to_numeric(frame[col], errors="coerce").to_numpy(dtype="float64")
+                columns[col] = values
+                unknown[col] = np.isnan(values)
+        X = pd.DataFrame(columns, index=frame.index)[self.features]
+        return X, pd.DataFrame(unknown, index=frame.index)[self.features]
+
+    def options(self):
+        """Pilihan form tiap kolom kategorikal menurut encoder model ini (tanpa "nan", yaitu sel kosong)."""
+        return {col: encoder.classes_[encoder.classes_ != "nan"] for col, encoder in self.encoders.items()}
+
+
+def training_key(df, features=FEATURES):
+    """Hash isi data latih + daftar fitur + parameter model."""
+    digest = hashlib.sha1()
+    digest.update(json.dumps([features, TARGET, MODEL_PARAMS], sort_keys=True).encode())
+    frame = df[list(features) + [TARGET]].astype(str)
+    digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def feature_options(df):
+    """Pilihan nilai tiap kolom kategorikal, sama dengan ``classes_`` LabelEncoder hasil ``train_model``
+    tanpa sel kosong (yang di-encode sebagai "nan" saat pelatihan, tetapi bukan pilihan form).
+
+    Dipakai untuk form prediksi tanpa perlu memuat model (dan scikit-learn).
+    """
+    return {col: np.unique(df[col].dropna().astype(str).to_numpy()) for col in LABEL_COLS}
+
+
+def training_data(df, features=FEATURES):
+    """Fit LabelEncoder untuk ``LABEL_COLS`` lalu kembalikan ``(encoders, X, y)`` data latih."""
+    from sklearn.preprocessing import LabelEncoder
+
+    df_model = df[list(features)].copy()
+    label_encoders = {}
+    for col in LABEL_COLS:
+        le = LabelEncoder()
+        df_model[col] = le.fit_transform(df_model[col].astype(str))
+        label_encoders[col] = le
+
+    y = df[TARGET].astype(str).map(TARGET_MAP)
+    return label_encoders, df_model[list(features)], y
+
+
+def train_model(df, features=FEATURES, key=None, estimator=None):
+    """Encode kolom kategorikal lalu latih ``estimator`` (default RandomForest) pada seluruh data."""
+    if estimator is None:
+        from sklearn.ensemble import RandomForestClassifier
+
+        estimator = RandomForestClassifier(**MODEL_PARAMS)
+
+    label_encoders, X, y = training_data(df, features)
+    estimator.fit(X, y)
+    return TrainedModel(estimator, label_encoders, list(features), key or training_key(df, features))
+
+
+class ModelStore:
+    """Cache model di memori dan disk, dikunci dengan ``training_key``."""
+
+    def __init__(self, directory, keep=KEEP_MODELS):
+        self.directory = Path(directory)
+        self.keep = keep
+        self._current = None
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return self.directory / f"rf-{key}.joblib"
+
+    @property
+    def _latest_path(self):
+        return self.directory / "latest"
+
+    def warm(self):
+        """Muat model terakhir dari disk saat startup (tanpa melatih)."""
+        try:
+            key = self._latest_path.read_text().strip()
+        except OSError:
+            return None
+        self._current = self._load(key)
+        return self._current
+
+    def get(self, df, features=FEATURES):
+        """Model untuk ``df``: dari memori, lalu disk, dan baru dilatih bila belum ada."""
+        key = training_key(df, features)
+        with self._lock:
+            if self._current is not None and self._current.key == key:
+                METRICS.cache("model", hit=True)
+                return self._current
+            trained = self._load(key)
+            METRICS.cache("model", hit=trained is not None)
+            if trained is None:
+                logger.info("Melatih model baru untuk data %s", key)
+                trained = train_model(df, features, key)
+                self._save(trained)
+            self._current = trained
+            return trained
+
+    def _load(self, key):
+        import joblib
+
+        try:
+            return joblib.load(self._path(key))
+        except (OSError, EOFError, ValueError, ImportError, AttributeError) as exc:
+            if self._path(key).exists():
+                logger.warning("Model %s di disk tidak bisa dimuat: %s", key, exc)
+            return None
+
+    def _save(self, trained):
+        import joblib
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(trained.key)
+        tmp = path.with_suffix(".tmp")
+        joblib.dump(trained, tmp)
+        os.replace(tmp, path)
+        self._latest_path.write_text(trained.key)
+        self._prune(keep=path)
+
+    def _prune(self, keep):
+        old = sorted(
+            (p for p in self.directory.glob("rf-*.joblib") if p != keep),
+            key=lambda p: p.stat().st_mtime, reverse=True,
+        )
+        # Model yang sedang dimuat proses lain sudah ada di memori; menghapus filenya aman
+        for path in old[max(self.keep - 1, 0):]:
+            try:
+                path.unlink()
+            except OSError as exc:
+                logger.warning("Model lama %s tidak bisa dihapus: %s", path, exc)
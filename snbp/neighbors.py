@@ -0,0 +1,90 @@
+"""Indeks tetangga terdekat: program studi serupa yang persaingannya lebih longgar.
+
+Di dataset ini ``RASIO KEKETATAN = DAYA TAMPUNG 2025 / PEMINAT 2024 x 100``,
+jadi rasio yang lebih **tinggi** berarti lebih sedikit peminat per kursi (lebih
+sepi, label SEPI PEMINAT di atas ambang). "Lebih longgar" di modul ini berarti
+rasio lebih tinggi dari program acuan; rasio ``inf`` (tanpa peminat) termasuk.
+
+Jarak antar program (baris) adalah jarak Euclidean kuadrat berbobot:
+
+- ``PROSPEK KERJA``, ``JENJANG``, ``PROVINSI``: ditambah bobotnya bila berbeda;
+- ``DAYA TAMPUNG 2025`` dan ``PEMINAT 2024``: selisih ``log1p`` yang sudah
+  distandardisasi (skala kapasitas dan permintaan, bukan angka mentahnya).
+
+Indeks dibangun sekali per versi dataset: setiap kode kategori dan fitur
+numerik disimpan sebagai array 1D kontigu (float32/int32), baris diurutkan per
+``JALUR`` sehingga kandidat satu jalur adalah satu potongan bersebelahan. Satu
+kueri = lima operasi vektor atas potongan itu + ``np.argpartition``, sekitar
+satu milidetik untuk ratusan ribu baris (lihat ``bench/neighbors_latency.py``).
+"""
+
+import numpy as np
+import pandas as pd
+
+# Bobot (tambahan jarak kuadrat) bila nilai kategori berbeda
+CATEGORY_WEIGHTS = {'PROSPEK KERJA': 2.0, 'JENJANG': 1.5, 'PROVINSI': 1.0}
+
+# Kapasitas dan permintaan, dalam skala log lalu distandardisasi
+NUMERIC_COLUMNS = ('DAYA TAMPUNG 2025', 'PEMINAT 2024')
+
+DEFAULT_K = 10
+
+
+class NeighborIndex:
+    def __init__(self, df, weights=CATEGORY_WEIGHTS, numeric=NUMERIC_COLUMNS):
+        self.df = df
+        jalur_codes, jalur_values = pd.factorize(df['JALUR'], sort=True, use_na_sentinel=False)
+        # Urut per jalur (stabil): kandidat satu jalur = satu potongan bersebelahan
+        order = np.argsort(jalur_codes, kind='stable')
+        self._positions = order
+        self._where = np.empty(len(order), dtype=np.intp)
+        self._where[order] = np.arange(len(order))
+
+        starts = np.searchsorted(jalur_codes[order], np.arange(len(jalur_values)))
+        ends = np.r_[starts[1:], len(order)]
+        self._jalur_of = jalur_codes[order]
+        self._jalur_slices = [slice(start, end) for start, end in zip(starts, ends)]
+
+        # Satu array kontigu per kolom: operasi per kolom jauh lebih cepat daripada per baris matriks
+        self._codes = [
+            (np.float32(weight), pd.factorize(df[col])[0][order].astype(np.int32))
+            for col, weight in weights.items()
+        ]
+        self._numeric = []
+        for col in numeric:
+            values = np.log1p(df[col].to_numpy(dtype=float)[order])
+            std = values.std() or 1.0
+            self._numeric.append(((values - values.mean()) / std).astype(np.float32))
+
+        self._rasio = df['RASIO KEKETATAN'].to_numpy(dtype=float)[order]
+        program = pd.factorize(df['NAMA'].astype(str) + "\0" + df['ASAL UNIV'].astype(str))[0]
+        self._program = program[order]
+        self._by_name = pd.Series(np.arange(len(df))).groupby(df['NAMA'].astype(str).to_numpy()).indices
+
+    def programs(self, nama):
+        """Posisi baris (di ``df``) program dengan ``NAMA`` ini; array kosong bila tidak ada."""
+        return self._by_name.get(str(nama), np.array([], dtype=np.intp))
+
+    def alternatives(self, position, k=DEFAULT_K, same_jalur=True):
+        """``k`` program terdekat dengan rasio keketatan lebih tinggi (lebih longgar) dari baris ``position``.
+
+        Program yang sama (NAMA + ASAL UNIV, di jalur mana pun) tidak ikut.
+        Hasilnya baris ``df`` ditambah kolom ``JARAK``, dari yang paling mirip.
+        """
+        i = self._where[position]
+        part = self._jalur_slices[self._jalur_of[i]] if same_jalur else slice(0, len(self._positions))
+
+        distance = np.zeros(part.stop - part.start, dtype=np.float32)
+        for values in self._numeric:
+            distance += (values[part] - values[i]) ** 2
+        for weight, codes in self._codes:
+            distance += weight * (codes[part] != codes[i])
+        # NaN (rasio tidak diketahui) tidak pernah lolos perbandingan
+        eligible = (self._rasio[part] > self._rasio[i]) & (self._program[part] != self._program[i])
+        candidates = np.flatnonzero(eligible)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(distance[candidates], k)[:k]]
+        candidates = candidates[np.lexsort((candidates, distance[candidates]))]
+
+        rows = self._positions[part][candidates]
+        return self.df.iloc[rows].assign(JARAK=distance[candidates])
@@ -0,0 +1,52 @@
+"""Batas ukuran data diagram: agregasi di server sebelum dikirim ke browser.
+
+Diagram per-NAMA bisa memuat ratusan hingga ribuan batang. Dengan
+``rank_bins`` hanya ``top`` batang pertama yang ditampilkan satu per satu,
+sisanya dikelompokkan menurut peringkat ke paling banyak ``bins`` batang,
+sehingga jumlah batang (dan ukuran JSON figure) tetap walau data bertambah.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Batas default: jumlah batang maksimum per diagram = TOP + BINS
+TOP = 40
+BINS = 20
+
+# Anggaran ukuran JSON figure per diagram (byte), dicek oleh bench/chart_payload.py
+FIGURE_BUDGET_BYTES = 64 * 1024
+
+
+def rank_bins(table, label, value, top=TOP, bins=BINS):
+    """Ringkas ``table`` (sudah terurut) menjadi paling banyak ``top + bins`` baris.
+
+    Baris ke-1 s/d ``top`` dipertahankan. Sisanya dibagi rata menurut urutan
+    ke ``bins`` kelompok berlabel "Peringkat a–b"; nilai ``value`` kelompok adalah
+    rata-rata per jurusan sehingga bentuk distribusinya tetap terbaca.
+    Kolom tambahan ``JUMLAH JURUSAN``, ``TOTAL``, ``MIN`` dan ``MAX`` dipakai untuk hover.
+    """
+    values = table[value].to_numpy()
+    n = len(values)
+    rank = np.arange(n)
+    group = rank.copy()
+    rest = n - top
+    if rest > bins:
+        tail = rank >= top
+        group[tail] = top + (rank[tail] - top) * bins // rest
+
+    frame = pd.DataFrame({'_group': group, '_rank': rank, value: values})
+    grouped = frame.groupby('_group', sort=True)
+    summary = grouped[value].agg(['mean', 'size', 'sum', 'min', 'max'])
+    summary.columns = [value, 'JUMLAH JURUSAN', 'TOTAL', 'MIN', 'MAX']
+    first = grouped['_rank'].min().to_numpy()
+    last = grouped['_rank'].max().to_numpy()
+    labels = table[label].astype(str).to_numpy()[first]
+    is_bin = last > first
+    labels = np.where(is_bin, [f"Peringkat {a + 1}–{b + 1}" for a, b in zip(first, last)], labels)
+    summary.insert(0, label, labels)
+    return summary.reset_index(drop=True)
+
+
+def figure_bytes(fig):
+    """Ukuran JSON figure Plotly yang dikirim ke browser (byte)."""
+    return len(fig.to_json().encode("utf-8"))
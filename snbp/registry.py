@@ -0,0 +1,100 @@
+"""Registry model lokal: hasil evaluasi, artefak model, dan model yang dipromosikan.
+
+Setiap entri menyimpan nama kandidat, kunci data latih (``training_key``),
+metrik cross-validation serta latensi, dan path artefak ``TrainedModel``
+(joblib). Dashboard hanya memuat model yang dipromosikan, jadi pelatihan
+tidak pernah terjadi di jalur request. Modul ini tidak mengimport
+scikit-learn; itu baru terjadi saat artefak dimuat.
+
+Tata letak di disk::
+
+    <directory>/registry.json           entri + id model yang dipromosikan
+    <directory>/<id>.joblib             artefak TrainedModel
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class ModelRegistry:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._state = {"entries": {}, "promoted": None}
+        self._mtime = None
+        self._loaded = {}
+
+    @property
+    def _path(self):
+        return self.directory / "registry.json"
+
+    def _refresh(self):
+        """Baca ulang registry.json bila berubah (mis. setelah promosi dari proses lain)."""
+        try:
+            mtime = self._path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self._state = json.loads(self._path.read_text())
+            self._mtime = mtime
+
+    def _write(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._state, indent=2, sort_keys=True))
+        os.replace(tmp, self._path)
+        self._mtime = self._path.stat().st_mtime_ns
+
+    # --- Pembacaan ---
+    def entries(self):
+        """Semua entri, terbaru lebih dulu."""
+        with self._lock:
+            self._refresh()
+            return sorted(self._state["entries"].values(), key=lambda e: e["created_at"], reverse=True)
+
+    def promoted(self):
+        """Entri yang dipromosikan, atau ``None``."""
+        with self._lock:
+            self._refresh()
+            promoted = self._state["promoted"]
+            return self._state["entries"].get(promoted) if promoted else None
+
+    def load(self, entry_id):
+        """Muat ``TrainedModel`` sebuah entri (sekali per proses)."""
+        import joblib
+
+        with self._lock:
+            if entry_id not in self._loaded:
+                self._loaded[entry_id] = joblib.load(self.directory / f"{entry_id}.joblib")
+            return self._loaded[entry_id]
+
+    # --- Penulisan ---
+    def register(self, name, trained, metrics):
+        """Simpan artefak ``trained`` beserta ``metrics``; kembalikan entri barunya."""
+        import joblib
+
+        entry_id = f"{name}-{trained.key}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{entry_id}.joblib"
+        tmp = path.with_suffix(".tmp")
+        joblib.dump(trained, tmp)
+        os.replace(tmp, path)
+
+        entry = {"id": entry_id, "name": name, "data_key": trained.key, "created_at": time.time(), **metrics}
+        with self._lock:
+            self._refresh()
+            self._state["entries"][entry_id] = entry
+            self._loaded.pop(entry_id, None)
+            self._write()
+        return entry
+
+    def promote(self, entry_id):
+        with self._lock:
+            self._refresh()
+            if entry_id not in self._state["entries"]:
+                raise KeyError(f"Model '{entry_id}' tidak ada di registry")
+            self._state["promoted"] = entry_id
+            self._write()
@@ -0,0 +1,355 @@
+"""Isi tampilan dashboard tanpa Streamlit: diagram, teks "Insight Otomatis", dan tabel.
+
+Setiap fungsi ``*_report`` membangun satu tampilan untuk satu kombinasi filter
+dari ``AggregateCube`` dan mengembalikan ``Report`` berisi figure Plotly dan
+teks markdown dengan id yang stabil. ``app.py`` mengatur tata letaknya di
+Streamlit, sedangkan ``snbp.export`` menuliskannya sebagai HTML/JSON statis.
+
+Figure dibangun lewat ``snbp.figures.FIGURES``; bila ``version`` (versi
+dataset) diberikan, figure di-cache per (id diagram, filter, versi) dan
+dibagi semua sesi, jadi figure dalam ``Report`` tidak boleh diubah.
+"""
+
+from dataclasses import dataclass, field
+
+from snbp.figures import FIGURES
+from snbp.payload import rank_bins
+
+# Pilihan radio "Pilih Jalur:" dan filter kubus untuk masing-masing
+JALUR_OPTIONS = ["SNBP", "SNBT", "SNBP dan SNBT"]
+
+
+@dataclass
+class Report:
+    title: str
+    charts: dict = field(default_factory=dict)
+    insights: dict = field(default_factory=dict)
+    tables: dict = field(default_factory=dict)
+
+
+def jalur_filter(pilihan_jalur):
+    if pilihan_jalur == "SNBP dan SNBT":
+        return {"JALUR": ["SNBP", "SNBT"]}
+    return {"JALUR": pilihan_jalur}
+
+
+def rasio_report(cube, jalur, kategori, version=None):
+    """Top 10 rasio keketatan untuk satu pasangan JALUR x KATEGORI JURUSAN."""
+    report = Report(f"Top 10 Jurusan {kategori} - Jalur {jalur} berdasarkan Rasio Keketatan")
+
+    # --- Ambil Top 10 sesuai pilihan (RASIO KEKETATAN sudah numerik, inf untuk peminat 0) ---
+    top10_rasio = cube.rows_ranked(
+        'RASIO KEKETATAN', where={'JALUR': jalur, 'KATEGORI JURUSAN': kategori}
+    ).head(10)
+
+    # --- Visualisasi ---
+    report.charts['top10'] = FIGURES.bar(
+        "rasio.top10", top10_rasio, state=(jalur, kategori), version=version,
+        x='NAMA',
+        y='RASIO KEKETATAN',
+        text='RASIO_LABEL',
+        labels={'RASIO KEKETATAN': 'Rasio Keketatan (%)'},
+        title=report.title,
+        traces=dict(marker_color='darkblue', textposition='outside'),
+        layout=dict(xaxis_tickangle=-45, yaxis_title="Rasio Keketatan (%)"),
+    )
+
+    # --- Tabel detail ---
+    report.tables['top10'] = top10_rasio[[
+        'NAMA', 'ASAL UNIV', 'JENJANG', 'DAYA TAMPUNG 2025',
+        'PEMINAT 2024', 'RASIO KEKETATAN', 'PROSPEK KERJA'
+    ]].assign(**{
+        'PEMINAT 2024': top10_rasio['PEMINAT 2024'].map("{:,}".format),
+        'RASIO KEKETATAN': top10_rasio['RASIO_LABEL'],
+    })
+    return report
+
+
+def province_report(cube, provinsi_terpilih, version=None):
+    """Drill-down satu provinsi: jurusan dengan peminat terbanyak dan tersedikit."""
+    report = Report(f"Provinsi {provinsi_terpilih}")
+
+    # --- Jumlah Peminat per Jurusan di Provinsi Terpilih, terurut terbanyak dan tersedikit ---
+    df_terpilih_jurusan_terbanyak = cube.ranking('NAMA', 'PEMINAT 2024', where={'PROVINSI': provinsi_terpilih})
+    df_terpilih_jurusan_tersedikit = cube.ranking('NAMA', 'PEMINAT 2024', where={'PROVINSI': provinsi_terpilih}, ascending=True)
+
+    # --- Diagram Batang Jurusan dengan Peminat Terbanyak ---
+    # Jurusan di luar peringkat teratas digabung per kelompok peringkat agar jumlah batang tetap terbatas
+    report.charts['terbanyak'] = FIGURES.bar(
+        "provinsi.terbanyak", rank_bins(df_terpilih_jurusan_terbanyak, 'NAMA', 'PEMINAT 2024'),
+        state=(provinsi_terpilih,), version=version,
+        x='NAMA',
+        y='PEMINAT 2024',
+        title=f"Jurusan dengan Peminat Terbanyak di {provinsi_terpilih}",
+        labels={'PEMINAT 2024': 'Jumlah Peminat', 'NAMA': 'Nama Jurusan'},
+        hover_data={
+            'PEMINAT 2024': True,
+            'NAMA': False,
+            'JUMLAH JURUSAN': True,
+        }
+    )
+
+    # --- Diagram Batang Jurusan dengan Peminat Tersedikit ---
+    report.charts['tersedikit'] = FIGURES.bar(
+        "provinsi.tersedikit", rank_bins(df_terpilih_jurusan_tersedikit, 'NAMA', 'PEMINAT 2024'),
+        state=(provinsi_terpilih,), version=version,
+        x='NAMA',
+        y='PEMINAT 2024',
+        title=f"Jurusan dengan Peminat Paling Sedikit di {provinsi_terpilih}",
+        labels={'PEMINAT 2024': 'Jumlah Peminat', 'NAMA': 'Nama Jurusan'},
+        hover_data={
+            'PEMINAT 2024': True,
+            'NAMA': False,
+            'JUMLAH JURUSAN': True,
+        }
+    )
+
+    # --- Insight Otomatis ---
+    jurusan_terbanyak = df_terpilih_jurusan_terbanyak.iloc[0]
+    jurusan_terendah = df_terpilih_jurusan_tersedikit.iloc[0]
+    insight = [
+        f"🎯 Di provinsi {provinsi_terpilih}, jurusan dengan peminat terbanyak adalah **{jurusan_terbanyak['NAMA']}** dengan **{jurusan_terbanyak['PEMINAT 2024']} peminat**.",
+        f"🎯 Sedangkan jurusan dengan peminat paling sedikit adalah **{jurusan_terendah['NAMA']}** dengan **{jurusan_terendah['PEMINAT 2024']} peminat**.",
+    ]
+
+    # Rekomendasi
+    if jurusan_terbanyak['PEMINAT 2024'] > jurusan_terendah['PEMINAT 2024']:
+        insight.append(f"📌 **Rekomendasi:** Berdasarkan data, jurusan **{jurusan_terbanyak['NAMA']}** memiliki peminat terbanyak, yang menunjukkan bahwa jurusan ini lebih diminati. **Pihak universitas perlu mempertimbangkan peningkatan kapasitas daya tampung dan rasio keketatan** untuk jurusan ini.")
+    else:
+        insight.append(f"📌 **Rekomendasi:** Jurusan dengan peminat paling sedikit perlu mendapat perhatian khusus. Mungkin perlu adanya **upaya untuk meningkatkan daya tarik jurusan tersebut**, seperti penambahan program studi baru atau perbaikan promosi jurusan.")
+    report.insights['insight'] = insight
+    return report
+
+
+def _jalur_ringkas(report, cube, pilihan_jalur, filter_jalur, cache):
+    """Top 10 peminat 0-50 / > 50 dan top/bottom 20 peminat dan daya tampung."""
+    # --- Baris pada jalur terpilih, sudah terurut dari peminat terbanyak (dari kubus) ---
+    peminat_terurut = cube.rows_ranked('PEMINAT 2024', where=filter_jalur)
+
+    # --- Filter Jurusan dengan Peminat antara 0 - 50 ---
+    # Ambil 10 jurusan teratas berdasarkan jumlah peminat (0 - 50)
+    filtered_df_sepi_peminat_top10 = peminat_terurut[peminat_terurut['PEMINAT 2024'].between(0, 50)].head(10)
+
+    # --- Filter Jurusan dengan Peminat lebih dari 50 ---
+    # Ambil 10 jurusan teratas berdasarkan jumlah peminat (> 50)
+    filtered_df_banyak_peminat_top10 = peminat_terurut[peminat_terurut['PEMINAT 2024'] > 50].head(10)
+
+    # --- Visualisasi Diagram Batang untuk Peminat 0 - 50 ---
+    report.charts['sepi_top10'] = FIGURES.bar(
+        "jalur.sepi_top10", filtered_df_sepi_peminat_top10, **cache,
+        x='PEMINAT 2024',
+        y='NAMA',
+        orientation='h',
+        title="10 Jurusan dengan Peminat 2024 antara 0 dan 50",
+        labels={'PEMINAT 2024': 'Jumlah Peminat', 'NAMA': 'Nama Jurusan'},
+        color='PEMINAT 2024',
+        color_continuous_scale='Viridis'
+    )
+    report.tables['sepi_top10'] = filtered_df_sepi_peminat_top10[['ASAL UNIV', 'NAMA', 'JENJANG', 'PEMINAT 2024', 'DAYA TAMPUNG 2025', 'PROSPEK KERJA']]
+
+    # --- Visualisasi Diagram Batang untuk Peminat lebih dari 50 ---
+    report.charts['ramai_top10'] = FIGURES.bar(
+        "jalur.ramai_top10", filtered_df_banyak_peminat_top10, **cache,
+        x='PEMINAT 2024',
+        y='NAMA',
+        orientation='h',
+        title="10 Jurusan dengan Peminat 2024 lebih dari 50",
+        labels={'PEMINAT 2024': 'Jumlah Peminat', 'NAMA': 'Nama Jurusan'},
+        color='PEMINAT 2024',
+        color_continuous_scale='Viridis'
+    )
+    report.tables['ramai_top10'] = filtered_df_banyak_peminat_top10[['ASAL UNIV', 'NAMA', 'JENJANG', 'PEMINAT 2024', 'DAYA TAMPUNG 2025', 'PROSPEK KERJA']]
+
+    # --- Diagram Peminat (Top 20 & Bottom 20) ---
+    peminat_df = cube.ranking("NAMA", "PEMINAT 2024", where=filter_jalur)
+
+    top20_peminat = peminat_df.head(20)
+    bottom20_peminat = peminat_df[peminat_df["PEMINAT 2024"] > 0].tail(20)
+
+    # Insight otomatis Peminat
+    top_peminat = top20_peminat.sort_values("PEMINAT 2024", ascending=False).iloc[0]
+    bottom_peminat = bottom20_peminat.sort_values("PEMINAT 2024").iloc[0]
+    report.insights['top_peminat'] = f"""
+    📌 Berdasarkan diagram di atas, Pada jalur **{pilihan_jalur}**, jurusan **{top_peminat['NAMA']}** memiliki jumlah peminat tertinggi sebanyak **{top_peminat['PEMINAT 2024']}** orang. Hal ini mengindikasikan bahwa jurusan ini memiliki daya tarik tinggi, baik dari segi prospek kerja maupun popularitas kampus. Rekomendasinya adalah memperluas kapasitas daya tampung atau membuka kelas tambahan jika memungkinkan.
+    """
+    report.insights['bottom_peminat'] = f"""
+    📌 Berdasarkan diagram di atas, Pada jalur **{pilihan_jalur}**, jurusan **{bottom_peminat['NAMA']}** memiliki jumlah peminat terendah dari 20 terbawah sebanyak **{bottom_peminat['PEMINAT 2024']}** orang. Hal ini bisa jadi karena kurangnya informasi publik, prospek kerja yang belum populer, atau lokasi kampus yang kurang strategis. Rekomendasinya adalah melakukan promosi dan kolaborasi industri untuk menarik minat calon mahasiswa.
+    """
+
+    report.charts['top_peminat'] = FIGURES.bar("jalur.top_peminat", top20_peminat, **cache, x="NAMA", y="PEMINAT 2024", title="Top 20 Jurusan dengan Peminat Terbanyak", labels={"NAMA": "Jurusan"})
+    report.charts['bottom_peminat'] = FIGURES.bar("jalur.bottom_peminat", bottom20_peminat, **cache, x="NAMA", y="PEMINAT 2024", title="Bottom 20 Jurusan dengan Peminat Terendah", labels={"NAMA": "Jurusan"})
+
+    # --- Diagram Daya Tampung (Top 20 & Bottom 20) ---
+    dt_df = cube.ranking("NAMA", "DAYA TAMPUNG 2025", where=filter_jalur)
+    top20_dt = dt_df.head(20)
+    bottom20_dt = dt_df[dt_df["DAYA TAMPUNG 2025"] > 0].tail(20)
+
+    top_dt = top20_dt.iloc[0]
+    bottom_dt = bottom20_dt.iloc[0]
+    report.insights['top_dt'] = f"""
+    📌 Berdasarkan diagram di atas, Pada jalur **{pilihan_jalur}**, jurusan **{top_dt['NAMA']}** memiliki daya tampung tertinggi sebanyak **{top_dt['DAYA TAMPUNG 2025']}** kursi. Ini menunjukkan kesiapan fasilitas dan kemungkinan kebutuhan tinggi akan lulusan bidang tersebut. Rekomendasinya adalah mempertahankan kualitas pengajaran meski dengan jumlah mahasiswa besar.
+    """
+    report.insights['bottom_dt'] = f"""
+    📌 Berdasarkan diagram di atas, Pada jalur **{pilihan_jalur}**, jurusan **{bottom_dt['NAMA']}** memiliki daya tampung terendah dari 20 terbawah sebanyak **{bottom_dt['DAYA TAMPUNG 2025']}** kursi. Jurusan ini mungkin bersifat spesialis atau baru dibuka. Rekomendasi: evaluasi keterisian daya tampung dan dorong kerja sama dengan industri untuk meningkatkan daya tarik.
+    """
+
+    report.charts['top_dt'] = FIGURES.bar("jalur.top_dt", top20_dt, **cache, x="NAMA", y="DAYA TAMPUNG 2025", title="Top 20 Jurusan dengan Daya Tampung Terbanyak")
+    report.charts['bottom_dt'] = FIGURES.bar("jalur.bottom_dt", bottom20_dt, **cache, x="NAMA", y="DAYA TAMPUNG 2025", title="Bottom 20 Jurusan dengan Daya Tampung Terendah")
+
+
+def _jalur_keseluruhan(report, cube, pilihan_jalur, filter_jalur, cache):
+    """Diagram semua jurusan (peminat dan daya tampung) beserta insight-nya."""
+    # --- Diagram Peminat Keseluruhan (Terurut) ---
+    # Total peminat per jurusan, terurut dari yang terbesar ke yang terkecil (memo kubus yang sama dengan top/bottom 20)
+    total_peminat_df = cube.ranking("NAMA", "PEMINAT 2024", where=filter_jalur)
+
+    # 40 jurusan teratas tampil satu per satu, sisanya dirata-rata per kelompok peringkat (ukuran figure tetap)
+    report.charts['all_peminat'] = FIGURES.bar(
+        "jalur.all_peminat", rank_bins(total_peminat_df, "NAMA", "PEMINAT 2024"), **cache,
+        x="NAMA",
+        y="PEMINAT 2024",
+        labels={"NAMA": "Jurusan", "PEMINAT 2024": "Jumlah Peminat"},
+        hover_data={"JUMLAH JURUSAN": True, "TOTAL": True, "MIN": True, "MAX": True},
+        title=f"Jumlah Peminat Keseluruhan per Jurusan ({pilihan_jalur})",
+        layout=dict(xaxis_tickangle=-45),
+    )
+
+    # Insight otomatis peminat keseluruhan
+    total_jurusan = total_peminat_df['NAMA'].nunique()
+    avg_peminat = int(total_peminat_df["PEMINAT 2024"].mean())
+    report.insights['all_peminat'] = f"""
+    📌 Pada jalur **{pilihan_jalur}**, terdapat total **{total_jurusan}** jurusan IPS yang tersedia.  
+    🔢 Rata-rata jumlah peminat per jurusan adalah sekitar **{avg_peminat}** orang.  
+    📈 Grafik di atas menunjukkan distribusi jumlah peminat yang bervariasi, dengan beberapa jurusan jauh lebih populer dari yang lain.  
+    🔍 Rekomendasi: jurusan dengan peminat tinggi bisa menyesuaikan kapasitas, sementara jurusan dengan peminat rendah perlu meningkatkan promosi dan kerja sama eksternal.
+    """
+
+    # --- Diagram Daya Tampung Keseluruhan (Terurut) ---
+    # Total daya tampung per jurusan, terurut dari yang terbesar ke yang terkecil (memo kubus yang sama dengan top/bottom 20)
+    total_daya_df = cube.ranking("NAMA", "DAYA TAMPUNG 2025", where=filter_jalur)
+
+    report.charts['all_daya'] = FIGURES.bar(
+        "jalur.all_daya", rank_bins(total_daya_df, "NAMA", "DAYA TAMPUNG 2025"), **cache,
+        x="NAMA",
+        y="DAYA TAMPUNG 2025",
+        labels={"NAMA": "Jurusan", "DAYA TAMPUNG 2025": "Daya Tampung"},
+        hover_data={"JUMLAH JURUSAN": True, "TOTAL": True, "MIN": True, "MAX": True},
+        title=f"Daya Tampung Keseluruhan per Jurusan ({pilihan_jalur})",
+        layout=dict(xaxis_tickangle=-45),
+    )
+
+    # Insight otomatis daya tampung keseluruhan
+    avg_daya = int(total_daya_df["DAYA TAMPUNG 2025"].mean())
+    report.insights['all_daya'] = f"""
+    📌 Pada jalur **{pilihan_jalur}**, total daya tampung dari semua jurusan adalah **{int(total_daya_df['DAYA TAMPUNG 2025'].sum())}** kursi.  
+    🔢 Rata-rata daya tampung per jurusan adalah sekitar **{avg_daya}** kursi.  
+    📥 Grafik memperlihatkan variasi besar dalam daya tampung antar jurusan, yang dapat dipengaruhi oleh kapasitas fakultas, kebijakan kampus, dan kebutuhan industri.  
+    🔍 Rekomendasi: evaluasi kembali alokasi daya tampung agar lebih proporsional terhadap peminat dan kebutuhan pasar kerja.
+    """
+
+
+def _jalur_distribusi(report, cube, pilihan_jalur, filter_jalur, cache):
+    """Jenjang, perbandingan peminat vs daya tampung, prospek kerja, dan jurusan per universitas."""
+    # --- Pie Chart Jenjang ---
+    jenjang_df = cube.counts('JENJANG').reset_index()
+    jenjang_df.columns = ['Jenjang', 'Jumlah']
+    report.charts['jenjang'] = FIGURES.pie(
+        "jalur.jenjang", jenjang_df, **cache, names='Jenjang', values='Jumlah', title="Distribusi Jenjang",
+        hover_data=['Jumlah'], labels={'Jumlah': 'Jumlah'}, traces=dict(textinfo='percent+label'),
+    )
+
+    # Insight jenjang
+    report.insights['jenjang'] = f"""
+    📌 Pada jalur **{pilihan_jalur}**, Sebagian besar program studi berada pada jenjang **{jenjang_df.iloc[0]['Jenjang']}** dengan jumlah **{jenjang_df.iloc[0]['Jumlah']}** program studi. Ini menandakan dominasi program sarjana dalam ranah IPS di PTN Indonesia. Rekomendasi: dorong peningkatan jenjang pendidikan lanjutan untuk memperluas akses ke pendidikan pascasarjana.
+    """
+
+    # --- Perbandingan Peminat vs Daya Tampung (Top & Bottom 10) ---
+    kolom_compare = ["NAMA", "PEMINAT 2024", "DAYA TAMPUNG 2025"]
+    top10_compare = cube.top("NAMA", "PEMINAT 2024", 10, where=filter_jalur)[kolom_compare]
+    bottom10_compare = cube.bottom("NAMA", "PEMINAT 2024", 10, where=filter_jalur)[kolom_compare]
+
+    report.charts['top10_compare'] = FIGURES.bar("jalur.top10_compare", top10_compare.melt(id_vars="NAMA"), **cache, x="NAMA", y="value",
+                                                 color="variable", barmode="group", title="Top 10 Peminat vs Daya Tampung")
+    report.charts['bottom10_compare'] = FIGURES.bar("jalur.bottom10_compare", bottom10_compare.melt(id_vars="NAMA"), **cache, x="NAMA", y="value",
+                                                    color="variable", barmode="group", title="Bottom 10 Peminat vs Daya Tampung")
+
+    report.insights['top10_compare'] = f"""
+    📌 Pada jalur **{pilihan_jalur}**, 10 jurusan teratas memiliki jumlah peminat yang jauh melampaui daya tampung. Hal ini menunjukkan persaingan yang sangat ketat dan popularitas tinggi jurusan tersebut.  
+    🔍 Rekomendasi: pertimbangkan peningkatan daya tampung atau pembukaan kelas paralel, serta lakukan seleksi masuk yang lebih kompetitif.
+    """
+
+    report.insights['bottom10_compare'] = f"""
+    📌 Pada jalur **{pilihan_jalur}**, 10 jurusan terbawah memiliki jumlah peminat yang relatif rendah dibandingkan daya tampung yang tersedia.  
+    🔍 Rekomendasi: lakukan promosi jurusan melalui media digital dan kolaborasi industri agar lebih dikenal, serta evaluasi kurikulum agar sesuai dengan kebutuhan pasar kerja.
+    """
+
+    # --- Diagram Prospek Kerja ---
+    prospek_df = cube.counts('PROSPEK KERJA').reset_index()
+    prospek_df.columns = ['Prospek Kerja', 'Jumlah']
+    report.charts['prospek'] = FIGURES.bar("jalur.prospek", prospek_df, **cache, x='Prospek Kerja', y='Jumlah', title="Distribusi Prospek Kerja", labels={"Jumlah": "Jumlah Lulusan"})
+
+    # Insight prospek kerja
+    top_prospek = prospek_df.iloc[0]
+    report.insights['prospek'] = f"""
+    📌 Berdasarkan diagram di atas, prospek kerja sebagai **{top_prospek['Prospek Kerja']}** mendominasi dengan **{top_prospek['Jumlah']}** jurusan yang mengarah ke bidang ini. Ini menunjukkan permintaan tinggi dan kesesuaian kurikulum pendidikan dengan kebutuhan industri. Rekomendasi: dorong kolaborasi lebih lanjut antara kampus dan sektor industri ini.
+    """
+
+    # --- Diagram Jumlah Jurusan per Universitas (Top 20 & Bottom 20) ---
+    # Hitung jumlah jurusan unik per universitas
+    jurusan_per_univ = cube.distinct("ASAL UNIV", "NAMA").set_axis(["Universitas", "Jumlah Jurusan"], axis=1)
+
+    # Ambil Top 20 dan Bottom 20
+    top20_univ = jurusan_per_univ.head(20)
+    bottom20_univ = jurusan_per_univ.tail(20)
+
+    # Insight otomatis
+    top_univ = top20_univ.iloc[0]
+    bottom_univ = bottom20_univ.iloc[-1]
+    report.insights['top_univ'] = f"""
+    📌 Pada jalur **{pilihan_jalur}**, universitas **{top_univ['Universitas']}** memiliki jumlah jurusan terbanyak yaitu **{top_univ['Jumlah Jurusan']}**. Ini mencerminkan kapasitas akademik yang luas dan ragam pilihan bagi calon mahasiswa di jalur tersebut.  
+    🔍 Rekomendasi: pastikan kualitas tiap jurusan tetap terjaga melalui evaluasi berkala dan penguatan kolaborasi akademik.
+    """
+
+    report.insights['bottom_univ'] = f"""
+    📌 Pada jalur **{pilihan_jalur}**, universitas **{bottom_univ['Universitas']}** hanya memiliki **{bottom_univ['Jumlah Jurusan']}** jurusan. Hal ini bisa menunjukkan fokus pada bidang tertentu atau kapasitas institusi yang terbatas.  
+    🔍 Rekomendasi: evaluasi potensi pengembangan jurusan baru untuk memperluas akses pendidikan di jalur {pilihan_jalur.lower()}.
+    """
+
+    report.charts['top_univ'] = FIGURES.bar(
+        "jalur.top_univ", top20_univ, **cache,
+        x="Universitas",
+        y="Jumlah Jurusan",
+        title="Top 20 Universitas dengan Jumlah Jurusan Terbanyak",
+        labels={"Universitas": "Universitas", "Jumlah Jurusan": "Jumlah Jurusan"},
+        hover_data=["Universitas"]
+    )
+    report.charts['bottom_univ'] = FIGURES.bar(
+        "jalur.bottom_univ", bottom20_univ, **cache,
+        x="Universitas",
+        y="Jumlah Jurusan",
+        title="Bottom 20 Universitas dengan Jumlah Jurusan Tersedikit",
+        labels={"Universitas": "Universitas", "Jumlah Jurusan": "Jumlah Jurusan"},
+        hover_data=["Universitas"]
+    )
+
+
+# Kelompok isi jalur_report; app.py menampilkan "ringkas" langsung dan kelompok lain saat dibuka
+JALUR_GROUPS = {
+    "ringkas": _jalur_ringkas,
+    "keseluruhan": _jalur_keseluruhan,
+    "distribusi": _jalur_distribusi,
+}
+
+
+def jalur_report(cube, pilihan_jalur, version=None, groups=tuple(JALUR_GROUPS)):
+    """Semua diagram dan insight yang bergantung pada pilihan jalur.
+
+    ``groups`` membatasi kelompok yang dibangun (kunci ``JALUR_GROUPS``); kelompok lain
+    tidak dihitung sama sekali dan tidak ada di ``Report``.
+    """
+    report = Report(f"Jalur {pilihan_jalur}")
+    filter_jalur = jalur_filter(pilihan_jalur)
+    cache = dict(state=(pilihan_jalur,), version=version)
+    for group in groups:
+        JALUR_GROUPS[group](report, cube, pilihan_jalur, filter_jalur, cache)
+    return report
@@ -0,0 +1,237 @@
+"""Simulasi "bagaimana jika": ubah daya tampung dan peminat, hitung ulang rasio dan kategori.
+
+Satu ``Scenario`` adalah daftar ``Adjustment``: kalikan ``DAYA TAMPUNG 2025``
+dan/atau ``PEMINAT 2024`` untuk baris yang cocok dengan filter ``where``
+(kolom ``JALUR``, ``PROVINSI``, ``ASAL UNIV``, ``NAMA``, ``KATEGORI JURUSAN``).
+``ScenarioEngine.evaluate`` menjalankan ratusan skenario sekaligus sebagai
+matriks ``skenario x baris``:
+
+1. faktor pengali per skenario disusun dari mask filter (mask dihitung sekali
+   per filter unik, dari kode kategori int32);
+2. daya tampung dan peminat baru = ``rint(nilai dasar x faktor)``;
+3. rasio baru = ``daya tampung / peminat x 100`` untuk sel yang berubah, ``inf``
+   bila peminat 0 (sama dengan ``format_rasio``: label "∞"); sel yang tidak
+   berubah memakai rasio asli spreadsheet apa adanya;
+4. ``ScenarioResult.top`` memberi peringkat top-k rasio per skenario dengan
+   ``np.argpartition`` sepanjang sumbu baris, dan ``classify`` mengklasifikasi
+   ulang hanya kombinasi (baris, daya tampung, peminat) unik yang berubah
+   dengan satu panggilan ``predict_proba`` model yang sudah di-cache.
+
+Lihat ``bench/scenario_batch.py`` untuk perbandingan dengan perhitungan ulang
+per skenario memakai pandas.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from snbp.batch import UNKNOWN_LABEL
+from snbp.ingest import format_rasio_series
+from snbp.model import CLASS_NAMES
+
+# Kolom yang boleh dipakai sebagai filter penyesuaian
+SCENARIO_COLUMNS = ('JALUR', 'PROVINSI', 'ASAL UNIV', 'NAMA', 'KATEGORI JURUSAN')
+
+# Kode kategori untuk sel yang tidak bisa diklasifikasi (angka kosong/kategori tidak dikenal)
+UNKNOWN_CODE = -1
+
+
+def _freeze(where):
+    return tuple(sorted(
+        (col, tuple(value) if isinstance(value, (list, tuple, set)) else (value,))
+        for col, value in where.items()
+    ))
+
+
+@dataclass(frozen=True)
+class Adjustment:
+    """Pengali daya tampung (``capacity``) dan peminat (``demand``) untuk baris yang cocok dengan ``where``.
+
+    ``where`` adalah dict kolom -> nilai (atau daftar nilai); dict kosong berarti semua baris.
+    """
+    where: dict = field(default_factory=dict)
+    capacity: float = 1.0
+    demand: float = 1.0
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    adjustments: tuple = ()
+
+
+class ScenarioEngine:
+    """Array dasar satu versi dataset untuk mengevaluasi skenario secara batch."""
+
+    def __init__(self, df):
+        self.df = df
+        self._codes, self._lookup = {}, {}
+        for col in SCENARIO_COLUMNS:
+            codes, values = pd.factorize(df[col].astype(str))
+            self._codes[col] = codes.astype(np.int32)
+            self._lookup[col] = {value: code for code, value in enumerate(values)}
+
+        self.capacity = df['DAYA TAMPUNG 2025'].to_numpy(dtype=float)
+        self.rasio = df['RASIO KEKETATAN'].to_numpy(dtype=float)
+        # ``prepare`` mengisi peminat 0 dengan daya tampung, tetapi rasionya tetap inf:
+        # untuk simulasi, baris itu dikembalikan ke peminat 0 agar tetap "∞" setelah diskalakan
+        self.demand = np.where(np.isinf(self.rasio), 0.0, df['PEMINAT 2024'].to_numpy(dtype=float))
+        self._masks = {}
+
+    def mask(self, where):
+        """Mask boolean baris yang cocok dengan ``where`` (di-memo per filter)."""
+        key = _freeze(where)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = np.ones(len(self.df), dtype=bool)
+            for col, values in key:
+                if col not in self._codes:
+                    raise ValueError(f"Kolom filter skenario harus salah satu dari {SCENARIO_COLUMNS}")
+                wanted = [self._lookup[col][v] for v in map(str, values) if v in self._lookup[col]]
+                mask &= np.isin(self._codes[col], wanted)
+            self._masks[key] = mask
+        return mask
+
+    def evaluate(self, scenarios):
+        """Jalankan semua ``scenarios`` sekaligus; hasilnya ``ScenarioResult`` berbentuk skenario x baris."""
+        scenarios = list(scenarios)
+        capacity_factor = np.ones((len(scenarios), len(self.df)))
+        demand_factor = np.ones((len(scenarios), len(self.df)))
+        for i, scenario in enumerate(scenarios):
+            for adjustment in scenario.adjustments:
+                mask = self.mask(adjustment.where)
+                if adjustment.capacity != 1.0:
+                    capacity_factor[i, mask] *= adjustment.capacity
+                if adjustment.demand != 1.0:
+                    demand_factor[i, mask] *= adjustment.demand
+
+        capacity = np.rint(self.capacity * capacity_factor)
+        demand = np.rint(self.demand * demand_factor)
+        # Angka kosong (NaN) tetap NaN dan tidak dihitung sebagai perubahan
+        changed = ((capacity != self.capacity) & ~np.isnan(self.capacity)) | ((demand != self.demand) & ~np.isnan(self.demand))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            recomputed = np.where(demand > 0, capacity / demand * 100, np.inf)
+        rasio = np.where(changed, recomputed, self.rasio)
+        return ScenarioResult(self, [scenario.name for scenario in scenarios], capacity, demand, rasio, changed)
+
+
+class ScenarioResult:
+    def __init__(self, engine, names, capacity, demand, rasio, changed):
+        self.engine = engine
+        self.names = names
+        self.capacity = capacity
+        self.demand = demand
+        self.rasio = rasio
+        self.changed = changed
+        self.categories = None
+        self.baseline_categories = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def top(self, k=10, mask=None, scenarios=None):
+        """Posisi baris top-``k`` rasio per skenario (matriks skenario x k, -1 bila kurang dari k).
+
+        Urutan sama dengan ``AggregateCube.rows_ranked``: rasio menurun (inf lebih dulu),
+        NaN di akhir, seri mengikuti urutan baris. ``mask`` (baris, atau skenario x baris)
+        membatasi baris yang ikut, misalnya satu JALUR atau kategori hasil ``classify``;
+        ``scenarios`` memilih sebagian skenario (indeks ke ``names``).
+        """
+        rasio = self.rasio if scenarios is None else self.rasio[scenarios]
+        if mask is not None and np.ndim(mask) == 2 and scenarios is not None:
+            mask = mask[scenarios]
+        rasio = np.atleast_2d(rasio)
+        # Kunci urut menaik: -rasio, lalu rasio NaN; baris di luar mask NaN (tidak pernah ikut)
+        key = np.where(np.isnan(rasio), np.inf, -rasio)
+        if mask is not None:
+            key = np.where(mask, key, np.nan)
+
+        k = min(k, key.shape[1])
+        result = np.full((len(key), k), -1, dtype=np.intp)
+        if k == 0:
+            return result
+        # Nilai ke-k per skenario; semua baris yang seri dengannya ikut agar urutan seri tetap urutan baris
+        kth = np.take_along_axis(key, np.argpartition(key, k - 1, axis=1)[:, k - 1:k], axis=1)
+        candidates = (key <= kth) | (np.isnan(kth) & ~np.isnan(key))
+        for i in range(len(key)):
+            rows = np.flatnonzero(candidates[i])
+            rows = rows[np.lexsort((rows, key[i, rows]))][:k]
+            result[i, :len(rows)] = rows
+        return result
+
+    def top_frame(self, scenario, k=10, mask=None):
+        """Tabel top-``k`` satu skenario (indeks ke ``names``): baris asli + nilai simulasi.
+
+        ``mask`` di sini adalah mask baris untuk skenario itu saja.
+        """
+        rows = self.top(k, mask, scenarios=[scenario])[0]
+        rows = rows[rows >= 0]
+        frame = self.engine.df.iloc[rows].copy()
+        frame['DAYA TAMPUNG SIMULASI'] = pd.array(self.capacity[scenario, rows], dtype='Int64')
+        frame['PEMINAT SIMULASI'] = pd.array(self.demand[scenario, rows], dtype='Int64')
+        frame['RASIO SIMULASI'] = self.rasio[scenario, rows]
+        frame['RASIO_LABEL SIMULASI'] = format_rasio_series(frame['RASIO SIMULASI']).to_numpy()
+        if self.categories is not None:
+            frame['KATEGORI SIMULASI'] = self.labels(scenario)[rows]
+        return frame
+
+    def classify(self, trained):
+        """Klasifikasi ulang semua sel dengan ``trained`` (``TrainedModel``); hasil kode ``TARGET_MAP``.
+
+        Sel yang tidak berubah memakai prediksi data asli (satu ``predict_proba`` atas
+        semua baris); sel yang berubah dikelompokkan menjadi kombinasi unik
+        (baris, daya tampung, peminat) sehingga skenario yang tumpang tindih tidak
+        memprediksi ulang hal yang sama.
+        """
+        df = self.engine.df
+        X, unknown_cells = trained.encode(df)
+        invalid = unknown_cells.to_numpy().any(axis=1)
+        features = X.to_numpy(dtype=float)
+        capacity_col = trained.features.index('DAYA TAMPUNG 2025')
+        demand_col = trained.features.index('PEMINAT 2024')
+        classes = np.asarray(trained.model.classes_)
+
+        base = np.full(len(df), UNKNOWN_CODE, dtype=np.int8)
+        if (~invalid).any():
+            base[~invalid] = classes[trained.model.predict_proba(X[~invalid]).argmax(axis=1)]
+        categories = np.broadcast_to(base, self.rasio.shape).copy()
+
+        scenario_idx, row_idx = np.nonzero(self.changed & ~invalid)
+        if len(row_idx):
+            # Peminat di data asli (bukan 0 simulasi) yang dilihat model saat dilatih: prepare mengisi 0 dengan daya tampung
+            demand = self.demand[scenario_idx, row_idx]
+            demand = np.where(demand == 0, self.capacity[scenario_idx, row_idx], demand)
+            cells = np.column_stack([row_idx, self.capacity[scenario_idx, row_idx], demand])
+            unique, inverse = np.unique(cells, axis=0, return_inverse=True)
+            batch = features[unique[:, 0].astype(np.intp)]
+            batch[:, capacity_col] = unique[:, 1]
+            batch[:, demand_col] = unique[:, 2]
+            batch = pd.DataFrame(batch, columns=X.columns).astype(X.dtypes.to_dict())
+            predicted = classes[trained.model.predict_proba(batch).argmax(axis=1)]
+            categories[scenario_idx, row_idx] = predicted[inverse.ravel()]
+
+        self.baseline_categories = base
+        self.categories = categories
+        return categories
+
+    def labels(self, scenario):
+        """Nama kategori hasil ``classify`` untuk satu skenario (array object)."""
+        names = np.array([UNKNOWN_LABEL] + [CLASS_NAMES[code] for code in range(len(CLASS_NAMES))], dtype=object)
+        return names[self.categories[scenario] + 1]
+
+    def summary(self):
+        """Ringkasan per skenario: total daya tampung/peminat, program berubah, rasio median, cacah kategori."""
+        finite = np.where(np.isfinite(self.rasio), self.rasio, np.nan)
+        table = pd.DataFrame({
+            'SKENARIO': self.names,
+            'DAYA TAMPUNG SIMULASI': np.nansum(self.capacity, axis=1).astype(int),
+            'PEMINAT SIMULASI': np.nansum(self.demand, axis=1).astype(int),
+            'PROGRAM BERUBAH': self.changed.sum(axis=1),
+            'MEDIAN RASIO': np.nanmedian(finite, axis=1),
+        })
+        if self.categories is not None:
+            for code, name in CLASS_NAMES.items():
+                table[name] = (self.categories == code).sum(axis=1)
+            table['PINDAH KATEGORI'] = (self.categories != self.baseline_categories).sum(axis=1)
+        return table
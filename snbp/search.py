@@ -0,0 +1,139 @@
+"""Pencarian fuzzy nama jurusan, universitas, dan prospek kerja dengan indeks n-gram.
+
+Setiap nilai unik ``NAMA``, ``ASAL UNIV``, dan ``PROSPEK KERJA`` menjadi satu
+dokumen. Teks dinormalisasi (huruf kecil, tanpa aksen dan tanda baca) lalu
+dipecah menjadi trigram karakter, termasuk batas kata, dan disimpan di indeks
+terbalik ``trigram -> array id dokumen``. Pencarian:
+
+1. trigram kueri -> gabungan posting list -> ``np.bincount`` = trigram yang sama;
+2. skor = campuran bagian trigram kueri yang ditemukan (``sama / trigram
+   kueri``, agar kueri pendek seperti "hukm" tetap menemukan "Ilmu Hukum") dan
+   koefisien Dice (``2 * sama / (trigram kueri + trigram dokumen)``, agar nilai
+   yang panjangnya mirip kueri lebih tinggi); salah ketik satu-dua huruf tetap cocok;
+3. ``RERANK`` kandidat teratas diberi bonus bila kueri adalah awalan nilai,
+   awalan salah satu kata, atau substring; seri diurutkan menurut jumlah baris.
+
+Indeks dibangun sekali per versi dataset; satu pencarian di bawah satu
+milidetik untuk katalog ribuan nilai (lihat ``bench/search_latency.py``).
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+
+import numpy as np
+
+SEARCH_FIELDS = ('NAMA', 'ASAL UNIV', 'PROSPEK KERJA')
+
+# Jumlah hasil/pilihan default untuk satu pencarian
+DEFAULT_LIMIT = 20
+
+# Kandidat teratas (menurut skor n-gram) yang diperiksa ulang dengan bonus awalan/substring
+RERANK = 50
+
+# Bobot bagian trigram kueri yang ditemukan; sisanya bobot koefisien Dice
+COVERAGE_WEIGHT = 0.7
+
+# Skor minimum (n-gram + bonus) agar sebuah nilai dianggap cocok
+MIN_SCORE = 0.4
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text):
+    """Huruf kecil tanpa aksen; selain huruf dan angka menjadi satu spasi."""
+    text = unicodedata.normalize("NFKD", str(text))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+def trigrams(normalized):
+    padded = f" {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _bonus(query, text):
+    if text.startswith(query):
+        return 1.0
+    if f" {query}" in f" {text}":
+        return 0.5
+    if query in text:
+        return 0.25
+    return 0.0
+
+
+@dataclass(frozen=True)
+class Match:
+    value: str
+    field: str
+    score: float
+
+
+class SearchIndex:
+    def __init__(self, df, fields=SEARCH_FIELDS):
+        self.fields = tuple(fields)
+        values, field_codes, counts = [], [], []
+        self._ranges = {}
+        for code, col in enumerate(self.fields):
+            # Urut dari yang paling sering muncul: urutan ``popular`` dan pemutus seri
+            frequency = df[col].dropna().astype(str).value_counts()
+            self._ranges[col] = (len(values), len(values) + len(frequency))
+            values.extend(frequency.index)
+            field_codes.extend([code] * len(frequency))
+            counts.extend(frequency.to_numpy())
+
+        self.values = values
+        self._field = np.array(field_codes, dtype=np.int8)
+        self._counts = np.array(counts)
+        self._normalized = [normalize(value) for value in values]
+
+        postings = defaultdict(list)
+        self._sizes = np.empty(len(values))
+        for doc, text in enumerate(self._normalized):
+            grams = trigrams(text)
+            self._sizes[doc] = len(grams)
+            for gram in grams:
+                postings[gram].append(doc)
+        self._postings = {gram: np.array(docs, dtype=np.int32) for gram, docs in postings.items()}
+
+    def __len__(self):
+        return len(self.values)
+
+    def search(self, query, field=None, limit=DEFAULT_LIMIT):
+        """``Match`` terbaik untuk ``query`` (opsional hanya di kolom ``field``), skor menurun."""
+        text = normalize(query)
+        if not text:
+            return []
+        grams = trigrams(text)
+        lists = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not lists:
+            return []
+
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.values))
+        score = COVERAGE_WEIGHT * shared / len(grams) + (1 - COVERAGE_WEIGHT) * 2 * shared / (len(grams) + self._sizes)
+        if field is not None:
+            start, end = self._ranges[field]
+            score[:start] = 0
+            score[end:] = 0
+
+        candidates = np.flatnonzero(score)
+        if len(candidates) > RERANK:
+            candidates = candidates[np.argpartition(-score[candidates], RERANK)[:RERANK]]
+        ranked = sorted(
+            ((score[doc] + _bonus(text, self._normalized[doc]), doc) for doc in candidates),
+            key=lambda item: (-item[0], -self._counts[item[1]], item[1]),
+        )
+        return [
+            Match(self.values[doc], self.fields[self._field[doc]], float(total))
+            for total, doc in ranked[:limit] if total >= MIN_SCORE
+        ]
+
+    def values_for(self, query, field, limit=DEFAULT_LIMIT):
+        """Hanya nilai hasil ``search`` di kolom ``field``, untuk pilihan selectbox."""
+        return [match.value for match in self.search(query, field, limit)]
+
+    def popular(self, field, limit=DEFAULT_LIMIT):
+        """``limit`` nilai ``field`` yang paling sering muncul (pilihan saat kueri kosong)."""
+        start, end = self._ranges[field]
+        return self.values[start:min(end, start + limit)]
@@ -0,0 +1,149 @@
+"""Dataset bersama: satu snapshot Arrow (Feather v2) read-only yang di-memory-map.
+
+Hasil ``snbp.ingest.prepare`` dipadatkan (teks berulang menjadi category, angka
+bulat ke tipe integer terkecil) lalu ditulis sekali per versi data sebagai file
+Feather tanpa kompresi dan dalam satu chunk. Setiap proses server membukanya
+dengan ``pyarrow.memory_map`` dan membangun DataFrame yang kolomnya langsung
+menunjuk ke halaman file tersebut:
+
+- kolom numerik dan kode category: array NumPy read-only di atas mmap;
+- teks unik (mis. KODE): ``pd.ArrowDtype(pa.string())`` di atas mmap;
+- hanya kamus category (nilai uniknya) yang disalin ke memori proses.
+
+Halaman file berada di page cache OS, jadi dibagi oleh semua sesi dalam satu
+proses dan oleh semua proses yang membuka versi yang sama. Karena kolomnya
+read-only, pemakai harus bekerja dengan view atau salinan kecil (dashboard
+menyalakan copy-on-write pandas).
+
+Tata letak di disk::
+
+    <directory>/<versi>-<format>.feather
+
+``<format>`` (``SNAPSHOT_KEY``) adalah hash skema ingest dan aturan pemadatan,
+jadi perubahan ``prepare``/``compact`` tidak memakai snapshot lama.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from snbp.ingest import REQUIRED_COLUMNS, SCHEMA
+
+logger = logging.getLogger(__name__)
+
+# Kolom teks dengan rasio nilai unik sampai batas ini disimpan sebagai category
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Jumlah versi snapshot yang disimpan di disk (proses lain mungkin masih memakai versi lama)
+KEEP_VERSIONS = 2
+
+# Naikkan bila isi snapshot berubah tanpa perubahan SCHEMA (mis. kolom turunan baru di prepare,
+# cara parsing, atau tata letak Arrow di _to_arrow)
+SNAPSHOT_FORMAT = 1
+
+
+def _snapshot_key():
+    spec = [SNAPSHOT_FORMAT, SCHEMA, REQUIRED_COLUMNS, CATEGORY_MAX_UNIQUE_RATIO]
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:8]
+
+
+SNAPSHOT_KEY = _snapshot_key()
+
+
+def compact(df):
+    """Teks berulang -> category, angka bulat -> tipe integer terkecil; float dibiarkan."""
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_integer_dtype(values.dtype):
+            values = pd.to_numeric(values, downcast="integer")
+        elif values.dtype == object and values.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(values):
+            values = values.astype("category")
+        columns[col] = values
+    return pd.DataFrame(columns)
+
+
+def _to_arrow(df):
+    arrays = []
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = values.cat.codes.to_numpy()
+            dictionary = pa.array(values.cat.categories.astype(str).to_numpy(), type=pa.string())
+            arrays.append(pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0), dictionary))
+        elif values.dtype == object:
+            arrays.append(pa.array(values.to_numpy(), type=pa.string(), from_pandas=True))
+        else:
+            # NaN tetap NaN (bukan null) agar kolom float bisa dibaca tanpa salinan
+            arrays.append(pa.array(values.to_numpy()))
+    return pa.Table.from_arrays(arrays, names=[str(col) for col in df.columns])
+
+
+def _column(array):
+    if pa.types.is_dictionary(array.type):
+        indices = array.indices
+        codes = indices.fill_null(-1).to_numpy() if indices.null_count else indices.to_numpy(zero_copy_only=True)
+        return pd.Categorical.from_codes(codes, categories=array.dictionary.to_pandas(), validate=False)
+    if pa.types.is_string(array.type):
+        return pd.array(array, dtype=pd.ArrowDtype(array.type))
+    return array.to_numpy(zero_copy_only=False)
+
+
+def write_snapshot(df, path):
+    """Tulis ``df`` (sudah dipadatkan) sebagai Feather satu chunk tanpa kompresi, secara atomik."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Nama sementara per proses: beberapa server bisa menulis versi yang sama bersamaan
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    feather.write_feather(_to_arrow(df), tmp, compression="uncompressed", chunksize=max(len(df), 1))
+    os.replace(tmp, path)
+
+
+def open_snapshot(path):
+    """DataFrame read-only di atas memory map ``path``."""
+    table = pa.ipc.open_file(pa.memory_map(str(path))).read_all().combine_chunks()
+    return pd.DataFrame({name: _column(table.column(name).chunk(0)) for name in table.column_names}, copy=False)
+
+
+class SharedDataset:
+    """Snapshot dataset per versi: dibuat sekali (oleh proses mana pun), lalu hanya dibuka."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._current = None
+        self._lock = threading.Lock()
+
+    def path(self, version):
+        return self.directory / f"{version}-{SNAPSHOT_KEY}.feather"
+
+    def get(self, version, build):
+        """DataFrame bersama untuk ``version``; ``build()`` hanya dipanggil bila file belum ada."""
+        with self._lock:
+            if self._current is not None and self._current[0] == version:
+                return self._current[1]
+            path = self.path(version)
+            if not path.exists():
+                write_snapshot(compact(build()), path)
+                self._prune(keep=path)
+            df = open_snapshot(path)
+            self._current = (version, df)
+            return df
+
+    def _prune(self, keep):
+        old = sorted(
+            (p for p in self.directory.glob("*.feather") if p != keep),
+            key=lambda p: p.stat().st_mtime, reverse=True,
+        )
+        # Menghapus file yang masih di-mmap proses lain aman di POSIX; halamannya tetap valid
+        for path in old[KEEP_VERSIONS - 1:]:
+            try:
+                path.unlink()
+            except OSError as exc:
+                logger.warning("Snapshot lama %s tidak bisa dihapus: %s", path, exc)
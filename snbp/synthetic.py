@@ -0,0 +1,119 @@
+"""Dataset SNBP sintetis dengan skema 13 kolom yang sama seperti spreadsheet.
+
+Dipakai benchmark untuk melihat perilaku dashboard ketika jumlah baris naik
+(lebih banyak PTN, program studi, dan tahun). Keluaran ``generate`` berformat
+seperti CSV mentah dari spreadsheet (rasio berkoma, "inf" untuk peminat 0),
+sehingga melewati jalur ``snbp.ingest`` yang sama dengan data asli.
+"""
+
+import numpy as np
+import pandas as pd
+
+PROVINCES = [
+    "Aceh", "Sumatera Utara", "Sumatera Barat", "Riau", "Kepulauan Riau", "Jambi",
+    "Sumatera Selatan", "Kepulauan Bangka Belitung", "Bengkulu", "Lampung",
+    "DKI Jakarta", "Jawa Barat", "Banten", "Jawa Tengah", "DI Yogyakarta", "Jawa Timur",
+    "Bali", "Nusa Tenggara Barat", "Nusa Tenggara Timur", "Kalimantan Barat",
+    "Kalimantan Tengah", "Kalimantan Selatan", "Kalimantan Timur", "Kalimantan Utara",
+    "Sulawesi Utara", "Gorontalo", "Sulawesi Tengah", "Sulawesi Barat",
+    "Sulawesi Selatan", "Sulawesi Tenggara", "Maluku", "Maluku Utara", "Papua",
+    "Papua Barat", "Papua Barat Daya", "Papua Tengah", "Papua Pegunungan", "Papua Selatan",
+]
+
+# Pulau Jawa dan Sumatera memiliki lebih banyak PTN
+_PROVINCE_WEIGHTS = np.array([
+    2, 4, 3, 2, 1, 2, 3, 1, 1, 2,
+    6, 8, 3, 7, 5, 8,
+    3, 2, 2, 2, 1, 2, 2, 1,
+    2, 1, 1, 1, 4, 2, 1, 1, 1,
+    1, 1, 1, 1, 1,
+], dtype=float)
+
+PROGRAMS = [
+    ("Manajemen", "Manajer, Wirausaha"), ("Akuntansi", "Akuntan, Auditor"),
+    ("Ilmu Ekonomi", "Ekonom, Analis Kebijakan"), ("Ilmu Hukum", "Advokat, Notaris"),
+    ("Ilmu Komunikasi", "Jurnalis, Humas"), ("Hubungan Internasional", "Diplomat, Analis Politik"),
+    ("Administrasi Publik", "ASN, Analis Kebijakan"), ("Administrasi Bisnis", "Manajer, Konsultan Bisnis"),
+    ("Psikologi", "Psikolog, HRD"), ("Sosiologi", "Peneliti Sosial, Konsultan CSR"),
+    ("Ilmu Politik", "Analis Politik, Legislatif"), ("Pendidikan Ekonomi", "Guru, Pengajar"),
+    ("Pendidikan Sejarah", "Guru, Peneliti Sejarah"), ("Pendidikan Geografi", "Guru, Perencana Wilayah"),
+    ("Geografi", "Perencana Wilayah, Analis GIS"), ("Sejarah", "Sejarawan, Kurator"),
+    ("Antropologi", "Peneliti Sosial, Kurator"), ("Sastra Indonesia", "Editor, Penulis"),
+    ("Sastra Inggris", "Penerjemah, Editor"), ("Ilmu Perpustakaan", "Pustakawan, Arsiparis"),
+    ("Pariwisata", "Perencana Wisata, Perhotelan"), ("Kesejahteraan Sosial", "Pekerja Sosial, Konsultan CSR"),
+    ("Ekonomi Pembangunan", "Ekonom, Perencana Pembangunan"), ("Ekonomi Syariah", "Bankir Syariah, Analis Keuangan"),
+    ("Bisnis Digital", "Digital Marketer, Wirausaha"), ("Perpajakan", "Konsultan Pajak, ASN"),
+    ("Pendidikan Pancasila dan Kewarganegaraan", "Guru, Penyuluh"), ("Kriminologi", "Analis Kriminal, Penyidik"),
+]
+
+_CONCENTRATIONS = ["Terapan", "Bisnis", "Digital", "Internasional", "Publik", "Syariah", "Pembangunan", "Kewirausahaan"]
+
+_JENJANG = (["Sarjana", "Sarjana Terapan", "Diploma 3", "Diploma 4"], [0.72, 0.1, 0.12, 0.06])
+_JALUR = (["SNBP", "SNBT"], [0.5, 0.5])
+_PORTOFOLIO = (["-", "Seni Pertunjukan", "Seni Rupa"], [0.94, 0.03, 0.03])
+
+# Rasio keketatan (daya tampung / peminat x 100) di atas batas ini dilabeli SEPI PEMINAT
+SEPI_THRESHOLD = 50.0
+
+
+def _program_names(count):
+    """``count`` nama program studi: nama dasar, lalu variasi konsentrasi, lalu bernomor."""
+    names = []
+    for i in range(count):
+        base, cycle = PROGRAMS[i % len(PROGRAMS)][0], i // len(PROGRAMS)
+        if cycle == 0:
+            names.append(base)
+        elif cycle <= len(_CONCENTRATIONS):
+            names.append(f"{base} {_CONCENTRATIONS[cycle - 1]}")
+        else:
+            names.append(f"{base} {cycle - len(_CONCENTRATIONS) + 1}")
+    return np.array(names, dtype=object)
+
+
+def _choice(rng, options, rows):
+    values, weights = options
+    return np.array(values, dtype=object)[rng.choice(len(values), size=rows, p=weights)]
+
+
+def generate(rows, seed=0, zero_demand=0.01):
+    """Buat ``rows`` baris sintetis dengan 13 kolom spreadsheet SNBP.
+
+    Kardinalitas ikut tumbuh bersama ``rows``: jumlah PTN sekitar ``rows / 18``
+    dan jumlah nama program sekitar ``6 * sqrt(rows)`` (sebanding dengan data asli
+    2.298 baris). ``zero_demand`` adalah porsi baris dengan PEMINAT 2024 = 0.
+    """
+    rng = np.random.default_rng(seed)
+
+    n_univ = max(20, rows // 18)
+    univ_names = np.array([f"Universitas Negeri {i + 1:04d}" for i in range(n_univ)], dtype=object)
+    univ_province = rng.choice(len(PROVINCES), size=n_univ, p=_PROVINCE_WEIGHTS / _PROVINCE_WEIGHTS.sum())
+    univ = rng.integers(n_univ, size=rows)
+
+    n_program = max(len(PROGRAMS), int(6 * np.sqrt(rows)))
+    program = rng.integers(n_program, size=rows)
+    prospek = np.array([job for _, job in PROGRAMS], dtype=object)
+
+    daya_tampung = np.clip(rng.lognormal(np.log(60), 0.6, size=rows), 5, 600).astype(np.int64)
+    peminat = np.round(daya_tampung * rng.lognormal(np.log(5), 1.0, size=rows)).astype(np.int64)
+    peminat[rng.random(rows) < zero_demand] = 0
+
+    with np.errstate(divide="ignore"):
+        rasio = daya_tampung / peminat * 100
+    rasio_text = pd.Series(rasio).map("{:.2f}".format).str.replace(".", ",", regex=False)
+    rasio_text[np.isinf(rasio)] = "inf"
+
+    return pd.DataFrame({
+        "NO": np.arange(1, rows + 1),
+        "KODE": rng.integers(1_000_000, 10_000_000, size=rows).astype(str),
+        "NAMA": _program_names(n_program)[program],
+        "JENJANG": _choice(rng, _JENJANG, rows),
+        "DAYA TAMPUNG 2025": daya_tampung,
+        "PEMINAT 2024": peminat,
+        "JENIS PORTOFOLIO": _choice(rng, _PORTOFOLIO, rows),
+        "JALUR": _choice(rng, _JALUR, rows),
+        "ASAL UNIV": univ_names[univ],
+        "PROSPEK KERJA": prospek[program % len(PROGRAMS)],
+        "PROVINSI": np.array(PROVINCES, dtype=object)[univ_province[univ]],
+        "RASIO KEKETATAN": rasio_text,
+        "KATEGORI JURUSAN": np.where(rasio >= SEPI_THRESHOLD, "SEPI PEMINAT", "RAMAI PEMINAT"),
+    })
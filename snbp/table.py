@@ -0,0 +1,46 @@
+"""Paging, pengurutan, dan proyeksi kolom tabel di sisi server.
+
+Hanya baris pada halaman yang diminta (dan kolom yang dipilih) yang
+disalin dari dataset di memori, sehingga biaya serialisasi per sesi tetap
+walau jumlah baris terus bertambah.
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+PAGE_SIZE = 20
+
+
+@dataclass
+class Page:
+    rows: pd.DataFrame
+    page: int
+    pages: int
+    total: int
+    start: int
+
+
+def paginate(frame, page=1, page_size=PAGE_SIZE, sort_by=None, ascending=True, columns=None, rows=None):
+    """Ambil satu halaman dari ``frame``.
+
+    ``rows`` adalah posisi baris (hasil filter) yang ingin ditampilkan; bila
+    ``None`` seluruh ``frame`` dipakai. Filter tidak perlu disalin menjadi
+    DataFrame baru: yang disalin hanya potongan halaman dengan ``columns``.
+    """
+    positions = np.arange(len(frame)) if rows is None else np.asarray(rows, dtype=np.intp)
+    total = len(positions)
+    pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, int(page)), pages)
+
+    if sort_by is not None:
+        keys = pd.Series(frame[sort_by].to_numpy()[positions])
+        order = keys.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+        positions = positions[order]
+
+    start = (page - 1) * page_size
+    selected = positions[start:start + page_size]
+    columns = list(frame.columns) if columns is None else list(columns)
+    return Page(frame.iloc[selected, frame.columns.get_indexer(columns)], page, pages, total, start)
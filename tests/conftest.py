@@ -0,0 +1,34 @@
+"""Fixture bersama: sheet sintetis kecil (``snbp.synthetic``) dan struktur turunannya."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from snbp.cube import AggregateCube  # noqa: E402
+from snbp.ingest import read_dataset  # noqa: E402
+from snbp.synthetic import generate  # noqa: E402
+
+ROWS = 600
+
+
+@pytest.fixture(scope="session")
+def raw_sheet():
+    return generate(ROWS, seed=3)
+
+
+@pytest.fixture(scope="session")
+def sheet_bytes(raw_sheet):
+    return raw_sheet.to_csv(index=False).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def df(sheet_bytes):
+    return read_dataset(sheet_bytes)
+
+
+@pytest.fixture(scope="session")
+def cube(df):
+    return AggregateCube(df)
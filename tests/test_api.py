@@ -0,0 +1,80 @@
+"""``snbp.api``: model baru dipasang tanpa restart, lewat ``ModelSource``."""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from snbp.api import MicroBatcher, ModelSource, make_server, predict_batch
+from snbp.model import FEATURES, train_model
+
+
+class Models:
+    """``load``/``version`` palsu: versi dan model yang dimuat diatur dari test."""
+
+    def __init__(self, models):
+        self.models = models
+        self.version = 0
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        if self.version not in self.models:
+            raise OSError("registry tidak bisa dibaca")
+        return self.models[self.version]
+
+
+@pytest.fixture(scope="module")
+def models(df):
+    return {i: (f"rf-{i}", train_model(df.iloc[:300 + 100 * i])) for i in range(2)}
+
+
+def test_reload_only_when_version_changes(models):
+    fake = Models(models)
+    source = ModelSource(fake.load, lambda: fake.version, interval=3600)
+    assert source.get()[0] == "rf-0"
+    assert not source.reload()
+    assert fake.loads == 1
+
+    fake.version = 1
+    assert source.reload()
+    assert source.get()[0] == "rf-1"
+    assert fake.loads == 2
+
+
+def test_failed_reload_keeps_current_model(models):
+    fake = Models(models)
+    source = ModelSource(fake.load, lambda: fake.version, interval=3600)
+    fake.version = "rusak"
+    assert not source.reload()
+    assert source.get()[0] == "rf-0"
+    # Versi yang gagal dimuat dicoba lagi pada pemeriksaan berikutnya
+    fake.models["rusak"] = models[1]
+    assert source.reload()
+    assert source.get()[0] == "rf-1"
+
+
+def test_server_answers_with_swapped_model(df, models):
+    fake = Models(models)
+    source = ModelSource(fake.load, lambda: fake.version, interval=3600)
+    batcher = MicroBatcher(lambda frame: predict_batch(source, frame))
+    server = make_server(source, batcher, 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    body = json.dumps({"rows": json.loads(df[FEATURES].head(3).to_json(orient="records"))})
+
+    def predict():
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+        connection.request("POST", "/predict", body, {"Content-Type": "application/json"})
+        return json.loads(connection.getresponse().read())
+
+    try:
+        first = predict()
+        assert first["model"] == "rf-0"
+        assert len(first["predictions"]) == 3
+        fake.version = 1
+        source.reload()
+        assert predict()["model"] == "rf-1"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,118 @@
+"""``app.py`` lewat ``streamlit.testing``: dashboard dijalankan utuh di atas sheet sintetis."""
+
+import io
+import json
+import socket
+import urllib.request
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import streamlit as st
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from streamlit.testing.v1 import AppTest
+
+import snbp.config
+
+APP = str(Path(__file__).resolve().parent.parent / "app.py")
+
+
+@pytest.fixture(scope="module")
+def config(tmp_path_factory, sheet_bytes):
+    folder = tmp_path_factory.mktemp("app")
+    (folder / "sheet.csv").write_bytes(sheet_bytes)
+    with pytest.MonkeyPatch.context() as patch:
+        for name, value in {
+            "SPREADSHEET_URL": (folder / "sheet.csv").as_uri(),
+            "CACHE_DIR": folder / "cache",
+            "HISTORY_DIR": folder / "history",
+            "MODEL_DIR": folder / "models",
+            "REGISTRY_DIR": folder / "registry",
+            "EXPORT_PORT": 0,
+            "METRICS_PORT": 0,
+        }.items():
+            patch.setattr(snbp.config, name, value)
+        # Cache resource dipakai bersama semua AppTest di proses ini
+        st.cache_resource.clear()
+        yield folder
+        st.cache_resource.clear()
+
+
+def run(**query):
+    at = AppTest.from_file(APP, default_timeout=300)
+    for key, value in query.items():
+        at.query_params[key] = value
+    at.run()
+    assert not at.exception, [e.value for e in at.exception]
+    return at
+
+
+def klik_peta(at, point_index):
+    """Rerun dengan event seleksi plotly di peta provinsi, seperti klik di browser.
+
+    ``AppTest`` belum punya API untuk event chart, jadi state widget chart ditambahkan sendiri.
+    """
+    chart = next(e for e in at.get("plotly_chart") if e.proto.id.endswith("peta_provinsi"))
+    selection = {"points": [{"point_index": point_index}], "point_indices": [point_index], "box": [], "lasso": []}
+    states = at._tree.get_widget_states()
+    states.widgets.append(WidgetState(id=chart.proto.id, string_value=json.dumps({"selection": selection})))
+    return at._run(states)
+
+
+def test_map_click_opens_province_drill_down(config):
+    at = run()
+    chart = next(e for e in at.get("plotly_chart") if e.proto.id.endswith("peta_provinsi"))
+    provinsi = json.loads(chart.proto.spec)["data"][0]["hovertext"]
+    assert not at.session_state["buka_bagian_provinsi_terpilih"]
+
+    klik_peta(at, 3)
+    assert not at.exception, [e.value for e in at.exception]
+    assert at.session_state["buka_bagian_provinsi_terpilih"]
+    assert at.selectbox(key="provinsi_terpilih").value == provinsi[3]
+    assert f"📊 Jurusan dengan Peminat Terbanyak di {provinsi[3]}" in [h.value for h in at.subheader]
+
+    # Pilihan manual tidak ditimpa seleksi lama yang masih aktif di chart
+    at.selectbox(key="provinsi_terpilih").set_value(provinsi[5])
+    klik_peta(at, 3)
+    assert at.selectbox(key="provinsi_terpilih").value == provinsi[5]
+    # Klik provinsi lain kembali mengganti pilihan
+    klik_peta(at, 7)
+    assert at.selectbox(key="provinsi_terpilih").value == provinsi[7]
+
+
+def test_download_without_export_port_builds_file_in_session(config, df):
+    at = run()
+    assert not at.get("link_button")
+    # Filter lain di halaman menjadi nilai awal; di sini hanya jalur yang dipakai
+    at.multiselect(key="kategori_unduh").set_value([])
+    at.multiselect(key="provinsi_unduh").set_value([])
+    at.multiselect(key="jalur_unduh").set_value(["SNBP"]).run()
+    assert not at.get("download_button")
+    at.button(key="siapkan_unduh").click().run()
+    assert not at.exception
+
+    nama, mime, data = at.session_state["file_unduh"][1:]
+    assert nama == "snbp-baris.csv" and mime.startswith("text/csv")
+    assert len(pd.read_csv(io.BytesIO(data))) == int((df['JALUR'] == 'SNBP').sum())
+    assert len(at.get("download_button")) == 1
+
+    # Filter berubah: file lama tidak ditawarkan lagi
+    at.radio(key="format_unduh").set_value("parquet").run()
+    assert not at.get("download_button")
+
+
+def test_export_port_links_to_streaming_endpoint(config, monkeypatch):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    monkeypatch.setattr(snbp.config, "EXPORT_PORT", port)
+    monkeypatch.setattr(snbp.config, "EXPORT_HOST", "127.0.0.1")
+    st.cache_resource.clear()
+    at = run()
+    # Tanpa SNBP_EXPORT_URL alamatnya mengikuti host yang dipakai browser (AppTest: tanpa header)
+    url = at.get("link_button")[0].proto.url
+    assert url.startswith(f"http://127.0.0.1:{port}/export?sumber=baris&format=csv")
+    with urllib.request.urlopen(url, timeout=10) as response:
+        assert response.headers["Transfer-Encoding"] == "chunked"
+        assert len(pd.read_csv(io.BytesIO(response.read()))) > 0
+    assert not at.get("download_button")
@@ -0,0 +1,62 @@
+"""Rollup, peringkat, dan filter ``AggregateCube`` dibandingkan dengan groupby langsung atas baris."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from snbp.download import row_count
+
+
+@pytest.mark.parametrize("by", [['PROVINSI'], ['JALUR', 'KATEGORI JURUSAN'], ['ASAL UNIV']])
+def test_rollup_matches_groupby(df, cube, by):
+    expected = df.groupby(by, observed=True).agg(
+        peminat=('PEMINAT 2024', 'sum'), daya_tampung=('DAYA TAMPUNG 2025', 'sum'), jumlah=('NAMA', 'size'))
+    table = cube.rollup(by).set_index(by).sort_index()
+    expected = expected.sort_index()
+    assert table['PEMINAT 2024'].tolist() == expected['peminat'].tolist()
+    assert table['DAYA TAMPUNG 2025'].tolist() == expected['daya_tampung'].tolist()
+    assert table['JUMLAH'].tolist() == expected['jumlah'].tolist()
+
+
+def test_rollup_mean_ratio_ignores_missing(df, cube):
+    expected = df.groupby('PROVINSI', observed=True)['RASIO KEKETATAN'].mean()
+    table = cube.rollup('PROVINSI').set_index('PROVINSI')['RASIO KEKETATAN']
+    pd.testing.assert_series_equal(table.sort_index(), expected.sort_index(), check_names=False)
+
+
+def test_rollup_where_filters_dimensions(df, cube):
+    where = {'JALUR': 'SNBP', 'KATEGORI JURUSAN': ['SEPI PEMINAT']}
+    subset = df[(df['JALUR'] == 'SNBP') & (df['KATEGORI JURUSAN'] == 'SEPI PEMINAT')]
+    table = cube.rollup('PROVINSI', where)
+    assert table['JUMLAH'].sum() == len(subset)
+    assert table['PEMINAT 2024'].sum() == subset['PEMINAT 2024'].sum()
+    assert row_count(cube, {'JALUR': ['SNBP'], 'KATEGORI JURUSAN': ['SEPI PEMINAT']}) == len(subset)
+
+
+def test_rollup_is_memoized_unless_told_otherwise(cube):
+    assert cube.rollup(['JALUR', 'PROVINSI']) is cube.rollup(['JALUR', 'PROVINSI'])
+    once = cube.rollup(['NAMA', 'JALUR'], remember=False)
+    again = cube.rollup(['NAMA', 'JALUR'], remember=False)
+    assert once is not again
+    pd.testing.assert_frame_equal(once, again)
+
+
+def test_ranking_top_and_bottom(cube):
+    ranking = cube.ranking('PROVINSI', 'PEMINAT 2024')
+    assert ranking['PEMINAT 2024'].is_monotonic_decreasing
+    assert cube.top('PROVINSI', 'PEMINAT 2024', 3).equals(ranking.head(3))
+    assert cube.bottom('PROVINSI', 'PEMINAT 2024', 3)['PEMINAT 2024'].is_monotonic_increasing
+
+
+def test_rows_ranked_sorts_rows_stably(df, cube):
+    ranked = cube.rows_ranked('RASIO KEKETATAN', {'JALUR': 'SNBT'})
+    assert (ranked['JALUR'] == 'SNBT').all()
+    assert len(ranked) == (df['JALUR'] == 'SNBT').sum()
+    finite = ranked['RASIO KEKETATAN'].dropna().to_numpy()
+    assert (np.diff(finite[np.isfinite(finite)]) <= 0).all()
+    assert np.isinf(finite[:np.isinf(finite).sum()]).all()
+
+
+def test_totals(df, cube):
+    assert cube.totals['PEMINAT 2024'] == df['PEMINAT 2024'].sum()
+    assert cube.totals['JUMLAH PTN'] == df['ASAL UNIV'].nunique()
@@ -0,0 +1,158 @@
+"""Unduhan streaming: CSV/Parquet yang disusun per potongan sama dengan hasil filter utuh."""
+
+import http.client
+import io
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import snbp.download
+from snbp.cube import DIMENSIONS, AggregateCube
+from snbp.download import (
+    ExportSource, aggregate_table, export_stream, export_url, parse_query, row_chunks, serve,
+)
+from snbp.history import HistoryStore, prepare_snapshot
+from snbp.synthetic import generate
+
+WHERE = {'JALUR': ['SNBP'], 'PROVINSI': ['DKI Jakarta', 'Jawa Barat', 'Jawa Timur']}
+
+
+def collect(body, fmt):
+    data = b"".join(body)
+    return pd.read_csv(io.BytesIO(data)) if fmt == 'csv' else pd.read_parquet(io.BytesIO(data))
+
+
+def expected_rows(df, where):
+    mask = np.ones(len(df), dtype=bool)
+    for col, values in where.items():
+        mask &= df[col].astype(str).isin(values).to_numpy()
+    return df[mask].reset_index(drop=True)
+
+
+@pytest.fixture(scope="module")
+def history(tmp_path_factory):
+    store = HistoryStore(tmp_path_factory.mktemp("riwayat"))
+    for i, year in enumerate((2024, 2025)):
+        store.append(prepare_snapshot(generate(300, seed=10 + i))[1], year=year)
+    return store
+
+
+def test_row_chunks_cover_filter_in_order(df):
+    chunks = list(row_chunks(df, WHERE, chunk_rows=100))
+    assert len(chunks) > 1
+    pd.testing.assert_frame_equal(pd.concat(chunks).reset_index(drop=True), expected_rows(df, WHERE))
+
+
+@pytest.mark.parametrize("fmt", ['csv', 'parquet'])
+def test_rows_round_trip(df, fmt):
+    filename, _, body = export_stream('baris', fmt, WHERE, [], [], df)
+    assert filename == f"snbp-baris.{fmt}"
+    result = collect(body, fmt)
+    expected = expected_rows(df, WHERE)
+    assert len(result) == len(expected) > 0
+    assert result['KODE'].astype(str).tolist() == expected['KODE'].astype(str).tolist()
+    assert result['PEMINAT 2024'].tolist() == expected['PEMINAT 2024'].tolist()
+    np.testing.assert_allclose(result['RASIO KEKETATAN'], expected['RASIO KEKETATAN'].to_numpy(), rtol=1e-9)
+
+
+@pytest.mark.parametrize("fmt", ['csv', 'parquet'])
+def test_empty_result_keeps_header(df, fmt):
+    _, _, body = export_stream('baris', fmt, {'PROVINSI': ['Tidak Ada']}, [], [], df)
+    result = collect(body, fmt)
+    assert result.empty
+    assert 'NAMA' in result.columns
+
+
+@pytest.mark.parametrize("fmt", ['csv', 'parquet'])
+def test_aggregate_round_trip_uses_pooled_ratio(df, cube, fmt):
+    by = ['PROVINSI', 'KATEGORI JURUSAN']
+    _, _, body = export_stream('agregat', fmt, {'JALUR': ['SNBT']}, by, [], df, cube)
+    result = collect(body, fmt)
+    subset = df[df['JALUR'] == 'SNBT']
+    expected = subset.groupby(by, observed=True)[['PEMINAT 2024', 'DAYA TAMPUNG 2025']].sum().reset_index()
+    merged = result.merge(expected, on=by, suffixes=('', '_pandas'))
+    assert len(merged) == len(expected) == len(result)
+    assert (merged['PEMINAT 2024'] == merged['PEMINAT 2024_pandas']).all()
+    np.testing.assert_allclose(
+        merged['RASIO KEKETATAN'], merged['DAYA TAMPUNG 2025_pandas'] / merged['PEMINAT 2024_pandas'] * 100)
+    assert 'PROSPEK KERJA' not in result.columns
+
+
+def test_aggregate_ratio_is_nan_without_demand(df):
+    frame = df.copy()
+    frame.loc[frame.index[:20], 'PEMINAT 2024'] = 0
+    table = aggregate_table(AggregateCube(frame), DIMENSIONS)
+    tanpa_peminat = table['PEMINAT 2024'] == 0
+    assert tanpa_peminat.any()
+    assert table.loc[tanpa_peminat, 'RASIO KEKETATAN'].isna().all()
+    assert np.isfinite(table.loc[~tanpa_peminat, 'RASIO KEKETATAN']).all()
+
+
+@pytest.mark.parametrize("fmt", ['csv', 'parquet'])
+def test_history_round_trip(df, history, fmt):
+    where = {'JALUR': ['SNBT'], 'KATEGORI JURUSAN': ['SEPI PEMINAT']}
+    _, _, body = export_stream('riwayat', fmt, where, [], [2025], df, history=history)
+    result = collect(body, fmt)
+    expected = history.read(years=[2025], jalur=['SNBT'])
+    expected = expected[expected['KATEGORI JURUSAN'] == 'SEPI PEMINAT']
+    assert len(result) == len(expected) > 0
+    assert set(result['TAHUN']) == {2025}
+    assert result['KODE'].astype(str).tolist() == expected['KODE'].astype(str).tolist()
+
+
+def test_parse_query_round_trips_export_url():
+    url = export_url("http://127.0.0.1:1", 'agregat', 'parquet', WHERE, by=['PROVINSI'], years=[2025])
+    source, fmt, where, by, years = parse_query(url.split("?", 1)[1])
+    assert (source, fmt, where, by, years) == ('agregat', 'parquet', WHERE, ['PROVINSI'], [2025])
+
+
+@pytest.mark.parametrize("query", ["sumber=semua", "format=xlsx", "sumber=agregat", "sumber=agregat&per=KODE",
+                                   "tahun=dua"])
+def test_parse_query_rejects_invalid(query):
+    with pytest.raises(ValueError):
+        parse_query(query)
+
+
+def test_server_streams_chunked_csv(df, cube):
+    source = ExportSource()
+    server = serve(source, 0)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(export_url(base, 'baris', 'csv'))
+        assert error.value.code == 400
+
+        source.publish("v1", df, cube)
+        with urllib.request.urlopen(export_url(base, 'baris', 'csv', WHERE)) as response:
+            assert response.headers["Transfer-Encoding"] == "chunked"
+            assert response.headers["X-SNBP-Version"] == "v1"
+            result = pd.read_csv(io.BytesIO(response.read()))
+        assert len(result) == len(expected_rows(df, WHERE))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_server_aborts_stream_on_error(df, cube, monkeypatch):
+    def rusak(frame, where=None, chunk_rows=None):
+        yield frame.iloc[:10]
+        raise RuntimeError("disk penuh")
+
+    monkeypatch.setattr(snbp.download, "row_chunks", rusak)
+    source = ExportSource()
+    source.publish("v1", df, cube)
+    server = serve(source, 0)
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        connection.request("GET", "/export?sumber=baris&format=csv")
+        response = connection.getresponse()
+        assert response.status == 200
+        # Tanpa potongan penutup: klien melihat unduhan terputus, bukan file lengkap
+        with pytest.raises(http.client.IncompleteRead):
+            response.read()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,38 @@
+"""``snbp.evaluate``: encoding kategori di-fit per fold, tanpa melihat fold uji."""
+
+import pandas as pd
+from sklearn.naive_bayes import GaussianNB
+
+from snbp.evaluate import candidates, cross_validate, with_encoder
+from snbp.model import FEATURES, LABEL_COLS, train_model
+
+
+def features(frame):
+    return frame[FEATURES].astype({col: str for col in LABEL_COLS})
+
+
+def test_encoder_is_fit_on_training_rows_only(df):
+    provinsi = df['PROVINSI'].astype(str)
+    latih = df[provinsi != provinsi.iloc[0]]
+    pipeline = with_encoder(GaussianNB()).fit(features(latih), latih['JALUR'])
+    # Provinsi yang tidak ada di data latih menjadi -1, bukan kode hasil fit pada seluruh data
+    encoded = pipeline.named_steps['encode'].transform(features(df.head(1)))
+    assert encoded[0, FEATURES.index('PROVINSI')] == -1
+
+
+def test_known_values_match_label_encoder(df):
+    pipeline = with_encoder(GaussianNB()).fit(features(df), df['JALUR'])
+    expected, _ = train_model(df).encode(df)
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(pipeline.named_steps['encode'].transform(features(df)), columns=FEATURES).astype(float),
+        expected.reset_index(drop=True).astype(float))
+
+
+def test_cross_validate_summary(df):
+    summary = cross_validate(df, candidates(), folds=3, n_jobs=1)
+    assert set(summary) == {'random_forest', 'gaussian_nb'}
+    for metrics in summary.values():
+        assert metrics['folds'] == 3
+        assert 0 <= metrics['accuracy'] <= 1
+        assert 0 <= metrics['f1_macro'] <= 1
+        assert metrics['fit_seconds'] > 0
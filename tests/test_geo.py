@@ -0,0 +1,185 @@
+"""``snbp.geo``: penyederhanaan topologis dan bundel, pada geometri kecil buatan.
+
+Empat provinsi 2 x 2 derajat dengan batas dalam bergelombang (dipakai persis sama
+oleh kedua provinsi) dan tepi luar lurus, plus pulau kecil dan satu provinsi
+yang hanya berupa pulau kecil.
+"""
+
+import json
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from snbp.geo import LEVELS, QUANTIZE, GeoBundle, build_bundle, douglas_peucker, province_key, read_source, simplify
+from snbp.synthetic import PROVINCES
+
+SHIPPED = Path(__file__).resolve().parent.parent / "snbp" / "data" / "provinsi.json"
+# Provinsi hasil pemekaran 2022 yang belum ada di bundel bawaan
+PAPUA_2022 = ['Papua Barat Daya', 'Papua Tengah', 'Papua Pegunungan', 'Papua Selatan']
+
+TITIK = 201
+# Nama di sumber geometri -> kunci yang dipakai dashboard
+NAMA = {
+    'A': ('Daerah Khusus Ibukota Jakarta', 'dki jakarta'),
+    'B': ('Jawa Barat', 'jawa barat'),
+    'C': ('Provinsi Banten', 'banten'),
+    'D': ('DAERAH ISTIMEWA YOGYAKARTA', 'di yogyakarta'),
+    'E': ('Kep. Riau', 'kepulauan riau'),
+}
+
+
+def garis(a, b, gelombang):
+    """Titik dari ``a`` ke ``b``; batas dalam bergelombang (0 di kedua ujung), tepi luar lurus."""
+    t = np.linspace(0, 1, TITIK)[:, None]
+    p, q = np.array(a, dtype=float), np.array(b, dtype=float)
+    points = p + t * (q - p)
+    if gelombang:
+        normal = np.array([-(q - p)[1], (q - p)[0]]) / np.hypot(*(q - p))
+        points = points + 0.03 * np.sin(10 * np.pi * t) * normal
+    return points.round(6).tolist()
+
+
+def ring(*sisi):
+    points = []
+    for a, b, gelombang in sisi:
+        # Batas bersama selalu dibangun dari titik terkecil agar kedua provinsi memakai titik yang sama
+        maju = garis(min(a, b), max(a, b), gelombang)
+        points.extend((maju if a <= b else maju[::-1])[:-1])
+    return points + points[:1]
+
+
+def kotak(x, y, sisi):
+    return [[x, y], [x + sisi, y], [x + sisi, y + sisi], [x, y + sisi], [x, y]]
+
+
+def feature(nama, *polygons):
+    return {'type': 'Feature', 'properties': {'NAME_1': nama},
+            'geometry': {'type': 'MultiPolygon', 'coordinates': [list(p) for p in polygons]}}
+
+
+@pytest.fixture(scope="module")
+def source():
+    a = ring(((0, 0), (1, 0), False), ((1, 0), (1, 1), True), ((1, 1), (0, 1), True), ((0, 1), (0, 0), False))
+    b = ring(((1, 0), (2, 0), False), ((2, 0), (2, 1), False), ((2, 1), (1, 1), True), ((1, 1), (1, 0), True))
+    c = ring(((0, 1), (1, 1), True), ((1, 1), (1, 2), True), ((1, 2), (0, 2), False), ((0, 2), (0, 1), False))
+    d = ring(((1, 1), (2, 1), True), ((2, 1), (2, 2), False), ((2, 2), (1, 2), False), ((1, 2), (1, 1), True))
+    return {'type': 'FeatureCollection', 'features': [
+        feature(NAMA['A'][0], [a]),
+        feature(NAMA['B'][0], [b], [kotak(1.5, -0.5, 0.005)]),
+        feature(NAMA['C'][0], [c]),
+        feature(NAMA['D'][0], [d]),
+        feature(NAMA['E'][0], [kotak(3, 3, 0.01)]),
+    ]}
+
+
+@pytest.fixture(scope="module")
+def levels(source):
+    return simplify(source)
+
+
+def rings_of(feature):
+    geometry = feature['geometry']
+    polygons = [geometry['coordinates']] if geometry['type'] == 'Polygon' else geometry['coordinates']
+    return [r for polygon in polygons for r in polygon]
+
+
+def test_province_names_match_sheet_keys(levels):
+    for collection in levels.values():
+        assert [f['id'] for f in collection['features']] == [key for _, key in NAMA.values()]
+        assert [f['properties']['name'] for f in collection['features']] == [name for name, _ in NAMA.values()]
+    assert province_key("DKI Jakarta") == province_key("Daerah Khusus Ibukota Jakarta") == 'dki jakarta'
+    assert province_key(" provinsi  Jawa-Barat ") == 'jawa barat'
+
+
+@pytest.mark.parametrize("level", list(LEVELS))
+def test_shared_borders_have_no_gaps(levels, level):
+    # Setiap ruas di dalam daratan A-D dipakai tepat dua provinsi; ruas tunggal hanya di tepi luar kotak 0..2
+    edges = Counter()
+    for feature in levels[level]['features'][:4]:
+        ring_luar = max(rings_of(feature), key=len)
+        titik = [tuple(np.rint(np.asarray(p) * QUANTIZE).astype(int)) for p in ring_luar]
+        for a, b in zip(titik[:-1], titik[1:]):
+            edges[(a, b) if a <= b else (b, a)] += 1
+    assert max(edges.values()) == 2
+    tepi = {0, 2 * QUANTIZE}
+    for (a, b), n in edges.items():
+        if n == 1:
+            assert (a[0] == b[0] and a[0] in tepi) or (a[1] == b[1] and a[1] in tepi), (a, b)
+
+
+def test_coarser_levels_have_fewer_points(source, levels):
+    def jumlah(collection):
+        return sum(len(r) for f in collection['features'] for r in rings_of(f))
+
+    counts = [jumlah(levels[level]) for level in sorted(LEVELS, key=LEVELS.get)]
+    assert counts == sorted(counts, reverse=True)
+    assert counts[-1] < jumlah(source) / 10
+
+
+def test_small_islands_dropped_but_province_kept(levels):
+    nasional = {f['id']: f for f in levels['nasional']['features']}
+    detail = {f['id']: f for f in levels['detail']['features']}
+    assert len(rings_of(nasional['jawa barat'])) == 1
+    assert len(rings_of(detail['jawa barat'])) == 2
+    # Provinsi yang seluruhnya pulau kecil tetap tampil di tingkat paling kasar
+    assert len(rings_of(nasional['kepulauan riau'])[0]) >= 4
+
+
+def test_build_bundle_round_trip(source, tmp_path):
+    path = tmp_path / "provinsi.geojson"
+    path.write_text(json.dumps(source))
+    bundle = build_bundle(path, tmp_path / "data" / "provinsi.json")
+    loaded = GeoBundle.load(tmp_path / "data" / "provinsi.json")
+    assert loaded.source == bundle['source']
+    assert loaded.geojson('pulau') == bundle['levels']['pulau']
+    assert loaded.keys(["DKI Jakarta", "Jawa Barat", "Papua"]) == ['dki jakarta', 'jawa barat', None]
+    assert GeoBundle.load(tmp_path / "tidak-ada.json") is None
+
+
+def test_douglas_peucker_keeps_corners_only():
+    lurus = np.c_[np.linspace(0, 10, 50), np.zeros(50)]
+    assert douglas_peucker(lurus, 0.1).tolist() == [0, 49]
+    siku = np.r_[lurus, np.c_[np.full(49, 10.0), np.linspace(0.2, 10, 49)]]
+    assert douglas_peucker(siku, 0.1).tolist() == [0, 49, 98]
+
+
+def echarts_encode(ring, scale=1024):
+    """Encoder ECharts (kebalikan ``snbp.geo._decode_ring``): ``(string, offset)``."""
+    points = np.rint(np.asarray(ring) * scale).astype(int)
+    deltas = np.diff(points, axis=0, prepend=points[:1])
+    zigzag = (deltas << 1) ^ (deltas >> 31)
+    return ''.join(chr(int(c) + 64) for c in zigzag.ravel()), points[0].tolist()
+
+
+def test_read_source_decodes_echarts_map(source, tmp_path):
+    features = []
+    for feature in source['features']:
+        encoded = [[echarts_encode(ring) for ring in polygon] for polygon in feature['geometry']['coordinates']]
+        geometry = {'type': 'MultiPolygon', 'coordinates': [[e for e, _ in p] for p in encoded],
+                    'encodeOffsets': [[o for _, o in p] for p in encoded]}
+        features.append({**feature, 'geometry': geometry})
+    collection = {'type': 'FeatureCollection', 'features': features, 'UTF8Encoding': True}
+    script = f"(function () {{echarts.registerMap('Indonesia', {json.dumps(collection)});}})();"
+
+    decoded = read_source(script.encode('utf-8'))
+    assert [f['properties'] for f in decoded['features']] == [f['properties'] for f in source['features']]
+    for got, expected in zip(decoded['features'], source['features']):
+        for ring_got, ring_expected in zip(rings_of(got), rings_of(expected)):
+            np.testing.assert_allclose(ring_got, ring_expected, atol=0.5 / 1024)
+    assert read_source(json.dumps(source).encode('utf-8')) == source
+
+
+def test_shipped_bundle_covers_sheet_provinces():
+    bundle = GeoBundle.load(SHIPPED)
+    assert bundle is not None and bundle.attribution
+    for level in LEVELS:
+        features = bundle.geojson(level)['features']
+        assert len(features) == 34
+        for feature in features:
+            lon, lat = np.concatenate([np.asarray(r) for r in rings_of(feature)]).T
+            assert 94 < lon.min() and lon.max() < 142 and -12 < lat.min() and lat.max() < 7
+    keys = dict(zip(PROVINCES, bundle.keys(PROVINCES)))
+    assert [name for name, key in keys.items() if key is None] == PAPUA_2022
+    assert keys['DKI Jakarta'] == 'dki jakarta' and keys['Kepulauan Bangka Belitung'] == 'kepulauan bangka belitung'
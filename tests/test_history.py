@@ -0,0 +1,65 @@
+"""``HistoryStore``: partisi TAHUN/JALUR, agregat per partisi, dan manifest yang diperbarui proses lain."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from snbp.history import HistoryStore, prepare_snapshot, snapshot_year
+from snbp.synthetic import generate
+
+
+@pytest.fixture
+def snapshots():
+    return [prepare_snapshot(generate(300, seed=20 + i))[1] for i in range(3)]
+
+
+def test_append_writes_only_changed_partitions(tmp_path, snapshots):
+    store = HistoryStore(tmp_path)
+    assert store.append(snapshots[0], year=2024) == ['2024/SNBP', '2024/SNBT']
+    assert store.append(snapshots[0], year=2024) == []
+    assert store.years() == [2024]
+    assert sum(part['rows'] for part in store.partitions.values()) == len(snapshots[0])
+
+
+def test_partition_missing_from_newer_snapshot_is_removed(tmp_path, snapshots):
+    store = HistoryStore(tmp_path)
+    store.append(snapshots[0], year=2024)
+    store.append(snapshots[1], year=2025)
+    hanya_snbp = snapshots[2][snapshots[2]['JALUR'] == 'SNBP']
+    assert store.append(hanya_snbp, year=2025) == ['2025/SNBP', '2025/SNBT']
+    assert sorted(store.partitions) == ['2024/SNBP', '2024/SNBT', '2025/SNBP']
+    assert not (tmp_path / "TAHUN=2025" / "JALUR=SNBT").exists()
+    assert (tmp_path / "TAHUN=2024" / "JALUR=SNBT" / "data.parquet").exists()
+    assert set(store.read(years=[2025])['JALUR']) == {'SNBP'}
+    assert set(store.aggregates().query('TAHUN == 2025')['JALUR']) == {'SNBP'}
+    # Proses lain juga tidak lagi melihat partisi yang dihapus
+    assert sorted(HistoryStore(tmp_path).partitions) == sorted(store.partitions)
+
+
+def test_trends_match_rows(tmp_path, snapshots):
+    store = HistoryStore(tmp_path)
+    for year, snapshot in zip((2023, 2024, 2025), snapshots):
+        store.append(snapshot, year=year)
+    trends = store.trends(by=['JALUR']).set_index(['TAHUN', 'JALUR'])
+    rows = store.read()
+    expected = rows.groupby(['TAHUN', 'JALUR'])[['PEMINAT', 'DAYA TAMPUNG']].sum()
+    assert trends['PEMINAT'].tolist() == expected['PEMINAT'].tolist()
+    np.testing.assert_allclose(trends['RASIO KEKETATAN'], expected['DAYA TAMPUNG'] / expected['PEMINAT'] * 100)
+
+
+def test_years_added_by_another_process_are_visible(tmp_path, snapshots):
+    dashboard = HistoryStore(tmp_path)
+    dashboard.append(snapshots[0], year=2024)
+    assert sorted(dashboard.aggregates()['TAHUN'].unique()) == [2024]
+
+    # Mis. ``python -m snbp.history`` dijalankan terpisah saat server masih hidup
+    HistoryStore(tmp_path).append(snapshots[1], year=2025)
+    assert dashboard.years() == [2024, 2025]
+    assert sorted(dashboard.aggregates()['TAHUN'].unique()) == [2024, 2025]
+    assert len(dashboard.read(years=[2025])) == len(snapshots[1])
+
+
+def test_snapshot_year_from_columns():
+    assert snapshot_year(pd.Index(['NAMA', 'PEMINAT 2023', 'DAYA TAMPUNG 2024'])) == 2024
+    with pytest.raises(ValueError):
+        snapshot_year(['NAMA'])
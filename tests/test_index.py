@@ -0,0 +1,43 @@
+"""``CascadeIndex``: pilihan dan baris tiap tingkat sama dengan filter pandas berurutan."""
+
+import numpy as np
+import pandas as pd
+
+from snbp.index import CascadeIndex
+
+LEVELS = ('PROVINSI', 'ASAL UNIV', 'KATEGORI JURUSAN')
+
+
+def test_options_follow_first_appearance(df):
+    index = CascadeIndex(df, LEVELS)
+    assert index.options() == df['PROVINSI'].dropna().unique().tolist()
+    provinsi = index.options()[0]
+    subset = df[df['PROVINSI'] == provinsi]
+    assert index.options(provinsi) == subset['ASAL UNIV'].dropna().unique().tolist()
+
+
+def test_rows_match_boolean_filter(df):
+    index = CascadeIndex(df, LEVELS)
+    for provinsi in index.options()[:3]:
+        for univ in index.options(provinsi)[:2]:
+            for kategori in index.options(provinsi, univ):
+                mask = (df['PROVINSI'] == provinsi) & (df['ASAL UNIV'] == univ) & (df['KATEGORI JURUSAN'] == kategori)
+                assert sorted(index.rows(provinsi, univ, kategori)) == np.flatnonzero(mask.to_numpy()).tolist()
+
+
+def test_rows_are_read_only_and_unknown_path_is_empty(df):
+    index = CascadeIndex(df, LEVELS)
+    assert len(index.rows()) == len(df)
+    assert not index.rows().flags.writeable
+    assert len(index.rows("Provinsi Tidak Ada")) == 0
+    assert index.options("Provinsi Tidak Ada") == []
+
+
+def test_missing_values_are_not_options(df):
+    frame = df.copy()
+    frame['PROVINSI'] = frame['PROVINSI'].astype(object)
+    frame.loc[frame.index[:5], 'PROVINSI'] = np.nan
+    index = CascadeIndex(frame, LEVELS)
+    assert not any(pd.isna(value) or value == "nan" for value in index.options())
+    # Baris tanpa provinsi tetap terhitung di akar
+    assert len(index.rows()) == len(frame)
@@ -0,0 +1,134 @@
+"""``SheetLoader`` terhadap server HTTP lokal: ETag/304, timeout, dan fallback ke snapshot di disk."""
+
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from snbp.loader import SheetLoader
+
+CSV_V1 = b"NAMA,PEMINAT 2024\nAkuntansi,10\n"
+CSV_V2 = b"NAMA,PEMINAT 2024\nAkuntansi,12\n"
+
+
+class Sheet:
+    """Isi CSV yang dilayani server beserta catatan permintaan yang diterima."""
+
+    def __init__(self, body):
+        self.body = body
+        self.delay = 0.0
+        self.requests = []
+
+    @property
+    def etag(self):
+        return '"%s"' % hashlib.sha1(self.body).hexdigest()[:8]
+
+
+@pytest.fixture
+def sheet():
+    state = Sheet(CSV_V1)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state.requests.append(dict(self.headers))
+            time.sleep(state.delay)
+            if self.headers.get("If-None-Match") == state.etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/csv")
+            self.send_header("ETag", state.etag)
+            self.send_header("Content-Length", str(len(state.body)))
+            self.end_headers()
+            self.wfile.write(state.body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}/sheet.csv"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_cold_start_downloads_and_writes_snapshot(sheet, tmp_path):
+    loader = SheetLoader(sheet.url, tmp_path, ttl=600)
+    snapshot = loader.get()
+    assert snapshot.data == CSV_V1
+    assert snapshot.etag == sheet.etag
+    assert (tmp_path / "sheet.csv").read_bytes() == CSV_V1
+    # Masih segar: get berikutnya tidak menghubungi server
+    assert loader.get() is snapshot
+    assert len(sheet.requests) == 1
+
+
+def test_unchanged_sheet_answers_304_and_keeps_version(sheet, tmp_path):
+    loader = SheetLoader(sheet.url, tmp_path, ttl=600)
+    first = loader.get()
+    time.sleep(0.01)
+    second = loader.refresh(force=True)
+    assert sheet.requests[-1]["If-None-Match"] == sheet.etag
+    assert second.version == first.version
+    assert second.data == first.data
+    assert second.fetched_at > first.fetched_at
+
+
+def test_304_refreshes_metadata_without_rewriting_csv(sheet, tmp_path):
+    loader = SheetLoader(sheet.url, tmp_path, ttl=600)
+    loader.get()
+    before = (tmp_path / "sheet.csv").stat()
+    time.sleep(0.01)
+    second = loader.refresh(force=True)
+    after = (tmp_path / "sheet.csv").stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+    # Umur snapshot yang diperpanjang ikut tersimpan untuk proses berikutnya
+    reloaded = SheetLoader(sheet.url, tmp_path, ttl=600)._load_from_disk()
+    assert reloaded.fetched_at == second.fetched_at
+    assert reloaded.version == second.version
+
+
+def test_changed_sheet_gives_new_version(sheet, tmp_path):
+    loader = SheetLoader(sheet.url, tmp_path, ttl=600)
+    first = loader.get()
+    sheet.body = CSV_V2
+    second = loader.refresh(force=True)
+    assert second.data == CSV_V2
+    assert second.version != first.version
+    assert second.etag == sheet.etag
+
+
+def test_timeout_keeps_previous_snapshot(sheet, tmp_path):
+    loader = SheetLoader(sheet.url, tmp_path, ttl=600, timeout=0.2)
+    first = loader.get()
+    sheet.body, sheet.delay = CSV_V2, 1.0
+    assert loader.refresh(force=True) is first
+    assert isinstance(loader.last_error, OSError)
+
+
+def test_timeout_on_cold_start_raises(sheet, tmp_path):
+    sheet.delay = 1.0
+    with pytest.raises(OSError):
+        SheetLoader(sheet.url, tmp_path, ttl=600, timeout=0.2).get()
+
+
+def test_unreachable_server_falls_back_to_disk(sheet, tmp_path):
+    first = SheetLoader(sheet.url, tmp_path, ttl=0).get()
+    # Proses baru, server mati: snapshot di disk tetap dilayani
+    loader = SheetLoader("http://127.0.0.1:9/sheet.csv", tmp_path, ttl=0, timeout=0.5)
+    assert loader.get().data == first.data
+    assert loader.refresh(force=True).version == first.version
+    assert loader.last_error is not None
+
+
+def test_empty_response_is_rejected(sheet, tmp_path):
+    loader = SheetLoader(sheet.url, tmp_path, ttl=600)
+    first = loader.get()
+    sheet.body = b"\n"
+    assert loader.refresh(force=True) is first
+    assert isinstance(loader.last_error, ValueError)
@@ -0,0 +1,29 @@
+"""``ModelStore``: model dikunci dengan isi data latih dan file lama di disk dipangkas."""
+
+import time
+
+from snbp.model import ModelStore, training_key
+
+
+def test_same_data_reuses_model(df, tmp_path):
+    store = ModelStore(tmp_path)
+    trained = store.get(df)
+    assert trained.key == training_key(df)
+    # Proses baru: model dimuat dari disk, tidak dilatih ulang
+    warmed = ModelStore(tmp_path).warm()
+    assert warmed.key == trained.key
+    X, unknown = warmed.encode(df.head(5))
+    assert not unknown.to_numpy().any()
+    assert (warmed.model.predict(X) == trained.model.predict(X)).all()
+
+
+def test_old_models_are_pruned(df, tmp_path):
+    store = ModelStore(tmp_path, keep=2)
+    keys = []
+    for rows in (200, 300, 400, 500):
+        keys.append(store.get(df.iloc[:rows]).key)
+        time.sleep(0.01)
+    assert len(set(keys)) == 4
+    assert sorted(p.name for p in tmp_path.glob("rf-*.joblib")) == sorted(f"rf-{key}.joblib" for key in keys[-2:])
+    assert (tmp_path / "latest").read_text() == keys[-1]
+    assert ModelStore(tmp_path).warm().key == keys[-1]
@@ -0,0 +1,56 @@
+"""``NeighborIndex.alternatives``: program serupa yang lebih longgar, dibandingkan dengan pencarian brute force."""
+
+import numpy as np
+import pytest
+
+from snbp.neighbors import CATEGORY_WEIGHTS, NUMERIC_COLUMNS, NeighborIndex
+
+
+def brute_force_distance(df, position):
+    distance = np.zeros(len(df))
+    for col in NUMERIC_COLUMNS:
+        values = np.log1p(df[col].to_numpy(dtype=float))
+        values = (values - values.mean()) / (values.std() or 1.0)
+        distance += (values - values[position]) ** 2
+    for col, weight in CATEGORY_WEIGHTS.items():
+        values = df[col].astype(str).to_numpy()
+        distance += weight * (values != values[position])
+    return distance
+
+
+@pytest.mark.parametrize("position", [0, 17, 250])
+def test_alternatives_are_looser_and_nearest(df, position):
+    index = NeighborIndex(df)
+    acuan = df.iloc[position]
+    result = index.alternatives(position, k=5)
+
+    assert len(result) == 5
+    assert (result['RASIO KEKETATAN'] > acuan['RASIO KEKETATAN']).all()
+    assert (result['JALUR'] == acuan['JALUR']).all()
+    assert not ((result['NAMA'] == acuan['NAMA']) & (result['ASAL UNIV'] == acuan['ASAL UNIV'])).any()
+    assert result['JARAK'].is_monotonic_increasing
+
+    distance = brute_force_distance(df, position)
+    eligible = (
+        (df['RASIO KEKETATAN'].to_numpy() > acuan['RASIO KEKETATAN'])
+        & (df['JALUR'] == acuan['JALUR']).to_numpy()
+        & ~((df['NAMA'] == acuan['NAMA']) & (df['ASAL UNIV'] == acuan['ASAL UNIV'])).to_numpy()
+    )
+    best = np.sort(distance[eligible])[:5]
+    np.testing.assert_allclose(result['JARAK'].to_numpy(), best, rtol=1e-4, atol=1e-5)
+
+
+def test_across_jalur_and_loosest_program(df):
+    index = NeighborIndex(df)
+    terlonggar = int(np.flatnonzero(np.isinf(df['RASIO KEKETATAN'].to_numpy()))[0])
+    # Rasio inf tidak punya pembanding yang lebih longgar
+    assert index.alternatives(terlonggar).empty
+    jalur = index.alternatives(0, k=50, same_jalur=False)['JALUR']
+    assert jalur.nunique() == 2
+
+
+def test_programs_by_name(df):
+    index = NeighborIndex(df)
+    nama = df['NAMA'].iloc[3]
+    assert sorted(index.programs(nama)) == np.flatnonzero((df['NAMA'] == nama).to_numpy()).tolist()
+    assert len(index.programs("Tidak Ada")) == 0
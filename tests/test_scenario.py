@@ -0,0 +1,65 @@
+"""``ScenarioEngine``: hasil batch sama dengan menghitung ulang satu skenario dengan pandas."""
+
+import numpy as np
+
+from snbp.scenario import Adjustment, Scenario, ScenarioEngine
+
+
+def recompute(df, capacity=1.0, demand=1.0, where=None):
+    """Rasio baru satu skenario, dihitung per baris dengan pandas."""
+    rasio = df['RASIO KEKETATAN'].to_numpy(dtype=float).copy()
+    mask = np.ones(len(df), dtype=bool)
+    for col, value in (where or {}).items():
+        mask &= (df[col].astype(str) == value).to_numpy()
+    peminat = np.where(np.isinf(rasio), 0.0, df['PEMINAT 2024'].to_numpy(dtype=float))
+    new_capacity = np.rint(df['DAYA TAMPUNG 2025'].to_numpy(dtype=float) * np.where(mask, capacity, 1.0))
+    new_demand = np.rint(peminat * np.where(mask, demand, 1.0))
+    changed = (new_capacity != df['DAYA TAMPUNG 2025'].to_numpy()) | (new_demand != peminat)
+    with np.errstate(divide='ignore'):
+        rasio[changed] = np.where(new_demand > 0, new_capacity / new_demand * 100, np.inf)[changed]
+    return rasio
+
+
+def test_identity_scenario_keeps_original_ratio(df):
+    result = ScenarioEngine(df).evaluate([Scenario("dasar")])
+    np.testing.assert_array_equal(result.rasio[0], df['RASIO KEKETATAN'].to_numpy())
+    assert not result.changed.any()
+
+
+def test_batch_matches_single_recompute(df):
+    engine = ScenarioEngine(df)
+    scenarios = [
+        Scenario("kapasitas SNBP x2", (Adjustment({'JALUR': 'SNBP'}, capacity=2.0),)),
+        Scenario("peminat +30%", (Adjustment(demand=1.3),)),
+        Scenario("kapasitas -50%", (Adjustment(capacity=0.5),)),
+    ]
+    result = engine.evaluate(scenarios)
+    np.testing.assert_allclose(result.rasio[0], recompute(df, capacity=2.0, where={'JALUR': 'SNBP'}))
+    np.testing.assert_allclose(result.rasio[1], recompute(df, demand=1.3))
+    np.testing.assert_allclose(result.rasio[2], recompute(df, capacity=0.5))
+    # Hanya baris SNBP yang berubah di skenario pertama
+    assert not result.changed[0][(df['JALUR'] != 'SNBP').to_numpy()].any()
+
+
+def test_top_matches_sorted_ratio(df):
+    engine = ScenarioEngine(df)
+    result = engine.evaluate([Scenario("peminat -20%", (Adjustment(demand=0.8),))])
+    top = result.top(k=10)[0]
+    expected = np.argsort(-np.nan_to_num(result.rasio[0], nan=-np.inf), kind='stable')[:10]
+    np.testing.assert_array_equal(top, expected)
+
+    frame = result.top_frame(0, k=10)
+    assert frame['RASIO SIMULASI'].tolist() == result.rasio[0][expected].tolist()
+
+
+def test_summary_counts_changed_programs(df):
+    engine = ScenarioEngine(df)
+    result = engine.evaluate([Scenario("dasar"), Scenario("x2", (Adjustment(capacity=2.0),))])
+    summary = result.summary()
+    assert summary['PROGRAM BERUBAH'].tolist() == [0, len(df)]
+    assert summary['DAYA TAMPUNG SIMULASI'].iloc[1] == 2 * df['DAYA TAMPUNG 2025'].sum()
+
+
+def test_unknown_filter_value_matches_nothing(df):
+    engine = ScenarioEngine(df)
+    assert not engine.mask({'PROVINSI': 'Tidak Ada'}).any()
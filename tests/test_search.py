@@ -0,0 +1,41 @@
+"""``SearchIndex``: pencarian trigram NAMA / ASAL UNIV / PROSPEK KERJA."""
+
+from snbp.search import SearchIndex, normalize
+
+
+def test_exact_value_ranks_first(df):
+    index = SearchIndex(df)
+    univ = df['ASAL UNIV'].iloc[0]
+    assert index.values_for(univ, 'ASAL UNIV')[0] == univ
+
+
+def test_typo_and_case_are_tolerated(df):
+    index = SearchIndex(df)
+    nama = df['NAMA'].value_counts().index[0]
+    query = nama.lower()[:-1]
+    assert nama in index.values_for(query, 'NAMA')
+
+
+def test_field_restricts_results(df):
+    index = SearchIndex(df)
+    prospek = df['PROSPEK KERJA'].astype(str).iloc[0]
+    matches = index.search(prospek, field='PROSPEK KERJA')
+    assert matches and all(match.field == 'PROSPEK KERJA' for match in matches)
+    assert [match.score for match in matches] == sorted((match.score for match in matches), reverse=True)
+
+
+def test_empty_or_unmatched_query(df):
+    index = SearchIndex(df)
+    assert index.search("") == []
+    assert index.search("   ") == []
+    assert index.search("qqqzzzxxx") == []
+
+
+def test_popular_is_frequency_order(df):
+    index = SearchIndex(df)
+    expected = df['NAMA'].astype(str).value_counts().index[:5].tolist()
+    assert index.popular('NAMA', limit=5) == expected
+
+
+def test_normalize():
+    assert normalize("  Teknik-Informatika (S1) ") == "teknik informatika s1"